@@ -3,8 +3,10 @@
 ⚠️  IMPORTANT: This is a PATTERN GUIDE showing how YOU can implement
 interactive shell/REPL in YOUR own CLI application using flext-cli as a foundation.
 
-flext-cli does NOT provide FlextCliShell or REPL features built-in.
-This example demonstrates patterns and best practices for YOUR implementation.
+For a ready-made REPL over FlextCliAppBase or FlextCliCommands commands
+(command-index completion, bounded history), use FlextCliShell
+(``app.shell().run()``). This example demonstrates patterns and best
+practices for a custom implementation.
 
 WHEN TO USE THIS PATTERN IN YOUR CLI:
 - Building interactive REPL-style CLIs
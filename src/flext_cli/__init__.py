@@ -20,20 +20,40 @@ if TYPE_CHECKING:
 
     from flext_cli.__version__ import __version__, __version_info__
     from flext_cli.api import FlextCli
-    from flext_cli.app_base import FlextCliAppBase
+    from flext_cli.app_base import FlextCliAppBase, FlextCliLazyCommand
     from flext_cli.base import FlextCliServiceBase
+    from flext_cli.batch import FlextCliBatchRunner
+    from flext_cli.cache import FlextCliFileCacheStore, FlextCliMemoryCacheStore
     from flext_cli.cli import FlextCliCli
     from flext_cli.cli_params import FlextCliCommonParams
     from flext_cli.command_builder import FlextCliCommandBuilder as FlextCommandBuilder
-    from flext_cli.commands import FlextCliCommands
+    from flext_cli.commands import FlextCliCommandPipeline, FlextCliCommands
+    from flext_cli.completion import FlextCliCompletionCache
+    from flext_cli.config_engine import FlextCliConfigEngine
     from flext_cli.constants import FlextCliConstants, FlextCliConstants as c
+    from flext_cli.daemon import FlextCliDaemon
     from flext_cli.debug import FlextCliDebug
     from flext_cli.file_tools import FlextCliFileTools
     from flext_cli.formatters import FlextCliFormatters
+    from flext_cli.metrics import (
+        FlextCliExecutionMetrics,
+        FlextCliLatencyHistogram,
+        FlextCliMetricsRegistry,
+        FlextCliOpenMetricsExporter,
+    )
     from flext_cli.middleware import (
+        FlextCliAsyncMiddlewareChain as AsyncMiddlewareChain,
+        FlextCliAsyncRetryMiddleware as AsyncRetryMiddleware,
+        FlextCliAsyncRunner as AsyncRunner,
+        FlextCliBulkheadMiddleware as BulkheadMiddleware,
+        FlextCliCacheMiddleware as CacheMiddleware,
+        FlextCliCircuitBreakerMiddleware as CircuitBreakerMiddleware,
         FlextCliLoggingMiddleware as LoggingMiddleware,
         FlextCliMiddleware as FlextMiddleware,
+        FlextCliMiddlewareChain as MiddlewareChain,
+        FlextCliRateLimitMiddleware as RateLimitMiddleware,
         FlextCliRetryMiddleware as RetryMiddleware,
+        FlextCliTimingMiddleware as TimingMiddleware,
         FlextCliValidationMiddleware as ValidationMiddleware,
     )
     from flext_cli.mixins import FlextCliMixins
@@ -43,44 +63,88 @@ if TYPE_CHECKING:
         FlextCliOptionGroup as FlextOptionGroup,
     )
     from flext_cli.protocols import FlextCliProtocols, FlextCliProtocols as p
+    from flext_cli.rate_limit import FlextCliFileTokenBucket, FlextCliTokenBucket
     from flext_cli.services.cmd import FlextCliCmd
     from flext_cli.services.core import FlextCliCore
     from flext_cli.services.output import FlextCliOutput
     from flext_cli.services.prompts import FlextCliPrompts
     from flext_cli.services.tables import FlextCliTables
+    from flext_cli.sessions import FlextCliSessionStore
     from flext_cli.settings import FlextCliSettings
+    from flext_cli.settings_cache import FlextCliSettingsCache
+    from flext_cli.shell import FlextCliShell
+    from flext_cli.startup import FlextCliStartupProfiler
     from flext_cli.typings import FlextCliTypes, FlextCliTypes as t
     from flext_cli.utilities import FlextCliUtilities, FlextCliUtilities as u
 
 # Lazy import mapping: export_name -> (module_path, attr_name)
 _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "AsyncMiddlewareChain": (
+        "flext_cli.middleware",
+        "FlextCliAsyncMiddlewareChain",
+    ),
+    "AsyncRetryMiddleware": (
+        "flext_cli.middleware",
+        "FlextCliAsyncRetryMiddleware",
+    ),
+    "AsyncRunner": ("flext_cli.middleware", "FlextCliAsyncRunner"),
+    "BulkheadMiddleware": ("flext_cli.middleware", "FlextCliBulkheadMiddleware"),
+    "CacheMiddleware": ("flext_cli.middleware", "FlextCliCacheMiddleware"),
+    "CircuitBreakerMiddleware": (
+        "flext_cli.middleware",
+        "FlextCliCircuitBreakerMiddleware",
+    ),
     "FlextCli": ("flext_cli.api", "FlextCli"),
     "FlextCliAppBase": ("flext_cli.app_base", "FlextCliAppBase"),
+    "FlextCliBatchRunner": ("flext_cli.batch", "FlextCliBatchRunner"),
     "FlextCliCli": ("flext_cli.cli", "FlextCliCli"),
     "FlextCliCmd": ("flext_cli.services.cmd", "FlextCliCmd"),
+    "FlextCliCommandPipeline": ("flext_cli.commands", "FlextCliCommandPipeline"),
     "FlextCliCommands": ("flext_cli.commands", "FlextCliCommands"),
     "FlextCliCommonParams": ("flext_cli.cli_params", "FlextCliCommonParams"),
+    "FlextCliCompletionCache": ("flext_cli.completion", "FlextCliCompletionCache"),
+    "FlextCliConfigEngine": ("flext_cli.config_engine", "FlextCliConfigEngine"),
     "FlextCliConstants": ("flext_cli.constants", "FlextCliConstants"),
     "FlextCliCore": ("flext_cli.services.core", "FlextCliCore"),
+    "FlextCliDaemon": ("flext_cli.daemon", "FlextCliDaemon"),
     "FlextCliDebug": ("flext_cli.debug", "FlextCliDebug"),
+    "FlextCliExecutionMetrics": ("flext_cli.metrics", "FlextCliExecutionMetrics"),
+    "FlextCliFileCacheStore": ("flext_cli.cache", "FlextCliFileCacheStore"),
+    "FlextCliFileTokenBucket": ("flext_cli.rate_limit", "FlextCliFileTokenBucket"),
     "FlextCliFileTools": ("flext_cli.file_tools", "FlextCliFileTools"),
     "FlextCliFormatters": ("flext_cli.formatters", "FlextCliFormatters"),
+    "FlextCliLatencyHistogram": ("flext_cli.metrics", "FlextCliLatencyHistogram"),
+    "FlextCliLazyCommand": ("flext_cli.app_base", "FlextCliLazyCommand"),
+    "FlextCliMemoryCacheStore": ("flext_cli.cache", "FlextCliMemoryCacheStore"),
+    "FlextCliMetricsRegistry": ("flext_cli.metrics", "FlextCliMetricsRegistry"),
     "FlextCliMixins": ("flext_cli.mixins", "FlextCliMixins"),
     "FlextCliModels": ("flext_cli.models", "FlextCliModels"),
+    "FlextCliOpenMetricsExporter": (
+        "flext_cli.metrics",
+        "FlextCliOpenMetricsExporter",
+    ),
     "FlextCliOptionGroup": ("flext_cli.option_groups", "FlextCliOptionGroup"),
     "FlextCliOutput": ("flext_cli.services.output", "FlextCliOutput"),
     "FlextCliPrompts": ("flext_cli.services.prompts", "FlextCliPrompts"),
     "FlextCliProtocols": ("flext_cli.protocols", "FlextCliProtocols"),
     "FlextCliServiceBase": ("flext_cli.base", "FlextCliServiceBase"),
+    "FlextCliSessionStore": ("flext_cli.sessions", "FlextCliSessionStore"),
     "FlextCliSettings": ("flext_cli.settings", "FlextCliSettings"),
+    "FlextCliSettingsCache": ("flext_cli.settings_cache", "FlextCliSettingsCache"),
+    "FlextCliShell": ("flext_cli.shell", "FlextCliShell"),
+    "FlextCliStartupProfiler": ("flext_cli.startup", "FlextCliStartupProfiler"),
     "FlextCliTables": ("flext_cli.services.tables", "FlextCliTables"),
+    "FlextCliTokenBucket": ("flext_cli.rate_limit", "FlextCliTokenBucket"),
     "FlextCliTypes": ("flext_cli.typings", "FlextCliTypes"),
     "FlextCliUtilities": ("flext_cli.utilities", "FlextCliUtilities"),
     "FlextCommandBuilder": ("flext_cli.command_builder", "FlextCliCommandBuilder"),
     "FlextMiddleware": ("flext_cli.middleware", "FlextCliMiddleware"),
     "FlextOptionGroup": ("flext_cli.option_groups", "FlextCliOptionGroup"),
     "LoggingMiddleware": ("flext_cli.middleware", "FlextCliLoggingMiddleware"),
+    "MiddlewareChain": ("flext_cli.middleware", "FlextCliMiddlewareChain"),
+    "RateLimitMiddleware": ("flext_cli.middleware", "FlextCliRateLimitMiddleware"),
     "RetryMiddleware": ("flext_cli.middleware", "FlextCliRetryMiddleware"),
+    "TimingMiddleware": ("flext_cli.middleware", "FlextCliTimingMiddleware"),
     "ValidationMiddleware": ("flext_cli.middleware", "FlextCliValidationMiddleware"),
     "__version__": ("flext_cli.__version__", "__version__"),
     "__version_info__": ("flext_cli.__version__", "__version_info__"),
@@ -97,33 +161,60 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
 }
 
 __all__ = [
+    "AsyncMiddlewareChain",
+    "AsyncRetryMiddleware",
+    "AsyncRunner",
+    "BulkheadMiddleware",
+    "CacheMiddleware",
+    "CircuitBreakerMiddleware",
     "FlextCli",
     "FlextCliAppBase",
+    "FlextCliBatchRunner",
     "FlextCliCli",
     "FlextCliCmd",
+    "FlextCliCommandPipeline",
     "FlextCliCommands",
     "FlextCliCommonParams",
+    "FlextCliCompletionCache",
+    "FlextCliConfigEngine",
     "FlextCliConstants",
     "FlextCliCore",
+    "FlextCliDaemon",
     "FlextCliDebug",
+    "FlextCliExecutionMetrics",
+    "FlextCliFileCacheStore",
+    "FlextCliFileTokenBucket",
     "FlextCliFileTools",
     "FlextCliFormatters",
+    "FlextCliLatencyHistogram",
+    "FlextCliLazyCommand",
+    "FlextCliMemoryCacheStore",
+    "FlextCliMetricsRegistry",
     "FlextCliMixins",
     "FlextCliModels",
+    "FlextCliOpenMetricsExporter",
     "FlextCliOptionGroup",
     "FlextCliOutput",
     "FlextCliPrompts",
     "FlextCliProtocols",
     "FlextCliServiceBase",
+    "FlextCliSessionStore",
     "FlextCliSettings",
+    "FlextCliSettingsCache",
+    "FlextCliShell",
+    "FlextCliStartupProfiler",
     "FlextCliTables",
+    "FlextCliTokenBucket",
     "FlextCliTypes",
     "FlextCliUtilities",
     "FlextCommandBuilder",
     "FlextMiddleware",
     "FlextOptionGroup",
     "LoggingMiddleware",
+    "MiddlewareChain",
+    "RateLimitMiddleware",
     "RetryMiddleware",
+    "TimingMiddleware",
     "ValidationMiddleware",
     "__version__",
     "__version_info__",
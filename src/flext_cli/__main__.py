@@ -0,0 +1,173 @@
+"""Developer entry point: ``flext-cli`` / ``python -m flext_cli``.
+
+Subcommands:
+    profile-startup    Import-time profile of a cold start, with an optional
+                       budget check for CI (exit status 1 when exceeded).
+    completion-script  Print the bash/zsh/fish script that completes an app
+                       from its completion cache, without starting the app.
+    daemon             Warm daemon of a ``module:AppClass`` app: ``serve``
+                       it, ``run`` a command cold (starting the daemon),
+                       ``stop`` it, or print the ``client`` command line.
+
+The entry point uses ``argparse`` so that the tool itself stays cheap to
+start; the profiled target is imported in a separate interpreter.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import argparse
+import shlex
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from flext_cli import c
+from flext_cli.completion import FlextCliCompletionCache
+from flext_cli.startup import FlextCliStartupProfiler
+
+_PROFILE_FAILED_EXIT, _BUDGET_EXCEEDED_EXIT, _SCRIPT_FAILED_EXIT = (2, 1, 2)
+
+
+def _parser() -> argparse.ArgumentParser:
+    defaults = c.Cli.StartupProfileDefaults
+    parser = argparse.ArgumentParser(prog="flext-cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+    profile = commands.add_parser(
+        "profile-startup", help="Profile the import time of a cold start"
+    )
+    _ = profile.add_argument(
+        "target",
+        nargs="?",
+        default=defaults.TARGET,
+        help="Module to import, or 'module:attribute' (default: %(default)s)",
+    )
+    _ = profile.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help=f"Fail when imports exceed this (CI default: {defaults.BUDGET_MS})",
+    )
+    _ = profile.add_argument("--runs", type=int, default=defaults.RUNS)
+    _ = profile.add_argument("--top", type=int, default=defaults.TOP)
+    _ = profile.add_argument(
+        "--json", action="store_true", help="Print the profile as JSON"
+    )
+    completion = commands.add_parser(
+        "completion-script", help="Print a shell script completing an app"
+    )
+    _ = completion.add_argument("app", help="Program name of the app")
+    _ = completion.add_argument(
+        "--shell",
+        choices=sorted(c.Cli.CompletionDefaults.SCRIPTS),
+        default=c.Cli.CompletionDefaults.DEFAULT_SHELL,
+    )
+    _ = completion.add_argument(
+        "--config-dir",
+        type=Path,
+        default=None,
+        help="Config dir holding the cache (default: the settings' config_dir)",
+    )
+    _add_daemon_parser(commands)
+    return parser
+
+
+def _add_daemon_parser(
+    commands: argparse._SubParsersAction[argparse.ArgumentParser],
+) -> None:
+    daemon = commands.add_parser("daemon", help="Warm daemon (fork server) of an app")
+    actions = daemon.add_subparsers(dest="action", required=True)
+    for action, help_text in (
+        ("serve", "Pre-import the app and serve requests until idle"),
+        ("run", "Run a command in-process and start the daemon for later calls"),
+        ("stop", "Ask a running daemon to exit"),
+        ("client", "Print the command line that runs the app through the daemon"),
+    ):
+        parser = actions.add_parser(action, help=help_text)
+        _ = parser.add_argument("target", help="App class as 'module:AppClass'")
+        _ = parser.add_argument(
+            "--socket",
+            type=Path,
+            default=None,
+            help="Unix socket (default: <config_dir>/daemon/<target>.sock)",
+        )
+        _ = parser.add_argument(
+            "--idle-timeout",
+            type=float,
+            default=c.Cli.DaemonDefaults.IDLE_TIMEOUT,
+            help="Seconds without requests before the daemon exits",
+        )
+        if action == "run":
+            _ = parser.add_argument(
+                "--no-spawn", action="store_true", help="Do not start a daemon"
+            )
+            _ = parser.add_argument("args", nargs=argparse.REMAINDER)
+
+
+def _config_dir() -> Path:
+    from flext_cli.settings import FlextCliSettings
+
+    return FlextCliSettings.get_global().config_dir
+
+
+def _daemon(args: argparse.Namespace) -> int:
+    from flext_cli.daemon import FlextCliDaemon
+
+    socket_path: Path | None = args.socket
+    if socket_path is None:
+        socket_path = FlextCliDaemon.default_socket(args.target, _config_dir())
+    daemon = FlextCliDaemon(args.target, socket_path, args.idle_timeout)
+    if args.action == "run":
+        command = args.args[1:] if args.args[:1] == ["--"] else args.args
+        return daemon.run_cold(command, spawn=not args.no_spawn)
+    if args.action == "client":
+        _ = sys.stdout.write(shlex.join(daemon.client_command()) + "\n")
+        return 0
+    result = daemon.serve() if args.action == "serve" else daemon.stop()
+    if result.is_failure:
+        _ = sys.stderr.write(f"{result.error}\n")
+        return c.Cli.DaemonDefaults.FAILURE_EXIT
+    return 0
+
+
+def _completion_script(args: argparse.Namespace) -> int:
+    config_dir: Path | None = args.config_dir
+    if config_dir is None:
+        config_dir = _config_dir()
+    script = FlextCliCompletionCache(args.app, config_dir).script(args.shell)
+    if script.is_failure:
+        _ = sys.stderr.write(f"{script.error}\n")
+        return _SCRIPT_FAILED_EXIT
+    _ = sys.stdout.write(script.value)
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the ``flext-cli`` developer tool; returns the exit status."""
+    args = _parser().parse_args(argv)
+    if args.command == "completion-script":
+        return _completion_script(args)
+    if args.command == "daemon":
+        return _daemon(args)
+    profiled = FlextCliStartupProfiler.profile(args.target, runs=args.runs)
+    if profiled.is_failure:
+        _ = sys.stderr.write(f"{profiled.error}\n")
+        return _PROFILE_FAILED_EXIT
+    profile = profiled.value
+    if args.json:
+        _ = sys.stdout.write(profile.model_dump_json(indent=2) + "\n")
+    else:
+        report = FlextCliStartupProfiler.format_report(profile, top=args.top)
+        _ = sys.stdout.write(report + "\n")
+    if args.budget_ms is not None:
+        checked = FlextCliStartupProfiler.check_budget(profile, args.budget_ms)
+        if checked.is_failure:
+            _ = sys.stderr.write(f"{checked.error}\n")
+            return _BUDGET_EXCEEDED_EXIT
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
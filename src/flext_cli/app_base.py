@@ -2,7 +2,17 @@
 
 Provides consistent initialization, execution, and error handling for Typer CLIs.
 Subclasses define `app_name`, `app_help` and `config_class` and implement
-`_register_commands()`.
+`_register_commands()`. Commands declared in `lazy_commands` as
+``"module:function"`` targets are imported only when invoked (or when their own
+help is shown), so startup does not pay for every subcommand's dependencies.
+The first top-level ``execute_cli`` of an instance also keeps the app's
+shell-completion cache current (see FlextCliCompletionCache), rewriting it
+when ``app_version`` or the command tree changes.
+``execute_cli(["--batch", FILE])`` (or ``execute_batch``) runs many command
+lines in one process and reports them as NDJSON (see FlextCliBatchRunner);
+``shell()`` opens an interactive prompt over the same commands (FlextCliShell).
+Settings are restored from a validated snapshot while their environment and
+input files are unchanged (see FlextCliSettingsCache).
 
 Copyright (c) 2025 FLEXT Team. All rights reserved.
 SPDX-License-Identifier: MIT
@@ -10,20 +20,126 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import importlib
 import inspect
 import os
 import pathlib
 import sys
 import traceback
-from typing import ClassVar
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, TextIO, override
 
+import click
 import typer
 from click.exceptions import UsageError as ClickUsageError
 from flext_core import FlextLogger, e, r
 
-from flext_cli import FlextCliOutput
+from flext_cli import FlextCliCompletionCache, FlextCliOutput, c
+from flext_cli.__version__ import __version__
+from flext_cli.batch import FlextCliBatchRunner
 from flext_cli.cli import FlextCliCli
+from flext_cli.metrics import FlextCliOpenMetricsExporter
 from flext_cli.settings import FlextCliSettings
+from flext_cli.settings_cache import FlextCliSettingsCache
+
+if TYPE_CHECKING:
+    from flext_cli.shell import FlextCliShell
+
+
+class FlextCliLazyCommand(click.Command):
+    """Placeholder for a ``"module:attribute"`` command imported on first use.
+
+    Group help lists the placeholder with its declared short help; parsing,
+    invocation, completion and the command's own ``--help`` resolve the real
+    command. The target may be a plain function (wrapped like
+    ``@app.command()``), a ``typer.Typer`` sub-application or a Click command.
+    """
+
+    def __init__(self, name: str, target: str, short_help: str = "") -> None:
+        """Initialize the placeholder.
+
+        Args:
+            name: Subcommand name.
+            target: Import path ``"package.module:attribute"``.
+            short_help: Text shown in the parent group's command list.
+
+        """
+        super().__init__(name, short_help=short_help or None)
+        self._target = target
+        self._resolved: click.Command | None = None
+
+    @property
+    def is_resolved(self) -> bool:
+        """Whether the target has been imported."""
+        return self._resolved is not None
+
+    @property
+    def target(self) -> str:
+        """Import path of the command."""
+        return self._target
+
+    def resolve(self) -> click.Command:
+        """Import the target and build its Click command (once).
+
+        Raises:
+            ClickUsageError: If the target cannot be imported.
+
+        """
+        if self._resolved is not None:
+            return self._resolved
+        defaults = c.Cli.LazyCommandDefaults
+        name = self.name or ""
+        module_name, _, attribute = self._target.partition(defaults.TARGET_SEPARATOR)
+        if not module_name or not attribute:
+            raise ClickUsageError(
+                defaults.INVALID_TARGET_MESSAGE.format(name=name, target=self._target)
+            )
+        try:
+            loaded = getattr(importlib.import_module(module_name), attribute)
+        except (ImportError, AttributeError) as exc:
+            raise ClickUsageError(
+                defaults.LOAD_FAILED_MESSAGE.format(
+                    name=name, target=self._target, error=exc
+                )
+            ) from exc
+        if isinstance(loaded, click.Command):
+            command = loaded
+        elif isinstance(loaded, typer.Typer):
+            command = typer.main.get_command(loaded)
+        else:
+            app = typer.Typer()
+            _ = app.command(name=name)(loaded)
+            command = typer.main.get_command(app)
+        command.name = name
+        self._resolved = command
+        return command
+
+    @override
+    def get_params(self, ctx: click.Context) -> list[click.Parameter]:
+        return self.resolve().get_params(ctx)
+
+    @override
+    def invoke(self, ctx: click.Context) -> object:
+        return self.resolve().invoke(ctx)
+
+    @override
+    def make_context(
+        self,
+        info_name: str | None,
+        args: list[str],
+        parent: click.Context | None = None,
+        **extra: object,
+    ) -> click.Context:
+        # The context belongs to the real command, so the group invokes it
+        # (and renders its help) directly.
+        return self.resolve().make_context(info_name, args, parent, **extra)
+
+    @override
+    def shell_complete(
+        self, ctx: click.Context, incomplete: str
+    ) -> list[click.shell_completion.CompletionItem]:
+        return self.resolve().shell_complete(ctx, incomplete)
 
 
 class FlextCliAppBase[SettingsT: FlextCliSettings]:
@@ -32,25 +148,55 @@ class FlextCliAppBase[SettingsT: FlextCliSettings]:
     Fornece inicialização, execução e tratamento de erros consistentes para CLIs
     Typer. Subclasses definem `app_name`, `app_help` e `config_class` e
     implementam `_register_commands()`.
+
+    Subcomandos pesados podem ser declarados em `lazy_commands` como
+    ``{"name": "module:function"}`` ou ``{"name": ("module:function", "help")}``
+    e só são importados quando usados.
+
+    A primeira chamada de `execute_cli` de cada instância regrava o cache de
+    completion do shell se ele não existir ou se `app_version` ou a árvore de
+    comandos mudou (`completion_cache = False` desativa).
+
+    `execute_cli(["--batch", "comandos.txt", "--batch-workers", "4"])` executa
+    várias linhas de comando no mesmo processo e emite NDJSON por linha;
+    `shell().run()` abre um prompt interativo com completion e histórico.
+
+    As settings são reconstruídas de um snapshot validado enquanto o ambiente e
+    os arquivos de entrada não mudam (`settings_cache = False` desativa).
     """
 
     app_name: ClassVar[str]
     app_help: ClassVar[str]
+    app_version: ClassVar[str] = ""
+    completion_cache: ClassVar[bool] = True
+    settings_cache: ClassVar[bool] = True
+    lazy_commands: ClassVar[Mapping[str, str | tuple[str, str]]] = {}
     config_class: type[SettingsT]
     logger: FlextLogger
     _output: FlextCliOutput
     _cli: FlextCliCli
     _app: typer.Typer
     _config: SettingsT
+    _metrics_exporter: FlextCliOpenMetricsExporter | None
+    _lazy_commands: dict[str, FlextCliLazyCommand]
+    _completion_refreshed: bool
 
     def __init__(self) -> None:
         """Initialize CLI with FlextCli infrastructure."""
         super().__init__()
+        self._lazy_commands = {}
+        self._completion_refreshed = False
+        for name, entry in self.lazy_commands.items():
+            target, short_help = (entry, "") if isinstance(entry, str) else entry
+            self.register_lazy_command(name, target, short_help)
         self.logger = FlextLogger(__name__)
         self._output = FlextCliOutput()
         self._cli = FlextCliCli()
-        self._config = self.config_class.get_global()
+        self._config = self._load_settings()
         self.logger.debug("CLI configuration loaded", app_name=self.app_name)
+        self._metrics_exporter = FlextCliOpenMetricsExporter.from_settings(self._config)
+        if self._metrics_exporter is not None:
+            _ = self._metrics_exporter.start()
         self._app = self._cli.create_app_with_common_params(
             name=self.app_name,
             help_text=self.app_help,
@@ -62,6 +208,12 @@ class FlextCliAppBase[SettingsT: FlextCliSettings]:
         except NameError as ne:
             self._handle_pathlib_annotation_error(ne)
 
+    def _load_settings(self) -> SettingsT:
+        """Global settings, from the snapshot cache unless it is disabled."""
+        if not self.settings_cache:
+            return self.config_class.get_global()
+        return FlextCliSettingsCache(self.app_name, self.config_class).load_global()
+
     @staticmethod
     def _handle_pathlib_annotation_error(ne: NameError) -> None:
         """Handle Typer annotation issues with pathlib.Path in Python <3.10."""
@@ -84,30 +236,170 @@ class FlextCliAppBase[SettingsT: FlextCliSettings]:
             return sys.argv[1:] if len(sys.argv) > 1 else []
         return args
 
+    def click_command(self) -> click.Command:
+        """Build the Click command of the app, with lazy placeholders attached.
+
+        Lazy commands never shadow commands registered eagerly under the same
+        name.
+        """
+        command = typer.main.get_command(self._app)
+        if isinstance(command, click.Group):
+            for name, lazy in self._lazy_commands.items():
+                if name not in command.commands:
+                    command.add_command(lazy, name)
+        return command
+
+    def register_lazy_command(
+        self, name: str, target: str, short_help: str = ""
+    ) -> FlextCliLazyCommand:
+        """Declare a subcommand imported from ``target`` on first use.
+
+        Args:
+            name: Subcommand name.
+            target: Import path ``"package.module:function"``.
+            short_help: Text listed in the app help without importing.
+
+        Returns:
+            FlextCliLazyCommand: The placeholder added to the app.
+
+        """
+        lazy = FlextCliLazyCommand(name, target, short_help)
+        self._lazy_commands[name] = lazy
+        return lazy
+
     def execute_cli(self, args: list[str] | None = None) -> r[bool]:
-        """Execute the CLI with Railway-pattern error handling."""
+        """Execute the CLI with Railway-pattern error handling.
+
+        Arguments starting with ``--batch`` run a batch instead (see
+        ``execute_batch``): ``--batch FILE|- [--batch-workers N]``.
+        """
+        resolved = FlextCliAppBase._resolve_cli_args(args)
+        batch_option = c.Cli.BatchDefaults.OPTION
+        if resolved and resolved[0].partition("=")[0] == batch_option:
+            return self._execute_batch_args(resolved)
+        return self._execute_args(resolved, refresh_completion=True)
+
+    def execute_batch(
+        self,
+        source: Path | TextIO,
+        *,
+        workers: int = c.Cli.BatchDefaults.WORKERS,
+        output: TextIO | None = None,
+    ) -> r[bool]:
+        """Run every command line of ``source`` and write NDJSON results.
+
+        Args:
+            source: File of shell-quoted command lines, or an open stream.
+            workers: Commands run at once (forked from this process when > 1).
+            output: Stream receiving one JSON record per command (stdout).
+
+        Returns:
+            r[bool]: Success when every command succeeded.
+
+        """
+        runner = FlextCliBatchRunner(self._execute_args, self._config, workers=workers)
+        stream = output if output is not None else sys.stdout
+        if not isinstance(source, Path):
+            return runner.run(source, stream)
+        try:
+            with source.open(encoding=c.Cli.Utilities.DEFAULT_ENCODING) as lines:
+                return runner.run(lines, stream)
+        except OSError as exc:
+            return r[bool].fail(
+                c.Cli.BatchDefaults.READ_FAILED_MESSAGE.format(path=source, error=exc)
+            )
+
+    def shell(
+        self, *, history_size: int = c.Cli.ShellDefaults.HISTORY_SIZE
+    ) -> FlextCliShell:
+        """Interactive shell running this app's commands in this process.
+
+        History is kept under ``config_dir/history/<app_name>.history``.
+        """
+        from flext_cli.shell import FlextCliShell
+
+        defaults = c.Cli.ShellDefaults
+        return FlextCliShell(
+            self._execute_args,
+            FlextCliCompletionCache.dump_tree(self.click_command()),
+            prompt=f"{self.app_name}{defaults.PROMPT_SUFFIX}",
+            settings=self._config,
+            history_size=history_size,
+            history_path=self._config.config_dir
+            / defaults.HISTORY_DIR
+            / f"{self.app_name}{defaults.HISTORY_SUFFIX}",
+        )
+
+    def _execute_batch_args(self, args: list[str]) -> r[bool]:
+        """Run ``--batch FILE|- [--batch-workers N]``."""
+        defaults = c.Cli.BatchDefaults
+        values = {defaults.OPTION: "", defaults.WORKERS_OPTION: str(defaults.WORKERS)}
+        remaining = iter(args)
+        for arg in remaining:
+            name, separator, value = arg.partition("=")
+            if name not in values:
+                return r[bool].fail(defaults.USAGE_MESSAGE)
+            values[name] = value if separator else next(remaining, "")
+        source, workers = values[defaults.OPTION], values[defaults.WORKERS_OPTION]
+        if not source or not workers.isdigit() or int(workers) < 1:
+            return r[bool].fail(defaults.USAGE_MESSAGE)
+        return self.execute_batch(
+            sys.stdin if source == defaults.STDIN_SOURCE else Path(source),
+            workers=int(workers),
+        )
+
+    def execute_cli_status(self, args: list[str] | None = None) -> int:
+        """Execute the CLI like ``execute_cli`` and return its exit status.
+
+        The status is the one the command exited with (``typer.Exit(code)``,
+        2 for usage errors), 0 on success and 1 for other failures.
+        """
+        resolved = FlextCliAppBase._resolve_cli_args(args)
+        batch_option = c.Cli.BatchDefaults.OPTION
+        if resolved and resolved[0].partition("=")[0] == batch_option:
+            failed = self._execute_batch_args(resolved).is_failure
+            return c.Cli.CliDefaults.FAILURE_EXIT if failed else 0
+        return self._execute_status(resolved, refresh_completion=True)[0]
+
+    def _execute_args(
+        self, args: list[str], *, refresh_completion: bool = False
+    ) -> r[bool]:
+        """Run one command line in-process.
+
+        Only top-level calls pass ``refresh_completion``; batch lines, shell
+        commands and daemon children reuse the cache checked by their process.
+        """
+        return self._execute_status(args, refresh_completion=refresh_completion)[1]
+
+    def _execute_status(
+        self, args: list[str], *, refresh_completion: bool = False
+    ) -> tuple[int, r[bool]]:
+        """Run one command line in-process; return its exit status and result."""
+        failure = c.Cli.CliDefaults.FAILURE_EXIT
         try:
             sys.modules["pathlib"] = pathlib
             frame = inspect.currentframe()
             if frame and "pathlib" not in frame.f_globals:
                 frame.f_globals["pathlib"] = pathlib
-            resolved_args = FlextCliAppBase._resolve_cli_args(args)
-            self._app(args=resolved_args, standalone_mode=True)
-            return r[bool].ok(value=True)
+            self._run_app(args, refresh_completion=refresh_completion)
+            return 0, r[bool].ok(value=True)
         except NameError as name_err:
             if "pathlib" in str(name_err):
                 error_msg = f"CLI annotation evaluation error: {name_err!s}"
                 self._output.print_error(error_msg)
-                return r[bool].fail(error_msg)
+                return failure, r[bool].fail(error_msg)
             raise
         except SystemExit as sys_exit:
-            if sys_exit.code == 0:
-                return r[bool].ok(value=True)
-            return r[bool].fail(f"CLI execution failed with code {sys_exit.code}")
+            if sys_exit.code in {0, None}:
+                return 0, r[bool].ok(value=True)
+            status = sys_exit.code if isinstance(sys_exit.code, int) else failure
+            return status, r[bool].fail(
+                f"CLI execution failed with code {sys_exit.code}"
+            )
         except ClickUsageError as exc:
             error_msg = f"CLI execution error: {exc!s}"
             self._output.print_error(error_msg)
-            return r[bool].fail(error_msg)
+            return exc.exit_code, r[bool].fail(error_msg)
         except (
             ValueError,
             KeyError,
@@ -120,7 +412,55 @@ class FlextCliAppBase[SettingsT: FlextCliSettings]:
             tb = traceback.format_exc()
             error_msg = f"CLI execution error: {exc!s}\nTraceback:\n{tb}"
             self._output.print_error(error_msg)
-            return r[bool].fail(f"CLI execution error: {exc!s}")
+            return failure, r[bool].fail(f"CLI execution error: {exc!s}")
+
+    def completion(self) -> FlextCliCompletionCache:
+        """Shell-completion cache of the app, under the configured config dir."""
+        return FlextCliCompletionCache(self.app_name, self._config.config_dir)
+
+    def refresh_completion_cache(self, command: click.Command | None = None) -> r[bool]:
+        """Rewrite the completion cache if it is missing or stale.
+
+        The check runs at most once per instance (a no-op afterwards and when
+        ``completion_cache`` is False).
+
+        Args:
+            command: The app's Click command, if already built.
+
+        Returns:
+            r[bool]: True if the file was (re)written.
+
+        """
+        if not self.completion_cache or self._completion_refreshed:
+            return r[bool].ok(value=False)
+        self._completion_refreshed = True
+        return self.completion().ensure(
+            lambda: command if command is not None else self.click_command(),
+            f"{self.app_version}+flext-cli-{__version__}",
+        )
+
+    def _run_app(self, args: list[str], *, refresh_completion: bool = False) -> None:
+        """Run the Typer app, or its Click command when lazy commands exist.
+
+        With ``refresh_completion`` the completion cache is checked first,
+        from the same Click command that then runs.
+        """
+        refresh = (
+            refresh_completion
+            and self.completion_cache
+            and not self._completion_refreshed
+        )
+        if not refresh and not self._lazy_commands:
+            self._app(args=args, standalone_mode=True)
+            return
+        command = self.click_command()
+        if refresh:
+            refreshed = self.refresh_completion_cache(command)
+            if refreshed.is_failure:
+                self.logger.debug(
+                    "Completion cache not refreshed", error=str(refreshed.error)
+                )
+        _ = command.main(args=args, standalone_mode=True)
 
     def _register_commands(self) -> None:
         """Register CLI commands - implement in subclass."""
@@ -0,0 +1,239 @@
+"""Batch execution of many command lines inside one warm process.
+
+FlextCliBatchRunner reads shell-quoted command lines (one argv per line,
+``#`` comments and blank lines skipped) and runs each through an app's
+execution function, writing one NDJSON record per line with its exit code,
+error, captured stdout/stderr and duration. Settings changed by a command
+(for example by ``--verbose``) are restored before the next one; the logging
+configuration that ``--debug``/``--log-level`` apply is process-wide and is
+not, so a later line keeps logging at that level. With more than one worker
+each command runs in a child forked from the warm process, which isolates
+settings, logging and module state completely; each child reports its record
+through a pipe and records are written in completion order (the ``line``
+field keeps the input position).
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import io
+import json
+import os
+import selectors
+import shlex
+import time
+from collections.abc import Callable, Generator, Iterable, Iterator
+from typing import NoReturn, TextIO
+
+from flext_core import r
+from pydantic import BaseModel
+
+from flext_cli import c
+
+type _Record = dict[str, object]
+# Forked worker: pid, line number, argv and the record bytes read so far.
+type _Worker = tuple[int, int, list[str], bytearray]
+
+
+class FlextCliBatchRunner:
+    """Runs command lines of one app sequentially or on forked workers.
+
+    Example:
+        >>> runner = FlextCliBatchRunner(app.execute_cli, settings, workers=4)
+        >>> with Path("commands.txt").open() as lines:
+        ...     runner.run(lines, sys.stdout)  # NDJSON, one record per line
+
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[list[str]], r[bool]],
+        settings: BaseModel | None = None,
+        *,
+        workers: int = c.Cli.BatchDefaults.WORKERS,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            execute: Runs one argv in-process (typically the app's CLI entry).
+            settings: Settings restored after each command.
+            workers: Commands run at once; above 1, each one is forked.
+
+        """
+        super().__init__()
+        self._execute = execute
+        self._settings = settings
+        self._workers = max(1, workers)
+
+    @staticmethod
+    def parse_lines(lines: Iterable[str]) -> Iterator[tuple[int, list[str] | str]]:
+        """Yield ``(line_number, argv)``, or the parse error instead of argv."""
+        for number, line in enumerate(lines, start=1):
+            try:
+                argv = shlex.split(line, comments=True)
+            except ValueError as exc:
+                yield number, c.Cli.BatchDefaults.PARSE_FAILED_MESSAGE.format(error=exc)
+                continue
+            if argv:
+                yield number, argv
+
+    @staticmethod
+    def _record(
+        line: int,
+        argv: list[str],
+        exit_code: int,
+        error: str | None,
+        output: tuple[str, str] = ("", ""),
+        duration_ms: float = 0.0,
+    ) -> _Record:
+        defaults = c.Cli.BatchDefaults
+        return {
+            defaults.KEY_LINE: line,
+            defaults.KEY_ARGV: argv,
+            defaults.KEY_EXIT_CODE: exit_code,
+            defaults.KEY_ERROR: error,
+            defaults.KEY_STDOUT: output[0],
+            defaults.KEY_STDERR: output[1],
+            defaults.KEY_DURATION_MS: round(duration_ms, 3),
+        }
+
+    def records(self, lines: Iterable[str]) -> Iterator[_Record]:
+        """Run every command line and yield its result record."""
+        parsed = self.parse_lines(lines)
+        if self._workers > 1 and hasattr(os, "fork"):
+            yield from self._run_forked(parsed)
+            return
+        for line, argv in parsed:
+            yield (
+                self.run_line(line, argv)
+                if isinstance(argv, list)
+                else self._record(line, [], c.Cli.BatchDefaults.USAGE_EXIT, argv)
+            )
+
+    def run(self, lines: Iterable[str], output: TextIO) -> r[bool]:
+        """Write the NDJSON records of ``lines`` to ``output``.
+
+        Returns:
+            r[bool]: Success when every command succeeded.
+
+        """
+        defaults = c.Cli.BatchDefaults
+        total = failed = 0
+        for record in self.records(lines):
+            total += 1
+            failed += 1 if record[defaults.KEY_EXIT_CODE] else 0
+            _ = output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+        if failed:
+            return r[bool].fail(
+                defaults.FAILED_MESSAGE.format(failed=failed, total=total)
+            )
+        return r[bool].ok(value=True)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def restored_settings(settings: BaseModel | None) -> Generator[None]:
+        """Undo, on exit, every settings field changed inside the block.
+
+        Values are deep-copied, so in-place changes to nested models and
+        containers are undone as well.
+        """
+        saved = (
+            {
+                name: copy.deepcopy(getattr(settings, name))
+                for name in type(settings).model_fields
+            }
+            if settings is not None
+            else {}
+        )
+        try:
+            yield
+        finally:
+            for name, value in saved.items():
+                if getattr(settings, name) != value:
+                    setattr(settings, name, value)
+
+    def run_line(self, line: int, argv: list[str]) -> _Record:
+        """Run one argv with captured output and restored settings."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        started = time.perf_counter()
+        with (
+            self.restored_settings(self._settings),
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+        ):
+            result = self._execute(argv)
+        return self._record(
+            line,
+            argv,
+            0 if result.is_success else c.Cli.BatchDefaults.FAILURE_EXIT,
+            None if result.is_success else result.error,
+            (stdout.getvalue(), stderr.getvalue()),
+            (time.perf_counter() - started) * 1000,
+        )
+
+    def _run_forked(
+        self, parsed: Iterator[tuple[int, list[str] | str]]
+    ) -> Iterator[_Record]:
+        with selectors.DefaultSelector() as selector:
+            for line, argv in parsed:
+                if not isinstance(argv, list):
+                    yield self._record(line, [], c.Cli.BatchDefaults.USAGE_EXIT, argv)
+                    continue
+                while len(selector.get_map()) >= self._workers:
+                    yield from self._reap(selector)
+                read_fd, write_fd = os.pipe()
+                pid = os.fork()
+                if pid == 0:
+                    os.close(read_fd)
+                    self._run_child(write_fd, line, argv)
+                os.close(write_fd)
+                worker: _Worker = (pid, line, argv, bytearray())
+                _ = selector.register(read_fd, selectors.EVENT_READ, worker)
+            while selector.get_map():
+                yield from self._reap(selector)
+
+    def _run_child(self, write_fd: int, line: int, argv: list[str]) -> NoReturn:
+        """Run one command in this forked worker and write its record."""
+        status = c.Cli.BatchDefaults.FAILURE_EXIT
+        try:
+            record = self.run_line(line, argv)
+            with os.fdopen(write_fd, "wb") as pipe:
+                _ = pipe.write(json.dumps(record, ensure_ascii=False).encode())
+            status = 0
+        finally:
+            os._exit(status)
+
+    def _reap(self, selector: selectors.BaseSelector) -> Iterator[_Record]:
+        """Block until workers write, and yield the records of finished ones.
+
+        A worker is done when its pipe reaches EOF; it is then waited for.
+        """
+        for key, _ in selector.select():
+            pid, line, argv, data = key.data
+            chunk = os.read(key.fd, c.Cli.BatchDefaults.READ_BYTES)
+            if chunk:
+                data += chunk
+                continue
+            _ = selector.unregister(key.fd)
+            os.close(key.fd)
+            _, status = os.waitpid(pid, 0)
+            if data:
+                record: _Record = json.loads(data)
+                yield record
+                continue
+            yield self._record(
+                line,
+                argv,
+                c.Cli.BatchDefaults.FAILURE_EXIT,
+                c.Cli.BatchDefaults.CRASHED_MESSAGE.format(
+                    status=os.waitstatus_to_exitcode(status)
+                ),
+            )
+
+
+__all__ = ["FlextCliBatchRunner"]
@@ -0,0 +1,253 @@
+"""Result cache stores for flext-cli command results.
+
+FlextCliMemoryCacheStore is a thread-safe in-memory LRU with per-entry TTL and
+FlextCliFileCacheStore persists entries as one JSON file per key (by default
+under ``~/.flext/cache/results``) so cached results survive between process
+runs. Both implement ``p.Cli.ResultCacheStore`` and back
+FlextCliCacheMiddleware; ``None`` is never stored and always means a miss.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+from flext_core import FlextLogger
+from pydantic import TypeAdapter, ValidationError
+
+from flext_cli import c
+
+_JSON_OBJECT_ADAPTER: TypeAdapter[object] = TypeAdapter(object)
+
+
+class FlextCliMemoryCacheStore:
+    """Thread-safe LRU cache with per-entry time-to-live.
+
+    Lookups and inserts are O(1); the least recently used entry is evicted
+    once ``max_entries`` is exceeded and expired entries are dropped when
+    they are read.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = c.Cli.ResultCacheDefaults.MAX_ENTRIES,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries kept.
+            clock: Monotonic time source used for expiry.
+
+        """
+        super().__init__()
+        self._max_entries = max_entries
+        self._clock = clock
+        # key -> (expires_at, value)
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of entries (expired ones included until read)."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def delete(self, key: str) -> bool:
+        """Drop ``key``; returns whether it was present."""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def get(self, key: str) -> object | None:
+        """Return the live value for ``key``, or ``None`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: object, ttl: float) -> bool:
+        """Store ``value`` for ``ttl`` seconds; returns whether it was stored."""
+        if value is None or ttl <= 0:
+            return False
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                _ = self._entries.popitem(last=False)
+        return True
+
+
+class FlextCliFileCacheStore:
+    """Directory-backed cache with one JSON file per key.
+
+    Entries are written atomically (temporary file + rename) and carry their
+    wall-clock expiry, so several processes can share the directory. Values
+    that are not JSON-serializable are not persisted. Once more than
+    ``max_entries`` files exist the oldest (by modification time) are removed.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        *,
+        max_entries: int = c.Cli.ResultCacheDefaults.MAX_FILES,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Cache directory (default: ``~/.flext/cache/results``).
+            max_entries: Maximum number of cache files kept.
+
+        """
+        super().__init__()
+        self._directory = directory or self.default_directory()
+        self._max_entries = max_entries
+        # Files in the directory: counted on the first write, then tracked
+        # (other processes sharing it are accounted for at each eviction).
+        self._file_count: int | None = None
+        self._lock = threading.Lock()
+        self._logger = FlextLogger(__name__)
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the cache files."""
+        return self._directory
+
+    @staticmethod
+    def default_directory() -> Path:
+        """Return ``~/.flext/cache/results``."""
+        return (
+            Path.home()
+            / c.Cli.Paths.FLEXT_DIR_NAME
+            / c.Cli.Subdirectories.CACHE
+            / c.Cli.ResultCacheDefaults.RESULTS_DIR_NAME
+        )
+
+    def clear(self) -> int:
+        """Delete all cache files; returns the number removed."""
+        removed = 0
+        with self._lock:
+            for path in self._files():
+                path.unlink(missing_ok=True)
+                removed += 1
+            self._file_count = 0
+        return removed
+
+    def delete(self, key: str) -> bool:
+        """Delete the file of ``key``; returns whether it existed."""
+        path = self._path(key)
+        existed = path.exists()
+        path.unlink(missing_ok=True)
+        if existed:
+            with self._lock:
+                if self._file_count:
+                    self._file_count -= 1
+        return existed
+
+    def get(self, key: str) -> object | None:
+        """Return the live value for ``key``, or ``None`` on a miss."""
+        defaults = c.Cli.ResultCacheDefaults
+        path = self._path(key)
+        try:
+            payload = _JSON_OBJECT_ADAPTER.validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError):
+            path.unlink(missing_ok=True)
+            return None
+        if not isinstance(payload, Mapping):
+            return None
+        expires_at = payload.get(defaults.KEY_EXPIRES_AT)
+        if not isinstance(expires_at, (int, float)) or expires_at <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return payload.get(defaults.KEY_VALUE)
+
+    def set(self, key: str, value: object, ttl: float) -> bool:
+        """Persist ``value`` for ``ttl`` seconds; returns whether it was stored."""
+        defaults = c.Cli.ResultCacheDefaults
+        if value is None or ttl <= 0:
+            return False
+        try:
+            data = json.dumps({
+                defaults.KEY_EXPIRES_AT: time.time() + ttl,
+                defaults.KEY_VALUE: value,
+            }).encode()
+        except (TypeError, ValueError):
+            return False
+        path = self._path(key)
+        added = not path.exists()
+        try:
+            self._write_atomic(path, data)
+        except OSError as exc:
+            self._logger.warning(
+                "Result cache write failed", operation="set", error=str(exc)
+            )
+            return False
+        if added:
+            self._count_added()
+        return True
+
+    def _count_added(self) -> None:
+        """Track a new file and evict the oldest ones beyond the limit."""
+        with self._lock:
+            if self._file_count is None:
+                self._file_count = len(self._files())
+            else:
+                self._file_count += 1
+            if self._file_count <= self._max_entries:
+                return
+            aged: list[tuple[int, Path]] = []
+            for path in self._files():
+                try:
+                    aged.append((path.stat().st_mtime_ns, path))
+                except FileNotFoundError:
+                    continue
+            aged.sort()
+            excess = max(len(aged) - self._max_entries, 0)
+            for _mtime, path in aged[:excess]:
+                path.unlink(missing_ok=True)
+            self._file_count = len(aged) - excess
+
+    def _files(self) -> list[Path]:
+        return list(self._directory.glob(f"*{c.Cli.ResultCacheDefaults.FILE_SUFFIX}"))
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}{c.Cli.ResultCacheDefaults.FILE_SUFFIX}"
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self._directory, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                _ = f.write(data)
+            _ = tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+__all__ = [
+    "FlextCliFileCacheStore",
+    "FlextCliMemoryCacheStore",
+]
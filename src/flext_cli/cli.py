@@ -23,11 +23,20 @@ import typer
 from click.exceptions import UsageError
 from flext_core import FlextContainer, FlextLogger, FlextRuntime, r
 from pydantic import BaseModel, TypeAdapter, ValidationError
-from rich.errors import ConsoleError, LiveError, StyleError
 from typer import Typer
 from typer.testing import CliRunner
 
-from flext_cli import FlextCliCommonParams, FlextCliSettings, c, m, p, t, u
+from flext_cli import (
+    FlextCliCommonParams,
+    FlextCliFormatters,
+    FlextCliSettings,
+    c,
+    m,
+    p,
+    t,
+    u,
+)
+from flext_cli.middleware import FlextCliAsyncRunner, FlextCliMiddleware
 from flext_cli.typings import FlextCliTypes
 
 
@@ -509,9 +518,7 @@ class FlextCliCli:
                 ValueError,
                 TypeError,
                 KeyError,
-                ConsoleError,
-                StyleError,
-                LiveError,
+                *FlextCliFormatters.rich_errors(),
             ) as exc:
                 logging.getLogger(__name__).debug(
                     "prompt result to dict fallback: %s", exc, exc_info=False
@@ -639,8 +646,15 @@ class FlextCliCli:
     def create_command_decorator(
         self, name: str | None = None, help_text: str | None = None
     ) -> Callable[[p.Cli.CliCommandFunction], click.Command]:
-        """Create a command decorator."""
-        return self._create_command_cli_decorator(name, help_text)
+        """Create a command decorator (``async def`` commands run on a loop)."""
+        decorator = self._create_command_cli_decorator(name, help_text)
+
+        def command_decorator(func: p.Cli.CliCommandFunction) -> click.Command:
+            if FlextCliMiddleware.is_async(func):
+                return decorator(FlextCliAsyncRunner.command(func))
+            return decorator(func)
+
+        return command_decorator
 
     def create_group_decorator(
         self, name: str | None = None, help_text: str | None = None
@@ -6,10 +6,9 @@ from collections.abc import Callable, Mapping
 from typing import ClassVar
 
 from flext_core import r
-from rich.errors import ConsoleError, LiveError, StyleError
 from typer.models import OptionInfo
 
-from flext_cli import FlextCliSettings, c, m, p, u
+from flext_cli import FlextCliFormatters, FlextCliSettings, c, m, p, u
 
 
 class FlextCliCommonParams:
@@ -201,9 +200,7 @@ class FlextCliCommonParams:
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[FlextCliSettings].fail(f"Failed to apply CLI parameters: {e}")
 
@@ -236,9 +233,7 @@ class FlextCliCommonParams:
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[bool].fail(
                 c.Cli.CliParamsErrorMessages.CONFIGURE_LOGGER_FAILED.format(error=e)
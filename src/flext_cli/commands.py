@@ -1,7 +1,8 @@
 """FLEXT CLI Commands - Command registration and execution service.
 
 Command creation and management using flext-core patterns.
-Provides command registration, execution, grouping, and lifecycle management.
+Provides command registration, execution, grouping, and lifecycle management,
+plus streaming pipelines that fan registered commands out over worker pools.
 
 Copyright (c) 2025 FLEXT Team. All rights reserved.
 SPDX-License-Identifier: MIT
@@ -10,14 +11,19 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import logging
-from collections.abc import Callable, Mapping, Sequence
+import asyncio
+import inspect
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from typing import Self, override
 
 from flext_core import r
-from rich.errors import ConsoleError, LiveError, StyleError
 
-from flext_cli import FlextCliServiceBase, c, m, t
+from flext_cli import FlextCliFormatters, FlextCliServiceBase, c, m, t
+from flext_cli.metrics import FlextCliExecutionMetrics
+from flext_cli.middleware import FlextCliAsyncRunner, FlextCliMiddleware
 from flext_cli.typings import FlextCliTypes
 
 FlextCliCommandGroup = m.Cli.CliCommandGroup
@@ -32,6 +38,7 @@ class FlextCliCommands(FlextCliServiceBase):
     - Command execution with arguments
     - Command groups creation
     - Command listing and discovery
+    - Parallel fan-out and multi-stage pipelines
 
     Business Rules:
     ───────────────
@@ -58,18 +65,137 @@ class FlextCliCommands(FlextCliServiceBase):
         self._name = name
         self._description = description
         self._commands: dict[str, FlextCliCommandEntryModel] = {}
+        # Argument binding per command, computed at registration.
+        self._plans: dict[str, FlextCliCommands._BindingPlan] = {}
         self._groups: dict[str, FlextCliCommandGroup] = {}
+        self._metrics = FlextCliExecutionMetrics()
 
     @property
     def description(self) -> str:
         """Return CLI description."""
         return self._description
 
+    @property
+    def execution_metrics(self) -> FlextCliExecutionMetrics:
+        """Per-command execution counts and latency histograms."""
+        return self._metrics
+
     @property
     def name(self) -> str:
         """Return CLI name."""
         return self._name
 
+    class _BindingPlan:
+        """How a handler accepts arguments, computed once from its signature.
+
+        ``positional`` is the number of positional parameters (``None`` for
+        ``*args``) and ``keywords`` the accepted keyword names (``None`` for
+        ``**kwargs``). Handlers whose signature cannot be inspected accept
+        everything.
+        """
+
+        __slots__ = ("handler", "is_async", "keywords", "positional")
+
+        def __init__(self, handler: Callable[..., object]) -> None:
+            super().__init__()
+            self.handler = handler
+            self.is_async = FlextCliMiddleware.is_async(handler)
+            self.positional: int | None = None
+            self.keywords: frozenset[str] | None = None
+            try:
+                parameters = inspect.signature(handler).parameters.values()
+            except (TypeError, ValueError):
+                return
+            kinds = {param.kind for param in parameters}
+            if inspect.Parameter.VAR_POSITIONAL not in kinds:
+                self.positional = sum(
+                    1
+                    for param in parameters
+                    if param.kind
+                    in {
+                        inspect.Parameter.POSITIONAL_ONLY,
+                        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    }
+                )
+            if inspect.Parameter.VAR_KEYWORD not in kinds:
+                self.keywords = frozenset(
+                    param.name
+                    for param in parameters
+                    if param.kind
+                    in {
+                        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        inspect.Parameter.KEYWORD_ONLY,
+                    }
+                )
+
+        def bind(
+            self, args: Sequence[object] | None, kwargs: Mapping[str, object]
+        ) -> tuple[Sequence[object], Mapping[str, object]]:
+            """Drop arguments the handler cannot accept.
+
+            Positional arguments are passed only if they all fit; keyword
+            arguments are filtered to the accepted names.
+            """
+            if not args or (
+                self.positional is not None and len(args) > self.positional
+            ):
+                args = ()
+            if kwargs and self.keywords is not None:
+                kwargs = {k: v for k, v in kwargs.items() if k in self.keywords}
+            return args, kwargs
+
+    @staticmethod
+    def _invoke_handler(
+        name: str,
+        plan: FlextCliCommands._BindingPlan,
+        args: Sequence[object] | None,
+        kwargs: Mapping[str, object],
+    ) -> r[object]:
+        """Call the handler bound by ``plan`` and normalize its result."""
+        try:
+            bound_args, bound_kwargs = plan.bind(args, kwargs)
+            result = plan.handler(*bound_args, **bound_kwargs)
+            if inspect.isawaitable(result):
+                result = FlextCliAsyncRunner.run(result)
+            return FlextCliCommands._normalize_handler_result(result, name)
+        except (
+            ValueError,
+            TypeError,
+            KeyError,
+            *FlextCliFormatters.rich_errors(),
+        ) as e:
+            return r[object].fail(f"Command execution failed: {e}")
+
+    @staticmethod
+    async def _invoke_handler_async(
+        name: str,
+        plan: FlextCliCommands._BindingPlan,
+        args: Sequence[object] | None,
+        kwargs: Mapping[str, object],
+    ) -> r[object]:
+        """Await an async handler bound by ``plan``, like the sync path."""
+        try:
+            bound_args, bound_kwargs = plan.bind(args, kwargs)
+            result = await plan.handler(*bound_args, **bound_kwargs)
+            return FlextCliCommands._normalize_handler_result(result, name)
+        except (
+            ValueError,
+            TypeError,
+            KeyError,
+            *FlextCliFormatters.rich_errors(),
+        ) as e:
+            return r[object].fail(f"Command execution failed: {e}")
+
+    def _binding_plan(
+        self, name: str, handler: Callable[..., object]
+    ) -> FlextCliCommands._BindingPlan:
+        """Return the plan computed at registration, rebuilding it if stale."""
+        plan = self._plans.get(name)
+        if plan is None or plan.handler is not handler:
+            plan = FlextCliCommands._BindingPlan(handler)
+            self._plans[name] = plan
+        return plan
+
     @staticmethod
     def _normalize_handler_result(
         result: r[object] | None, command_name: str
@@ -82,6 +208,38 @@ class FlextCliCommands(FlextCliServiceBase):
         error_value = result.error
         return r[object].fail(str(error_value) if error_value else "Command failed")
 
+    def call_command(self, name: str, /, *args: object, **kwargs: object) -> r[object]:
+        """Execute a registered command with in-process values.
+
+        Unlike `execute_command`, arguments are not limited to command-line
+        strings and scalars, and any keyword (``name`` and ``args`` included)
+        reaches the handler.
+
+        Args:
+            name: Command name to execute.
+            *args: Positional arguments for the command.
+            **kwargs: Keyword arguments for the command.
+
+        Returns:
+            r[object]: Command execution result.
+
+        """
+        if not name.strip():
+            return r[object].fail("Invalid command name")
+        if name not in self._commands:
+            return r[object].fail(f"Command not found: {name}")
+        cmd_info = self._commands[name]
+        handler = cmd_info.handler
+        if not callable(handler):
+            return r[object].fail(f"Handler not callable for: {name}")
+        plan = self._binding_plan(name, handler)
+        start_ns = time.perf_counter_ns()
+        result = FlextCliCommands._invoke_handler(name, plan, args, kwargs)
+        self._metrics.record(
+            name, time.perf_counter_ns() - start_ns, success=result.is_success
+        )
+        return result
+
     def clear_commands(self) -> r[int]:
         """Clear all registered commands.
 
@@ -91,6 +249,7 @@ class FlextCliCommands(FlextCliServiceBase):
         """
         count = len(self._commands)
         self._commands.clear()
+        self._plans.clear()
         self._groups.clear()
         return r[int].ok(count)
 
@@ -161,6 +320,25 @@ class FlextCliCommands(FlextCliServiceBase):
     ) -> r[object]:
         """Execute a registered CLI command.
 
+        Args:
+            name: Command name to execute.
+            args: Positional arguments for the command.
+            **kwargs: Keyword arguments for the command.
+
+        Returns:
+            r[object]: Command execution result.
+
+        """
+        return self.call_command(name, *(args or ()), **kwargs)
+
+    async def execute_command_async(
+        self, name: str, args: Sequence[str] | None = None, **kwargs: t.Scalar
+    ) -> r[object]:
+        """Execute a registered command without blocking the event loop.
+
+        ``async def`` handlers are awaited directly; sync handlers run in a
+        worker thread, so several commands can overlap with ``asyncio.gather``.
+
         Args:
             name: Command name to execute.
             args: Positional arguments for the command.
@@ -174,36 +352,62 @@ class FlextCliCommands(FlextCliServiceBase):
             return r[object].fail("Invalid command name")
         if name not in self._commands:
             return r[object].fail(f"Command not found: {name}")
-        cmd_info = self._commands[name]
-        handler = cmd_info.handler
+        handler = self._commands[name].handler
         if not callable(handler):
             return r[object].fail(f"Handler not callable for: {name}")
-        try:
-            result: r[object] | None = None
-            execution_attempted = False
-            if args or kwargs:
-                try:
-                    result = handler(*args, **kwargs) if args else handler(**kwargs)
-                    execution_attempted = True
-                except TypeError as exc:
-                    logging.getLogger(__name__).debug(
-                        "Handler signature mismatch for %s, trying no-args: %s",
-                        name,
-                        exc,
-                        exc_info=False,
-                    )
-            if not execution_attempted:
-                result = handler()
-            return self._normalize_handler_result(result, name)
-        except (
-            ValueError,
-            TypeError,
-            KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
-        ) as e:
-            return r[object].fail(f"Command execution failed: {e}")
+        plan = self._binding_plan(name, handler)
+        start_ns = time.perf_counter_ns()
+        if plan.is_async:
+            result = await FlextCliCommands._invoke_handler_async(
+                name, plan, args, kwargs
+            )
+        else:
+            result = await asyncio.to_thread(
+                FlextCliCommands._invoke_handler, name, plan, args, kwargs
+            )
+        self._metrics.record(
+            name, time.perf_counter_ns() - start_ns, success=result.is_success
+        )
+        return result
+
+    def fan_out(
+        self,
+        name: str,
+        inputs: Iterable[object],
+        *,
+        workers: int = c.Cli.PipelineDefaults.WORKERS,
+        argument: str | None = None,
+    ) -> Iterator[r[object]]:
+        """Run command ``name`` once per input on a pool of ``workers`` threads.
+
+        Shorthand for a single-stage :meth:`pipeline`; results are streamed
+        in completion order.
+
+        Args:
+            name: Registered command name.
+            inputs: One item per invocation.
+            workers: Concurrent invocations.
+            argument: Keyword receiving each item; positional if ``None``.
+
+        Returns:
+            Iterator[r[object]]: One result per input.
+
+        """
+        return (
+            self.pipeline().stage(name, workers=workers, argument=argument).run(inputs)
+        )
+
+    def get_command_statistics(self) -> r[m.Cli.CommandStatistics]:
+        """Get execution statistics for the registered commands.
+
+        Returns:
+            r[m.Cli.CommandStatistics]: Execution counts, failures and latency
+                percentiles per command.
+
+        """
+        return r[m.Cli.CommandStatistics].ok(
+            self._metrics.to_statistics(len(self._commands))
+        )
 
     def get_click_group(self) -> FlextCliCommandGroup:
         """Get Click group representation.
@@ -243,9 +447,26 @@ class FlextCliCommands(FlextCliServiceBase):
         """
         return r[list[str]].ok(list(self._commands.keys()))
 
+    def pipeline(
+        self, *, queue_size: int = c.Cli.PipelineDefaults.QUEUE_SIZE
+    ) -> FlextCliCommandPipeline:
+        """Create an empty pipeline over the registered commands.
+
+        Args:
+            queue_size: Capacity of the pipeline output queue.
+
+        Returns:
+            FlextCliCommandPipeline: Pipeline to add stages to.
+
+        """
+        return FlextCliCommandPipeline(self, queue_size=queue_size)
+
     def register_command(self, name: str, handler: Callable[..., r[object]]) -> r[bool]:
         """Register a CLI command.
 
+        The handler signature is inspected here once; execution then passes
+        only the arguments it accepts, without trial calls.
+
         Args:
             name: Command name.
             handler: Command handler callable.
@@ -257,6 +478,7 @@ class FlextCliCommands(FlextCliServiceBase):
         if not name.strip():
             return r[bool].fail("Command name must be non-empty string")
         self._commands[name] = FlextCliCommandEntryModel(name=name, handler=handler)
+        self._plans[name] = FlextCliCommands._BindingPlan(handler)
         return r[bool].ok(value=True)
 
     def run_cli(self, args: Sequence[str] | None = None) -> r[object]:
@@ -297,4 +519,276 @@ class FlextCliCommands(FlextCliServiceBase):
         if name not in self._commands:
             return r[bool].fail(f"Command not found: {name}")
         del self._commands[name]
+        _ = self._plans.pop(name, None)
         return r[bool].ok(value=True)
+
+
+class FlextCliCommandPipeline:
+    """Streaming pipeline of registered commands connected by bounded queues.
+
+    Each stage runs its command on a pool of worker threads. Items flow
+    through bounded queues, so a slow stage blocks its producers
+    (backpressure) and the input iterable is consumed lazily. A successful
+    result's value becomes the next stage's input; failures skip the
+    remaining stages and are streamed out as they happen, as are exceptions
+    raised by a handler. Results arrive in completion order.
+
+    Example:
+        >>> pipeline = commands.pipeline().stage("fetch", workers=8)
+        >>> pipeline = pipeline.stage("parse", workers=2)
+        >>> for result in pipeline.run(urls):
+        ...     print(result.value if result.is_success else result.error)
+        >>> pipeline.stage_metrics()  # throughput per stage
+
+    """
+
+    class _Done:
+        """End-of-stream marker passed through the queues."""
+
+    class _StageState:
+        """Counters of one stage, updated by its workers."""
+
+        __slots__ = ("busy_ns", "failed", "finished", "lock", "processed", "started")
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.busy_ns = 0
+            self.failed = 0
+            self.processed = 0
+            self.started = 0
+            self.finished = 0
+            self.lock = threading.Lock()
+
+        def record(self, started: int, finished: int, *, success: bool) -> None:
+            with self.lock:
+                self.started = min(self.started, started) if self.started else started
+                self.finished = max(self.finished, finished)
+                self.busy_ns += finished - started
+                self.processed += 1
+                self.failed += 0 if success else 1
+
+    def __init__(
+        self,
+        commands: FlextCliCommands,
+        *,
+        queue_size: int = c.Cli.PipelineDefaults.QUEUE_SIZE,
+    ) -> None:
+        """Initialize an empty pipeline.
+
+        Args:
+            commands: Service whose registered commands the stages run.
+            queue_size: Capacity of the output queue.
+
+        """
+        super().__init__()
+        self._commands = commands
+        self._queue_size = queue_size
+        self._stages: list[m.Cli.PipelineStage] = []
+        # Stages and counters of the most recently started run
+        self._last_run: tuple[
+            tuple[m.Cli.PipelineStage, ...], list[FlextCliCommandPipeline._StageState]
+        ] = ((), [])
+
+    @property
+    def stages(self) -> tuple[m.Cli.PipelineStage, ...]:
+        """Configured stages in execution order."""
+        return tuple(self._stages)
+
+    def stage(
+        self,
+        command: str,
+        *,
+        workers: int = c.Cli.PipelineDefaults.WORKERS,
+        queue_size: int = c.Cli.PipelineDefaults.QUEUE_SIZE,
+        argument: str | None = None,
+    ) -> Self:
+        """Append a stage running ``command`` on ``workers`` threads.
+
+        Args:
+            command: Registered command name.
+            workers: Concurrent invocations (fan-out width).
+            queue_size: Items buffered before producers block.
+            argument: Keyword receiving each item; positional if ``None``.
+
+        Returns:
+            Self: This pipeline, for chaining.
+
+        """
+        self._stages.append(
+            m.Cli.PipelineStage(
+                command=command,
+                workers=workers,
+                queue_size=queue_size,
+                argument=argument,
+            )
+        )
+        return self
+
+    def run(self, inputs: Iterable[object]) -> Iterator[r[object]]:
+        """Stream ``inputs`` through the stages, yielding one result per item.
+
+        Closing the iterator early stops the workers and the input feed.
+
+        Args:
+            inputs: Items given to the first stage.
+
+        Yields:
+            r[object]: Final-stage result, or the failure that ended an item.
+
+        """
+        defaults = c.Cli.PipelineDefaults
+        stages = tuple(self._stages)
+        if not stages:
+            yield r[object].fail(defaults.NO_STAGES_MESSAGE)
+            return
+        registered = self._commands.get_commands()
+        for stage in stages:
+            if stage.command not in registered:
+                yield r[object].fail(
+                    defaults.UNKNOWN_COMMAND_MESSAGE.format(command=stage.command)
+                )
+                return
+        cancel = threading.Event()
+        queues: list[queue.Queue[object]] = [
+            queue.Queue(maxsize=stage.queue_size) for stage in stages
+        ]
+        output: queue.Queue[object] = queue.Queue(maxsize=self._queue_size)
+        queues.append(output)
+        remaining = [stage.workers for stage in stages]
+        remaining_lock = threading.Lock()
+        states = [self._StageState() for _ in stages]
+        self._last_run = (stages, states)
+
+        def feed() -> None:
+            try:
+                for item in inputs:
+                    if not self._put(queues[0], item, cancel):
+                        return
+            except (ValueError, TypeError, KeyError, RuntimeError, OSError) as exc:
+                _ = self._put(
+                    output,
+                    r[object].fail(defaults.INPUT_FAILED_MESSAGE.format(error=exc)),
+                    cancel,
+                )
+            finally:
+                for _ in range(stages[0].workers):
+                    _ = self._put(queues[0], self._Done, cancel)
+
+        def work(index: int) -> None:
+            stage = stages[index]
+            state = states[index]
+            last = index == len(stages) - 1
+            try:
+                while (item := self._get(queues[index], cancel)) is not self._Done:
+                    started = time.perf_counter_ns()
+                    result = self._call(stage, item)
+                    state.record(
+                        started, time.perf_counter_ns(), success=result.is_success
+                    )
+                    if result.is_failure or last:
+                        forwarded = self._put(output, result, cancel)
+                    else:
+                        forwarded = self._put(queues[index + 1], result.value, cancel)
+                    if not forwarded:
+                        return
+            finally:
+                with remaining_lock:
+                    remaining[index] -= 1
+                    drained = remaining[index] == 0
+                if drained:
+                    downstream = 1 if last else stages[index + 1].workers
+                    for _ in range(downstream):
+                        _ = self._put(queues[index + 1], self._Done, cancel)
+
+        threads = [threading.Thread(target=feed, daemon=True)] + [
+            threading.Thread(target=work, args=(index,), daemon=True)
+            for index, stage in enumerate(stages)
+            for _ in range(stage.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            while (result := self._next_output(output, threads)) is not self._Done:
+                if isinstance(result, r):
+                    yield result
+        finally:
+            cancel.set()
+            for thread in threads:
+                thread.join()
+
+    def stage_metrics(self) -> list[m.Cli.PipelineStageMetrics]:
+        """Return throughput of each stage for the current or last run."""
+        stages, states = self._last_run
+        ns_per_second = c.Cli.PipelineDefaults.NS_PER_SECOND
+        metrics: list[m.Cli.PipelineStageMetrics] = []
+        for stage, state in zip(stages, states, strict=True):
+            with state.lock:
+                elapsed = max(0, state.finished - state.started) / ns_per_second
+                metrics.append(
+                    m.Cli.PipelineStageMetrics(
+                        command=stage.command,
+                        workers=stage.workers,
+                        processed=state.processed,
+                        failed=state.failed,
+                        busy_seconds=state.busy_ns / ns_per_second,
+                        elapsed_seconds=elapsed,
+                        throughput=state.processed / elapsed if elapsed else 0.0,
+                    )
+                )
+        return metrics
+
+    def _call(self, stage: m.Cli.PipelineStage, item: object) -> r[object]:
+        """Run ``stage`` on ``item``; a raising handler becomes a failure."""
+        try:
+            if stage.argument is None:
+                return self._commands.call_command(stage.command, item)
+            return self._commands.call_command(stage.command, **{stage.argument: item})
+        except (
+            ValueError,
+            TypeError,
+            KeyError,
+            AttributeError,
+            RuntimeError,
+            OSError,
+            *FlextCliFormatters.rich_errors(),
+        ) as exc:
+            return r[object].fail(
+                c.Cli.PipelineDefaults.STAGE_FAILED_MESSAGE.format(
+                    command=stage.command, error=exc
+                )
+            )
+
+    @staticmethod
+    def _get(source: queue.Queue[object], cancel: threading.Event) -> object:
+        """Block for the next item; returns the end marker once cancelled."""
+        while not cancel.is_set():
+            try:
+                return source.get(timeout=c.Cli.PipelineDefaults.POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return FlextCliCommandPipeline._Done
+
+    @staticmethod
+    def _next_output(
+        output: queue.Queue[object], threads: Sequence[threading.Thread]
+    ) -> object:
+        """Wait for the next output; the end marker once every thread exited."""
+        while True:
+            try:
+                return output.get(timeout=c.Cli.PipelineDefaults.POLL_SECONDS)
+            except queue.Empty:
+                if output.empty() and not any(thread.is_alive() for thread in threads):
+                    return FlextCliCommandPipeline._Done
+
+    @staticmethod
+    def _put(
+        target: queue.Queue[object], item: object, cancel: threading.Event
+    ) -> bool:
+        """Block until ``item`` is queued; returns False once cancelled."""
+        while not cancel.is_set():
+            try:
+                target.put(item, timeout=c.Cli.PipelineDefaults.POLL_SECONDS)
+            except queue.Full:
+                continue
+            return True
+        return False
@@ -0,0 +1,207 @@
+"""Persistent shell-completion cache for flext-cli applications.
+
+FlextCliCompletionCache dumps the command/option tree of a Click or Typer
+application to a compact file under the config directory (rewritten when the
+application version or its command tree changes) and renders bash/zsh/fish scripts that answer
+TAB presses with the standalone ``completion_entry`` script, so completing
+never imports the application.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import re
+import shlex
+import sys
+import tempfile
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+
+import click
+from flext_core import r
+
+from flext_cli import c
+from flext_cli.completion_entry import (
+    FORMAT,
+    KEY_ARGUMENTS,
+    KEY_COMMANDS,
+    KEY_FINGERPRINT,
+    KEY_FORMAT,
+    KEY_OPTIONS,
+    complete,
+    load,
+)
+
+_ENTRY_SCRIPT = Path(__file__).with_name("completion_entry.py")
+
+
+class FlextCliCompletionCache:
+    """Completion cache file of one application.
+
+    Example:
+        >>> cache = FlextCliCompletionCache("my-cli", settings.config_dir)
+        >>> cache.ensure(app.click_command, version="1.4.0")
+        >>> print(cache.script("bash").value)  # source from ~/.bashrc
+
+    """
+
+    def __init__(self, app_name: str, config_dir: Path) -> None:
+        """Initialize the cache of ``app_name``.
+
+        Args:
+            app_name: Program name the shell completes.
+            config_dir: Config directory; the file lives in its
+                ``completion`` subdirectory.
+
+        """
+        super().__init__()
+        defaults = c.Cli.CompletionDefaults
+        self._app_name = app_name
+        self._path = (
+            config_dir / defaults.DIR_NAME / f"{app_name}{defaults.FILE_SUFFIX}"
+        )
+
+    @property
+    def path(self) -> Path:
+        """Completion cache file."""
+        return self._path
+
+    @staticmethod
+    def _choices(param: click.Parameter) -> list[str] | None:
+        choices = getattr(param.type, "choices", None)
+        return [str(choice) for choice in choices] if choices is not None else None
+
+    @classmethod
+    def dump_tree(cls, command: click.Command) -> dict[str, object]:
+        """Return the completion tree of ``command`` and its subcommands.
+
+        Only ``command.params`` is read, so lazy placeholders contribute their
+        name without being imported. Parameters and groups are recognized by
+        their attributes, which also covers Typer's vendored Click classes.
+        """
+        options: list[object] = [[[c.Cli.CompletionDefaults.HELP_OPTION], False, None]]
+        arguments: list[object] = []
+        for param in command.params:
+            if param.param_type_name == "argument":
+                arguments.append(cls._choices(param))
+            elif not getattr(param, "hidden", False):
+                options.append([
+                    [*param.opts, *param.secondary_opts],
+                    not getattr(param, "is_flag", False)
+                    and not getattr(param, "count", False),
+                    cls._choices(param),
+                ])
+        node: dict[str, object] = {KEY_OPTIONS: options, KEY_ARGUMENTS: arguments}
+        subcommands: Mapping[str, click.Command] | None = getattr(
+            command, "commands", None
+        )
+        if subcommands is not None:
+            node[KEY_COMMANDS] = {
+                name: cls.dump_tree(subcommand)
+                for name, subcommand in subcommands.items()
+                if not subcommand.hidden
+            }
+        return node
+
+    def complete(self, words: Sequence[str]) -> list[str]:
+        """Answer a completion from the cache file, as the entry script does."""
+        tree = load(str(self._path))
+        return complete(tree, list(words)) if tree is not None else []
+
+    def ensure(
+        self, command_factory: Callable[[], click.Command], version: str
+    ) -> r[bool]:
+        """Write the cache unless it already holds this version and tree.
+
+        The command tree is dumped on every call (lazy commands stay
+        unimported) so that changed commands are picked up even when
+        ``version`` is not bumped; the file is only written on a mismatch.
+
+        Returns:
+            r[bool]: True if the file was (re)written.
+
+        """
+        tree = self.dump_tree(command_factory())
+        fingerprint = self.fingerprint(tree, version)
+        if self.is_current(fingerprint):
+            return r[bool].ok(value=False)
+        return self._write_tree(tree, fingerprint).map(lambda _: True)
+
+    @staticmethod
+    def fingerprint(tree: Mapping[str, object], version: str) -> str:
+        """Digest identifying a dumped command ``tree`` of ``version``."""
+        return hashlib.blake2b(
+            repr((version, tree)).encode(), digest_size=16
+        ).hexdigest()
+
+    def is_current(self, fingerprint: str) -> bool:
+        """Return whether the cache file was written for ``fingerprint``."""
+        try:
+            with self._path.open("rb") as cache_file:
+                header = marshal.load(cache_file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+        return (
+            isinstance(header, dict)
+            and header.get(KEY_FORMAT) == FORMAT
+            and header.get(KEY_FINGERPRINT) == fingerprint
+        )
+
+    def script(self, shell: str = c.Cli.CompletionDefaults.DEFAULT_SHELL) -> r[str]:
+        """Render the completion script of ``shell`` (bash, zsh or fish)."""
+        scripts = c.Cli.CompletionDefaults.SCRIPTS
+        template = scripts.get(shell)
+        if template is None:
+            return r[str].fail(
+                c.Cli.CompletionDefaults.UNSUPPORTED_SHELL_MESSAGE.format(
+                    shell=shell, shells=", ".join(sorted(scripts))
+                )
+            )
+        return r[str].ok(
+            template.format(
+                function=f"_{re.sub(r'\W', '_', self._app_name)}_completion",
+                prog=shlex.quote(self._app_name),
+                python=shlex.quote(sys.executable),
+                entry=shlex.quote(str(_ENTRY_SCRIPT)),
+                cache=shlex.quote(str(self._path)),
+            )
+        )
+
+    def write(self, command: click.Command, version: str) -> r[Path]:
+        """Dump the tree of ``command`` for ``version`` (atomic replace)."""
+        tree = self.dump_tree(command)
+        return self._write_tree(tree, self.fingerprint(tree, version))
+
+    def _write_tree(self, tree: dict[str, object], fingerprint: str) -> r[Path]:
+        header = {KEY_FORMAT: FORMAT, KEY_FINGERPRINT: fingerprint}
+        try:
+            self._write_atomic(marshal.dumps(header) + marshal.dumps(tree))
+        except OSError as exc:
+            return r[Path].fail(
+                c.Cli.CompletionDefaults.WRITE_FAILED_MESSAGE.format(
+                    path=self._path, error=exc
+                )
+            )
+        return r[Path].ok(self._path)
+
+    def _write_atomic(self, data: bytes) -> None:
+        directory = self._path.parent
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=directory, prefix=f".{self._path.name}.", suffix=".tmp"
+        )
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as cache_file:
+                _ = cache_file.write(data)
+            _ = tmp_path.replace(self._path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+__all__ = ["FlextCliCompletionCache"]
@@ -0,0 +1,118 @@
+"""Standalone shell-completion entry point backed by a completion cache file.
+
+Shell completion scripts run this file by path (``python -S <this file>
+<cache> <words...>``) instead of starting the application, so a TAB press
+costs a bare interpreter start plus one small read. It must therefore only
+import built-in modules (not even ``json`` or ``typing``, which add ~15ms)
+and never ``flext_cli`` itself; the cache files are written by
+FlextCliCompletionCache.
+
+A cache file holds two ``marshal`` records: a header (format and a
+fingerprint of the application version and command tree) and the command tree, where each node is::
+
+    {"o": [[["--name", "-n"], takes_value, choices | None], ...],
+     "a": [choices | None, ...],
+     "c": {"subcommand": node, ...}}
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import marshal
+import sys
+
+KEY_FORMAT, KEY_FINGERPRINT = ("format", "fingerprint")
+KEY_OPTIONS, KEY_ARGUMENTS, KEY_COMMANDS = ("o", "a", "c")
+FORMAT = 2
+OPTION_PREFIX, VALUE_SEPARATOR = ("-", "=")
+
+
+def _options(node: dict[str, object]) -> dict[str, list[object]]:
+    """Map every option name of ``node`` to its ``[names, takes_value, choices]``."""
+    by_name: dict[str, list[object]] = {}
+    options = node.get(KEY_OPTIONS)
+    for option in options if isinstance(options, list) else []:
+        for name in option[0]:
+            by_name[name] = option
+    return by_name
+
+
+def _strings(choices: object) -> list[str]:
+    return [str(choice) for choice in choices] if isinstance(choices, list) else []
+
+
+def complete(tree: dict[str, object], words: list[str]) -> list[str]:
+    """Return the candidates for the last of ``words`` (the word being typed).
+
+    ``words`` are the command line words after the program name.
+    """
+    *done, incomplete = words or [""]
+    node = tree
+    position = 0
+    pending: list[object] | None = None
+    for word in done:
+        if pending is not None:
+            pending = None
+            continue
+        if word.startswith(OPTION_PREFIX):
+            option = _options(node).get(word.split(VALUE_SEPARATOR, 1)[0])
+            if option is not None and option[1] and VALUE_SEPARATOR not in word:
+                pending = option
+            continue
+        commands = node.get(KEY_COMMANDS)
+        child = commands.get(word) if isinstance(commands, dict) else None
+        if isinstance(child, dict):
+            node, position = child, 0
+        else:
+            position += 1
+    if pending is not None:
+        candidates = _strings(pending[2])
+    elif incomplete.startswith(OPTION_PREFIX):
+        name, separator, _ = incomplete.partition(VALUE_SEPARATOR)
+        options = _options(node)
+        option = options.get(name)
+        candidates = (
+            [f"{name}{separator}{choice}" for choice in _strings(option[2])]
+            if separator and option is not None
+            else sorted(options)
+        )
+    else:
+        commands = node.get(KEY_COMMANDS)
+        arguments = node.get(KEY_ARGUMENTS)
+        candidates = sorted(commands) if isinstance(commands, dict) else []
+        if isinstance(arguments, list) and position < len(arguments):
+            candidates += _strings(arguments[position])
+    return [candidate for candidate in candidates if candidate.startswith(incomplete)]
+
+
+def load(path: str) -> dict[str, object] | None:
+    """Read the command tree of a cache file, or None if it is unusable."""
+    try:
+        # open() rather than pathlib: importing pathlib would slow every TAB.
+        with open(path, "rb") as cache_file:
+            header = marshal.load(cache_file)
+            if not isinstance(header, dict) or header.get(KEY_FORMAT) != FORMAT:
+                return None
+            tree = marshal.load(cache_file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return tree if isinstance(tree, dict) else None
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print one candidate per line; ``argv`` is ``[cache_path, *words]``."""
+    args = list(sys.argv[1:] if argv is None else argv)
+    if not args:
+        return 2
+    tree = load(args[0])
+    if tree is not None:
+        candidates = complete(tree, args[1:])
+        if candidates:
+            _ = sys.stdout.write("\n".join(candidates) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,367 @@
+"""Incremental configuration engine with JSON merge patches.
+
+FlextCliConfigEngine applies RFC 7396 merge patches copy-on-write (only the
+patched branches are copied), validates only the keys a patch changes, keeps
+a bounded versioned history of the configurations each patch replaced (which
+share their unchanged branches) for rollback and notifies only the
+subscribers whose keys are affected.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import uuid
+from collections import deque
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from types import MappingProxyType
+
+from flext_core import FlextLogger, r
+
+from flext_cli import c, m
+from flext_cli.typings import FlextCliTypes
+
+type _ConfigDict = dict[str, FlextCliTypes.Cli.JsonValue]
+type _Validator = Callable[[FlextCliTypes.Cli.JsonValue | None], r[bool]]
+type _Subscriber = Callable[[m.Cli.ConfigVersion], None]
+
+
+class FlextCliConfigEngine:
+    """Versioned configuration updated through JSON merge patches.
+
+    Keys are addressed as dotted paths (``"db.host"``). A validator or
+    subscriber registered for a path is triggered when that path, one of its
+    parents or one of its children changes.
+
+    Example:
+        >>> engine = FlextCliConfigEngine({"db": {"host": "a", "port": 1}})
+        >>> engine.subscribe("db.host", on_change)
+        >>> engine.apply_patch({"db": {"host": "b"}})  # notifies on_change
+        >>> engine.apply_patch({"db": {"port": None}})  # removes db.port
+        >>> engine.rollback(0)
+
+    """
+
+    def __init__(
+        self,
+        config: Mapping[str, FlextCliTypes.Cli.JsonValue] | None = None,
+        *,
+        max_history: int = c.Cli.ConfigPatchDefaults.MAX_HISTORY,
+    ) -> None:
+        """Initialize engine at version 0 with ``config``.
+
+        Args:
+            config: Initial configuration.
+            max_history: Versions retained for rollback.
+
+        """
+        super().__init__()
+        self._config: _ConfigDict = copy.deepcopy(dict(config or {}))
+        self._version = 0
+        # (version entry, configuration it replaced); snapshots are never
+        # mutated, so consecutive versions share their unchanged branches
+        self._history: deque[tuple[m.Cli.ConfigVersion, _ConfigDict]] = deque(
+            maxlen=max_history
+        )
+        self._validators: dict[str, list[_Validator]] = {}
+        self._subscribers: dict[str, dict[str, _Subscriber]] = {}
+        self._lock = threading.RLock()
+        self._logger = FlextLogger(__name__)
+
+    @property
+    def config(self) -> Mapping[str, FlextCliTypes.Cli.JsonValue]:
+        """Read-only view of the current configuration (update via patches)."""
+        return MappingProxyType(self._config)
+
+    @property
+    def version(self) -> int:
+        """Current configuration version."""
+        return self._version
+
+    @staticmethod
+    def affects(path: str, other: str) -> bool:
+        """Return whether two dotted paths overlap (equal, parent or child)."""
+        sep = c.Cli.ConfigPatchDefaults.PATH_SEPARATOR
+        return (
+            path == other
+            or path.startswith(other + sep)
+            or other.startswith(path + sep)
+        )
+
+    @classmethod
+    def diff(
+        cls,
+        source: Mapping[str, FlextCliTypes.Cli.JsonValue],
+        target: Mapping[str, FlextCliTypes.Cli.JsonValue],
+    ) -> _ConfigDict:
+        """Return the minimal merge patch turning ``source`` into ``target``.
+
+        Merge patches cannot express ``None`` values: a ``None`` in ``target``
+        becomes a deletion (RFC 7396).
+        """
+        patch: _ConfigDict = {key: None for key in source if key not in target}
+        for key, value in target.items():
+            old = source.get(key)
+            if key in source and old == value:
+                continue
+            if isinstance(value, Mapping) and isinstance(old, Mapping):
+                patch[key] = cls.diff(old, value)
+            else:
+                patch[key] = value
+        return patch
+
+    @classmethod
+    def merge_patch(
+        cls,
+        target: Mapping[str, FlextCliTypes.Cli.JsonValue],
+        patch: Mapping[str, FlextCliTypes.Cli.JsonValue],
+    ) -> _ConfigDict:
+        """Return ``target`` with ``patch`` applied (RFC 7396); inputs unchanged."""
+        return cls._merge(target, patch, "", [])
+
+    def apply_patch(
+        self,
+        patch: Mapping[str, FlextCliTypes.Cli.JsonValue],
+        *,
+        source: str = c.Cli.ConfigPatchDefaults.SOURCE_UPDATE,
+    ) -> r[m.Cli.ConfigVersion]:
+        """Validate and apply a merge patch, creating a new version.
+
+        A patch that changes nothing returns the current version entry without
+        recording history or notifying subscribers.
+
+        Args:
+            patch: JSON merge patch (``None`` values delete keys).
+            source: Origin recorded in the history entry.
+
+        Returns:
+            r[m.Cli.ConfigVersion]: Applied version, or failure from a validator.
+
+        """
+        if not isinstance(patch, Mapping):
+            return r[m.Cli.ConfigVersion].fail(
+                c.Cli.ConfigPatchErrorMessages.PATCH_NOT_DICT
+            )
+        with self._lock:
+            changed: list[str] = []
+            merged = self._merge(self._config, patch, "", changed)
+            committed, subscribers = self._commit(merged, changed, patch, source)
+        return self._notify(committed, subscribers)
+
+    def history(self) -> list[m.Cli.ConfigVersion]:
+        """Return retained history entries, oldest first."""
+        with self._lock:
+            return [entry for entry, _inverse in self._history]
+
+    def register_validator(self, key: str, validator: _Validator) -> None:
+        """Register a validator run when ``key`` is affected by a patch.
+
+        The validator receives the new value at ``key`` (``None`` if absent).
+        """
+        with self._lock:
+            self._validators.setdefault(key, []).append(validator)
+
+    def rollback(self, version: int) -> r[m.Cli.ConfigVersion]:
+        """Restore the configuration of ``version`` as a new version.
+
+        The rollback is applied like any other patch: validated, recorded in
+        history (source ``rollback``) and announced to affected subscribers.
+        The retained configuration is restored as it was, ``None`` values
+        included.
+        """
+        with self._lock:
+            oldest = self._history[0][0].version - 1 if self._history else 0
+            if not oldest <= version <= self._version:
+                return r[m.Cli.ConfigVersion].fail(
+                    c.Cli.ConfigPatchErrorMessages.VERSION_NOT_AVAILABLE.format(
+                        version=version, oldest=oldest, current=self._version
+                    )
+                )
+            target = self._config
+            for entry, previous in reversed(self._history):
+                if entry.version <= version:
+                    break
+                target = previous
+            changed: list[str] = []
+            self._collect_changes(self._config, target, "", changed)
+            committed, subscribers = self._commit(
+                target,
+                changed,
+                self.diff(self._config, target),
+                c.Cli.ConfigPatchDefaults.SOURCE_ROLLBACK,
+            )
+        return self._notify(committed, subscribers)
+
+    def subscribe(self, key: str, callback: _Subscriber) -> str:
+        """Subscribe ``callback`` to changes affecting ``key``; returns a token."""
+        token = uuid.uuid4().hex
+        with self._lock:
+            self._subscribers.setdefault(key, {})[token] = callback
+        return token
+
+    def unsubscribe(self, token: str) -> bool:
+        """Remove a subscription; returns whether the token was known."""
+        with self._lock:
+            for callbacks in self._subscribers.values():
+                if callbacks.pop(token, None) is not None:
+                    return True
+        return False
+
+    def _affected_subscribers(self, changed: list[str]) -> list[_Subscriber]:
+        return [
+            callback
+            for key, callbacks in self._subscribers.items()
+            if any(self.affects(key, path) for path in changed)
+            for callback in callbacks.values()
+        ]
+
+    @classmethod
+    def _collect_changes(
+        cls,
+        source: Mapping[str, FlextCliTypes.Cli.JsonValue],
+        target: Mapping[str, FlextCliTypes.Cli.JsonValue],
+        prefix: str,
+        changed: list[str],
+    ) -> None:
+        """Collect the paths differing between two configurations."""
+        for key in [*source, *(key for key in target if key not in source)]:
+            path = f"{prefix}{key}"
+            if key not in source or key not in target:
+                changed.append(path)
+                continue
+            old, new = source[key], target[key]
+            if old is new:
+                continue
+            if isinstance(old, Mapping) and isinstance(new, Mapping):
+                cls._collect_changes(
+                    old, new, path + c.Cli.ConfigPatchDefaults.PATH_SEPARATOR, changed
+                )
+            elif old != new:
+                changed.append(path)
+
+    def _commit(
+        self,
+        config: _ConfigDict,
+        changed: list[str],
+        patch: Mapping[str, FlextCliTypes.Cli.JsonValue],
+        source: str,
+    ) -> tuple[r[m.Cli.ConfigVersion], list[_Subscriber]]:
+        """Validate ``config`` and make it the next version (lock held).
+
+        Returns the result and the subscribers to notify once unlocked.
+        """
+        if not changed:
+            return r[m.Cli.ConfigVersion].ok(self._current_entry()), []
+        validated = self._validate_changes(config, changed)
+        if validated.is_failure:
+            return r[m.Cli.ConfigVersion].fail(
+                validated.error or "Configuration validation failed"
+            ), []
+        entry = m.Cli.ConfigVersion(
+            version=self._version + 1,
+            patch=dict(patch),
+            changed_keys=tuple(changed),
+            source=source,
+            timestamp=datetime.now(UTC).isoformat(),
+        )
+        self._history.append((entry, self._config))
+        self._config = config
+        self._version = entry.version
+        return r[m.Cli.ConfigVersion].ok(entry), self._affected_subscribers(changed)
+
+    def _current_entry(self) -> m.Cli.ConfigVersion:
+        if self._history and self._history[-1][0].version == self._version:
+            return self._history[-1][0]
+        return m.Cli.ConfigVersion(version=self._version)
+
+    def _notify(
+        self, committed: r[m.Cli.ConfigVersion], subscribers: list[_Subscriber]
+    ) -> r[m.Cli.ConfigVersion]:
+        """Announce a committed version to ``subscribers``; returns it."""
+        for subscriber in subscribers:
+            try:
+                subscriber(committed.value)
+            except (ValueError, TypeError, KeyError, RuntimeError) as exc:
+                self._logger.warning(
+                    "Configuration subscriber failed",
+                    operation="apply_patch",
+                    version=committed.value.version,
+                    error=str(exc),
+                )
+        return committed
+
+    @classmethod
+    def _merge(
+        cls,
+        target: Mapping[str, FlextCliTypes.Cli.JsonValue],
+        patch: Mapping[str, FlextCliTypes.Cli.JsonValue],
+        prefix: str,
+        changed: list[str],
+    ) -> _ConfigDict:
+        """Merge copy-on-write and collect the changed paths."""
+        merged: _ConfigDict = dict(target)
+        for key, value in patch.items():
+            path = f"{prefix}{key}"
+            exists = key in target
+            old = target.get(key)
+            if value is None:
+                if exists:
+                    del merged[key]
+                    changed.append(path)
+                continue
+            if isinstance(value, Mapping) and isinstance(old, Mapping):
+                known = len(changed)
+                nested = cls._merge(
+                    old,
+                    value,
+                    path + c.Cli.ConfigPatchDefaults.PATH_SEPARATOR,
+                    changed,
+                )
+                if len(changed) > known:
+                    merged[key] = nested
+                continue
+            new_value = (
+                cls.merge_patch({}, value) if isinstance(value, Mapping) else value
+            )
+            if exists and old == new_value:
+                continue
+            merged[key] = new_value
+            changed.append(path)
+        return merged
+
+    def _validate_changes(
+        self,
+        config: Mapping[str, FlextCliTypes.Cli.JsonValue],
+        changed: list[str],
+    ) -> r[bool]:
+        for key, validators in self._validators.items():
+            if not any(self.affects(key, path) for path in changed):
+                continue
+            value = self._value_at(config, key)
+            for validator in validators:
+                result = validator(value)
+                if result.is_failure:
+                    return r[bool].fail(
+                        c.Cli.ConfigPatchErrorMessages.VALIDATION_FAILED.format(
+                            key=key, error=result.error or ""
+                        )
+                    )
+        return r[bool].ok(value=True)
+
+    @staticmethod
+    def _value_at(
+        config: Mapping[str, FlextCliTypes.Cli.JsonValue], key: str
+    ) -> FlextCliTypes.Cli.JsonValue | None:
+        current: FlextCliTypes.Cli.JsonValue | None = config
+        for part in key.split(c.Cli.ConfigPatchDefaults.PATH_SEPARATOR):
+            if not isinstance(current, Mapping):
+                return None
+            current = current.get(part)
+        return current
+
+
+__all__ = ["FlextCliConfigEngine"]
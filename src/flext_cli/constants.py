@@ -18,6 +18,7 @@ class FlextCliConstants(FlextConstants):
 
         type EntityTypeLiteral = Literal["command", "group"]
         type OutputFormatLiteral = Literal["json", "yaml", "csv", "table", "plain"]
+        type MetricsExpositionLiteral = Literal["openmetrics", "prometheus"]
 
         class Project:
             """Project constants."""
@@ -195,6 +196,8 @@ class FlextCliConstants(FlextConstants):
                 False,
                 True,
             )
+            # Exit status of commands failing without one of their own.
+            FAILURE_EXIT = 1
 
         class CliGlobalDefaults:
             """Global default CLI constants."""
@@ -801,6 +804,419 @@ class FlextCliConstants(FlextConstants):
                 "Service execution failed: {error}",
             )
 
+        class MetricsDefaults:
+            """Command execution metrics defaults."""
+
+            HISTOGRAM_SUB_BUCKET_BITS, NANOS_PER_SECOND = (5, 1_000_000_000)
+            P50, P95, P99 = (50.0, 95.0, 99.0)
+            JSON_INDENT = 2
+            DURATION_BUCKETS: typing.Final[tuple[float, ...]] = (
+                0.001,
+                0.005,
+                0.01,
+                0.025,
+                0.05,
+                0.1,
+                0.25,
+                0.5,
+                1.0,
+                2.5,
+                5.0,
+                10.0,
+                30.0,
+                60.0,
+            )
+            COMMAND_EXECUTIONS, COMMAND_FAILURES, COMMAND_DURATION = (
+                "flext_cli_command_executions",
+                "flext_cli_command_failures",
+                "flext_cli_command_duration_seconds",
+            )
+            FILE_IO_BYTES, OUTPUT_ROWS, PROCESS_START_TIME = (
+                "flext_cli_file_io_bytes",
+                "flext_cli_output_rows",
+                "flext_cli_process_start_time_seconds",
+            )
+            IO_READ, IO_WRITE = ("read", "write")
+            EXPOSITION_OPENMETRICS: Literal["openmetrics"] = "openmetrics"
+            EXPOSITION_PROMETHEUS: Literal["prometheus"] = "prometheus"
+            TEXTFILE_MODE = 0o644
+
+        class ConfigPatchDefaults:
+            """Incremental configuration engine defaults."""
+
+            MAX_HISTORY, PATH_SEPARATOR = (100, ".")
+            SOURCE_UPDATE, SOURCE_ROLLBACK = ("update", "rollback")
+
+        class ConfigPatchErrorMessages:
+            """Incremental configuration engine error messages."""
+
+            PATCH_NOT_DICT = "Configuration patch must be a JSON object"
+            VALIDATION_FAILED = "Invalid configuration value for '{key}': {error}"
+            VERSION_NOT_AVAILABLE = (
+                "Configuration version {version} not available "
+                "(retained: {oldest}-{current})"
+            )
+
+        class SessionStoreDefaults:
+            """Session journal defaults."""
+
+            JOURNAL_FILE_NAME, COMPACT_THRESHOLD = ("sessions.jsonl", 10_000)
+            OP_START, OP_COMMAND, OP_STATUS, OP_END = (
+                "start",
+                "command",
+                "status",
+                "end",
+            )
+
+        class SessionStoreErrorMessages:
+            """Session journal error messages."""
+
+            SESSION_NOT_FOUND, SESSION_EXISTS, SESSION_ENDED = (
+                "Session not found: {session_id}",
+                "Session already exists: {session_id}",
+                "Session already ended: {session_id}",
+            )
+            COMMAND_NOT_FOUND, INVALID_STATUS = (
+                "Command position {position} not found in session {session_id}",
+                "Invalid status '{status}'. Valid: {valid}",
+            )
+            JOURNAL_WRITE_FAILED, JOURNAL_LOAD_FAILED, COMPACTION_FAILED = (
+                "Session journal write failed: {error}",
+                "Session journal load failed: {error}",
+                "Session journal compaction failed: {error}",
+            )
+            STORE_NOT_CONFIGURED = "No session store configured"
+
+        class ValidationMiddlewareDefaults:
+            """Validation middleware defaults."""
+
+            CONTEXT_ATTRIBUTE = "validated"
+
+        class RetryDefaults:
+            """Retry middleware defaults."""
+
+            MAX_ATTEMPTS, BACKOFF, MAX_BACKOFF, BACKOFF_FACTOR = (3, 1.0, 30.0, 2.0)
+            UNKNOWN_COMMAND = "unknown"
+            RETRIES, OUTCOMES, DELAY = (
+                "flext_cli_retry_attempts",
+                "flext_cli_retry_outcomes",
+                "flext_cli_retry_delay_seconds",
+            )
+            OUTCOME_RECOVERED, OUTCOME_EXHAUSTED = ("recovered", "exhausted")
+            OUTCOME_DEADLINE, OUTCOME_NOT_RETRYABLE = ("deadline", "not_retryable")
+
+        class CircuitBreakerDefaults:
+            """Circuit breaker middleware defaults."""
+
+            FAILURE_RATE, MIN_CALLS, WINDOW_SECONDS, WINDOW_BUCKETS = (
+                0.5,
+                10,
+                30.0,
+                10,
+            )
+            RESET_TIMEOUT, HALF_OPEN_PROBES = (30.0, 1)
+            STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN = ("closed", "half_open", "open")
+            STATE_VALUES: typing.ClassVar[Mapping[str, float]] = {
+                "closed": 0.0,
+                "half_open": 1.0,
+                "open": 2.0,
+            }
+            STATE_GAUGE, REJECTIONS = (
+                "flext_cli_circuit_state",
+                "flext_cli_circuit_rejections",
+            )
+            ERROR_CODE = "CIRCUIT_OPEN"
+            OPEN_MESSAGE = (
+                "Circuit open for command '{command}'; retry in {retry_in:.1f}s"
+            )
+
+        class BulkheadDefaults:
+            """Bulkhead middleware defaults."""
+
+            MAX_CONCURRENT, QUEUE_TIMEOUT = (10, 5.0)
+            IN_FLIGHT, REJECTIONS = (
+                "flext_cli_bulkhead_in_flight",
+                "flext_cli_bulkhead_rejections",
+            )
+            ERROR_CODE = "BULKHEAD_FULL"
+            FULL_MESSAGE = (
+                "Bulkhead full for command '{command}' "
+                "({limit} concurrent, waited {timeout:.1f}s)"
+            )
+
+        class AsyncRunnerDefaults:
+            """Async command runner defaults."""
+
+            THREAD_NAME = "flext-cli-async-runner"
+
+        class ResultCacheDefaults:
+            """Result caching middleware defaults."""
+
+            TTL, MAX_ENTRIES, MAX_FILES = (300.0, 1024, 4096)
+            RESULTS_DIR_NAME, FILE_SUFFIX = ("results", ".json")
+            KEY_EXPIRES_AT, KEY_VALUE = ("expires_at", "value")
+            REQUESTS = "flext_cli_result_cache_requests"
+            OUTCOME_HIT, OUTCOME_MISS, OUTCOME_SHARED, OUTCOME_BYPASS = (
+                "hit",
+                "miss",
+                "shared",
+                "bypass",
+            )
+
+        class ModelCacheDefaults:
+            """Model-driven command metadata cache defaults."""
+
+            DIR_NAME, KEY_LENGTH = ("models", 32)
+            # Persisted entries are validated by fingerprint; the TTL only
+            # bounds how long files of removed models linger.
+            TTL = 30 * 24 * 3600.0
+            TYPE_REF_SEPARATOR = ":"
+            KEY_FINGERPRINT, KEY_COMMAND, KEY_CLI_PARAMS = (
+                "fingerprint",
+                "command",
+                "cli_params",
+            )
+            KEY_ANNOTATIONS, KEY_DEFAULTS, KEY_UNDEFINED, KEY_FACTORY = (
+                "annotations",
+                "defaults",
+                "undefined",
+                "factory",
+            )
+            KEY_FIELD_NAME, KEY_PARAM_TYPE, KEY_CLICK_TYPE, KEY_DEFAULT, KEY_HELP = (
+                "field_name",
+                "param_type",
+                "click_type",
+                "default",
+                "help",
+            )
+
+        class TimingDefaults:
+            """Timing/profiling middleware defaults."""
+
+            WALL, CPU = (
+                "flext_cli_command_wall_seconds",
+                "flext_cli_command_cpu_seconds",
+            )
+            MIN_SAMPLES, MAX_PROFILES, PROFILE_LINES = (20, 10, 25)
+            PROFILE_SORT, ALLOCATION_GROUPING = ("cumulative", "lineno")
+            PERCENT_MAX, MILLIS_PER_SECOND = (100.0, 1000.0)
+            LOG_MESSAGE = "Command timing"
+            REPORT_HEADER = (
+                f"{'command':<24} {'calls':>7} {'fail':>5} {'p50 ms':>9} "
+                f"{'p95 ms':>9} {'p99 ms':>9} {'max ms':>9} {'cpu ms':>9}"
+            )
+            REPORT_ROW = (
+                "{command:<24} {calls:>7} {failures:>5} {p50:>9.2f} "
+                "{p95:>9.2f} {p99:>9.2f} {max:>9.2f} {cpu:>9.2f}"
+            )
+            REPORT_PROFILES = "Slowest profiled invocations: {count}"
+
+        class RateLimitDefaults:
+            """Token-bucket rate limiter defaults."""
+
+            BURST, MAX_WAIT = (1, 10.0)
+            STATE_SUFFIX, LOCK_SUFFIX = (".bucket", ".lock")
+            KEY_TOKENS, KEY_UPDATED = ("tokens", "updated")
+            WAIT_SECONDS, REJECTIONS = (
+                "flext_cli_rate_limit_wait_seconds",
+                "flext_cli_rate_limit_rejections",
+            )
+            ERROR_CODE = "RATE_LIMITED"
+            LIMITED_MESSAGE = (
+                "Rate limit for command '{command}' exceeded "
+                "(next token in {wait:.2f}s, max wait {max_wait:.2f}s)"
+            )
+
+        class LazyCommandDefaults:
+            """Lazily imported ``module:function`` subcommands."""
+
+            TARGET_SEPARATOR = ":"
+            INVALID_TARGET_MESSAGE = "Lazy command '{name}' target must be 'module:attribute', got '{target}'"
+            LOAD_FAILED_MESSAGE = (
+                "Cannot load command '{name}' from '{target}': {error}"
+            )
+
+        class StartupProfileDefaults:
+            """Import-time startup profiler defaults."""
+
+            TARGET, BUDGET_MS, RUNS, TOP = ("flext_cli", 150.0, 3, 15)
+            IMPORTTIME_PREFIX, COLUMN_SEPARATOR = ("import time:", "|")
+            COLUMNS, INDENT = (3, 2)
+            US_PER_MS, MS_PER_SECOND, TIMEOUT_SECONDS = (1000.0, 1000.0, 120.0)
+            ERROR_CODE, FAILED_CODE = (
+                "STARTUP_BUDGET_EXCEEDED",
+                "STARTUP_PROFILE_FAILED",
+            )
+            IMPORT_FAILED_MESSAGE = "Importing '{target}' failed: {error}"
+            NO_OUTPUT_MESSAGE = "No -X importtime output captured for '{target}'"
+            BUDGET_EXCEEDED_MESSAGE = (
+                "Startup of '{target}' takes {total_ms:.1f} ms, "
+                "over the {budget_ms:.1f} ms budget"
+            )
+            REPORT_HEADER = (
+                "Startup profile for {target}: {total_ms:.1f} ms in imports "
+                "(process wall {wall_ms:.1f} ms, {modules} modules)"
+            )
+            CRITICAL_PATH_HEADER = "Critical path (cumulative):"
+            SLOWEST_HEADER = "Slowest modules (self):"
+            REPORT_ROW = "{ms:10.2f} ms  {indent}{module}"
+
+        class CompletionDefaults:
+            """Shell-completion cache defaults."""
+
+            DIR_NAME, FILE_SUFFIX = ("completion", ".cache")
+            DEFAULT_SHELL, HELP_OPTION = ("bash", "--help")
+            UNSUPPORTED_SHELL_MESSAGE = (
+                "Unsupported shell '{shell}' (expected one of: {shells})"
+            )
+            WRITE_FAILED_MESSAGE = "Cannot write completion cache {path}: {error}"
+            # {function}, {prog}, {python}, {entry} and {cache} are filled in
+            # (shell-quoted) by FlextCliCompletionCache.script().
+            SCRIPTS: typing.ClassVar[dict[str, str]] = {
+                # COMP_WORDBREAKS splits "--opt=value" at "=": the words are
+                # rejoined (like _get_comp_words_by_ref -n =) and the prefix up
+                # to the last "=" stripped, as readline only replaces the rest.
+                "bash": (
+                    "{function}() {{\n"
+                    "    local IFS=$'\\n' word i\n"
+                    "    local -a words=()\n"
+                    "    for ((i = 1; i <= COMP_CWORD; i++)); do\n"
+                    "        word=${{COMP_WORDS[i]}}\n"
+                    '        if ((i > 1)) && [[ $word == "=" ||'
+                    ' ${{COMP_WORDS[i - 1]}} == "=" ]]; then\n'
+                    "            words[${{#words[@]}} - 1]+=$word\n"
+                    "        else\n"
+                    '            words+=("$word")\n'
+                    "        fi\n"
+                    "    done\n"
+                    "    COMPREPLY=($({python} -S {entry} {cache}"
+                    ' "${{words[@]}}"))\n'
+                    "    word=${{words[${{#words[@]}} - 1]}}\n"
+                    "    if [[ $word == *=* ]]; then\n"
+                    '        COMPREPLY=("${{COMPREPLY[@]#"${{word%"${{word##*=}}"}}"}}")\n'
+                    "    fi\n"
+                    "}}\n"
+                    "complete -o default -F {function} {prog}\n"
+                ),
+                "zsh": (
+                    "#compdef {prog}\n"
+                    "{function}() {{\n"
+                    "    local -a candidates\n"
+                    '    candidates=(${{(f)"$({python} -S {entry} {cache}'
+                    ' "${{(@)words[2,CURRENT]}}")"}})\n'
+                    '    compadd -- "${{candidates[@]}}"\n'
+                    "}}\n"
+                    "compdef {function} {prog}\n"
+                ),
+                "fish": (
+                    "function {function}\n"
+                    "    {python} -S {entry} {cache}"
+                    " (commandline -opc)[2..-1] (commandline -ct)\n"
+                    "end\n"
+                    "complete -c {prog} -f -a '({function})'\n"
+                ),
+            }
+
+        class BatchDefaults:
+            """Batch execution of many command lines in one process."""
+
+            OPTION, WORKERS_OPTION, STDIN_SOURCE = ("--batch", "--batch-workers", "-")
+            WORKERS, READ_BYTES = (1, 65536)
+            FAILURE_EXIT, USAGE_EXIT = (1, 2)
+            KEY_LINE, KEY_ARGV, KEY_EXIT_CODE, KEY_ERROR = (
+                "line",
+                "argv",
+                "exit_code",
+                "error",
+            )
+            KEY_STDOUT, KEY_STDERR, KEY_DURATION_MS = (
+                "stdout",
+                "stderr",
+                "duration_ms",
+            )
+            USAGE_MESSAGE = "Usage: --batch FILE|- [--batch-workers N]"
+            READ_FAILED_MESSAGE = "Cannot read batch file {path}: {error}"
+            PARSE_FAILED_MESSAGE = "Cannot parse command line: {error}"
+            CRASHED_MESSAGE = "Batch worker exited with status {status}"
+            FAILED_MESSAGE = "{failed} of {total} batch commands failed"
+
+        class SettingsCacheDefaults:
+            """Validated-settings snapshot cache defaults."""
+
+            DIR_NAME, FILE_SUFFIX, FORMAT = ("settings", ".snapshot", 2)
+            KEY_FORMAT, KEY_FINGERPRINT, KEY_FIELDS_SET, KEY_VALUES = (
+                "format",
+                "fingerprint",
+                "fields_set",
+                "values",
+            )
+            # Fingerprinted variables: those with a settings prefix, plus the
+            # ones default factories read (config_dir lives under HOME).
+            ENV_PREFIX = "FLEXT_"
+            ENV_NAMES: typing.ClassVar[tuple[str, ...]] = ("HOME", "XDG_CONFIG_HOME")
+            # Snapshot directory: config_dir as set by {env_prefix}CONFIG_DIR
+            # or the CLI-wide variable, read before settings are loaded.
+            CONFIG_DIR_FIELD, CONFIG_DIR_ENV = ("config_dir", "FLEXT_CLI_CONFIG_DIR")
+            # model_config keys naming files pydantic-settings reads.
+            INPUT_FILE_KEYS: typing.ClassVar[tuple[str, ...]] = (
+                "env_file",
+                "json_file",
+                "yaml_file",
+                "toml_file",
+            )
+            STALE_MESSAGE = "Settings snapshot {path} is missing or stale"
+            SECRETS_MESSAGE = (
+                "Settings snapshot {path} not written: secret fields are set ({fields})"
+            )
+            READ_FAILED_MESSAGE = "Cannot read settings snapshot {path}: {error}"
+            WRITE_FAILED_MESSAGE = "Cannot write settings snapshot {path}: {error}"
+
+        class ShellDefaults:
+            """Interactive shell (REPL) defaults."""
+
+            PROMPT_SUFFIX, HISTORY_SIZE = ("> ", 1000)
+            HISTORY_DIR, HISTORY_SUFFIX = ("history", ".history")
+            EXIT_COMMANDS = frozenset({"exit", "quit"})
+            HISTORY_COMMAND = "history"
+            PARSE_FAILED_MESSAGE = "Cannot parse command line: {error}"
+            HISTORY_SAVE_FAILED_MESSAGE = "Cannot save shell history {path}: {error}"
+
+        class DaemonDefaults:
+            """Warm daemon (fork server) defaults."""
+
+            DIR_NAME, SOCKET_SUFFIX = ("daemon", ".sock")
+            IDLE_TIMEOUT, POLL_SECONDS, REQUEST_TIMEOUT = (900.0, 1.0, 5.0)
+            BACKLOG, FAILURE_EXIT, INTERRUPTED_EXIT = (64, 1, 130)
+            DIR_MODE, SOCKET_MODE = (0o700, 0o600)
+            # A request whose settings fingerprint (environment, config files,
+            # working directory) differs from the daemon's runs cold instead
+            # of in a warm child.
+            MISMATCH_PROTOCOL, MISMATCH_PYTHON, MISMATCH_STALE, MISMATCH_ENV = (
+                "protocol",
+                "interpreter",
+                "stale",
+                "environment",
+            )
+            UNSUPPORTED_MESSAGE = "Warm daemon needs os.fork and Unix sockets"
+            INVALID_APP_MESSAGE = (
+                "Daemon target '{target}' is not a FlextCliAppBase subclass"
+            )
+            ALREADY_RUNNING_MESSAGE = "A daemon is already listening on {path}"
+            BIND_FAILED_MESSAGE = "Cannot listen on {path}: {error}"
+            NOT_RUNNING_MESSAGE = "No daemon is listening on {path}"
+            SPAWN_FAILED_MESSAGE = "Cannot start daemon for '{target}': {error}"
+
+        class PipelineDefaults:
+            """Command pipeline defaults."""
+
+            WORKERS, QUEUE_SIZE, POLL_SECONDS = (1, 64, 0.05)
+            # Stage timings are perf_counter_ns readings.
+            NS_PER_SECOND = 1_000_000_000
+            NO_STAGES_MESSAGE = "Pipeline has no stages"
+            UNKNOWN_COMMAND_MESSAGE = "Pipeline stage command not found: {command}"
+            INPUT_FAILED_MESSAGE = "Pipeline input failed: {error}"
+            STAGE_FAILED_MESSAGE = "Pipeline stage '{command}' raised: {error}"
+
         class MixinsFieldNames:
             """Mixin field names."""
 
@@ -911,6 +1327,12 @@ class FlextCliConstants(FlextConstants):
                 "\n",
                 ": ",
             )
+            # Written verbatim to stdout: no Rich import, wrapping or markup.
+            PLAIN_STREAM_FORMATS: typing.ClassVar[frozenset[str]] = frozenset({
+                "json",
+                "yaml",
+                "csv",
+            })
 
         class OutputFieldNames:
             """Output field names."""
@@ -0,0 +1,412 @@
+"""Warm daemon (fork server) for FlextCliAppBase applications.
+
+FlextCliDaemon imports an app once, builds it, and listens on a Unix socket.
+Each request from the ``daemon_client`` script is run in a child forked from
+that pre-warmed process, with the client's argv, environment, working
+directory and stdio descriptors, so a call costs a fork instead of importing
+Python, Pydantic, Typer and the app again. The daemon exits after
+``idle_timeout`` seconds without requests, and steps down (asking the client
+to run cold, which starts a fresh daemon) when the interpreter differs or any
+imported ``flext_cli``/``flext_core``/app source file changed since it started.
+Requests whose settings inputs differ from the daemon's (the fingerprint of
+FlextCliSettingsCache: settings environment, config files and working
+directory) run cold without retiring it.
+
+Apps should not start background threads while being built (for example the
+metrics exporter): forking a multi-threaded process only copies the calling
+thread.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import os
+import re
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, NoReturn
+
+from flext_core import r
+
+from flext_cli import c
+from flext_cli.app_base import FlextCliAppBase
+from flext_cli.daemon_client import (
+    FORMAT,
+    KEY_ARGV,
+    KEY_CWD,
+    KEY_ENV,
+    KEY_EXIT,
+    KEY_FALLBACK,
+    KEY_FORMAT,
+    KEY_PID,
+    KEY_PYTHON,
+    KEY_SPAWN,
+    KEY_STOP,
+    LENGTH_BYTES,
+    STDIO_FDS,
+    decode,
+    forward,
+    interpreter,
+    send,
+)
+from flext_cli.settings_cache import FlextCliSettingsCache
+
+_CLIENT_SCRIPT = Path(__file__).with_name("daemon_client.py")
+
+type _AppClass = type[FlextCliAppBase[Any]]
+
+
+class FlextCliDaemon:
+    """Fork server of one ``"package.module:AppClass"`` target.
+
+    Example:
+        >>> daemon = FlextCliDaemon("my_cli.app:MyApp", Path("/tmp/my-cli.sock"))
+        >>> daemon.spawn()  # background `flext-cli daemon serve ...`
+        >>> subprocess.run([*daemon.client_command(), "status"])
+
+    """
+
+    def __init__(
+        self,
+        target: str,
+        socket_path: Path,
+        idle_timeout: float = c.Cli.DaemonDefaults.IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize the daemon of ``target``.
+
+        Args:
+            target: Import path ``"package.module:AppClass"``.
+            socket_path: Unix socket to listen on (at most ~100 bytes long).
+            idle_timeout: Seconds without requests before ``serve`` returns.
+
+        """
+        super().__init__()
+        self._target = target
+        self._socket_path = socket_path
+        self._idle_timeout = idle_timeout
+        self._sources: dict[str, int] = {}
+        self._settings: FlextCliSettingsCache[Any] | None = None
+        self._settings_fingerprint = ""
+
+    @property
+    def socket_path(self) -> Path:
+        """Unix socket of the daemon."""
+        return self._socket_path
+
+    @property
+    def target(self) -> str:
+        """Import path of the app class."""
+        return self._target
+
+    @staticmethod
+    def default_socket(target: str, config_dir: Path) -> Path:
+        """Socket path of ``target`` under the config directory."""
+        defaults = c.Cli.DaemonDefaults
+        name = re.sub(r"\W", "_", target)
+        return config_dir / defaults.DIR_NAME / f"{name}{defaults.SOCKET_SUFFIX}"
+
+    @staticmethod
+    def load_app(target: str) -> r[_AppClass]:
+        """Import the FlextCliAppBase subclass named by ``target``."""
+        module_name, _, attribute = target.partition(
+            c.Cli.LazyCommandDefaults.TARGET_SEPARATOR
+        )
+        invalid = c.Cli.DaemonDefaults.INVALID_APP_MESSAGE.format(target=target)
+        if not module_name or not attribute:
+            return r[_AppClass].fail(invalid)
+        try:
+            loaded = getattr(importlib.import_module(module_name), attribute)
+        except (ImportError, AttributeError) as exc:
+            return r[_AppClass].fail(f"{invalid}: {exc}")
+        if not isinstance(loaded, type) or not issubclass(loaded, FlextCliAppBase):
+            return r[_AppClass].fail(invalid)
+        return r[_AppClass].ok(loaded)
+
+    @staticmethod
+    def _source_stamps(packages: set[str]) -> dict[str, int]:
+        """Modification times of the imported source files of ``packages``."""
+        stamps: dict[str, int] = {}
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+            if path and name.partition(".")[0] in packages:
+                with contextlib.suppress(OSError):
+                    stamps[path] = Path(path).stat().st_mtime_ns
+        return stamps
+
+    def client_command(self) -> list[str]:
+        """Command line that runs the app through this daemon (append args)."""
+        return [
+            sys.executable,
+            "-S",
+            str(_CLIENT_SCRIPT),
+            str(self._socket_path),
+            self._target,
+        ]
+
+    def run_cold(self, args: list[str], *, spawn: bool = True) -> int:
+        """Run the app in this process, starting a daemon for later calls.
+
+        Returns:
+            int: Exit status of the command.
+
+        """
+        failure = c.Cli.DaemonDefaults.FAILURE_EXIT
+        loaded = self.load_app(self._target)
+        if loaded.is_failure:
+            _ = sys.stderr.write(f"{loaded.error}\n")
+            return failure
+        if spawn:
+            _ = self.spawn()
+        return loaded.value().execute_cli_status(args)
+
+    def serve(self) -> r[bool]:
+        """Pre-warm the app and serve requests until idle, stale or stopped."""
+        defaults = c.Cli.DaemonDefaults
+        if not hasattr(os, "fork") or not hasattr(socket, "AF_UNIX"):
+            return r[bool].fail(defaults.UNSUPPORTED_MESSAGE)
+        loaded = self.load_app(self._target)
+        if loaded.is_failure:
+            return r[bool].fail(loaded.error)
+        app = loaded.value()
+        # Checked once here; forked children inherit the refreshed state.
+        _ = app.refresh_completion_cache()
+        packages = {"flext_cli", "flext_core", type(app).__module__.partition(".")[0]}
+        self._sources = self._source_stamps(packages)
+        self._settings = FlextCliSettingsCache(app.app_name, type(app).config_class)
+        self._settings_fingerprint = self._settings.fingerprint()
+        listening = self._listen()
+        if listening.is_failure:
+            return r[bool].fail(listening.error)
+        listener = listening.value
+        bound = self._socket_path.stat().st_ino
+        try:
+            self._loop(listener, app)
+        finally:
+            listener.close()
+            # A successor may already listen on the path; leave its socket.
+            with contextlib.suppress(OSError):
+                if self._socket_path.stat().st_ino == bound:
+                    self._socket_path.unlink()
+        return r[bool].ok(value=True)
+
+    def spawn(self) -> r[int]:
+        """Start ``flext-cli daemon serve`` detached from this session.
+
+        Returns:
+            r[int]: Process id of the daemon.
+
+        """
+        command = [sys.executable, "-m", "flext_cli", "daemon", "serve"]
+        command += [self._target, "--socket", str(self._socket_path)]
+        command += ["--idle-timeout", str(self._idle_timeout)]
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except OSError as exc:
+            return r[int].fail(
+                c.Cli.DaemonDefaults.SPAWN_FAILED_MESSAGE.format(
+                    target=self._target, error=exc
+                )
+            )
+        return r[int].ok(process.pid)
+
+    def stop(self) -> r[bool]:
+        """Ask the daemon to exit; running commands finish on their own."""
+        reply = forward(
+            str(self._socket_path), {KEY_FORMAT: FORMAT, KEY_STOP: True}, fds=()
+        )
+        if reply is None:
+            return r[bool].fail(
+                c.Cli.DaemonDefaults.NOT_RUNNING_MESSAGE.format(path=self._socket_path)
+            )
+        return r[bool].ok(value=True)
+
+    def _listen(self) -> r[socket.socket]:
+        defaults = c.Cli.DaemonDefaults
+        path = self._socket_path
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        with probe, contextlib.suppress(OSError):
+            probe.connect(str(path))
+            return r[socket.socket].fail(
+                defaults.ALREADY_RUNNING_MESSAGE.format(path=path)
+            )
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            path.parent.mkdir(mode=defaults.DIR_MODE, parents=True, exist_ok=True)
+            path.unlink(missing_ok=True)
+            listener.bind(str(path))
+            path.chmod(defaults.SOCKET_MODE)
+            listener.listen(defaults.BACKLOG)
+        except OSError as exc:
+            listener.close()
+            return r[socket.socket].fail(
+                defaults.BIND_FAILED_MESSAGE.format(path=path, error=exc)
+            )
+        return r[socket.socket].ok(listener)
+
+    def _loop(self, listener: socket.socket, app: FlextCliAppBase[Any]) -> None:
+        """Accept requests until idle for ``idle_timeout`` or told to stop.
+
+        Children still running afterwards are left to finish on their own.
+        """
+        listener.settimeout(c.Cli.DaemonDefaults.POLL_SECONDS)
+        children: set[int] = set()
+        last_active = time.monotonic()
+        while True:
+            self._reap(children)
+            if children:
+                last_active = time.monotonic()
+            try:
+                conn, _ = listener.accept()
+            except TimeoutError:
+                if time.monotonic() - last_active >= self._idle_timeout:
+                    return
+                continue
+            last_active = time.monotonic()
+            with conn:
+                if not self._handle(conn, listener, app, children):
+                    return
+
+    @staticmethod
+    def _reap(children: set[int]) -> None:
+        for pid in list(children):
+            with contextlib.suppress(ChildProcessError):
+                done, _ = os.waitpid(pid, os.WNOHANG)
+                if not done:
+                    continue
+            children.discard(pid)
+
+    def _mismatch(self, request: Mapping[str, object]) -> str | None:
+        """Why ``request`` cannot run in a warm child, or None if it can."""
+        defaults = c.Cli.DaemonDefaults
+        if request.get(KEY_FORMAT) != FORMAT:
+            return defaults.MISMATCH_PROTOCOL
+        if request.get(KEY_PYTHON) != interpreter():
+            return defaults.MISMATCH_PYTHON
+        if any(self._stamp(path) != stamp for path, stamp in self._sources.items()):
+            return defaults.MISMATCH_STALE
+        env, cwd = request.get(KEY_ENV), request.get(KEY_CWD)
+        if (
+            self._settings is None
+            or not isinstance(env, dict)
+            or not isinstance(cwd, str)
+            or self._settings.fingerprint(env, Path(cwd)) != self._settings_fingerprint
+        ):
+            return defaults.MISMATCH_ENV
+        return None
+
+    @staticmethod
+    def _stamp(path: str) -> int | None:
+        try:
+            return Path(path).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _handle(
+        self,
+        conn: socket.socket,
+        listener: socket.socket,
+        app: FlextCliAppBase[Any],
+        children: set[int],
+    ) -> bool:
+        """Serve one connection; returns whether to keep accepting requests."""
+        conn.settimeout(c.Cli.DaemonDefaults.REQUEST_TIMEOUT)
+        fds: list[int] = []
+        try:
+            head, fds, _, _ = socket.recv_fds(conn, LENGTH_BYTES, len(STDIO_FDS))
+            return self._dispatch(
+                conn, decode(conn, head), fds, listener, app, children
+            )
+        except (OSError, EOFError, ValueError, TypeError):
+            return True
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def _dispatch(
+        self,
+        conn: socket.socket,
+        request: Mapping[str, object],
+        fds: list[int],
+        listener: socket.socket,
+        app: FlextCliAppBase[Any],
+        children: set[int],
+    ) -> bool:
+        """Answer a stop or fallback request, or fork a child for a command."""
+        defaults = c.Cli.DaemonDefaults
+        if request.get(KEY_STOP) and request.get(KEY_FORMAT) == FORMAT:
+            send(conn, {KEY_EXIT: 0})
+            return False
+        reason = (
+            self._mismatch(request)
+            if len(fds) == len(STDIO_FDS)
+            else defaults.MISMATCH_PROTOCOL
+        )
+        if reason is not None:
+            # Only a changed environment keeps this daemon serving.
+            stale = reason != defaults.MISMATCH_ENV
+            send(conn, {KEY_FALLBACK: reason, KEY_SPAWN: stale})
+            return not stale
+        conn.settimeout(None)
+        pid = os.fork()
+        if pid == 0:
+            listener.close()
+            self._run_child(conn, fds, request, app)
+        children.add(pid)
+        return True
+
+    @staticmethod
+    def _enter_request(fds: list[int], request: Mapping[str, object]) -> list[str]:
+        """Adopt the client's stdio, environment and directory; return argv."""
+        for std_fd, fd in zip(STDIO_FDS, fds, strict=True):
+            _ = os.dup2(fd, std_fd)
+        env = request.get(KEY_ENV)
+        os.environ.clear()
+        os.environ.update(env if isinstance(env, dict) else {})
+        os.chdir(str(request.get(KEY_CWD)))
+        argv = request.get(KEY_ARGV)
+        return [str(arg) for arg in argv] if isinstance(argv, list) else []
+
+    @classmethod
+    def _run_child(
+        cls,
+        conn: socket.socket,
+        fds: list[int],
+        request: Mapping[str, object],
+        app: FlextCliAppBase[Any],
+    ) -> NoReturn:
+        """Run the request in this forked child and exit with its status."""
+        defaults = c.Cli.DaemonDefaults
+        status = defaults.FAILURE_EXIT
+        try:
+            argv = cls._enter_request(fds, request)
+            sys.argv = [app.app_name, *argv]
+            send(conn, {KEY_PID: os.getpid()})
+            status = app.execute_cli_status(argv)
+        except KeyboardInterrupt:
+            status = defaults.INTERRUPTED_EXIT
+        except OSError:
+            status = defaults.FAILURE_EXIT
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                with contextlib.suppress(OSError, ValueError):
+                    stream.flush()
+            with contextlib.suppress(OSError):
+                send(conn, {KEY_EXIT: status})
+            os._exit(status)
+
+
+__all__ = ["FlextCliDaemon"]
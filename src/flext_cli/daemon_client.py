@@ -0,0 +1,173 @@
+"""Thin client of the flext-cli warm daemon (see FlextCliDaemon).
+
+Wrapper scripts run this file by path::
+
+    python -S daemon_client.py SOCKET package.module:AppClass [ARGS...]
+
+It forwards argv, environment, working directory and its stdin/stdout/stderr
+descriptors to the daemon listening on SOCKET, which forks a pre-warmed child
+to run the app, and exits with the child's status; Ctrl-C is forwarded to the
+child. Like ``completion_entry`` it never imports ``flext_cli`` itself, and it
+uses the built-in ``_socket``/``_signal`` modules directly because ``socket``
+and ``signal`` pull in ``enum`` and ``selectors`` (~10ms per call). When no daemon answers, or
+the daemon asks for a cold run (it is stale, or the settings inputs differ), the client execs ``python -m flext_cli daemon run``, which runs the
+app in-process and starts a fresh daemon for the next call.
+
+Every message is a 4-byte big-endian length followed by a ``marshal`` record.
+Requests carry ``format``, ``python``, ``argv``, ``cwd`` and ``env`` (or
+``stop``); command requests have the three stdio descriptors attached to the
+length prefix.
+Replies are ``{"pid": child}`` followed by ``{"exit": status}``, or
+``{"fallback": reason, "spawn": bool}`` when the request must run cold.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import _signal
+import _socket
+import array
+import marshal
+import os
+import sys
+
+KEY_FORMAT, KEY_PYTHON, KEY_ARGV, KEY_CWD, KEY_ENV, KEY_STOP = (
+    "format",
+    "python",
+    "argv",
+    "cwd",
+    "env",
+    "stop",
+)
+KEY_PID, KEY_EXIT, KEY_FALLBACK, KEY_SPAWN = ("pid", "exit", "fallback", "spawn")
+FORMAT = 1
+LENGTH_BYTES, BYTE_ORDER = (4, "big")
+STDIO_FDS = (0, 1, 2)
+# Status when the child dies without reporting one (EX_SOFTWARE).
+CRASHED_EXIT, USAGE_EXIT = (70, 2)
+MIN_ARGS = 2  # SOCKET and target
+USAGE = "usage: daemon_client.py SOCKET module:AppClass [ARGS...]\n"
+
+
+def interpreter() -> str:
+    """Resolved path of the running interpreter, compared by the daemon."""
+    return os.path.realpath(sys.executable)
+
+
+def read_exact(conn: _socket.socket, size: int, head: bytes = b"") -> bytes:
+    """Read until ``size`` bytes (including ``head``) arrived.
+
+    Raises:
+        EOFError: If the peer closed the connection first.
+
+    """
+    data = bytearray(head)
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise EOFError
+        data += chunk
+    return bytes(data)
+
+
+def decode(conn: _socket.socket, head: bytes = b"") -> dict[str, object]:
+    """Read one record whose length prefix starts with ``head``."""
+    size = int.from_bytes(read_exact(conn, LENGTH_BYTES, head), BYTE_ORDER)
+    record = marshal.loads(read_exact(conn, size))
+    if not isinstance(record, dict):
+        raise TypeError
+    return record
+
+
+def send(
+    conn: _socket.socket, record: dict[str, object], fds: tuple[int, ...] = ()
+) -> None:
+    """Write one record, attaching ``fds`` to its length prefix."""
+    data = marshal.dumps(record)
+    prefix = len(data).to_bytes(LENGTH_BYTES, BYTE_ORDER)
+    if fds:
+        rights = array.array("i", fds).tobytes()
+        _ = conn.sendmsg([prefix], [(_socket.SOL_SOCKET, _socket.SCM_RIGHTS, rights)])
+    else:
+        conn.sendall(prefix)
+    conn.sendall(data)
+
+
+def forward(
+    socket_path: str, record: dict[str, object], fds: tuple[int, ...] = STDIO_FDS
+) -> dict[str, object] | None:
+    """Send ``record`` with ``fds`` (our stdio) and return the final reply.
+
+    While waiting, SIGINT is forwarded to the child running the command; the
+    previous handler is restored afterwards.
+
+    Returns None when the daemon cannot be reached.
+    """
+    conn = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        try:
+            conn.connect(socket_path)
+            send(conn, record, fds)
+        except OSError:
+            return None
+        child = [0]
+
+        def interrupt(signum: int, _frame: object) -> None:
+            if child[0]:
+                os.kill(child[0], signum)
+
+        previous = _signal.signal(_signal.SIGINT, interrupt)
+        try:
+            while True:
+                try:
+                    reply = decode(conn)
+                except (OSError, EOFError, ValueError, TypeError):
+                    return {KEY_EXIT: CRASHED_EXIT}
+                pid = reply.get(KEY_PID)
+                if not isinstance(pid, int):
+                    return reply
+                child[0] = pid
+        finally:
+            if previous is not None:
+                _ = _signal.signal(_signal.SIGINT, previous)
+    finally:
+        conn.close()
+
+
+def request(argv: list[str]) -> dict[str, object]:
+    """Build the request running ``argv`` here, in this environment."""
+    return {
+        KEY_FORMAT: FORMAT,
+        KEY_PYTHON: interpreter(),
+        KEY_ARGV: argv,
+        KEY_CWD: os.getcwd(),
+        KEY_ENV: dict(os.environ),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the app through the daemon, falling back to a cold run."""
+    args = list(sys.argv[1:] if argv is None else argv)
+    if len(args) < MIN_ARGS:
+        _ = sys.stderr.write(USAGE)
+        return USAGE_EXIT
+    socket_path, target, *command = args
+    reply = forward(socket_path, request(command))
+    status = reply.get(KEY_EXIT) if reply is not None else None
+    if isinstance(status, int):
+        return status
+    cold = [sys.executable, "-m", "flext_cli", "daemon", "run", target]
+    cold += ["--socket", socket_path]
+    if reply is not None and not reply.get(KEY_SPAWN):
+        cold.append("--no-spawn")
+    try:
+        os.execv(sys.executable, [*cold, "--", *command])
+    except OSError as exc:
+        _ = sys.stderr.write(f"{exc}\n")
+    return CRASHED_EXIT
+
+
+if __name__ == "__main__":
+    sys.exit(main())
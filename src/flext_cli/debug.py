@@ -19,9 +19,15 @@ from collections.abc import Mapping, MutableMapping
 from typing import override
 
 from flext_core import r
-from rich.errors import ConsoleError, LiveError, StyleError
 
-from flext_cli import FlextCliServiceBase, FlextCliUtilities, c, m, u
+from flext_cli import (
+    FlextCliFormatters,
+    FlextCliServiceBase,
+    FlextCliUtilities,
+    c,
+    m,
+    u,
+)
 from flext_cli.typings import FlextCliTypes
 
 
@@ -150,9 +156,7 @@ class FlextCliDebug(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             errors.append(
                 c.Cli.ErrorMessages.FILESYSTEM_VALIDATION_FAILED.format(error=e)
@@ -175,9 +179,7 @@ class FlextCliDebug(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 c.Cli.DebugErrorMessages.HEALTH_CHECK_FAILED.format(error=e)
@@ -199,9 +201,7 @@ class FlextCliDebug(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 c.Cli.DebugErrorMessages.TRACE_EXECUTION_FAILED.format(error=e)
@@ -222,9 +222,7 @@ class FlextCliDebug(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[Mapping[str, str]].fail(
                 c.Cli.DebugErrorMessages.CONNECTIVITY_TEST_FAILED.format(error=e)
@@ -263,9 +261,7 @@ class FlextCliDebug(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 c.Cli.DebugErrorMessages.COMPREHENSIVE_DEBUG_INFO_FAILED.format(error=e)
@@ -301,9 +297,7 @@ class FlextCliDebug(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 c.Cli.DebugErrorMessages.DEBUG_INFO_COLLECTION_FAILED.format(error=e)
@@ -321,9 +315,7 @@ class FlextCliDebug(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 c.Cli.DebugErrorMessages.ENVIRONMENT_INFO_FAILED.format(error=e)
@@ -341,9 +333,7 @@ class FlextCliDebug(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 c.Cli.DebugErrorMessages.SYSTEM_INFO_COLLECTION_FAILED.format(error=e)
@@ -366,9 +356,7 @@ class FlextCliDebug(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 c.Cli.DebugErrorMessages.SYSTEM_PATHS_COLLECTION_FAILED.format(error=e)
@@ -383,9 +371,7 @@ class FlextCliDebug(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[list[str]].fail(
                 c.Cli.DebugErrorMessages.ENVIRONMENT_VALIDATION_FAILED.format(error=e)
@@ -13,11 +13,11 @@ from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import TextIO, TypeGuard
 
-import yaml
 from flext_core import r
 from pydantic import TypeAdapter, ValidationError
 
 from flext_cli import c, m, t, u
+from flext_cli.metrics import FlextCliMetricsRegistry
 from flext_cli.typings import FlextCliTypes
 
 _JSON_OBJECT_ADAPTER: TypeAdapter[object] = TypeAdapter(object)
@@ -122,6 +122,17 @@ class FlextCliFileTools:
             c.Cli.FileErrorMessages.UNSUPPORTED_FORMAT_EXTENSION.format(extension=ext)
         )
 
+    @staticmethod
+    def _track_io[T](result: r[T], direction: str, file_path: str | Path) -> r[T]:
+        """Feed the file size into the I/O byte counter when ``result`` succeeded."""
+        if result.is_success:
+            try:
+                size = Path(file_path).stat().st_size
+            except OSError:
+                return result
+            FlextCliMetricsRegistry.get_global().record_file_io(direction, size)
+        return result
+
     @staticmethod
     def _write_structured_file(
         file_path: str | Path, writer: Callable[[TextIO], None], error_template: str
@@ -133,7 +144,11 @@ class FlextCliFileTools:
                 writer(f)
             return True
 
-        return FlextCliFileTools._execute_file_operation(_write, error_template)
+        return FlextCliFileTools._track_io(
+            FlextCliFileTools._execute_file_operation(_write, error_template),
+            c.Cli.MetricsDefaults.IO_WRITE,
+            path,
+        )
 
     @staticmethod
     def calculate_file_hash(file_path: str | Path, algorithm: str = "sha256") -> r[str]:
@@ -378,24 +393,36 @@ class FlextCliFileTools:
     @staticmethod
     def read_binary_file(file_path: str | Path) -> r[bytes]:
         p = Path(file_path)
-        return FlextCliFileTools._execute_file_operation(
-            p.read_bytes, c.Cli.FileErrorMessages.BINARY_READ_FAILED
+        return FlextCliFileTools._track_io(
+            FlextCliFileTools._execute_file_operation(
+                p.read_bytes, c.Cli.FileErrorMessages.BINARY_READ_FAILED
+            ),
+            c.Cli.MetricsDefaults.IO_READ,
+            p,
         )
 
     @staticmethod
     def read_csv_file(file_path: str | Path) -> r[list[list[str]]]:
         path = Path(file_path)
-        return FlextCliFileTools._execute_file_operation(
-            lambda: FlextCliFileTools._read_csv_rows(path),
-            c.Cli.FileErrorMessages.CSV_READ_FAILED,
+        return FlextCliFileTools._track_io(
+            FlextCliFileTools._execute_file_operation(
+                lambda: FlextCliFileTools._read_csv_rows(path),
+                c.Cli.FileErrorMessages.CSV_READ_FAILED,
+            ),
+            c.Cli.MetricsDefaults.IO_READ,
+            path,
         )
 
     @staticmethod
     def read_csv_file_with_headers(file_path: str | Path) -> r[list[Mapping[str, str]]]:
         path = Path(file_path)
-        return FlextCliFileTools._execute_file_operation(
-            lambda: FlextCliFileTools._read_csv_dict_rows(path),
-            c.Cli.FileErrorMessages.CSV_READ_FAILED,
+        return FlextCliFileTools._track_io(
+            FlextCliFileTools._execute_file_operation(
+                lambda: FlextCliFileTools._read_csv_dict_rows(path),
+                c.Cli.FileErrorMessages.CSV_READ_FAILED,
+            ),
+            c.Cli.MetricsDefaults.IO_READ,
+            path,
         )
 
     @staticmethod
@@ -409,8 +436,12 @@ class FlextCliFileTools:
                 raise ValueError(msg)
             return parsed
 
-        return FlextCliFileTools._execute_file_operation(
-            _load, c.Cli.FileErrorMessages.JSON_LOAD_FAILED
+        return FlextCliFileTools._track_io(
+            FlextCliFileTools._execute_file_operation(
+                _load, c.Cli.FileErrorMessages.JSON_LOAD_FAILED
+            ),
+            c.Cli.MetricsDefaults.IO_READ,
+            file_path,
         )
 
     @staticmethod
@@ -433,15 +464,21 @@ class FlextCliFileTools:
     @staticmethod
     def read_text_file(file_path: str | Path) -> r[str]:
         p = Path(file_path)
-        return FlextCliFileTools._execute_file_operation(
-            lambda: p.read_text(encoding=c.Cli.Utilities.DEFAULT_ENCODING),
-            c.Cli.ErrorMessages.TEXT_FILE_READ_FAILED,
+        return FlextCliFileTools._track_io(
+            FlextCliFileTools._execute_file_operation(
+                lambda: p.read_text(encoding=c.Cli.Utilities.DEFAULT_ENCODING),
+                c.Cli.ErrorMessages.TEXT_FILE_READ_FAILED,
+            ),
+            c.Cli.MetricsDefaults.IO_READ,
+            p,
         )
 
     @staticmethod
     def read_yaml_file(file_path: str | Path) -> r[object]:
 
         def _load() -> FlextCliTypes.Cli.JsonValue:
+            import yaml
+
             out = FlextCliFileTools._load_structured_file(
                 str(file_path), yaml.safe_load
             )
@@ -450,8 +487,12 @@ class FlextCliFileTools:
                 raise ValueError(msg)
             return out
 
-        return FlextCliFileTools._execute_file_operation(
-            _load, c.Cli.FileErrorMessages.YAML_LOAD_FAILED
+        return FlextCliFileTools._track_io(
+            FlextCliFileTools._execute_file_operation(
+                _load, c.Cli.FileErrorMessages.YAML_LOAD_FAILED
+            ),
+            c.Cli.MetricsDefaults.IO_READ,
+            file_path,
         )
 
     @staticmethod
@@ -482,8 +523,13 @@ class FlextCliFileTools:
     @staticmethod
     def write_binary_file(file_path: str | Path, content: bytes) -> r[bool]:
         p = Path(file_path)
-        return FlextCliFileTools._run_bool_operation(
-            lambda: p.write_bytes(content), c.Cli.FileErrorMessages.BINARY_WRITE_FAILED
+        return FlextCliFileTools._track_io(
+            FlextCliFileTools._run_bool_operation(
+                lambda: p.write_bytes(content),
+                c.Cli.FileErrorMessages.BINARY_WRITE_FAILED,
+            ),
+            c.Cli.MetricsDefaults.IO_WRITE,
+            p,
         )
 
     @staticmethod
@@ -496,8 +542,12 @@ class FlextCliFileTools:
             ) as f:
                 csv.writer(f).writerows(data)
 
-        return FlextCliFileTools._run_bool_operation(
-            _write, c.Cli.FileErrorMessages.CSV_WRITE_FAILED
+        return FlextCliFileTools._track_io(
+            FlextCliFileTools._run_bool_operation(
+                _write, c.Cli.FileErrorMessages.CSV_WRITE_FAILED
+            ),
+            c.Cli.MetricsDefaults.IO_WRITE,
+            path,
         )
 
     @staticmethod
@@ -528,11 +578,15 @@ class FlextCliFileTools:
         encoding: str | None = c.Cli.Utilities.DEFAULT_ENCODING,
     ) -> r[bool]:
         p = Path(file_path)
-        return FlextCliFileTools._run_bool_operation(
-            lambda: p.write_text(
-                content, encoding=FlextCliFileTools._get_encoding(encoding)
+        return FlextCliFileTools._track_io(
+            FlextCliFileTools._run_bool_operation(
+                lambda: p.write_text(
+                    content, encoding=FlextCliFileTools._get_encoding(encoding)
+                ),
+                c.Cli.ErrorMessages.TEXT_FILE_WRITE_FAILED,
             ),
-            c.Cli.ErrorMessages.TEXT_FILE_WRITE_FAILED,
+            c.Cli.MetricsDefaults.IO_WRITE,
+            p,
         )
 
     @staticmethod
@@ -544,6 +598,8 @@ class FlextCliFileTools:
         sort_keys: bool = False,
         allow_unicode: bool = True,
     ) -> r[bool]:
+        import yaml
+
         return FlextCliFileTools._write_structured_file(
             file_path,
             lambda f: yaml.safe_dump(
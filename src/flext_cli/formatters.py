@@ -3,6 +3,9 @@
 Provides minimal CLI formatting abstraction. Uses Rich directly for all operations.
 Following zero-tolerance principle: Use libraries, don't reimplement.
 
+Rich is imported on first use (each Rich module costs tens of milliseconds),
+so commands that only emit JSON never load it.
+
 Copyright (c) 2025 FLEXT Team. All rights reserved.
 SPDX-License-Identifier: MIT
 
@@ -10,25 +13,27 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import functools
 import sys
 from collections.abc import Mapping
 from io import StringIO
-from typing import Literal, Self, overload, override
+from typing import TYPE_CHECKING, Literal, Self, overload, override
 
 from flext_core import FlextLogger, r, u
-from rich.console import Console
-from rich.errors import ConsoleError, LiveError, NotRenderableError, StyleError
-from rich.layout import Layout as RichLayout
-from rich.live import Live as RichLive
-from rich.panel import Panel as RichPanel
-from rich.progress import Progress
-from rich.status import Status as RichStatus
-from rich.table import Table as RichTable
-from rich.tree import Tree as RichTree
 
 from flext_cli import c, p
 from flext_cli.typings import FlextCliTypes
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.layout import Layout as RichLayout
+    from rich.live import Live as RichLive
+    from rich.panel import Panel as RichPanel
+    from rich.progress import Progress
+    from rich.status import Status as RichStatus
+    from rich.table import Table as RichTable
+    from rich.tree import Tree as RichTree
+
 _logger = FlextLogger(__name__)
 
 
@@ -98,9 +103,31 @@ class FlextCliFormatters:
             return self._tree
 
     def __init__(self) -> None:
-        """Initialize Rich formatters with direct Rich imports."""
+        """Initialize Rich formatters; the console is created on first use."""
         super().__init__()
-        self.console: Console = Console()
+        self._console: Console | None = None
+
+    @property
+    def console(self) -> Console:
+        """Rich console shared by this instance (imports Rich on first access)."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
+
+    @staticmethod
+    @functools.cache
+    def rich_errors() -> tuple[type[Exception], ...]:
+        """Return Rich's ``(ConsoleError, StyleError, LiveError)``, imported once.
+
+        Meant for ``except (ValueError, *FlextCliFormatters.rich_errors())``:
+        an ``except`` tuple is only evaluated while matching an exception, so
+        modules catching Rich errors do not import Rich up front.
+        """
+        from rich.errors import ConsoleError, LiveError, StyleError
+
+        return (ConsoleError, StyleError, LiveError)
 
     @staticmethod
     def create_layout() -> r[RichLayout]:
@@ -114,6 +141,9 @@ class FlextCliFormatters:
             directly using Rich.
 
         """
+        from rich.errors import ConsoleError
+        from rich.layout import Layout as RichLayout
+
         try:
             layout = RichLayout()
             return r[RichLayout].ok(layout)
@@ -142,6 +172,9 @@ class FlextCliFormatters:
             directly using Rich.
 
         """
+        from rich.errors import ConsoleError, StyleError
+        from rich.panel import Panel as RichPanel
+
         try:
             validated_border_style = (
                 border_style
@@ -168,6 +201,9 @@ class FlextCliFormatters:
             directly using Rich.
 
         """
+        from rich.errors import ConsoleError
+        from rich.progress import Progress
+
         try:
             progress = Progress()
             return r[Progress].ok(progress)
@@ -198,6 +234,9 @@ class FlextCliFormatters:
             access self.console directly and create Rich tables.
 
         """
+        from rich.errors import ConsoleError, StyleError
+        from rich.table import Table as RichTable
+
         try:
             table = RichTable(title=title)
             if headers:
@@ -234,6 +273,9 @@ class FlextCliFormatters:
             Use tree.add(label) for side-effect; tree.add(label, return_child=True) to chain.
 
         """
+        from rich.errors import ConsoleError
+        from rich.tree import Tree as RichTree
+
         try:
             tree = RichTree(label)
             return r[FlextCliFormatters.Tree].ok(FlextCliFormatters.Tree(tree))
@@ -256,6 +298,9 @@ class FlextCliFormatters:
             For custom live displays, access self.console directly and create Live objects.
 
         """
+        from rich.errors import ConsoleError, LiveError
+        from rich.live import Live as RichLive
+
         try:
             validated_refresh_rate = (
                 refresh_per_second
@@ -284,6 +329,9 @@ class FlextCliFormatters:
             For custom spinners, access self.console directly and create Status objects.
 
         """
+        from rich.errors import ConsoleError, StyleError
+        from rich.status import Status as RichStatus
+
         try:
             validated_spinner = (
                 spinner
@@ -318,6 +366,8 @@ class FlextCliFormatters:
             For advanced Rich features, access self.console directly.
 
         """
+        from rich.errors import ConsoleError, StyleError
+
         try:
             self.console.print(message, style=style)
         except (ConsoleError, StyleError) as exc:
@@ -342,6 +392,9 @@ class FlextCliFormatters:
             r[str]: Rendered table string or error
 
         """
+        from rich.console import Console
+        from rich.errors import ConsoleError, NotRenderableError
+
         try:
             console = Console(width=width) if width else self.console
             buffer = StringIO()
@@ -367,6 +420,9 @@ class FlextCliFormatters:
             r[str]: Rendered tree string or error
 
         """
+        from rich.console import Console
+        from rich.errors import ConsoleError, NotRenderableError
+
         inner = tree.tree if isinstance(tree, FlextCliFormatters.Tree) else tree
         try:
             buffer = StringIO()
@@ -0,0 +1,763 @@
+"""Command execution metrics for flext-cli.
+
+FlextCliLatencyHistogram records latencies into HDR-style logarithmic buckets
+(constant relative precision, sparse storage) and FlextCliExecutionMetrics
+aggregates per-command execution counts, failures and latency histograms.
+Both are thread-safe and cheap enough to sit on the dispatch hot path of
+FlextCliCore and FlextCliCommands; snapshots are exposed as `m.Cli` models.
+
+FlextCliMetricsRegistry holds process-wide counters, gauges and histograms
+(command executions, file I/O bytes, rendered output rows) and
+FlextCliOpenMetricsExporter writes them atomically as OpenMetrics text for
+node-exporter textfile collectors.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import abc
+import atexit
+import bisect
+import math
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import ClassVar
+
+from flext_core import r
+
+from flext_cli import c, m
+from flext_cli.settings import FlextCliSettings
+
+
+class FlextCliLatencyHistogram:
+    """Log-bucketed latency histogram with HDR-style sub-bucket precision.
+
+    Values below ``2**bits`` nanoseconds get exact buckets; larger values are
+    split into ``2**(bits - 1)`` sub-buckets per power of two, bounding the
+    relative error of reported percentiles to ``2**-(bits - 1)``.
+    """
+
+    __slots__ = ("_bits", "_count", "_counts", "_half", "_lock", "_max", "_min", "_sum")
+
+    def __init__(
+        self, sub_bucket_bits: int = c.Cli.MetricsDefaults.HISTOGRAM_SUB_BUCKET_BITS
+    ) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            sub_bucket_bits: Precision bits; 5 gives ~3% relative error.
+
+        """
+        super().__init__()
+        self._bits = sub_bucket_bits
+        self._half = 1 << (sub_bucket_bits - 1)
+        self._counts: dict[int, int] = {}
+        self._count = 0
+        self._sum = 0
+        self._min = 0
+        self._max = 0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        """Number of recorded values."""
+        return self._count
+
+    def _bucket_index(self, value_ns: int) -> int:
+        if value_ns < (1 << self._bits):
+            return value_ns
+        shift = value_ns.bit_length() - self._bits
+        return shift * self._half + (value_ns >> shift)
+
+    def _bucket_bounds(self, index: int) -> tuple[int, int]:
+        if index < (1 << self._bits):
+            return index, index
+        shift = index // self._half - 1
+        mantissa = index - shift * self._half
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def record(self, value_ns: int) -> None:
+        """Record one latency sample.
+
+        Args:
+            value_ns: Latency in nanoseconds (negative values clamp to zero).
+
+        """
+        value_ns = max(value_ns, 0)
+        index = self._bucket_index(value_ns)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            if self._count == 0 or value_ns < self._min:
+                self._min = value_ns
+            self._max = max(self._max, value_ns)
+            self._count += 1
+            self._sum += value_ns
+
+    def percentile(self, percent: float) -> int:
+        """Return the value at ``percent`` (0-100) in nanoseconds.
+
+        The midpoint of the matching bucket is reported, clamped to the
+        observed min/max so single-sample histograms stay exact.
+        """
+        with self._lock:
+            return self._percentile_locked(sorted(self._counts.items()), percent)
+
+    def _percentile_locked(self, buckets: list[tuple[int, int]], percent: float) -> int:
+        if self._count == 0:
+            return 0
+        rank = max(1, math.ceil(self._count * percent / 100.0))
+        seen = 0
+        for index, bucket_count in buckets:
+            seen += bucket_count
+            if seen >= rank:
+                lower, upper = self._bucket_bounds(index)
+                return min(max((lower + upper) // 2, self._min), self._max)
+        return self._max
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        with self._lock:
+            self._counts.clear()
+            self._count = self._sum = self._min = self._max = 0
+
+    def snapshot(self) -> m.Cli.LatencyHistogramSnapshot:
+        """Return an immutable snapshot with p50/p95/p99 in seconds."""
+        defaults = c.Cli.MetricsDefaults
+        scale = float(defaults.NANOS_PER_SECOND)
+        with self._lock:
+            buckets = sorted(self._counts.items())
+            p50, p95, p99 = (
+                self._percentile_locked(buckets, pct)
+                for pct in (defaults.P50, defaults.P95, defaults.P99)
+            )
+            count, total, low, high = self._count, self._sum, self._min, self._max
+        return m.Cli.LatencyHistogramSnapshot(
+            count=count,
+            min_seconds=low / scale,
+            max_seconds=high / scale,
+            mean_seconds=(total / count / scale) if count else 0.0,
+            p50_seconds=p50 / scale,
+            p95_seconds=p95 / scale,
+            p99_seconds=p99 / scale,
+            bucket_upper_bounds_ns=[self._bucket_bounds(i)[1] for i, _ in buckets],
+            bucket_counts=[n for _, n in buckets],
+        )
+
+
+class FlextCliExecutionMetrics:
+    """Per-command execution counters and latency histograms.
+
+    Example:
+        >>> metrics = FlextCliExecutionMetrics()
+        >>> start = time.perf_counter_ns()
+        >>> result = handler()
+        >>> metrics.record(
+        ...     "deploy",
+        ...     time.perf_counter_ns() - start,
+        ...     success=result.is_success,
+        ... )
+        >>> metrics.to_json()
+
+    """
+
+    class _CommandEntry:
+        """Mutable counters for a single command."""
+
+        __slots__ = ("executions", "failures", "histogram")
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.executions = 0
+            self.failures = 0
+            self.histogram = FlextCliLatencyHistogram()
+
+    def __init__(self, registry: FlextCliMetricsRegistry | None = None) -> None:
+        """Initialize an empty metrics collector.
+
+        Args:
+            registry: Registry that also receives every execution; defaults to
+                the process-wide `FlextCliMetricsRegistry`.
+
+        """
+        super().__init__()
+        self._entries: dict[str, FlextCliExecutionMetrics._CommandEntry] = {}
+        self._lock = threading.Lock()
+        self._executions = 0
+        self._failures = 0
+        self._registry = (
+            registry if registry is not None else FlextCliMetricsRegistry.get_global()
+        )
+
+    @property
+    def total_executions(self) -> int:
+        """Executions recorded across all commands."""
+        return self._executions
+
+    @property
+    def total_failures(self) -> int:
+        """Failures recorded across all commands."""
+        return self._failures
+
+    def record(self, command_name: str, elapsed_ns: int, *, success: bool) -> None:
+        """Record one command execution.
+
+        Args:
+            command_name: Registered command name.
+            elapsed_ns: Wall-clock latency in nanoseconds.
+            success: Whether the execution returned a successful result.
+
+        """
+        entry = self._entries.get(command_name)
+        if entry is None:
+            with self._lock:
+                entry = self._entries.setdefault(
+                    command_name, FlextCliExecutionMetrics._CommandEntry()
+                )
+        with self._lock:
+            entry.executions += 1
+            self._executions += 1
+            if not success:
+                entry.failures += 1
+                self._failures += 1
+        entry.histogram.record(elapsed_ns)
+        self._registry.record_command_execution(
+            command_name, elapsed_ns, success=success
+        )
+
+    def reset(self) -> None:
+        """Discard all recorded executions."""
+        with self._lock:
+            self._entries.clear()
+            self._executions = self._failures = 0
+
+    def command_stats(self, command_name: str) -> m.Cli.CommandExecutionStats | None:
+        """Return the snapshot for one command, or None if never executed."""
+        entry = self._entries.get(command_name)
+        if entry is None:
+            return None
+        return m.Cli.CommandExecutionStats(
+            command_name=command_name,
+            executions=entry.executions,
+            failures=entry.failures,
+            latency=entry.histogram.snapshot(),
+        )
+
+    def snapshot(self) -> dict[str, m.Cli.CommandExecutionStats]:
+        """Return snapshots for every executed command keyed by name."""
+        with self._lock:
+            names = list(self._entries)
+        snapshots: dict[str, m.Cli.CommandExecutionStats] = {}
+        for name in names:
+            stats = self.command_stats(name)
+            if stats is not None:
+                snapshots[name] = stats
+        return snapshots
+
+    def to_statistics(self, registered_commands: int) -> m.Cli.CommandStatistics:
+        """Build the CommandStatistics model reported by the services.
+
+        Args:
+            registered_commands: Number of commands currently registered.
+
+        """
+        per_command = self.snapshot()
+        executions = sum(s.executions for s in per_command.values())
+        failures = sum(s.failures for s in per_command.values())
+        return m.Cli.CommandStatistics(
+            total_commands=registered_commands,
+            successful_commands=executions - failures,
+            failed_commands=failures,
+            total_executions=executions,
+            per_command=per_command,
+        )
+
+    def to_json(self, registered_commands: int | None = None) -> str:
+        """Export the statistics as a JSON document.
+
+        Args:
+            registered_commands: Registered command count; defaults to the
+                number of commands that have executed at least once.
+
+        """
+        count = (
+            len(self._entries) if registered_commands is None else registered_commands
+        )
+        return self.to_statistics(count).model_dump_json(
+            indent=c.Cli.MetricsDefaults.JSON_INDENT
+        )
+
+
+class FlextCliMetricsRegistry:
+    """Process-wide registry of counters, gauges and histograms.
+
+    Metric families are created on first use and keyed by name; samples are
+    keyed by label values given positionally in ``label_names`` order.
+    The standard families are fed by FlextCliCore/FlextCliCommands executions,
+    FlextCliFileTools reads/writes and FlextCliOutput table/CSV rendering.
+    """
+
+    class _Family(abc.ABC):
+        """Base metric family with label handling and text rendering."""
+
+        kind: ClassVar[str] = "unknown"
+
+        def __init__(
+            self, name: str, documentation: str, label_names: Sequence[str]
+        ) -> None:
+            super().__init__()
+            self.name = name
+            self.documentation = documentation
+            self.label_names = tuple(label_names)
+            self._lock = threading.Lock()
+
+        def _check_labels(self, label_values: tuple[str, ...]) -> None:
+            if len(label_values) != len(self.label_names):
+                msg = (
+                    f"Metric {self.name} expects labels {self.label_names}, "
+                    f"got {len(label_values)} values"
+                )
+                raise ValueError(msg)
+
+        @staticmethod
+        def _number(value: float) -> str:
+            return str(int(value)) if value.is_integer() else repr(value)
+
+        @staticmethod
+        def _escape(value: str) -> str:
+            return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+        def _label_text(
+            self, label_values: tuple[str, ...], extra: tuple[str, str] | None = None
+        ) -> str:
+            pairs = list(zip(self.label_names, label_values, strict=True))
+            if extra is not None:
+                pairs.append(extra)
+            if not pairs:
+                return ""
+            escaped = (f'{key}="{self._escape(value)}"' for key, value in pairs)
+            return "{" + ",".join(escaped) + "}"
+
+        def header(self, exposition: str) -> list[str]:
+            """Return the HELP/TYPE lines for this family."""
+            type_name = self.name
+            if (
+                self.kind == "counter"
+                and exposition == c.Cli.MetricsDefaults.EXPOSITION_PROMETHEUS
+            ):
+                type_name = f"{self.name}_total"
+            return [
+                f"# HELP {type_name} {self.documentation}",
+                f"# TYPE {type_name} {self.kind}",
+            ]
+
+        @abc.abstractmethod
+        def samples(self) -> list[str]:
+            """Return the sample lines for this family."""
+
+    class Counter(_Family):
+        """Monotonic counter; samples are exposed with a ``_total`` suffix."""
+
+        kind: ClassVar[str] = "counter"
+
+        def __init__(
+            self, name: str, documentation: str, label_names: Sequence[str] = ()
+        ) -> None:
+            """Initialize counter family."""
+            super().__init__(name, documentation, label_names)
+            self._values: dict[tuple[str, ...], float] = {}
+
+        def inc(self, *label_values: str, amount: float = 1.0) -> None:
+            """Increase the counter for ``label_values`` by ``amount`` (>= 0)."""
+            if amount < 0:
+                msg = f"Counter {self.name} cannot decrease"
+                raise ValueError(msg)
+            self._check_labels(label_values)
+            with self._lock:
+                self._values[label_values] = (
+                    self._values.get(label_values, 0.0) + amount
+                )
+
+        def value(self, *label_values: str) -> float:
+            """Return current value for ``label_values``."""
+            return self._values.get(label_values, 0.0)
+
+        def samples(self) -> list[str]:
+            """Return ``<name>_total`` sample lines."""
+            with self._lock:
+                items = sorted(self._values.items())
+            return [
+                f"{self.name}_total{self._label_text(labels)} {self._number(value)}"
+                for labels, value in items
+            ]
+
+    class Gauge(_Family):
+        """Gauge that can be set, increased and decreased."""
+
+        kind: ClassVar[str] = "gauge"
+
+        def __init__(
+            self, name: str, documentation: str, label_names: Sequence[str] = ()
+        ) -> None:
+            """Initialize gauge family."""
+            super().__init__(name, documentation, label_names)
+            self._values: dict[tuple[str, ...], float] = {}
+
+        def set(self, value: float, *label_values: str) -> None:
+            """Set the gauge for ``label_values``."""
+            self._check_labels(label_values)
+            with self._lock:
+                self._values[label_values] = value
+
+        def inc(self, *label_values: str, amount: float = 1.0) -> None:
+            """Add ``amount`` (may be negative) to the gauge."""
+            self._check_labels(label_values)
+            with self._lock:
+                self._values[label_values] = (
+                    self._values.get(label_values, 0.0) + amount
+                )
+
+        def value(self, *label_values: str) -> float:
+            """Return current value for ``label_values``."""
+            return self._values.get(label_values, 0.0)
+
+        def samples(self) -> list[str]:
+            """Return gauge sample lines."""
+            with self._lock:
+                items = sorted(self._values.items())
+            return [
+                f"{self.name}{self._label_text(labels)} {self._number(value)}"
+                for labels, value in items
+            ]
+
+    class Histogram(_Family):
+        """Cumulative histogram with fixed ``le`` bucket bounds."""
+
+        kind: ClassVar[str] = "histogram"
+
+        def __init__(
+            self,
+            name: str,
+            documentation: str,
+            label_names: Sequence[str] = (),
+            buckets: Sequence[float] = c.Cli.MetricsDefaults.DURATION_BUCKETS,
+        ) -> None:
+            """Initialize histogram family with sorted bucket bounds."""
+            super().__init__(name, documentation, label_names)
+            self.buckets = tuple(sorted(buckets))
+            self._series: dict[tuple[str, ...], list[float]] = {}
+
+        def observe(self, value: float, *label_values: str) -> None:
+            """Record one observation for ``label_values``."""
+            self._check_labels(label_values)
+            index = bisect.bisect_left(self.buckets, value)
+            with self._lock:
+                series = self._series.get(label_values)
+                if series is None:
+                    # Layout: per-bucket counts, +Inf count, sum.
+                    series = [0.0] * (len(self.buckets) + 2)
+                    self._series[label_values] = series
+                series[index] += 1
+                series[-1] += value
+
+        def count(self, *label_values: str) -> int:
+            """Return number of observations for ``label_values``."""
+            series = self._series.get(label_values)
+            return int(sum(series[:-1])) if series is not None else 0
+
+        def samples(self) -> list[str]:
+            """Return cumulative bucket, count and sum sample lines."""
+            with self._lock:
+                items = sorted((k, list(v)) for k, v in self._series.items())
+            lines: list[str] = []
+            for labels, series in items:
+                cumulative = 0.0
+                for bound, bucket_count in zip(self.buckets, series, strict=False):
+                    cumulative += bucket_count
+                    label_text = self._label_text(labels, ("le", f"{bound:g}"))
+                    lines.append(
+                        f"{self.name}_bucket{label_text} {self._number(cumulative)}"
+                    )
+                cumulative += series[-2]
+                inf_text = self._label_text(labels, ("le", "+Inf"))
+                lines.extend((
+                    f"{self.name}_bucket{inf_text} {self._number(cumulative)}",
+                    f"{self.name}_count{self._label_text(labels)} {self._number(cumulative)}",
+                    f"{self.name}_sum{self._label_text(labels)} {self._number(series[-1])}",
+                ))
+            return lines
+
+    _global: ClassVar[FlextCliMetricsRegistry | None] = None
+    _global_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self) -> None:
+        """Initialize registry with the standard flext-cli metric families."""
+        super().__init__()
+        self._families: dict[str, FlextCliMetricsRegistry._Family] = {}
+        self._lock = threading.Lock()
+        defaults = c.Cli.MetricsDefaults
+        self.command_executions = self.counter(
+            defaults.COMMAND_EXECUTIONS, "Command executions.", ("command",)
+        )
+        self.command_failures = self.counter(
+            defaults.COMMAND_FAILURES, "Command executions that failed.", ("command",)
+        )
+        self.command_duration = self.histogram(
+            defaults.COMMAND_DURATION, "Command execution latency.", ("command",)
+        )
+        self.file_io_bytes = self.counter(
+            defaults.FILE_IO_BYTES,
+            "Bytes read or written by FlextCliFileTools.",
+            ("direction",),
+        )
+        self.output_rows = self.counter(
+            defaults.OUTPUT_ROWS, "Rows rendered by FlextCliOutput.", ("format",)
+        )
+        self.gauge(
+            defaults.PROCESS_START_TIME, "Unix time the registry was created."
+        ).set(time.time())
+
+    @classmethod
+    def get_global(cls) -> FlextCliMetricsRegistry:
+        """Return the process-wide registry, creating it on first use."""
+        registry = cls._global
+        if registry is None:
+            with cls._global_lock:
+                if cls._global is None:
+                    cls._global = cls()
+                registry = cls._global
+        return registry
+
+    @classmethod
+    def reset_global(cls) -> None:
+        """Drop the process-wide registry (mainly for tests)."""
+        with cls._global_lock:
+            cls._global = None
+
+    def _get_or_create[F: FlextCliMetricsRegistry._Family](
+        self, family_type: type[F], name: str, **options: object
+    ) -> F:
+        with self._lock:
+            existing = self._families.get(name)
+            if existing is None:
+                created = family_type(name, **options)
+                self._families[name] = created
+                return created
+        if not isinstance(existing, family_type):
+            msg = f"Metric {name} already registered as {existing.kind}"
+            raise TypeError(msg)
+        return existing
+
+    def counter(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> FlextCliMetricsRegistry.Counter:
+        """Return the counter family ``name``, creating it if needed."""
+        return self._get_or_create(
+            FlextCliMetricsRegistry.Counter,
+            name,
+            documentation=documentation,
+            label_names=label_names,
+        )
+
+    def gauge(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> FlextCliMetricsRegistry.Gauge:
+        """Return the gauge family ``name``, creating it if needed."""
+        return self._get_or_create(
+            FlextCliMetricsRegistry.Gauge,
+            name,
+            documentation=documentation,
+            label_names=label_names,
+        )
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = c.Cli.MetricsDefaults.DURATION_BUCKETS,
+    ) -> FlextCliMetricsRegistry.Histogram:
+        """Return the histogram family ``name``, creating it if needed."""
+        return self._get_or_create(
+            FlextCliMetricsRegistry.Histogram,
+            name,
+            documentation=documentation,
+            label_names=label_names,
+            buckets=buckets,
+        )
+
+    def record_command_execution(
+        self, command_name: str, elapsed_ns: int, *, success: bool
+    ) -> None:
+        """Feed one command execution into the standard command families."""
+        self.command_executions.inc(command_name)
+        if not success:
+            self.command_failures.inc(command_name)
+        self.command_duration.observe(
+            elapsed_ns / c.Cli.MetricsDefaults.NANOS_PER_SECOND, command_name
+        )
+
+    def record_file_io(self, direction: str, byte_count: int) -> None:
+        """Feed bytes read/written by file tools."""
+        self.file_io_bytes.inc(direction, amount=float(max(byte_count, 0)))
+
+    def record_rendered_rows(self, output_format: str, row_count: int) -> None:
+        """Feed rows rendered by the output service."""
+        self.output_rows.inc(output_format, amount=float(max(row_count, 0)))
+
+    def render(
+        self,
+        exposition: c.Cli.MetricsExpositionLiteral = (
+            c.Cli.MetricsDefaults.EXPOSITION_OPENMETRICS
+        ),
+    ) -> str:
+        """Render all families as OpenMetrics (default) or Prometheus 0.0.4 text."""
+        with self._lock:
+            families = sorted(self._families.values(), key=lambda fam: fam.name)
+        lines: list[str] = []
+        for family in families:
+            lines.extend(family.header(exposition))
+            lines.extend(family.samples())
+        if exposition == c.Cli.MetricsDefaults.EXPOSITION_OPENMETRICS:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+class FlextCliOpenMetricsExporter:
+    """Write registry contents atomically to a textfile-collector path.
+
+    The file is written to a temporary sibling and moved into place with
+    ``os.replace`` so scrapers never read a partial file. Exports happen on
+    `write`, on a background interval (when ``interval_seconds > 0``) and at
+    interpreter exit once `start` has been called.
+
+    Example:
+        >>> exporter = FlextCliOpenMetricsExporter(
+        ...     "/var/lib/node_exporter/textfile/mycli.prom",
+        ...     interval_seconds=15.0,
+        ...     exposition="prometheus",
+        ... )
+        >>> exporter.start()
+
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        registry: FlextCliMetricsRegistry | None = None,
+        *,
+        interval_seconds: float = 0.0,
+        exposition: c.Cli.MetricsExpositionLiteral = (
+            c.Cli.MetricsDefaults.EXPOSITION_OPENMETRICS
+        ),
+    ) -> None:
+        """Initialize exporter.
+
+        Args:
+            path: Destination file (``.prom`` for node-exporter).
+            registry: Registry to export; defaults to the process-wide one.
+            interval_seconds: Periodic export interval; 0 exports only at exit.
+            exposition: ``openmetrics`` or ``prometheus`` (text format 0.0.4).
+
+        """
+        super().__init__()
+        self._path = Path(path)
+        self._registry = (
+            registry if registry is not None else FlextCliMetricsRegistry.get_global()
+        )
+        self._interval = interval_seconds
+        self._exposition = exposition
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = False
+
+    @classmethod
+    def from_settings(
+        cls, settings: FlextCliSettings
+    ) -> FlextCliOpenMetricsExporter | None:
+        """Build an exporter from `FlextCliSettings`, or None when disabled."""
+        if not settings.metrics_textfile:
+            return None
+        return cls(
+            settings.metrics_textfile,
+            interval_seconds=settings.metrics_export_interval,
+            exposition=settings.metrics_exposition,
+        )
+
+    @property
+    def path(self) -> Path:
+        """Destination path."""
+        return self._path
+
+    def write(self) -> r[bool]:
+        """Render the registry and atomically replace the destination file."""
+        payload = self._registry.render(self._exposition)
+        try:
+            self._replace_file(payload)
+        except OSError as exc:
+            return r[bool].fail(f"Metrics export to {self._path} failed: {exc}")
+        return r[bool].ok(value=True)
+
+    def _replace_file(self, payload: str) -> None:
+        """Write ``payload`` to a temporary sibling and move it into place."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self._path.parent, prefix=f".{self._path.name}.", suffix=".tmp"
+        )
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "w", encoding=c.Cli.Utilities.DEFAULT_ENCODING) as f:
+                _ = f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            tmp_path.chmod(c.Cli.MetricsDefaults.TEXTFILE_MODE)
+            _ = tmp_path.replace(self._path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _run_interval(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            _ = self.write()
+
+    def start(self) -> r[bool]:
+        """Register the exit-time export and start the interval thread."""
+        if self._started:
+            return r[bool].ok(value=True)
+        self._started = True
+        self._stop_event.clear()
+        atexit.register(self._write_at_exit)
+        if self._interval > 0:
+            self._thread = threading.Thread(
+                target=self._run_interval, name="flext-cli-metrics", daemon=True
+            )
+            self._thread.start()
+        return r[bool].ok(value=True)
+
+    def stop(self) -> r[bool]:
+        """Stop periodic export and write a final snapshot."""
+        if not self._started:
+            return r[bool].ok(value=True)
+        self._started = False
+        self._stop_event.set()
+        atexit.unregister(self._write_at_exit)
+        if self._thread is not None:
+            self._thread.join(timeout=self._interval + 1.0)
+            self._thread = None
+        return self.write()
+
+    def _write_at_exit(self) -> None:
+        self._stop_event.set()
+        _ = self.write()
+
+
+__all__ = [
+    "FlextCliExecutionMetrics",
+    "FlextCliLatencyHistogram",
+    "FlextCliMetricsRegistry",
+    "FlextCliOpenMetricsExporter",
+]
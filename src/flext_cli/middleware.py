@@ -3,7 +3,16 @@
 FlextCliMiddleware provides a protocol and implementations for middleware chains
 that can process CLI command execution with logging, validation, retry, and
 other cross-cutting concerns. All classes use FlextCli prefix; compose is
-FlextCliMiddleware.compose (no loose functions).
+FlextCliMiddleware.compose (no loose functions). Asyncio middleware composes via
+FlextCliMiddleware.compose_async; sync and async middleware can be mixed in
+either chain, and FlextCliAsyncRunner drives coroutines from sync entry points
+such as Typer commands. FlextCliRetryMiddleware retries classified failures with
+jittered exponential backoff inside a total time budget, and the circuit
+breaker and bulkhead middleware keep one failing dependency from tying up
+every worker. FlextCliCacheMiddleware memoizes idempotent command results and
+FlextCliTimingMiddleware records wall/CPU time with slow-call profiling.
+FlextCliRateLimitMiddleware applies per-command token buckets, optionally
+shared across processes.
 
 Copyright (c) 2025 FLEXT Team. All rights reserved.
 SPDX-License-Identifier: MIT
@@ -11,14 +20,44 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import cProfile
+import functools
+import hashlib
+import heapq
+import inspect
+import io
+import json
+import pstats
+import random
+import sys
+import threading
 import time
-from collections.abc import Callable
+import tracemalloc
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Collection,
+    Coroutine,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import ClassVar, TextIO, override
 
-from flext_core import p as p_core, r
+from flext_core import FlextLogger, p as p_core, r
 from pydantic import BaseModel
-from rich.errors import ConsoleError, LiveError, StyleError
 
-from flext_cli import p
+from flext_cli import FlextCliFormatters, c, m, p
+from flext_cli.cache import FlextCliMemoryCacheStore
+from flext_cli.metrics import FlextCliLatencyHistogram, FlextCliMetricsRegistry
+from flext_cli.rate_limit import FlextCliFileTokenBucket, FlextCliTokenBucket
+from flext_cli.settings import FlextCliSettings
+from flext_cli.typings import FlextCliTypes
+
+_logger = FlextLogger(__name__)
 
 
 class FlextCliLoggingMiddleware:
@@ -39,25 +78,41 @@ class FlextCliLoggingMiddleware:
             r[object]: Result from next middleware or handler.
 
         """
-        _ = getattr(ctx, "command", "unknown")
+        command = FlextCliMiddleware.command_name(ctx)
         start = time.perf_counter()
         result = next_(ctx)
-        _elapsed = time.perf_counter() - start
+        _logger.debug(
+            "Command executed",
+            command=command,
+            elapsed_ms=(time.perf_counter() - start)
+            * c.Cli.TimingDefaults.MILLIS_PER_SECOND,
+            success=result.is_success,
+        )
         return result
 
 
 class FlextCliValidationMiddleware:
-    """Validate command inputs using Pydantic schema."""
+    """Validate command inputs using Pydantic schema.
+
+    Params that already are an instance of the schema are not re-validated.
+    With ``dump=False`` the validated model is attached to the context as
+    ``ctx.validated`` (see `validated`) instead of being dumped back into
+    ``ctx.params``, avoiding a serialize round trip per call. Contexts that
+    reject new attributes receive the model in ``ctx.params`` instead.
+    """
 
-    def __init__(self, schema: type[BaseModel]) -> None:
+    def __init__(self, schema: type[BaseModel], *, dump: bool = True) -> None:
         """Initialize validation middleware.
 
         Args:
             schema: Pydantic model class for validation.
+            dump: Replace ``ctx.params`` with the dumped model (default); when
+                False, pass the model instance through ``ctx.validated``.
 
         """
         super().__init__()
         self._schema = schema
+        self._dump = dump
 
     def __call__(
         self,
@@ -77,34 +132,88 @@ class FlextCliValidationMiddleware:
         """
         params = getattr(ctx, "params", {})
         try:
-            validated = self._schema.model_validate(params)
-            ctx.params = validated.model_dump()
+            validated = (
+                params
+                if isinstance(params, self._schema)
+                else self._schema.model_validate(params)
+            )
+            if self._dump:
+                ctx.params = validated.model_dump()
+            else:
+                self._attach(ctx, validated)
             return next_(ctx)
         except (
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[object].fail(f"Validation failed: {e}")
 
+    @staticmethod
+    def _attach(ctx: p.Cli.CliContext, model: BaseModel) -> None:
+        """Attach ``model`` as ``ctx.validated``, or as params when slotted."""
+        try:
+            setattr(ctx, c.Cli.ValidationMiddlewareDefaults.CONTEXT_ATTRIBUTE, model)
+        except AttributeError:
+            ctx.params = model
+
+    @staticmethod
+    def validated[M: BaseModel](ctx: p.Cli.CliContext, schema: type[M]) -> M | None:
+        """Return the model validated for ``ctx`` if it is a ``schema`` instance."""
+        model = getattr(ctx, c.Cli.ValidationMiddlewareDefaults.CONTEXT_ATTRIBUTE, None)
+        if not isinstance(model, schema):
+            model = getattr(ctx, "params", None)
+        return model if isinstance(model, schema) else None
+
 
 class FlextCliRetryMiddleware:
-    """Retry failed commands with exponential backoff."""
+    """Retry failed commands with jittered exponential backoff and a deadline.
+
+    The delay before retry ``n`` is drawn uniformly from
+    ``[0, min(max_backoff, backoff * 2 ** (n - 1))]`` (full jitter), so callers
+    that fail together do not retry in lockstep. Only failures accepted by the
+    retry predicates are retried, and no retry is started whose sleep would
+    overrun the total ``deadline``. Retries, their delays and final outcomes
+    are recorded in FlextCliMetricsRegistry. Use FlextCliAsyncRetryMiddleware
+    in async chains to sleep without holding a thread.
+    """
 
-    def __init__(self, max_retries: int = 3, backoff: float = 1.0) -> None:
+    def __init__(
+        self,
+        max_retries: int = c.Cli.RetryDefaults.MAX_ATTEMPTS,
+        backoff: float = c.Cli.RetryDefaults.BACKOFF,
+        *,
+        max_backoff: float = c.Cli.RetryDefaults.MAX_BACKOFF,
+        deadline: float | None = None,
+        retry_codes: Collection[str] | None = None,
+        retry_if: Callable[[p_core.Result[object]], bool] | None = None,
+        rng: random.Random | None = None,
+        registry: FlextCliMetricsRegistry | None = None,
+    ) -> None:
         """Initialize retry middleware.
 
         Args:
-            max_retries: Maximum number of retry attempts (default: 3).
+            max_retries: Maximum number of attempts, including the first call
+                (default: 3).
             backoff: Base backoff delay in seconds (default: 1.0).
+            max_backoff: Upper bound of the backoff window in seconds.
+            deadline: Total time budget in seconds across all attempts.
+            retry_codes: Only retry failures whose ``error_code`` is listed.
+            retry_if: Only retry failures for which the predicate is true.
+            rng: Random source for jitter (seed it for reproducible delays).
+            registry: Metrics registry (default: the process-wide registry).
 
         """
         super().__init__()
         self._max_retries = max_retries
         self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._deadline = deadline
+        self._retry_codes = frozenset(retry_codes) if retry_codes is not None else None
+        self._retry_if = retry_if
+        self._rng = rng or random.SystemRandom()
+        self._registry = registry
 
     def __call__(
         self,
@@ -121,34 +230,1258 @@ class FlextCliRetryMiddleware:
             r[object]: Result from next middleware or handler after retries.
 
         """
+        started = time.monotonic()
+        attempt = 1
         result = next_(ctx)
-        if result.is_success:
-            return result
-        for attempt in range(1, self._max_retries):
-            delay = self._backoff * attempt
+        while result.is_failure:
+            delay = self.next_delay(ctx, result, attempt, started)
+            if delay is None:
+                return result
             time.sleep(delay)
+            attempt += 1
             result = next_(ctx)
-            if result.is_success:
+        self._record_success(ctx, attempt)
+        return result
+
+    def backoff_window(self, attempt: int) -> float:
+        """Return the upper bound of the jittered delay after ``attempt``."""
+        return min(
+            self._max_backoff,
+            self._backoff * c.Cli.RetryDefaults.BACKOFF_FACTOR ** (attempt - 1),
+        )
+
+    def is_retryable(self, result: p_core.Result[object]) -> bool:
+        """Return whether a failed ``result`` passes the retry predicates."""
+        if self._retry_codes is not None and result.error_code not in self._retry_codes:
+            return False
+        return self._retry_if is None or self._retry_if(result)
+
+    def next_delay(
+        self,
+        ctx: p.Cli.CliContext,
+        result: p_core.Result[object],
+        attempt: int,
+        started: float,
+    ) -> float | None:
+        """Return the sleep before the next attempt, or ``None`` to give up.
+
+        Args:
+            ctx: CLI execution context (its ``command`` labels the metrics).
+            result: Failed result of ``attempt``.
+            attempt: Number of attempts made so far (1-based).
+            started: ``time.monotonic()`` value when the first attempt began.
+
+        Returns:
+            Delay in seconds, or ``None`` when the failure is final.
+
+        """
+        defaults = c.Cli.RetryDefaults
+        outcome: str | None = None
+        delay = 0.0
+        if not self.is_retryable(result):
+            outcome = defaults.OUTCOME_NOT_RETRYABLE
+        elif attempt >= self._max_retries:
+            outcome = defaults.OUTCOME_EXHAUSTED
+        else:
+            delay = self._rng.uniform(0.0, self.backoff_window(attempt))
+            if (
+                self._deadline is not None
+                and time.monotonic() - started + delay > self._deadline
+            ):
+                outcome = defaults.OUTCOME_DEADLINE
+        registry = self._registry or FlextCliMetricsRegistry.get_global()
+        command = FlextCliMiddleware.command_name(ctx)
+        if outcome is not None:
+            self._outcomes(registry).inc(command, outcome)
+            return None
+        registry.counter(
+            defaults.RETRIES, "Command retries after a failure.", ("command",)
+        ).inc(command)
+        registry.histogram(
+            defaults.DELAY, "Jittered delay before a retry.", ("command",)
+        ).observe(delay, command)
+        return delay
+
+    @staticmethod
+    def _outcomes(registry: FlextCliMetricsRegistry) -> FlextCliMetricsRegistry.Counter:
+        return registry.counter(
+            c.Cli.RetryDefaults.OUTCOMES,
+            "Final outcomes of retried commands.",
+            ("command", "outcome"),
+        )
+
+    def _record_success(self, ctx: p.Cli.CliContext, attempt: int) -> None:
+        if attempt > 1:
+            registry = self._registry or FlextCliMetricsRegistry.get_global()
+            self._outcomes(registry).inc(
+                FlextCliMiddleware.command_name(ctx),
+                c.Cli.RetryDefaults.OUTCOME_RECOVERED,
+            )
+
+
+class FlextCliAsyncRetryMiddleware(FlextCliRetryMiddleware):
+    """Async FlextCliRetryMiddleware; backoff sleeps with ``asyncio.sleep``."""
+
+    @override
+    async def __call__(
+        self,
+        ctx: p.Cli.CliContext,
+        next_: Callable[[p.Cli.CliContext], Awaitable[p_core.Result[object]]],
+    ) -> p_core.Result[object]:
+        """Retry failed commands without blocking the event loop.
+
+        Args:
+            ctx: CLI execution context.
+            next_: Next async middleware or handler.
+
+        Returns:
+            Result from next middleware or handler after retries.
+
+        """
+        started = time.monotonic()
+        attempt = 1
+        result = await next_(ctx)
+        while result.is_failure:
+            delay = self.next_delay(ctx, result, attempt, started)
+            if delay is None:
                 return result
+            await asyncio.sleep(delay)
+            attempt += 1
+            result = await next_(ctx)
+        self._record_success(ctx, attempt)
+        return result
+
+
+class FlextCliCircuitBreakerMiddleware:
+    """Fail fast for commands whose recent failure rate is too high.
+
+    Each command (``ctx.command``) has its own circuit, shared by every thread
+    calling this instance. Outcomes are counted in a rolling time window of
+    ``window_buckets`` buckets; once at least ``min_calls`` calls were seen and
+    the failure rate reaches ``failure_rate`` the circuit opens and calls are
+    rejected with error code ``CIRCUIT_OPEN``. After ``reset_timeout`` seconds
+    up to ``half_open_probes`` concurrent probe calls are let through: a
+    successful probe closes the circuit, a failed one re-opens it.
+    """
+
+    class _Circuit:
+        """Per-command circuit state guarded by its own lock."""
+
+        __slots__ = ("buckets", "lock", "opened_at", "probes", "state")
+
+        def __init__(self, bucket_count: int) -> None:
+            super().__init__()
+            # Each bucket: [bucket epoch, calls, failures].
+            self.buckets = [[-1, 0, 0] for _ in range(bucket_count)]
+            self.lock = threading.Lock()
+            self.opened_at = 0.0
+            self.probes = 0
+            self.state = c.Cli.CircuitBreakerDefaults.STATE_CLOSED
+
+    def __init__(
+        self,
+        failure_rate: float = c.Cli.CircuitBreakerDefaults.FAILURE_RATE,
+        *,
+        min_calls: int = c.Cli.CircuitBreakerDefaults.MIN_CALLS,
+        window: float = c.Cli.CircuitBreakerDefaults.WINDOW_SECONDS,
+        window_buckets: int = c.Cli.CircuitBreakerDefaults.WINDOW_BUCKETS,
+        reset_timeout: float = c.Cli.CircuitBreakerDefaults.RESET_TIMEOUT,
+        half_open_probes: int = c.Cli.CircuitBreakerDefaults.HALF_OPEN_PROBES,
+        clock: Callable[[], float] = time.monotonic,
+        registry: FlextCliMetricsRegistry | None = None,
+    ) -> None:
+        """Initialize circuit breaker middleware.
+
+        Args:
+            failure_rate: Failure ratio (0-1) in the window that opens a circuit.
+            min_calls: Calls required in the window before the rate is judged.
+            window: Rolling window length in seconds.
+            window_buckets: Number of buckets the window is split into.
+            reset_timeout: Seconds an open circuit waits before probing.
+            half_open_probes: Concurrent probe calls allowed when half-open.
+            clock: Monotonic time source.
+            registry: Metrics registry (default: the process-wide registry).
+
+        """
+        super().__init__()
+        self._failure_rate = failure_rate
+        self._min_calls = min_calls
+        self._bucket_count = window_buckets
+        self._bucket_width = window / window_buckets
+        self._reset_timeout = reset_timeout
+        self._half_open_probes = half_open_probes
+        self._clock = clock
+        self._registry = registry
+        self._circuits: dict[str, FlextCliCircuitBreakerMiddleware._Circuit] = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        ctx: p.Cli.CliContext,
+        next_: Callable[[p.Cli.CliContext], r[object]],
+    ) -> r[object]:
+        """Run the command unless its circuit is open.
+
+        Args:
+            ctx: CLI execution context.
+            next_: Next middleware or handler.
+
+        Returns:
+            r[object]: Result from next middleware or handler, or a
+                ``CIRCUIT_OPEN`` failure while the circuit rejects calls.
+
+        """
+        command = FlextCliMiddleware.command_name(ctx)
+        circuit = self._circuit(command)
+        admitted, probe, retry_in = self._admit(circuit, command)
+        if not admitted:
+            registry = self._registry or FlextCliMetricsRegistry.get_global()
+            registry.counter(
+                c.Cli.CircuitBreakerDefaults.REJECTIONS,
+                "Calls rejected by an open circuit.",
+                ("command",),
+            ).inc(command)
+            return r[object].fail(
+                c.Cli.CircuitBreakerDefaults.OPEN_MESSAGE.format(
+                    command=command, retry_in=retry_in
+                ),
+                error_code=c.Cli.CircuitBreakerDefaults.ERROR_CODE,
+            )
+        try:
+            result = next_(ctx)
+        except BaseException:
+            self._record(circuit, command, failed=True, probe=probe)
+            raise
+        self._record(circuit, command, failed=result.is_failure, probe=probe)
+        return result
+
+    def reset(self, command: str | None = None) -> None:
+        """Close the circuit of ``command`` (or all circuits) and clear counts."""
+        with self._lock:
+            names = [command] if command is not None else list(self._circuits)
+            circuits = [self._circuits.pop(name, None) for name in names]
+        for name, circuit in zip(names, circuits, strict=True):
+            if circuit is not None:
+                self._set_state_gauge(name, c.Cli.CircuitBreakerDefaults.STATE_CLOSED)
+
+    def state(self, command: str) -> str:
+        """Return the circuit state of ``command`` (``closed`` if never seen)."""
+        circuit = self._circuits.get(command)
+        if circuit is None:
+            return c.Cli.CircuitBreakerDefaults.STATE_CLOSED
+        with circuit.lock:
+            self._refresh(circuit)
+            return circuit.state
+
+    def _admit(
+        self, circuit: FlextCliCircuitBreakerMiddleware._Circuit, command: str
+    ) -> tuple[bool, bool, float]:
+        """Return (admitted, is_probe, seconds until the next probe)."""
+        defaults = c.Cli.CircuitBreakerDefaults
+        with circuit.lock:
+            previous = circuit.state
+            self._refresh(circuit)
+            if circuit.state == defaults.STATE_CLOSED:
+                return True, False, 0.0
+            if circuit.state == defaults.STATE_OPEN:
+                retry_in = circuit.opened_at + self._reset_timeout - self._clock()
+                return False, False, retry_in
+            if circuit.probes >= self._half_open_probes:
+                return False, False, 0.0
+            circuit.probes += 1
+        if previous != circuit.state:
+            self._set_state_gauge(command, circuit.state)
+        return True, True, 0.0
+
+    def _circuit(self, command: str) -> FlextCliCircuitBreakerMiddleware._Circuit:
+        circuit = self._circuits.get(command)
+        if circuit is None:
+            with self._lock:
+                circuit = self._circuits.setdefault(
+                    command, self._Circuit(self._bucket_count)
+                )
+        return circuit
+
+    def _record(
+        self,
+        circuit: FlextCliCircuitBreakerMiddleware._Circuit,
+        command: str,
+        *,
+        failed: bool,
+        probe: bool,
+    ) -> None:
+        defaults = c.Cli.CircuitBreakerDefaults
+        with circuit.lock:
+            previous = circuit.state
+            now = self._clock()
+            if probe:
+                circuit.probes -= 1
+                if failed:
+                    circuit.state, circuit.opened_at = defaults.STATE_OPEN, now
+                else:
+                    circuit.state = defaults.STATE_CLOSED
+                    for bucket in circuit.buckets:
+                        bucket[:] = [-1, 0, 0]
+            else:
+                epoch = int(now // self._bucket_width)
+                bucket = circuit.buckets[epoch % self._bucket_count]
+                if bucket[0] != epoch:
+                    bucket[:] = [epoch, 0, 0]
+                bucket[1] += 1
+                bucket[2] += int(failed)
+                if circuit.state == defaults.STATE_CLOSED and failed:
+                    calls = failures = 0
+                    for bucket_epoch, bucket_calls, bucket_failures in circuit.buckets:
+                        if epoch - bucket_epoch < self._bucket_count:
+                            calls += bucket_calls
+                            failures += bucket_failures
+                    if calls >= self._min_calls and (
+                        failures >= self._failure_rate * calls
+                    ):
+                        circuit.state, circuit.opened_at = defaults.STATE_OPEN, now
+            state = circuit.state
+        if state != previous:
+            self._set_state_gauge(command, state)
+
+    def _refresh(self, circuit: FlextCliCircuitBreakerMiddleware._Circuit) -> None:
+        """Move an open circuit to half-open once its reset timeout elapsed."""
+        defaults = c.Cli.CircuitBreakerDefaults
+        if (
+            circuit.state == defaults.STATE_OPEN
+            and self._clock() - circuit.opened_at >= self._reset_timeout
+        ):
+            circuit.state = defaults.STATE_HALF_OPEN
+
+    def _set_state_gauge(self, command: str, state: str) -> None:
+        defaults = c.Cli.CircuitBreakerDefaults
+        registry = self._registry or FlextCliMetricsRegistry.get_global()
+        registry.gauge(
+            defaults.STATE_GAUGE,
+            "Circuit state (0 closed, 1 half-open, 2 open).",
+            ("command",),
+        ).set(defaults.STATE_VALUES[state], command)
+
+
+class FlextCliBulkheadMiddleware:
+    """Bound concurrent executions of each command with a semaphore.
+
+    Each command gets its own bounded semaphore, shared by every thread calling
+    this instance, so one slow dependency can only occupy ``max_concurrent``
+    workers. A call waits up to ``queue_timeout`` seconds for a slot and is
+    otherwise rejected with error code ``BULKHEAD_FULL``.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = c.Cli.BulkheadDefaults.MAX_CONCURRENT,
+        queue_timeout: float = c.Cli.BulkheadDefaults.QUEUE_TIMEOUT,
+        *,
+        limits: Mapping[str, int] | None = None,
+        registry: FlextCliMetricsRegistry | None = None,
+    ) -> None:
+        """Initialize bulkhead middleware.
+
+        Args:
+            max_concurrent: Concurrent executions allowed per command.
+            queue_timeout: Seconds a call may wait for a free slot.
+            limits: Per-command overrides of ``max_concurrent``.
+            registry: Metrics registry (default: the process-wide registry).
+
+        """
+        super().__init__()
+        self._max_concurrent = max_concurrent
+        self._queue_timeout = queue_timeout
+        self._limits = dict(limits or {})
+        self._registry = registry
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._in_flight: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        ctx: p.Cli.CliContext,
+        next_: Callable[[p.Cli.CliContext], r[object]],
+    ) -> r[object]:
+        """Run the command once a concurrency slot is free.
+
+        Args:
+            ctx: CLI execution context.
+            next_: Next middleware or handler.
+
+        Returns:
+            r[object]: Result from next middleware or handler, or a
+                ``BULKHEAD_FULL`` failure when no slot freed up in time.
+
+        """
+        defaults = c.Cli.BulkheadDefaults
+        command = FlextCliMiddleware.command_name(ctx)
+        semaphore = self._semaphore(command)
+        registry = self._registry or FlextCliMetricsRegistry.get_global()
+        if not semaphore.acquire(timeout=self._queue_timeout):
+            registry.counter(
+                defaults.REJECTIONS, "Calls rejected by a full bulkhead.", ("command",)
+            ).inc(command)
+            return r[object].fail(
+                defaults.FULL_MESSAGE.format(
+                    command=command,
+                    limit=self.limit(command),
+                    timeout=self._queue_timeout,
+                ),
+                error_code=defaults.ERROR_CODE,
+            )
+        gauge = registry.gauge(
+            defaults.IN_FLIGHT, "Executions holding a bulkhead slot.", ("command",)
+        )
+        self._track(command, gauge, 1)
+        try:
+            return next_(ctx)
+        finally:
+            self._track(command, gauge, -1)
+            semaphore.release()
+
+    def in_flight(self, command: str) -> int:
+        """Return the number of running executions of ``command``."""
+        return self._in_flight.get(command, 0)
+
+    def limit(self, command: str) -> int:
+        """Return the concurrency limit of ``command``."""
+        return self._limits.get(command, self._max_concurrent)
+
+    def _semaphore(self, command: str) -> threading.BoundedSemaphore:
+        semaphore = self._semaphores.get(command)
+        if semaphore is None:
+            with self._lock:
+                semaphore = self._semaphores.setdefault(
+                    command, threading.BoundedSemaphore(self.limit(command))
+                )
+        return semaphore
+
+    def _track(
+        self, command: str, gauge: FlextCliMetricsRegistry.Gauge, delta: int
+    ) -> None:
+        # Set under the lock so concurrent updates cannot publish stale counts.
+        with self._lock:
+            count = self._in_flight.get(command, 0) + delta
+            self._in_flight[command] = count
+            gauge.set(float(count), command)
+
+
+class FlextCliCacheMiddleware:
+    """Memoize successful results of idempotent, opted-in commands.
+
+    Results are keyed on a stable hash of the command name and ``ctx.params``
+    and kept in an in-memory LRU with TTL, optionally backed by a persistent
+    ``store`` such as FlextCliFileCacheStore (entries found there are promoted
+    to memory). Concurrent misses for the same key are collapsed into a single
+    execution (single-flight): followers wait for the leader and share its
+    result. Failures are never cached, and calls whose parameters are not
+    JSON values bypass the cache.
+    """
+
+    def __init__(
+        self,
+        commands: Collection[str],
+        *,
+        ttl: float = c.Cli.ResultCacheDefaults.TTL,
+        ttls: Mapping[str, float] | None = None,
+        memory: FlextCliMemoryCacheStore | None = None,
+        store: p.Cli.ResultCacheStore | None = None,
+        registry: FlextCliMetricsRegistry | None = None,
+    ) -> None:
+        """Initialize caching middleware.
+
+        Args:
+            commands: Names of the idempotent commands whose results are cached.
+            ttl: Default time-to-live in seconds.
+            ttls: Per-command overrides of ``ttl``.
+            memory: In-memory LRU (default: a new FlextCliMemoryCacheStore).
+            store: Optional persistent second-level store.
+            registry: Metrics registry (default: the process-wide registry).
+
+        """
+        super().__init__()
+        self._commands = frozenset(commands)
+        self._ttl = ttl
+        self._ttls = dict(ttls or {})
+        self._memory = memory or FlextCliMemoryCacheStore()
+        self._store = store
+        self._registry = registry
+        self._inflight: dict[str, Future[r[object]]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        ctx: p.Cli.CliContext,
+        next_: Callable[[p.Cli.CliContext], r[object]],
+    ) -> r[object]:
+        """Return a cached result or run the command once and cache it.
+
+        Args:
+            ctx: CLI execution context.
+            next_: Next middleware or handler.
+
+        Returns:
+            r[object]: Cached or freshly computed result.
+
+        """
+        defaults = c.Cli.ResultCacheDefaults
+        command = FlextCliMiddleware.command_name(ctx)
+        if command not in self._commands:
+            return next_(ctx)
+        try:
+            key = self.cache_key(command, getattr(ctx, "params", {}))
+        except (TypeError, ValueError):
+            self._count(command, defaults.OUTCOME_BYPASS)
+            return next_(ctx)
+        ttl = self._ttls.get(command, self._ttl)
+        cached = self._lookup(key, ttl)
+        if cached is not None:
+            self._count(command, defaults.OUTCOME_HIT)
+            return r[object].ok(cached)
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+        if not leader:
+            self._count(command, defaults.OUTCOME_SHARED)
+            return future.result()
+        self._count(command, defaults.OUTCOME_MISS)
+        try:
+            result = next_(ctx)
+        except BaseException as exc:
+            with self._lock:
+                _ = self._inflight.pop(key, None)
+            future.set_exception(exc)
+            raise
+        # Cache before leaving the in-flight table, so a call arriving in
+        # between finds the result instead of running the command again.
+        try:
+            if result.is_success:
+                _ = self._memory.set(key, result.value, ttl)
+                if self._store is not None:
+                    _ = self._store.set(key, result.value, ttl)
+        finally:
+            with self._lock:
+                _ = self._inflight.pop(key, None)
+            future.set_result(result)
+        return result
+
+    @staticmethod
+    def cache_key(
+        command: str, params: Mapping[str, FlextCliTypes.Cli.JsonValue]
+    ) -> str:
+        """Return a stable SHA-256 key for ``command`` called with ``params``.
+
+        Parameters are serialized as canonical JSON (sorted keys, compact
+        separators), so the key does not depend on dict ordering.
+
+        Raises:
+            TypeError: A parameter is not a JSON value.
+            ValueError: A parameter is a non-finite float.
+
+        """
+        canonical = json.dumps(
+            [command, params], sort_keys=True, separators=(",", ":"), allow_nan=False
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def invalidate(
+        self,
+        command: str,
+        params: Mapping[str, FlextCliTypes.Cli.JsonValue] | None = None,
+    ) -> bool:
+        """Drop the cached result of ``command`` called with ``params``."""
+        key = self.cache_key(command, params or {})
+        removed = self._memory.delete(key)
+        if self._store is not None:
+            removed = self._store.delete(key) or removed
+        return removed
+
+    def _count(self, command: str, outcome: str) -> None:
+        registry = self._registry or FlextCliMetricsRegistry.get_global()
+        registry.counter(
+            c.Cli.ResultCacheDefaults.REQUESTS,
+            "Result cache lookups by outcome.",
+            ("command", "outcome"),
+        ).inc(command, outcome)
+
+    def _lookup(self, key: str, ttl: float) -> object | None:
+        value = self._memory.get(key)
+        if value is not None or self._store is None:
+            return value
+        value = self._store.get(key)
+        if value is not None:
+            # Promote with the command's TTL; the store keeps its own expiry.
+            _ = self._memory.set(key, value, ttl)
+        return value
+
+
+class FlextCliRateLimitMiddleware:
+    """Throttle commands with per-command token buckets.
+
+    A call takes one token from its command's bucket, sleeping for the next
+    token up to ``max_wait`` seconds; beyond that it fails with error code
+    ``RATE_LIMITED``. With ``shared_dir`` every bucket is a
+    FlextCliFileTokenBucket, so all processes using the same directory share
+    one fleet-wide rate; otherwise buckets are in-process. Commands without a
+    limit (and no ``default``) pass through untouched.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, m.Cli.RateLimit],
+        *,
+        default: m.Cli.RateLimit | None = None,
+        shared_dir: Path | None = None,
+        max_wait: float = c.Cli.RateLimitDefaults.MAX_WAIT,
+        registry: FlextCliMetricsRegistry | None = None,
+    ) -> None:
+        """Initialize rate-limit middleware.
+
+        Args:
+            limits: Token-bucket limit per command name.
+            default: Limit for commands not listed in ``limits``.
+            shared_dir: Directory of cross-process bucket files.
+            max_wait: Seconds a call may wait for a token.
+            registry: Metrics registry (default: the process-wide registry).
+
+        """
+        super().__init__()
+        self._limits = dict(limits)
+        self._default = default
+        self._shared_dir = shared_dir
+        self._max_wait = max_wait
+        self._registry = registry
+        self._buckets: dict[str, FlextCliTokenBucket | FlextCliFileTokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        ctx: p.Cli.CliContext,
+        next_: Callable[[p.Cli.CliContext], r[object]],
+    ) -> r[object]:
+        """Run the command once a token is available.
+
+        Args:
+            ctx: CLI execution context.
+            next_: Next middleware or handler.
+
+        Returns:
+            r[object]: Result from next middleware or handler, or a
+                ``RATE_LIMITED`` failure when no token arrives within max_wait.
+
+        """
+        defaults = c.Cli.RateLimitDefaults
+        command = FlextCliMiddleware.command_name(ctx)
+        bucket = self._bucket(command)
+        if bucket is None:
+            return next_(ctx)
+        deadline = time.monotonic() + self._max_wait
+        waited = 0.0
+        wait = bucket.try_acquire()
+        while wait > 0.0:
+            if time.monotonic() + wait > deadline:
+                registry = self._registry or FlextCliMetricsRegistry.get_global()
+                registry.counter(
+                    defaults.REJECTIONS, "Calls rejected by rate limits.", ("command",)
+                ).inc(command)
+                return r[object].fail(
+                    defaults.LIMITED_MESSAGE.format(
+                        command=command, wait=wait, max_wait=self._max_wait
+                    ),
+                    error_code=defaults.ERROR_CODE,
+                )
+            time.sleep(wait)
+            waited += wait
+            wait = bucket.try_acquire()
+        if waited:
+            registry = self._registry or FlextCliMetricsRegistry.get_global()
+            registry.counter(
+                defaults.WAIT_SECONDS, "Time spent waiting for tokens.", ("command",)
+            ).inc(command, amount=waited)
+        return next_(ctx)
+
+    @classmethod
+    def from_settings(
+        cls, settings: FlextCliSettings
+    ) -> FlextCliRateLimitMiddleware | None:
+        """Build the middleware from FlextCliSettings, or None without limits."""
+        if not settings.rate_limits:
+            return None
+        return cls(
+            settings.rate_limits,
+            shared_dir=settings.rate_limit_dir,
+            max_wait=settings.rate_limit_max_wait,
+        )
+
+    def _bucket(
+        self, command: str
+    ) -> FlextCliTokenBucket | FlextCliFileTokenBucket | None:
+        bucket = self._buckets.get(command)
+        if bucket is not None:
+            return bucket
+        limit = self._limits.get(command, self._default)
+        if limit is None:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(command)
+            if bucket is None:
+                bucket = (
+                    FlextCliFileTokenBucket(
+                        self._shared_dir, command, limit.rate, limit.burst
+                    )
+                    if self._shared_dir is not None
+                    else FlextCliTokenBucket(limit.rate, limit.burst)
+                )
+                self._buckets[command] = bucket
+        return bucket
+
+
+class FlextCliTimingMiddleware:
+    """Record wall-clock and CPU time per command, with slow-call profiling.
+
+    Every invocation is recorded into per-command FlextCliLatencyHistogram
+    instances (wall and thread CPU time) and into the registry histograms.
+    It can also emit one structured log line per call. With
+    ``profile_slowest=N`` a sample of calls (``profile_sample_rate``) runs
+    under cProfile (and tracemalloc when ``trace_memory``) once
+    ``min_samples`` calls were seen; a profile is kept only if the call landed
+    in the slowest N% so far, and at most ``max_profiles`` slowest are
+    retained. ``report`` renders a summary table; ``register_exit_report``
+    prints it at interpreter exit.
+    """
+
+    class _Timings:
+        """Per-command wall and CPU histograms."""
+
+        __slots__ = ("cpu", "failures", "wall")
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.cpu = FlextCliLatencyHistogram()
+            self.failures = 0
+            self.wall = FlextCliLatencyHistogram()
+
+    def __init__(
+        self,
+        *,
+        log: bool = False,
+        profile_slowest: float = 0.0,
+        profile_sample_rate: float = 1.0,
+        trace_memory: bool = False,
+        min_samples: int = c.Cli.TimingDefaults.MIN_SAMPLES,
+        max_profiles: int = c.Cli.TimingDefaults.MAX_PROFILES,
+        rng: random.Random | None = None,
+        registry: FlextCliMetricsRegistry | None = None,
+    ) -> None:
+        """Initialize timing middleware.
+
+        Args:
+            log: Emit a structured log line per invocation.
+            profile_slowest: Keep profiles of the slowest N percent (0 disables).
+            profile_sample_rate: Fraction of eligible calls run under profiling.
+            trace_memory: Also capture tracemalloc allocation sites.
+            min_samples: Calls per command before profiling starts.
+            max_profiles: Number of slowest profiles retained.
+            rng: Random source for sampling.
+            registry: Metrics registry (default: the process-wide registry).
+
+        """
+        super().__init__()
+        self._log = log
+        self._profile_slowest = profile_slowest
+        self._sample_rate = profile_sample_rate
+        self._trace_memory = trace_memory
+        self._min_samples = min_samples
+        self._max_profiles = max_profiles
+        self._rng = rng or random.SystemRandom()
+        self._registry = registry
+        self._timings: dict[str, FlextCliTimingMiddleware._Timings] = {}
+        # Min-heap of (wall ns, sequence, profile); smallest evicted first.
+        self._profiles: list[tuple[int, int, m.Cli.SlowInvocationProfile]] = []
+        self._sequence = 0
+        self._lock = threading.Lock()
+        # cProfile and tracemalloc are process-global: one profiled call at a time.
+        self._profiler_lock = threading.Lock()
+        self._exit_report_registered = False
+        self._exit_stream: TextIO | None = None
+
+    def __call__(
+        self,
+        ctx: p.Cli.CliContext,
+        next_: Callable[[p.Cli.CliContext], r[object]],
+    ) -> r[object]:
+        """Time (and possibly profile) the command.
+
+        Args:
+            ctx: CLI execution context.
+            next_: Next middleware or handler.
+
+        Returns:
+            r[object]: Result from next middleware or handler.
+
+        """
+        command = FlextCliMiddleware.command_name(ctx)
+        timings = self._command_timings(command)
+        if self._should_profile(timings):
+            return self._profiled(ctx, next_, command, timings)
+        wall_start, cpu_start = time.perf_counter_ns(), time.thread_time_ns()
+        result = next_(ctx)
+        self._record(
+            command,
+            timings,
+            time.perf_counter_ns() - wall_start,
+            time.thread_time_ns() - cpu_start,
+            success=result.is_success,
+        )
         return result
 
+    def profiles(self, command: str | None = None) -> list[m.Cli.SlowInvocationProfile]:
+        """Return retained slow-call profiles, slowest first."""
+        with self._lock:
+            entries = sorted(self._profiles, reverse=True)
+        return [
+            profile
+            for _wall, _seq, profile in entries
+            if command is None or profile.command_name == command
+        ]
+
+    def register_exit_report(self, stream: TextIO | None = None) -> None:
+        """Print `report` to ``stream`` (default: stderr) at interpreter exit.
+
+        The report is registered once; later calls only change ``stream``.
+        """
+        with self._lock:
+            self._exit_stream = stream
+            if self._exit_report_registered:
+                return
+            self._exit_report_registered = True
+        atexit.register(self._write_exit_report)
+
+    def report(self) -> str:
+        """Render a per-command latency summary table (milliseconds)."""
+        defaults = c.Cli.TimingDefaults
+        millis = defaults.MILLIS_PER_SECOND
+        lines = [defaults.REPORT_HEADER]
+        for name, entry in sorted(self.summary().items()):
+            wall = entry.wall
+            lines.append(
+                defaults.REPORT_ROW.format(
+                    command=name,
+                    calls=wall.count,
+                    failures=entry.failures,
+                    p50=wall.p50_seconds * millis,
+                    p95=wall.p95_seconds * millis,
+                    p99=wall.p99_seconds * millis,
+                    max=wall.max_seconds * millis,
+                    cpu=entry.cpu.mean_seconds * millis,
+                )
+            )
+        if self._profiles:
+            lines.append(defaults.REPORT_PROFILES.format(count=len(self._profiles)))
+        return "\n".join(lines)
+
+    def summary(self) -> dict[str, m.Cli.CommandTimingSummary]:
+        """Return wall/CPU distributions per command."""
+        with self._lock:
+            items = list(self._timings.items())
+        return {
+            name: m.Cli.CommandTimingSummary(
+                command_name=name,
+                failures=timings.failures,
+                wall=timings.wall.snapshot(),
+                cpu=timings.cpu.snapshot(),
+            )
+            for name, timings in items
+        }
+
+    def _command_timings(self, command: str) -> FlextCliTimingMiddleware._Timings:
+        timings = self._timings.get(command)
+        if timings is None:
+            with self._lock:
+                timings = self._timings.setdefault(command, self._Timings())
+        return timings
+
+    def _write_exit_report(self) -> None:
+        if self._timings:
+            _ = (self._exit_stream or sys.stderr).write(self.report() + "\n")
+
+    def _keep_profile(self, wall_ns: int, profile: m.Cli.SlowInvocationProfile) -> None:
+        with self._lock:
+            self._sequence += 1
+            entry = (wall_ns, self._sequence, profile)
+            if len(self._profiles) < self._max_profiles:
+                heapq.heappush(self._profiles, entry)
+            elif wall_ns > self._profiles[0][0]:
+                _ = heapq.heapreplace(self._profiles, entry)
+
+    def _profiled(
+        self,
+        ctx: p.Cli.CliContext,
+        next_: Callable[[p.Cli.CliContext], r[object]],
+        command: str,
+        timings: FlextCliTimingMiddleware._Timings,
+    ) -> r[object]:
+        defaults = c.Cli.TimingDefaults
+        profiler: cProfile.Profile | None = cProfile.Profile()
+        started_tracing = self._trace_memory and not tracemalloc.is_tracing()
+        try:
+            if started_tracing:
+                tracemalloc.start()
+            try:
+                profiler.enable()
+            except ValueError:
+                # Another profiler (debugger, coverage) is active.
+                profiler = None
+            wall_start, cpu_start = time.perf_counter_ns(), time.thread_time_ns()
+            try:
+                result = next_(ctx)
+            finally:
+                wall_ns = time.perf_counter_ns() - wall_start
+                cpu_ns = time.thread_time_ns() - cpu_start
+                if profiler is not None:
+                    profiler.disable()
+            # Only snapshot tracing this middleware asked for.
+            snapshot = (
+                tracemalloc.take_snapshot()
+                if self._trace_memory and tracemalloc.is_tracing()
+                else None
+            )
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+            self._profiler_lock.release()
+        threshold = timings.wall.percentile(
+            defaults.PERCENT_MAX - self._profile_slowest
+        )
+        self._record(command, timings, wall_ns, cpu_ns, success=result.is_success)
+        if wall_ns >= threshold:
+            stats_text = io.StringIO()
+            if profiler is not None:
+                _ = (
+                    pstats
+                    .Stats(profiler, stream=stats_text)
+                    .sort_stats(defaults.PROFILE_SORT)
+                    .print_stats(defaults.PROFILE_LINES)
+                )
+            allocations = (
+                tuple(
+                    str(stat)
+                    for stat in snapshot.statistics(defaults.ALLOCATION_GROUPING)[
+                        : defaults.PROFILE_LINES
+                    ]
+                )
+                if snapshot is not None
+                else ()
+            )
+            scale = float(c.Cli.MetricsDefaults.NANOS_PER_SECOND)
+            self._keep_profile(
+                wall_ns,
+                m.Cli.SlowInvocationProfile(
+                    command_name=command,
+                    wall_seconds=wall_ns / scale,
+                    cpu_seconds=cpu_ns / scale,
+                    success=result.is_success,
+                    profile=stats_text.getvalue(),
+                    allocations=allocations,
+                ),
+            )
+        return result
+
+    def _record(
+        self,
+        command: str,
+        timings: FlextCliTimingMiddleware._Timings,
+        wall_ns: int,
+        cpu_ns: int,
+        *,
+        success: bool,
+    ) -> None:
+        defaults = c.Cli.TimingDefaults
+        timings.wall.record(wall_ns)
+        timings.cpu.record(cpu_ns)
+        if not success:
+            with self._lock:
+                timings.failures += 1
+        scale = float(c.Cli.MetricsDefaults.NANOS_PER_SECOND)
+        registry = self._registry or FlextCliMetricsRegistry.get_global()
+        registry.histogram(
+            defaults.WALL, "Command wall-clock time.", ("command",)
+        ).observe(wall_ns / scale, command)
+        registry.histogram(
+            defaults.CPU, "Command CPU time on the calling thread.", ("command",)
+        ).observe(cpu_ns / scale, command)
+        if self._log:
+            _logger.info(
+                defaults.LOG_MESSAGE,
+                command=command,
+                wall_ms=wall_ns / scale * defaults.MILLIS_PER_SECOND,
+                cpu_ms=cpu_ns / scale * defaults.MILLIS_PER_SECOND,
+                success=success,
+            )
+
+    def _should_profile(self, timings: FlextCliTimingMiddleware._Timings) -> bool:
+        """Decide (and reserve the profiler) for the next call of a command."""
+        if (
+            self._profile_slowest <= 0
+            or timings.wall.count < self._min_samples
+            or self._rng.random() >= self._sample_rate
+        ):
+            return False
+        return self._profiler_lock.acquire(blocking=False)
+
+
+class FlextCliMiddlewareChain:
+    """Middleware chain compiled once into pre-bound links.
+
+    Each middleware gets a link holding the already-bound ``next_`` callable
+    of the following link, so a call walks the chain without allocating
+    closures. Inserting or removing a middleware creates one link and
+    re-points the neighbour's ``next_``; other links are untouched.
+    """
+
+    class Link:
+        """One compiled chain element: middleware plus its bound successor."""
+
+        __slots__ = ("middleware", "next_")
+
+        def __init__(
+            self,
+            middleware: p.Cli.Middleware,
+            next_: Callable[[p.Cli.CliContext], p_core.Result[object]],
+        ) -> None:
+            """Bind ``middleware`` to its successor ``next_``."""
+            super().__init__()
+            self.middleware = middleware
+            self.next_ = next_
+
+        def call(self, ctx: p.Cli.CliContext) -> p_core.Result[object]:
+            """Run this middleware with its pre-bound successor."""
+            return self.middleware(ctx, self.next_)
+
+    def __init__(
+        self,
+        middlewares: Sequence[p.Cli.Middleware],
+        handler: Callable[[p.Cli.CliContext], p_core.Result[object]],
+    ) -> None:
+        """Compile ``middlewares`` around ``handler`` (outermost first).
+
+        Args:
+            middlewares: Middleware instances in execution order.
+            handler: Final command handler.
+
+        """
+        super().__init__()
+        self._lock = threading.Lock()
+        self._handler = self._adapt_handler(handler)
+        self._links: list[FlextCliMiddlewareChain.Link] = []
+        next_ = self._handler
+        for middleware in reversed(middlewares):
+            link = self.Link(self._adapt(middleware), next_)
+            self._links.append(link)
+            next_ = link.call
+        self._links.reverse()
+        self._entry = next_
+
+    def __call__(self, ctx: p.Cli.CliContext) -> p_core.Result[object]:
+        """Execute the compiled chain."""
+        return self._entry(ctx)
+
+    def __len__(self) -> int:
+        """Return the number of middlewares in the chain."""
+        return len(self._links)
+
+    @property
+    def middlewares(self) -> tuple[p.Cli.Middleware, ...]:
+        """Middlewares in execution order."""
+        return tuple(link.middleware for link in self._links)
+
+    def append(self, middleware: p.Cli.Middleware) -> None:
+        """Add ``middleware`` as the innermost element (closest to handler)."""
+        self.insert(len(self._links), middleware)
+
+    def insert(self, index: int, middleware: p.Cli.Middleware) -> None:
+        """Insert ``middleware`` at ``index`` relinking only its predecessor."""
+        with self._lock:
+            position = max(0, min(index, len(self._links)))
+            successor = (
+                self._links[position].call
+                if position < len(self._links)
+                else self._handler
+            )
+            self._links.insert(position, self.Link(self._adapt(middleware), successor))
+            self._relink(position)
+
+    def remove(self, middleware: p.Cli.Middleware) -> bool:
+        """Remove the first occurrence of ``middleware``; return if found."""
+        with self._lock:
+            for position, link in enumerate(self._links):
+                if (
+                    link.middleware is middleware
+                    or getattr(link.middleware, "__wrapped__", None) is middleware
+                ):
+                    del self._links[position]
+                    self._relink(position)
+                    return True
+        return False
+
+    @staticmethod
+    def _adapt(
+        middleware: p.Cli.Middleware | p.Cli.AsyncMiddleware,
+    ) -> p.Cli.Middleware:
+        return FlextCliMiddleware.to_sync(middleware)
+
+    @staticmethod
+    def _adapt_handler(
+        handler: Callable[[p.Cli.CliContext], p_core.Result[object]]
+        | Callable[[p.Cli.CliContext], Awaitable[p_core.Result[object]]],
+    ) -> Callable[[p.Cli.CliContext], p_core.Result[object]]:
+        return FlextCliMiddleware.to_sync_handler(handler)
+
+    def _relink(self, position: int) -> None:
+        """Point the predecessor of the element at ``position`` (or the entry)."""
+        target = (
+            self._links[position].call if position < len(self._links) else self._handler
+        )
+        if position == 0:
+            self._entry = target
+        else:
+            self._links[position - 1].next_ = target
+
+
+class FlextCliAsyncMiddlewareChain(FlextCliMiddlewareChain):
+    """Asyncio middleware chain with the same compiled-link structure.
+
+    Sync middleware and handlers are adapted on insertion: sync middleware runs
+    in a worker thread and its ``next_`` call is scheduled back on the event
+    loop, so the remaining async chain keeps overlapping with other tasks.
+    """
+
+    class Link(FlextCliMiddlewareChain.Link):
+        """Compiled async chain element."""
+
+        __slots__ = ()
+
+        @override
+        async def call(self, ctx: p.Cli.CliContext) -> p_core.Result[object]:
+            """Await this middleware with its pre-bound successor."""
+            return await self.middleware(ctx, self.next_)
+
+    @override
+    async def __call__(self, ctx: p.Cli.CliContext) -> p_core.Result[object]:
+        """Execute the compiled chain."""
+        return await self._entry(ctx)
+
+    @staticmethod
+    @override
+    def _adapt(
+        middleware: p.Cli.Middleware | p.Cli.AsyncMiddleware,
+    ) -> p.Cli.AsyncMiddleware:
+        return FlextCliMiddleware.to_async(middleware)
+
+    @staticmethod
+    @override
+    def _adapt_handler(
+        handler: Callable[[p.Cli.CliContext], p_core.Result[object]]
+        | Callable[[p.Cli.CliContext], Awaitable[p_core.Result[object]]],
+    ) -> Callable[[p.Cli.CliContext], Awaitable[p_core.Result[object]]]:
+        return FlextCliMiddleware.to_async_handler(handler)
+
+
+class FlextCliAsyncRunner:
+    """Drive coroutines from synchronous entry points (Typer commands, REPLs).
+
+    When no event loop is running in the calling thread the coroutine runs on
+    a fresh loop; when one is already running (e.g. called from async code)
+    it is submitted to a long-lived loop on a daemon helper thread, so the
+    caller's loop is never re-entered and no loop or thread is created per
+    call.
+    """
+
+    _loop: ClassVar[asyncio.AbstractEventLoop | None] = None
+    _loop_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @staticmethod
+    def command[**P, T](
+        func: Callable[P, Coroutine[object, object, T]],
+    ) -> Callable[P, T]:
+        """Wrap an ``async def`` command so Typer/Click can call it.
+
+        The wrapper keeps the signature and annotations of ``func`` (Typer reads
+        them for options and arguments).
+
+        Example:
+            >>> @app.command()
+            ... @FlextCliAsyncRunner.command
+            ... async def fetch(url: str) -> None: ...
+
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            return FlextCliAsyncRunner.run(func(*args, **kwargs))
+
+        return wrapper
+
+    @classmethod
+    def run[T](cls, awaitable: Awaitable[T]) -> T:
+        """Run ``awaitable`` to completion and return its result."""
+
+        async def _await() -> T:
+            return await awaitable
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(_await())
+        helper = cls._helper_loop()
+        if running is helper:
+            # Blocking the helper loop on itself would deadlock.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                return pool.submit(asyncio.run, _await()).result()
+        return asyncio.run_coroutine_threadsafe(_await(), helper).result()
+
+    @classmethod
+    def _helper_loop(cls) -> asyncio.AbstractEventLoop:
+        """Return the shared helper loop, starting its thread on first use."""
+        with cls._loop_lock:
+            if cls._loop is None or cls._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name=c.Cli.AsyncRunnerDefaults.THREAD_NAME,
+                    daemon=True,
+                ).start()
+                cls._loop = loop
+            return cls._loop
+
 
 class FlextCliMiddleware:
     """Middleware namespace: protocol type and compose static method."""
 
+    @staticmethod
+    def command_name(ctx: p.Cli.CliContext) -> str:
+        """Return the command name carried by ``ctx`` (``unknown`` if absent)."""
+        return str(getattr(ctx, "command", c.Cli.RetryDefaults.UNKNOWN_COMMAND))
+
     @staticmethod
     def compose(
         middlewares: list[p.Cli.Middleware],
         handler: Callable[[p.Cli.CliContext], p_core.Result[object]],
-    ) -> Callable[[p.Cli.CliContext], p_core.Result[object]]:
+    ) -> FlextCliMiddlewareChain:
         """Compose middleware into single callable.
 
+        The chain is compiled once; calling it does not rebuild closures, and
+        middlewares can later be inserted or removed in place.
+
         Args:
             middlewares: List of middleware instances to compose.
             handler: Final command handler.
 
         Returns:
-            Composed callable that executes all middleware in order.
+            Compiled chain that executes all middleware in order.
 
         Example:
             >>> composed = FlextCliMiddleware.compose(
@@ -161,17 +1494,105 @@ class FlextCliMiddleware:
             >>> result = composed(context)
 
         """
+        return FlextCliMiddlewareChain(middlewares, handler)
+
+    @staticmethod
+    def compose_async(
+        middlewares: Sequence[p.Cli.AsyncMiddleware | p.Cli.Middleware],
+        handler: Callable[[p.Cli.CliContext], Awaitable[p_core.Result[object]]]
+        | Callable[[p.Cli.CliContext], p_core.Result[object]],
+    ) -> FlextCliAsyncMiddlewareChain:
+        """Compose async (and adapted sync) middleware around ``handler``.
+
+        Args:
+            middlewares: Middleware instances in execution order.
+            handler: Final command handler, async or sync.
 
-        def composed(ctx: p.Cli.CliContext) -> p_core.Result[object]:
+        Returns:
+            Compiled async chain; ``await chain(ctx)`` runs it.
 
-            def build_chain(
-                idx: int,
-            ) -> Callable[[p.Cli.CliContext], p_core.Result[object]]:
-                if idx >= len(middlewares):
-                    return handler
-                current_middleware = middlewares[idx]
-                return lambda c: current_middleware(c, build_chain(idx + 1))
+        """
+        return FlextCliAsyncMiddlewareChain(middlewares, handler)
 
-            return build_chain(0)(ctx)
+    @staticmethod
+    def is_async(func: object) -> bool:
+        """Return whether ``func`` (or its ``__call__``) is a coroutine function."""
+        return inspect.iscoroutinefunction(func) or (
+            callable(func) and inspect.iscoroutinefunction(type(func).__call__)
+        )
 
-        return composed
+    @staticmethod
+    def to_async(
+        middleware: p.Cli.Middleware | p.Cli.AsyncMiddleware,
+    ) -> p.Cli.AsyncMiddleware:
+        """Adapt a sync middleware for an async chain (runs in a worker thread)."""
+        if FlextCliMiddleware.is_async(middleware):
+            return middleware
+
+        @functools.wraps(middleware)
+        async def adapted(
+            ctx: p.Cli.CliContext,
+            next_: Callable[[p.Cli.CliContext], Awaitable[p_core.Result[object]]],
+        ) -> p_core.Result[object]:
+            loop = asyncio.get_running_loop()
+
+            def sync_next(inner_ctx: p.Cli.CliContext) -> p_core.Result[object]:
+                return asyncio.run_coroutine_threadsafe(
+                    FlextCliMiddleware._awaited(next_(inner_ctx)), loop
+                ).result()
+
+            return await asyncio.to_thread(middleware, ctx, sync_next)
+
+        return adapted
+
+    @staticmethod
+    def to_async_handler(
+        handler: Callable[[p.Cli.CliContext], p_core.Result[object]]
+        | Callable[[p.Cli.CliContext], Awaitable[p_core.Result[object]]],
+    ) -> Callable[[p.Cli.CliContext], Awaitable[p_core.Result[object]]]:
+        """Adapt a sync handler for an async chain (runs in a worker thread)."""
+        if FlextCliMiddleware.is_async(handler):
+            return handler
+
+        @functools.wraps(handler)
+        async def adapted(ctx: p.Cli.CliContext) -> p_core.Result[object]:
+            return await asyncio.to_thread(handler, ctx)
+
+        return adapted
+
+    @staticmethod
+    def to_sync(
+        middleware: p.Cli.Middleware | p.Cli.AsyncMiddleware,
+    ) -> p.Cli.Middleware:
+        """Adapt an async middleware for a sync chain via FlextCliAsyncRunner."""
+        if not FlextCliMiddleware.is_async(middleware):
+            return middleware
+
+        @functools.wraps(middleware)
+        def adapted(
+            ctx: p.Cli.CliContext,
+            next_: Callable[[p.Cli.CliContext], p_core.Result[object]],
+        ) -> p_core.Result[object]:
+            async_next = FlextCliMiddleware.to_async_handler(next_)
+            return FlextCliAsyncRunner.run(middleware(ctx, async_next))
+
+        return adapted
+
+    @staticmethod
+    def to_sync_handler(
+        handler: Callable[[p.Cli.CliContext], p_core.Result[object]]
+        | Callable[[p.Cli.CliContext], Awaitable[p_core.Result[object]]],
+    ) -> Callable[[p.Cli.CliContext], p_core.Result[object]]:
+        """Adapt an async handler for a sync chain via FlextCliAsyncRunner."""
+        if not FlextCliMiddleware.is_async(handler):
+            return handler
+
+        @functools.wraps(handler)
+        def adapted(ctx: p.Cli.CliContext) -> p_core.Result[object]:
+            return FlextCliAsyncRunner.run(handler(ctx))
+
+        return adapted
+
+    @staticmethod
+    async def _awaited[T](awaitable: Awaitable[T]) -> T:
+        return await awaitable
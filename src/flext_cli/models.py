@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import inspect
+import json
 import operator
+import sys
+import threading
 import types
-from collections.abc import Callable, Mapping, MutableMapping, Sequence
+import weakref
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from pathlib import Path
 from typing import (
     Annotated,
     ClassVar,
@@ -16,6 +30,7 @@ from typing import (
     Union,
     get_args,
     get_origin,
+    overload,
     override,
 )
 
@@ -25,6 +40,7 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    GetCoreSchemaHandler,
     RootModel,
     TypeAdapter,
     ValidationError,
@@ -33,15 +49,17 @@ from pydantic import (
     model_validator,
 )
 from pydantic.fields import FieldInfo
-from rich.errors import ConsoleError, LiveError, StyleError
+from pydantic_core import PydanticUndefined, core_schema
 from typer.models import OptionInfo
 
-from flext_cli import c, p
+from flext_cli import FlextCliFileCacheStore, FlextCliFormatters, c, p
 from flext_cli.typings import FlextCliTypes
 
 _logger = FlextLogger(__name__)
 
 _JSON_NORMALIZE_ADAPTER: TypeAdapter[object] = TypeAdapter(object)
+# Handler results of these types are already JSON values.
+_JSON_SCALAR_TYPES: tuple[type, ...] = (str, int, float, bool)
 _DICT_STR_OBJECT_ADAPTER: TypeAdapter[dict[str, FlextCliTypes.Cli.JsonValue]] = (
     TypeAdapter(
         dict[str, FlextCliTypes.Cli.JsonValue],
@@ -56,6 +74,10 @@ def _default_json_list() -> list[FlextCliTypes.Cli.JsonValue]:
     return []
 
 
+def _default_command_log() -> FlextCliModels.Cli.CommandLog:
+    return FlextCliModels.Cli.CommandLog()
+
+
 def _default_step_results() -> list[dict[str, FlextCliTypes.Cli.JsonValue]]:
     return []
 
@@ -971,9 +993,7 @@ class FlextCliModels(FlextModels):
                     ValueError,
                     TypeError,
                     KeyError,
-                    ConsoleError,
-                    StyleError,
-                    LiveError,
+                    *FlextCliFormatters.rich_errors(),
                 ) as e:
                     return (
                         r[FlextCliModels.Cli.CliCommand]
@@ -992,9 +1012,7 @@ class FlextCliModels(FlextModels):
                     ValueError,
                     TypeError,
                     KeyError,
-                    ConsoleError,
-                    StyleError,
-                    LiveError,
+                    *FlextCliFormatters.rich_errors(),
                 ) as e:
                     return (
                         r[Self]
@@ -1028,9 +1046,7 @@ class FlextCliModels(FlextModels):
                     ValueError,
                     TypeError,
                     KeyError,
-                    ConsoleError,
-                    StyleError,
-                    LiveError,
+                    *FlextCliFormatters.rich_errors(),
                 ) as e:
                     return (
                         r[Self]
@@ -1053,6 +1069,183 @@ class FlextCliModels(FlextModels):
                 """
                 return self._copy_with_update(status=str(status))
 
+        class CommandLog(Sequence["FlextCliModels.Cli.CliCommand"]):
+            """Immutable command log with structural sharing and a status index.
+
+            NOT a Pydantic model - a persistent sequence used as the type of
+            `CliSession.commands`. Logs derived by `append` share one backing
+            list: appending at the tip is amortized O(1), every older log keeps
+            seeing only its own prefix, and appending to an older log (a branch)
+            copies that prefix once. The status index keeps one shared position
+            list per status, so status lookups cost O(matches) and counts O(1).
+            """
+
+            __slots__ = ("_items", "_length", "_lock", "_status_index")
+
+            _items: list[FlextCliModels.Cli.CliCommand]
+            _length: int
+            _lock: threading.Lock
+            _status_index: dict[str, tuple[list[int], int]]
+
+            def __init__(
+                self, commands: Iterable[FlextCliModels.Cli.CliCommand] = ()
+            ) -> None:
+                """Build a log (and its status index) from existing commands."""
+                super().__init__()
+                self._items = list(commands)
+                self._length = len(self._items)
+                self._lock = threading.Lock()
+                self._status_index = {}
+                for position, command in enumerate(self._items):
+                    positions, count = self._status_index.get(command.status, ([], 0))
+                    positions.append(position)
+                    self._status_index[command.status] = (positions, count + 1)
+
+            @classmethod
+            def __get_pydantic_core_schema__(
+                cls,
+                source_type: type,
+                handler: GetCoreSchemaHandler,
+            ) -> core_schema.CoreSchema:
+                """Validate from a sequence of commands; serialize as a tuple."""
+                items_schema = core_schema.tuple_variable_schema(
+                    handler.generate_schema(FlextCliModels.Cli.CliCommand)
+                )
+                return core_schema.no_info_after_validator_function(
+                    cls._coerce,
+                    core_schema.union_schema([
+                        core_schema.is_instance_schema(cls),
+                        items_schema,
+                    ]),
+                    serialization=core_schema.plain_serializer_function_ser_schema(
+                        tuple, return_schema=items_schema
+                    ),
+                )
+
+            def __deepcopy__(
+                self, memo: dict[int, object]
+            ) -> FlextCliModels.Cli.CommandLog:
+                """Copy this log's commands into a new log with its own lock."""
+                return type(self)(copy.deepcopy(list(self), memo))
+
+            @override
+            def __eq__(self, other: object) -> bool:
+                """Compare element-wise with any non-string sequence."""
+                if isinstance(other, Sequence) and not isinstance(other, str):
+                    return len(self) == len(other) and all(
+                        mine == theirs for mine, theirs in zip(self, other, strict=True)
+                    )
+                return NotImplemented
+
+            @overload
+            def __getitem__(self, index: int) -> FlextCliModels.Cli.CliCommand: ...
+
+            @overload
+            def __getitem__(
+                self, index: slice
+            ) -> tuple[FlextCliModels.Cli.CliCommand, ...]: ...
+
+            @override
+            def __getitem__(
+                self, index: int | slice
+            ) -> (
+                FlextCliModels.Cli.CliCommand
+                | tuple[FlextCliModels.Cli.CliCommand, ...]
+            ):
+                """Return the command at ``index`` (slices return a tuple)."""
+                if isinstance(index, slice):
+                    return tuple(self._items[: self._length][index])
+                position = index + self._length if index < 0 else index
+                if not 0 <= position < self._length:
+                    msg = "command log index out of range"
+                    raise IndexError(msg)
+                return self._items[position]
+
+            @override
+            def __hash__(self) -> int:
+                """Hash like the equivalent tuple."""
+                return hash(tuple(self))
+
+            @override
+            def __iter__(self) -> Iterator[FlextCliModels.Cli.CliCommand]:
+                """Iterate this log's prefix of the shared backing list."""
+                items = self._items
+                for position in range(self._length):
+                    yield items[position]
+
+            @override
+            def __len__(self) -> int:
+                """Return the number of commands in this log."""
+                return self._length
+
+            @override
+            def __reduce__(
+                self,
+            ) -> tuple[
+                type[FlextCliModels.Cli.CommandLog],
+                tuple[tuple[FlextCliModels.Cli.CliCommand, ...]],
+            ]:
+                """Pickle as this log's commands; the lock is recreated on load."""
+                return type(self), (tuple(self),)
+
+            @override
+            def __repr__(self) -> str:
+                """Represent as the equivalent list of commands."""
+                return f"CommandLog({list(self)!r})"
+
+            def append(
+                self, command: FlextCliModels.Cli.CliCommand
+            ) -> FlextCliModels.Cli.CommandLog:
+                """Return a new log ending with ``command``; this log is unchanged."""
+                status = command.status
+                with self._lock:
+                    items = self._items
+                    if len(items) != self._length:
+                        items = items[: self._length]
+                    items.append(command)
+                    positions, count = self._status_index.get(status, ([], 0))
+                    if len(positions) != count:
+                        positions = positions[:count]
+                    positions.append(self._length)
+                derived = FlextCliModels.Cli.CommandLog.__new__(
+                    FlextCliModels.Cli.CommandLog
+                )
+                object.__setattr__(derived, "_items", items)
+                object.__setattr__(derived, "_length", self._length + 1)
+                object.__setattr__(derived, "_lock", self._lock)
+                object.__setattr__(
+                    derived,
+                    "_status_index",
+                    {**self._status_index, status: (positions, count + 1)},
+                )
+                return derived
+
+            def by_status(self, status: str) -> list[FlextCliModels.Cli.CliCommand]:
+                """Return commands with ``status`` in append order."""
+                positions, count = self._status_index.get(status, ([], 0))
+                items = self._items
+                return [items[position] for position in positions[:count]]
+
+            def count_by_status(self, status: str) -> int:
+                """Return how many commands have ``status`` in O(1)."""
+                return self._status_index.get(status, ([], 0))[1]
+
+            def statuses(self) -> list[str]:
+                """Return the statuses present in this log."""
+                return [
+                    status
+                    for status, (_positions, count) in self._status_index.items()
+                    if count
+                ]
+
+            @classmethod
+            def _coerce(
+                cls,
+                value: FlextCliModels.Cli.CommandLog
+                | Sequence[FlextCliModels.Cli.CliCommand],
+            ) -> FlextCliModels.Cli.CommandLog:
+                return value if isinstance(value, cls) else cls(value)
+
         class CliSession(FlextModels.Entity):
             """CLI session model for tracking command execution sessions extending Entity via inheritance."""
 
@@ -1091,11 +1284,11 @@ class FlextCliModels(FlextModels):
                     raise ValueError(msg)
                 return value
 
-            # Use concrete type to avoid protocol typing issues
+            # Persistent log: O(1) add_command and indexed commands_by_status
             commands: Annotated[
-                tuple[FlextCliModels.Cli.CliCommand, ...],
+                FlextCliModels.Cli.CommandLog,
                 Field(
-                    default_factory=tuple,
+                    default_factory=_default_command_log,
                     description="Commands in session",
                 ),
             ]
@@ -1142,20 +1335,21 @@ class FlextCliModels(FlextModels):
                 )
 
             def add_command(self, command: FlextCliModels.Cli.CliCommand) -> r[Self]:
-                """Add command to session."""
+                """Add command to session.
+
+                The returned session shares this session's command log; the
+                append and the shallow copy are both constant-time.
+                """
                 try:
-                    updated_commands = list(self.commands) + [command]
                     updated_session = self.model_copy(
-                        update={"commands": tuple(updated_commands)}
+                        update={"commands": self._command_log().append(command)}
                     )
                     return r[Self].ok(updated_session)
                 except (
                     ValueError,
                     TypeError,
                     KeyError,
-                    ConsoleError,
-                    StyleError,
-                    LiveError,
+                    *FlextCliFormatters.rich_errors(),
                 ) as e:
                     return (
                         r[Self]
@@ -1180,17 +1374,17 @@ class FlextCliModels(FlextModels):
                     If status is None: Mapping of status -> commands
 
                 """
-                cli_commands: list[FlextCliModels.Cli.CliCommand] = list(self.commands)
-                result: dict[str, list[FlextCliModels.Cli.CliCommand]] = {}
-                for command in cli_commands:
-                    cmd_status = command.status or ""
-                    if cmd_status not in result:
-                        result[cmd_status] = []
-                    result[cmd_status].append(command)
-
+                log = self._command_log()
                 if status is not None:
-                    return result.get(status, [])
-                return result
+                    return log.by_status(status)
+                return {
+                    cmd_status: log.by_status(cmd_status)
+                    for cmd_status in log.statuses()
+                }
+
+            def count_by_status(self, status: str) -> int:
+                """Return the number of commands with ``status`` in O(1)."""
+                return self._command_log().count_by_status(status)
 
             # Inherit created_at and updated_at from Entity - frozen=True makes them read-only
             # Entity provides these fields, and frozen models inherit them correctly
@@ -1204,6 +1398,13 @@ class FlextCliModels(FlextModels):
                 """
                 # Entity handles timestamp initialization via its own model_post_init
 
+            def _command_log(self) -> FlextCliModels.Cli.CommandLog:
+                """Return commands as a log (model_construct may bypass coercion)."""
+                commands = self.commands
+                if isinstance(commands, FlextCliModels.Cli.CommandLog):
+                    return commands
+                return FlextCliModels.Cli.CommandLog(commands)
+
             def _copy_with_update(self, **updates: FlextCliTypes.Scalar) -> Self:
                 """Helper method for model_copy with updates - reduces repetition.
 
@@ -1517,6 +1718,52 @@ class FlextCliModels(FlextModels):
                 ),
             ]
 
+        class RateLimit(FlextModels.Value):
+            """Token-bucket limit for one command."""
+
+            rate: Annotated[
+                float, Field(..., gt=0.0, description="Tokens added per second")
+            ]
+            burst: Annotated[
+                int,
+                Field(
+                    default=c.Cli.RateLimitDefaults.BURST,
+                    ge=1,
+                    description="Bucket capacity (largest burst)",
+                ),
+            ]
+
+        class ConfigVersion(FlextModels.Value):
+            """One applied configuration patch in the versioned history."""
+
+            version: Annotated[
+                int, Field(..., ge=0, description="Configuration version number")
+            ]
+            patch: Annotated[
+                dict[str, FlextCliTypes.Cli.JsonValue],
+                Field(
+                    default_factory=dict,
+                    description="JSON merge patch applied for this version",
+                ),
+            ]
+            changed_keys: Annotated[
+                tuple[str, ...],
+                Field(
+                    default_factory=tuple,
+                    description="Dotted paths whose values changed",
+                ),
+            ]
+            source: Annotated[
+                str,
+                Field(
+                    default=c.Cli.ConfigPatchDefaults.SOURCE_UPDATE,
+                    description="Origin of the change (update, rollback)",
+                ),
+            ]
+            timestamp: Annotated[
+                str, Field(default="", description="When the patch was applied")
+            ]
+
         class ServiceStatus(FlextModels.Value):
             """Generic service status response."""
 
@@ -2293,6 +2540,192 @@ class FlextCliModels(FlextModels):
             total_commands: Annotated[int, Field(default=0)]
             successful_commands: Annotated[int, Field(default=0)]
             failed_commands: Annotated[int, Field(default=0)]
+            total_executions: Annotated[
+                int,
+                Field(default=0, ge=0, description="Recorded command executions"),
+            ]
+            per_command: Annotated[
+                dict[str, FlextCliModels.Cli.CommandExecutionStats],
+                Field(
+                    default_factory=dict,
+                    description="Execution statistics keyed by command name",
+                ),
+            ]
+
+        class LatencyHistogramSnapshot(FlextModels.Value):
+            """Point-in-time view of a log-bucketed latency histogram.
+
+            Inherits frozen=True and extra="forbid" from FlextModels.Value.
+            Bucket bounds are inclusive upper bounds in nanoseconds.
+            """
+
+            count: Annotated[int, Field(default=0, ge=0)]
+            min_seconds: Annotated[float, Field(default=0.0, ge=0.0)]
+            max_seconds: Annotated[float, Field(default=0.0, ge=0.0)]
+            mean_seconds: Annotated[float, Field(default=0.0, ge=0.0)]
+            p50_seconds: Annotated[float, Field(default=0.0, ge=0.0)]
+            p95_seconds: Annotated[float, Field(default=0.0, ge=0.0)]
+            p99_seconds: Annotated[float, Field(default=0.0, ge=0.0)]
+            bucket_upper_bounds_ns: Annotated[
+                list[int], Field(default_factory=list, description="Bucket bounds")
+            ]
+            bucket_counts: Annotated[
+                list[int], Field(default_factory=list, description="Bucket counts")
+            ]
+
+        class CommandExecutionStats(FlextModels.Value):
+            """Execution counters and latency histogram for one command.
+
+            Inherits frozen=True and extra="forbid" from FlextModels.Value.
+            """
+
+            command_name: Annotated[str, Field(..., min_length=1)]
+            executions: Annotated[int, Field(default=0, ge=0)]
+            failures: Annotated[int, Field(default=0, ge=0)]
+            latency: Annotated[
+                FlextCliModels.Cli.LatencyHistogramSnapshot,
+                Field(..., description="Latency distribution"),
+            ]
+
+            @computed_field
+            @property
+            def successes(self) -> int:
+                """Executions that completed successfully."""
+                return self.executions - self.failures
+
+        class CommandTimingSummary(FlextModels.Value):
+            """Wall-clock and CPU time distributions for one command.
+
+            Inherits frozen=True and extra="forbid" from FlextModels.Value.
+            """
+
+            command_name: Annotated[str, Field(..., min_length=1)]
+            failures: Annotated[int, Field(default=0, ge=0)]
+            wall: Annotated[
+                FlextCliModels.Cli.LatencyHistogramSnapshot,
+                Field(..., description="Wall-clock time distribution"),
+            ]
+            cpu: Annotated[
+                FlextCliModels.Cli.LatencyHistogramSnapshot,
+                Field(..., description="CPU time distribution"),
+            ]
+
+        class SlowInvocationProfile(FlextModels.Value):
+            """Profile captured for one of the slowest invocations of a command.
+
+            Inherits frozen=True and extra="forbid" from FlextModels.Value.
+            """
+
+            command_name: Annotated[str, Field(..., min_length=1)]
+            wall_seconds: Annotated[float, Field(default=0.0, ge=0.0)]
+            cpu_seconds: Annotated[float, Field(default=0.0, ge=0.0)]
+            success: Annotated[bool, Field(default=True)]
+            profile: Annotated[
+                str, Field(default="", description="cProfile statistics text")
+            ]
+            allocations: Annotated[
+                tuple[str, ...],
+                Field(default=(), description="Top tracemalloc allocation sites"),
+            ]
+
+        class ImportTiming(FlextModels.Value):
+            """One module import reported by ``python -X importtime``.
+
+            Inherits frozen=True and extra="forbid" from FlextModels.Value.
+            """
+
+            module: Annotated[str, Field(..., min_length=1)]
+            self_us: Annotated[
+                int, Field(default=0, ge=0, description="Time in the module itself")
+            ]
+            cumulative_us: Annotated[
+                int,
+                Field(default=0, ge=0, description="Time including nested imports"),
+            ]
+            depth: Annotated[
+                int, Field(default=0, ge=0, description="Import nesting level")
+            ]
+
+        class StartupProfile(FlextModels.Value):
+            """Import-time profile of a cold interpreter importing a target.
+
+            Inherits frozen=True and extra="forbid" from FlextModels.Value.
+            """
+
+            target: Annotated[str, Field(..., min_length=1)]
+            total_ms: Annotated[
+                float,
+                Field(default=0.0, ge=0.0, description="Summed top-level imports"),
+            ]
+            wall_ms: Annotated[
+                float,
+                Field(default=0.0, ge=0.0, description="Whole process wall time"),
+            ]
+            imports: Annotated[
+                tuple[FlextCliModels.Cli.ImportTiming, ...],
+                Field(default=(), description="Imports in completion order"),
+            ]
+            critical_path: Annotated[
+                tuple[FlextCliModels.Cli.ImportTiming, ...],
+                Field(
+                    default=(),
+                    description="Chain of slowest imports from the root down",
+                ),
+            ]
+
+        class PipelineStage(FlextModels.Value):
+            """One stage of a command pipeline.
+
+            Inherits frozen=True and extra="forbid" from FlextModels.Value.
+            """
+
+            command: Annotated[
+                str, Field(..., min_length=1, description="Registered command name")
+            ]
+            workers: Annotated[
+                int,
+                Field(
+                    default=c.Cli.PipelineDefaults.WORKERS,
+                    ge=1,
+                    description="Worker threads running the command concurrently",
+                ),
+            ]
+            queue_size: Annotated[
+                int,
+                Field(
+                    default=c.Cli.PipelineDefaults.QUEUE_SIZE,
+                    ge=1,
+                    description="Capacity of the input queue (backpressure bound)",
+                ),
+            ]
+            argument: Annotated[
+                str | None,
+                Field(
+                    default=None,
+                    description="Keyword receiving each item (None: positional)",
+                ),
+            ]
+
+        class PipelineStageMetrics(FlextModels.Value):
+            """Throughput of one pipeline stage during a run.
+
+            Inherits frozen=True and extra="forbid" from FlextModels.Value.
+            """
+
+            command: Annotated[str, Field(..., min_length=1)]
+            workers: Annotated[int, Field(default=1, ge=1)]
+            processed: Annotated[int, Field(default=0, ge=0)]
+            failed: Annotated[int, Field(default=0, ge=0)]
+            busy_seconds: Annotated[
+                float, Field(default=0.0, ge=0.0, description="Summed handler time")
+            ]
+            elapsed_seconds: Annotated[
+                float,
+                Field(default=0.0, ge=0.0, description="First start to last finish"),
+            ]
+            throughput: Annotated[
+                float, Field(default=0.0, ge=0.0, description="Items per second")
+            ]
 
         class CommandExecutionContextResult(FlextModels.Value):
             """Command execution context result.
@@ -2332,6 +2765,325 @@ class FlextCliModels(FlextModels):
             current_step_name: Annotated[str, Field(default="")]
             percentage: Annotated[float, Field(default=0.0)]
 
+        class ModelCommandCache:
+            """Per-model-class cache of derived command metadata.
+
+            ModelCommandBuilder and CliModelConverter derive field types,
+            defaults, an ``inspect.Signature`` and CLI parameter specs from
+            ``model_fields``. Entries are keyed weakly on the model class and
+            validated against a fingerprint of its field definitions, so a
+            redefined or rebuilt model is analyzed again. After ``persist_to()``
+            entries are also written to a result cache store and reused by
+            later runs; only entries whose field types are importable classes
+            and whose defaults are plain JSON are persisted.
+            """
+
+            class Entry:
+                """Derived metadata of one model class, filled in on demand."""
+
+                __slots__ = (
+                    "adapter",
+                    "annotations",
+                    "cli_params",
+                    "defaults",
+                    "fields",
+                    "fields_with_factory",
+                    "fingerprint",
+                    "real_annotations",
+                    "signature",
+                )
+
+                def __init__(
+                    self, fields: Mapping[str, FieldInfo], fingerprint: str
+                ) -> None:
+                    """Initialize an empty entry for the given field definitions."""
+                    super().__init__()
+                    self.fields = fields
+                    self.fingerprint = fingerprint
+                    # None until the builder (or a persisted entry) fills them.
+                    self.annotations: Mapping[str, type] | None = None
+                    self.defaults: Mapping[str, FlextCliTypes.Cli.JsonValue] = {}
+                    self.fields_with_factory: frozenset[str] = frozenset()
+                    self.signature: inspect.Signature | None = None
+                    self.real_annotations: Mapping[str, type] = {}
+                    self.cli_params: tuple[p.Cli.CliParameterSpec, ...] | None = None
+                    self.adapter: TypeAdapter[BaseModel] | None = None
+
+            _shared: ClassVar[FlextCliModels.Cli.ModelCommandCache | None] = None
+
+            def __init__(self, store: p.Cli.ResultCacheStore | None = None) -> None:
+                """Initialize the cache.
+
+                Args:
+                    store: Optional store persisting entries between runs.
+
+                """
+                super().__init__()
+                self._store = store
+                self._entries: weakref.WeakKeyDictionary[
+                    type[BaseModel], FlextCliModels.Cli.ModelCommandCache.Entry
+                ] = weakref.WeakKeyDictionary()
+                self._lock = threading.Lock()
+
+            def __len__(self) -> int:
+                """Return the number of cached model classes."""
+                with self._lock:
+                    return len(self._entries)
+
+            @classmethod
+            def shared(cls) -> FlextCliModels.Cli.ModelCommandCache:
+                """Return the process-wide cache used by the builders."""
+                if cls._shared is None:
+                    cls._shared = cls()
+                return cls._shared
+
+            @staticmethod
+            def fingerprint(model_class: type[BaseModel]) -> str:
+                """Hash the class name and the definition of every field."""
+                digest = hashlib.sha256(
+                    f"{model_class.__module__}.{model_class.__qualname__}".encode()
+                )
+                for name, info in model_class.model_fields.items():
+                    factory = info.default_factory
+                    digest.update(
+                        repr((
+                            name,
+                            info.annotation,
+                            info.default,
+                            getattr(factory, "__qualname__", None),
+                            info.description,
+                        )).encode()
+                    )
+                return digest.hexdigest()
+
+            def adapter(self, model_class: type[BaseModel]) -> TypeAdapter[BaseModel]:
+                """Return the cached validator of ``model_class``."""
+                entry = self.entry(model_class)
+                if entry.adapter is None:
+                    entry.adapter = TypeAdapter(model_class)
+                return entry.adapter
+
+            def clear(self) -> None:
+                """Drop all in-memory entries (persisted entries are kept)."""
+                with self._lock:
+                    self._entries.clear()
+
+            def entry(self, model_class: type[BaseModel]) -> Entry:
+                """Return the valid entry of ``model_class``, creating it if needed.
+
+                The fingerprint is only recomputed when ``model_fields`` is no
+                longer the dict the entry was built from.
+                """
+                fields = model_class.model_fields
+                with self._lock:
+                    entry = self._entries.get(model_class)
+                if entry is not None and entry.fields is fields:
+                    return entry
+                fingerprint = self.fingerprint(model_class)
+                if entry is not None and entry.fingerprint == fingerprint:
+                    entry.fields = fields
+                    return entry
+                entry = self.Entry(fields, fingerprint)
+                if self._store is not None:
+                    self._load(model_class, entry)
+                with self._lock:
+                    self._entries[model_class] = entry
+                return entry
+
+            def persist_to(self, directory: Path | None = None) -> None:
+                """Persist entries as JSON files (default ``~/.flext/cache/models``)."""
+                self._store = FlextCliFileCacheStore(
+                    directory
+                    or FlextCliFileCacheStore.default_directory().with_name(
+                        c.Cli.ModelCacheDefaults.DIR_NAME
+                    )
+                )
+
+            def save(self, model_class: type[BaseModel], entry: Entry) -> bool:
+                """Persist ``entry``; returns whether anything was stored."""
+                defaults = c.Cli.ModelCacheDefaults
+                if self._store is None:
+                    return False
+                payload: dict[str, FlextCliTypes.Cli.JsonValue] = {
+                    defaults.KEY_FINGERPRINT: entry.fingerprint
+                }
+                command = self._dump_command(entry)
+                if command is not None:
+                    payload[defaults.KEY_COMMAND] = command
+                cli_params = self._dump_cli_params(entry)
+                if cli_params is not None:
+                    payload[defaults.KEY_CLI_PARAMS] = cli_params
+                if len(payload) == 1:
+                    return False
+                return self._store.set(
+                    self._store_key(model_class), payload, defaults.TTL
+                )
+
+            @staticmethod
+            def _dump_value(
+                value: object,
+            ) -> tuple[bool, FlextCliTypes.Cli.JsonValue]:
+                """Return (ok, value) if ``value`` survives a JSON round trip."""
+                try:
+                    loaded: FlextCliTypes.Cli.JsonValue = json.loads(json.dumps(value))
+                except (TypeError, ValueError):
+                    return False, None
+                return loaded == value, loaded
+
+            @staticmethod
+            def _resolve_type(ref: str) -> type | None:
+                """Resolve a type reference without importing anything."""
+                module, _, qualname = ref.partition(
+                    c.Cli.ModelCacheDefaults.TYPE_REF_SEPARATOR
+                )
+                resolved: object = sys.modules.get(module)
+                for part in qualname.split("."):
+                    resolved = getattr(resolved, part, None)
+                return resolved if isinstance(resolved, type) else None
+
+            @staticmethod
+            def _store_key(model_class: type[BaseModel]) -> str:
+                name = f"{model_class.__module__}.{model_class.__qualname__}"
+                return hashlib.sha256(name.encode()).hexdigest()[
+                    : c.Cli.ModelCacheDefaults.KEY_LENGTH
+                ]
+
+            @classmethod
+            def _type_ref(cls, field_type: object) -> str | None:
+                """Return ``module:qualname`` if it resolves back to ``field_type``."""
+                if not isinstance(field_type, type):
+                    return None
+                ref = (
+                    f"{field_type.__module__}"
+                    f"{c.Cli.ModelCacheDefaults.TYPE_REF_SEPARATOR}"
+                    f"{field_type.__qualname__}"
+                )
+                return ref if cls._resolve_type(ref) is field_type else None
+
+            @classmethod
+            def _dump_command(
+                cls, entry: Entry
+            ) -> dict[str, FlextCliTypes.Cli.JsonValue] | None:
+                defaults = c.Cli.ModelCacheDefaults
+                if entry.annotations is None:
+                    return None
+                annotations: dict[str, FlextCliTypes.Cli.JsonValue] = {}
+                for name, field_type in entry.annotations.items():
+                    ref = cls._type_ref(field_type)
+                    if ref is None:
+                        return None
+                    annotations[name] = ref
+                values: dict[str, FlextCliTypes.Cli.JsonValue] = {}
+                undefined: list[FlextCliTypes.Cli.JsonValue] = []
+                for name, value in entry.defaults.items():
+                    if value is PydanticUndefined:
+                        undefined.append(name)
+                        continue
+                    ok, values[name] = cls._dump_value(value)
+                    if not ok:
+                        return None
+                return {
+                    defaults.KEY_ANNOTATIONS: annotations,
+                    defaults.KEY_DEFAULTS: values,
+                    defaults.KEY_UNDEFINED: undefined,
+                    defaults.KEY_FACTORY: sorted(entry.fields_with_factory),
+                }
+
+            @classmethod
+            def _dump_cli_params(
+                cls, entry: Entry
+            ) -> list[FlextCliTypes.Cli.JsonValue] | None:
+                defaults = c.Cli.ModelCacheDefaults
+                if entry.cli_params is None:
+                    return None
+                dumped: list[FlextCliTypes.Cli.JsonValue] = []
+                for spec in entry.cli_params:
+                    ref = cls._type_ref(spec.param_type)
+                    if ref is None:
+                        return None
+                    item: dict[str, FlextCliTypes.Cli.JsonValue] = {
+                        defaults.KEY_FIELD_NAME: spec.field_name,
+                        defaults.KEY_PARAM_TYPE: ref,
+                        defaults.KEY_CLICK_TYPE: spec.click_type,
+                        defaults.KEY_HELP: spec.help,
+                    }
+                    if spec.default is not PydanticUndefined:
+                        ok, item[defaults.KEY_DEFAULT] = cls._dump_value(spec.default)
+                        if not ok:
+                            return None
+                    dumped.append(item)
+                return dumped
+
+            def _load(self, model_class: type[BaseModel], entry: Entry) -> None:
+                """Fill ``entry`` from the store if its fingerprint still matches."""
+                defaults = c.Cli.ModelCacheDefaults
+                if self._store is None:
+                    return
+                payload = self._store.get(self._store_key(model_class))
+                if (
+                    not isinstance(payload, Mapping)
+                    or payload.get(defaults.KEY_FINGERPRINT) != entry.fingerprint
+                ):
+                    return
+                command = payload.get(defaults.KEY_COMMAND)
+                if isinstance(command, Mapping):
+                    self._load_command(entry, command)
+                cli_params = payload.get(defaults.KEY_CLI_PARAMS)
+                if isinstance(cli_params, list):
+                    self._load_cli_params(entry, cli_params)
+
+            @classmethod
+            def _load_command(cls, entry: Entry, command: Mapping[str, object]) -> None:
+                defaults = c.Cli.ModelCacheDefaults
+                refs = command.get(defaults.KEY_ANNOTATIONS)
+                values = command.get(defaults.KEY_DEFAULTS)
+                undefined = command.get(defaults.KEY_UNDEFINED)
+                factory = command.get(defaults.KEY_FACTORY)
+                if not (
+                    isinstance(refs, Mapping)
+                    and isinstance(values, Mapping)
+                    and isinstance(undefined, list)
+                    and isinstance(factory, list)
+                ):
+                    return
+                annotations: dict[str, type] = {}
+                for name, ref in refs.items():
+                    field_type = cls._resolve_type(str(ref))
+                    if field_type is None:
+                        return
+                    annotations[str(name)] = field_type
+                loaded: dict[str, FlextCliTypes.Cli.JsonValue] = dict(values)
+                loaded.update(dict.fromkeys(map(str, undefined), PydanticUndefined))
+                entry.annotations = annotations
+                # Restore the original field order of the defaults mapping.
+                entry.defaults = {
+                    name: loaded[name] for name in annotations if name in loaded
+                }
+                entry.fields_with_factory = frozenset(map(str, factory))
+
+            @classmethod
+            def _load_cli_params(cls, entry: Entry, cli_params: list[object]) -> None:
+                defaults = c.Cli.ModelCacheDefaults
+                specs: list[p.Cli.CliParameterSpec] = []
+                for item in cli_params:
+                    if not isinstance(item, Mapping):
+                        return
+                    param_type = cls._resolve_type(
+                        str(item.get(defaults.KEY_PARAM_TYPE))
+                    )
+                    if param_type is None:
+                        return
+                    specs.append(
+                        FlextCliModels.Cli.CliParameterSpec(
+                            field_name=str(item.get(defaults.KEY_FIELD_NAME)),
+                            param_type=param_type,
+                            click_type=str(item.get(defaults.KEY_CLICK_TYPE)),
+                            default=item.get(defaults.KEY_DEFAULT, PydanticUndefined),
+                            help_text=str(item.get(defaults.KEY_HELP, "")),
+                        )
+                    )
+                entry.cli_params = tuple(specs)
+
         class ModelCommandBuilder:
             """Builder for Typer commands from Pydantic models.
 
@@ -2632,11 +3384,14 @@ class FlextCliModels(FlextModels):
 
             def _process_field_metadata(
                 self,
-                field_name: str,
+                _field_name: str,
                 field_info: FieldInfo | object,
             ) -> tuple[type, FlextCliTypes.Cli.JsonValue | None, bool, bool]:
                 """Process field metadata and return type info.
 
+                Config defaults are not applied here: the result only depends
+                on the model class, so it is cached per class (see build).
+
                 Returns (field_type, default_value, is_required, has_factory).
                 """
                 default_value: FlextCliTypes.Cli.JsonValue | None = None
@@ -2662,16 +3417,6 @@ class FlextCliModels(FlextModels):
                 if callable(is_required_fn):
                     is_required = bool(is_required_fn())
 
-                # Get config default if available
-                if self.config is not None:
-                    config_value = (
-                        getattr(self.config, field_name)
-                        if hasattr(self.config, field_name)
-                        else None
-                    )
-                    if config_value is not None:
-                        default_value = config_value
-
                 # Get and resolve field type
                 # Use getattr for FieldInfo access - field_info is an object, not always a Mapping
                 field_type_raw = (
@@ -2738,18 +3483,58 @@ class FlextCliModels(FlextModels):
                     Typer command function with auto-generated parameters
 
                 """
-                narrowed_fields: dict[str, FieldInfo] = dict(
-                    self.model_class.model_fields
-                )
-                annotations, defaults, fields_with_factory = self._collect_field_data(
-                    narrowed_fields,
+                cache = FlextCliModels.Cli.ModelCommandCache.shared()
+                entry = cache.entry(self.model_class)
+                annotations = entry.annotations
+                if annotations is None:
+                    narrowed_fields: dict[str, FieldInfo] = dict(
+                        self.model_class.model_fields
+                    )
+                    annotations, defaults, fields_with_factory = (
+                        self._collect_field_data(narrowed_fields)
+                    )
+                    entry.annotations = annotations
+                    entry.defaults = defaults
+                    entry.fields_with_factory = frozenset(fields_with_factory)
+                    _ = cache.save(self.model_class, entry)
+                if entry.signature is None:
+                    entry.signature = self._command_signature(
+                        annotations, entry.defaults, entry.fields_with_factory
+                    )
+                    entry.real_annotations = self._create_real_annotations(annotations)
+                command_signature = entry.signature
+                config_defaults = self._config_defaults(
+                    annotations, entry.defaults, entry.fields_with_factory
                 )
+                if config_defaults is not None:
+                    command_signature = self._command_signature(
+                        annotations, config_defaults, entry.fields_with_factory
+                    )
                 return self._execute_command_wrapper(
-                    annotations,
-                    defaults,
-                    fields_with_factory,
+                    command_signature, entry.real_annotations
                 )
 
+            def _config_defaults(
+                self,
+                annotations: Mapping[str, type],
+                defaults: Mapping[str, FlextCliTypes.Cli.JsonValue],
+                fields_with_factory: frozenset[str],
+            ) -> Mapping[str, FlextCliTypes.Cli.JsonValue] | None:
+                """Overlay config values on the model defaults; None if none apply."""
+                if self.config is None:
+                    return None
+                overrides: dict[str, FlextCliTypes.Cli.JsonValue] = {}
+                for field_name in annotations:
+                    config_value = getattr(self.config, field_name, None)
+                    if (
+                        config_value is not None
+                        and field_name not in fields_with_factory
+                    ):
+                        overrides[field_name] = config_value
+                if not overrides:
+                    return None
+                return {**defaults, **overrides}
+
             def _build_signature_parts(
                 self,
                 annotations: Mapping[str, type],
@@ -2886,12 +3671,13 @@ class FlextCliModels(FlextModels):
 
                 return annotations, defaults, fields_with_factory
 
-            def _execute_command_wrapper(
-                self,
+            @staticmethod
+            def _command_signature(
                 annotations: Mapping[str, type],
                 defaults: Mapping[str, FlextCliTypes.Cli.JsonValue],
-                fields_with_factory: set[str],
-            ) -> p.Cli.CliCommandWrapper:
+                fields_with_factory: frozenset[str],
+            ) -> inspect.Signature:
+                """Build the command signature: required fields first."""
                 required_parameters: list[inspect.Parameter] = []
                 defaulted_parameters: list[inspect.Parameter] = []
                 for field_name, field_type in annotations.items():
@@ -2912,52 +3698,102 @@ class FlextCliModels(FlextModels):
                     else:
                         required_parameters.append(parameter)
                 signature_parameters = required_parameters + defaulted_parameters
-                command_signature = inspect.Signature(parameters=signature_parameters)
+                return inspect.Signature(parameters=signature_parameters)
 
-                def command_wrapper(
-                    *args: FlextCliTypes.Cli.JsonValue,
-                    **kwargs: FlextCliTypes.Scalar,
-                ) -> FlextCliTypes.Cli.JsonValue:
+            def _execute_command_wrapper(
+                self,
+                command_signature: inspect.Signature,
+                real_annotations: Mapping[str, type],
+            ) -> p.Cli.CliCommandWrapper:
+                """Compile the command function for ``command_signature``.
+
+                Keyword arguments, and positional arguments in field order, are
+                bound without ``Signature.bind``; any other call shape falls back
+                to it so errors read as before. Validation goes through the
+                class's cached TypeAdapter and the fields the config accepts
+                are resolved once, here.
+                """
+                field_order = tuple(command_signature.parameters)
+                field_names = frozenset(field_order)
+                required = frozenset(
+                    name
+                    for name, parameter in command_signature.parameters.items()
+                    if parameter.default is inspect.Parameter.empty
+                )
+                adapter = FlextCliModels.Cli.ModelCommandCache.shared().adapter(
+                    self.model_class
+                )
+                config = self.config
+                config_fields = (
+                    frozenset()
+                    if config is None
+                    else frozenset(
+                        name for name in field_order if hasattr(config, name)
+                    )
+                )
+                handler = self.handler
+                convert = FlextCliModels.Cli.CliModelConverter.convert_field_value
+
+                def bind(
+                    args: tuple[FlextCliTypes.Cli.JsonValue, ...],
+                    kwargs: Mapping[str, FlextCliTypes.Scalar],
+                ) -> dict[str, FlextCliTypes.Cli.JsonValue]:
+                    if (
+                        not args
+                        and required.issubset(kwargs)
+                        and field_names.issuperset(kwargs)
+                    ):
+                        return dict(kwargs)
+                    if len(args) <= len(field_order):
+                        arguments: dict[str, FlextCliTypes.Cli.JsonValue] = dict(
+                            zip(field_order, args, strict=False)
+                        )
+                        if (
+                            field_names.issuperset(kwargs)
+                            and arguments.keys().isdisjoint(kwargs)
+                            and required.issubset(arguments.keys() | kwargs.keys())
+                        ):
+                            arguments.update(kwargs)
+                            return arguments
                     try:
                         bound_arguments = command_signature.bind(*args, **kwargs)
                     except TypeError as ex:
                         msg = f"Invalid command arguments: {ex}"
                         raise RuntimeError(msg) from ex
+                    return dict(bound_arguments.arguments)
 
-                    model_instance = self.model_class.model_validate(
-                        dict(bound_arguments.arguments),
-                    )
-                    if self.config is not None:
-                        for fn, value in bound_arguments.arguments.items():
-                            try:
-                                FlextCliTypes.Cli.JsonValue.__setattr__(
-                                    self.config, fn, value
-                                )
-                            except (AttributeError, TypeError) as ex:
-                                _logger.debug(
-                                    f"Could not set builder_config.{fn}",
-                                    error=ex,
-                                )
-                    if callable(self.handler):
-                        return self.handler(model_instance)
+                def update_config(
+                    arguments: Mapping[str, FlextCliTypes.Cli.JsonValue],
+                ) -> None:
+                    for name in config_fields.intersection(arguments):
+                        try:
+                            setattr(config, name, arguments[name])
+                        except (AttributeError, TypeError, ValueError) as ex:
+                            _logger.debug(
+                                f"Could not set builder_config.{name}",
+                                error=ex,
+                            )
+
+                def call_handler(model_instance: BaseModel) -> object:
+                    if callable(handler):
+                        return handler(model_instance)
                     msg = "builder_handler is not callable"
                     raise RuntimeError(msg)
 
-                # Type narrowing: _create_real_annotations returns dict[str, type]
-                real_annotations = self._create_real_annotations(annotations)
-                command_wrapper.__annotations__ = dict(real_annotations)
-
-                # TypeGuard narrows command_wrapper to Callable[..., object] for dynamic exec result
                 def typed_wrapper(
                     *args: FlextCliTypes.Cli.JsonValue,
                     **kwargs: FlextCliTypes.Scalar,
                 ) -> FlextCliTypes.Cli.JsonValue:
-                    raw_result = command_wrapper(*args, **kwargs)
-                    normalized = (
-                        FlextCliModels.Cli.CliModelConverter.convert_field_value(
-                            raw_result,
-                        )
-                    )
+                    arguments = bind(args, kwargs)
+                    model_instance = adapter.validate_python(arguments)
+                    if config_fields:
+                        update_config(arguments)
+                    raw_result = call_handler(model_instance)
+                    if raw_result is None:
+                        return ""
+                    if isinstance(raw_result, _JSON_SCALAR_TYPES):
+                        return raw_result
+                    normalized = convert(raw_result)
                     if normalized.is_success:
                         return normalized.value
                     return str(raw_result)
@@ -3025,9 +3861,7 @@ class FlextCliModels(FlextModels):
                     ValueError,
                     TypeError,
                     KeyError,
-                    ConsoleError,
-                    StyleError,
-                    LiveError,
+                    *FlextCliFormatters.rich_errors(),
                 ) as e:
                     return r[BaseModel].fail(f"Failed to create model instance: {e}")
 
@@ -3091,9 +3925,7 @@ class FlextCliModels(FlextModels):
                     ValueError,
                     TypeError,
                     KeyError,
-                    ConsoleError,
-                    StyleError,
-                    LiveError,
+                    *FlextCliFormatters.rich_errors(),
                 ) as e:
                     return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                         f"Extraction failed: {e}",
@@ -3154,9 +3986,7 @@ class FlextCliModels(FlextModels):
                     ValueError,
                     TypeError,
                     KeyError,
-                    ConsoleError,
-                    StyleError,
-                    LiveError,
+                    *FlextCliFormatters.rich_errors(),
                 ) as e:
                     return r[p.Cli.CliParameterSpec].fail(
                         f"Field conversion failed: {e}"
@@ -3317,7 +4147,15 @@ class FlextCliModels(FlextModels):
             def model_to_cli_params(
                 model_cls: type[BaseModel],
             ) -> r[list[p.Cli.CliParameterSpec]]:
-                """Convert Pydantic model to list of CLI parameter specifications."""
+                """Convert Pydantic model to list of CLI parameter specifications.
+
+                Specs are cached per model class (see ModelCommandCache); every
+                call returns a new list of the shared spec objects.
+                """
+                cache = FlextCliModels.Cli.ModelCommandCache.shared()
+                entry = cache.entry(model_cls)
+                if entry.cli_params is not None:
+                    return r[list[p.Cli.CliParameterSpec]].ok(list(entry.cli_params))
                 try:
 
                     def convert_field(
@@ -3364,15 +4202,11 @@ class FlextCliModels(FlextModels):
                             field_name: convert_field(field_name, field_info)
                             for field_name, field_info in model_cls.model_fields.items()
                         }
-                        params_list = list(params_dict.values())
-                        return r[list[p.Cli.CliParameterSpec]].ok(params_list)
                     except (
                         ValueError,
                         TypeError,
                         KeyError,
-                        ConsoleError,
-                        StyleError,
-                        LiveError,
+                        *FlextCliFormatters.rich_errors(),
                     ) as e:
                         return r[list[p.Cli.CliParameterSpec]].fail(
                             f"Conversion failed: {e}"
@@ -3381,13 +4215,15 @@ class FlextCliModels(FlextModels):
                     ValueError,
                     TypeError,
                     KeyError,
-                    ConsoleError,
-                    StyleError,
-                    LiveError,
+                    *FlextCliFormatters.rich_errors(),
                 ) as e:
                     return r[list[p.Cli.CliParameterSpec]].fail(
                         f"Conversion failed: {e}"
                     )
+                params_list = list(params_dict.values())
+                entry.cli_params = tuple(params_list)
+                _ = cache.save(model_cls, entry)
+                return r[list[p.Cli.CliParameterSpec]].ok(params_list)
 
             @staticmethod
             def model_to_click_options(
@@ -3596,9 +4432,7 @@ class FlextCliModels(FlextModels):
                     ValueError,
                     TypeError,
                     KeyError,
-                    ConsoleError,
-                    StyleError,
-                    LiveError,
+                    *FlextCliFormatters.rich_errors(),
                 ) as e:
                     return r[object].fail(
                         f"Validation failed: {e}",
@@ -3715,9 +4549,7 @@ class FlextCliModels(FlextModels):
                             ValueError,
                             TypeError,
                             KeyError,
-                            ConsoleError,
-                            StyleError,
-                            LiveError,
+                            *FlextCliFormatters.rich_errors(),
                         ) as e:
                             # Return error string on failure (decorator pattern)
                             output = f"Validation failed: {e}"
@@ -3756,9 +4588,7 @@ class FlextCliModels(FlextModels):
                             ValueError,
                             TypeError,
                             KeyError,
-                            ConsoleError,
-                            StyleError,
-                            LiveError,
+                            *FlextCliFormatters.rich_errors(),
                         ) as e:
                             return f"Validation failed: {e}"
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from datetime import datetime
 from types import TracebackType
 from typing import Protocol, Self, runtime_checkable
@@ -850,6 +850,21 @@ class FlextCliProtocols(FlextProtocols):
                 """Get table style."""
                 ...
 
+        @runtime_checkable
+        class AsyncMiddleware(Protocol):
+            """Asyncio middleware protocol for CLI commands."""
+
+            async def __call__(
+                self,
+                ctx: FlextCliProtocols.Cli.CliContext,
+                next_: Callable[
+                    [FlextCliProtocols.Cli.CliContext],
+                    Awaitable[FlextProtocols.Result[object]],
+                ],
+            ) -> FlextProtocols.Result[object]:
+                """Process and await the next middleware."""
+                ...
+
         @runtime_checkable
         class Middleware(Protocol):
             """Middleware protocol for CLI commands."""
@@ -865,6 +880,22 @@ class FlextCliProtocols(FlextProtocols):
                 """Process and pass to next middleware."""
                 ...
 
+        @runtime_checkable
+        class ResultCacheStore(Protocol):
+            """Store for cached command results (``None`` means a miss)."""
+
+            def delete(self, key: str) -> bool:
+                """Drop the entry for ``key``."""
+                ...
+
+            def get(self, key: str) -> object | None:
+                """Return the live value for ``key``, or ``None``."""
+                ...
+
+            def set(self, key: str, value: object, ttl: float) -> bool:
+                """Store ``value`` for ``ttl`` seconds."""
+                ...
+
         @runtime_checkable
         class CliApp(Protocol):
             """Protocol for CLI application base classes.
@@ -0,0 +1,186 @@
+"""Token buckets for flext-cli rate limiting.
+
+FlextCliTokenBucket is a thread-safe in-process bucket. FlextCliFileTokenBucket
+keeps the bucket state in a small file guarded by an OS file lock, so every
+process pointing at the same directory draws from one shared bucket without a
+central service. Both back FlextCliRateLimitMiddleware.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+from flext_cli import c
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FlextCliTokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate`` per second."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = c.Cli.RateLimitDefaults.BURST,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Bucket capacity.
+            clock: Monotonic time source.
+
+        """
+        super().__init__()
+        self._rate = rate
+        self._burst = float(burst)
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def take(
+        tokens: float,
+        updated: float,
+        now: float,
+        rate: float,
+        burst: float,
+        amount: float,
+    ) -> tuple[float, float]:
+        """Refill and try to take ``amount``; returns (tokens left, wait).
+
+        ``wait`` is 0.0 when ``amount`` was taken, otherwise the seconds until
+        enough tokens will have accumulated (nothing is taken then).
+        """
+        available = min(burst, tokens + max(0.0, now - updated) * rate)
+        if available >= amount:
+            return available - amount, 0.0
+        return available, (amount - available) / rate
+
+    def try_acquire(self, amount: float = 1.0) -> float:
+        """Take ``amount`` tokens; returns 0.0 or the seconds to wait."""
+        with self._lock:
+            now = self._clock()
+            self._tokens, wait = self.take(
+                self._tokens, self._updated, now, self._rate, self._burst, amount
+            )
+            self._updated = now
+            return wait
+
+
+class FlextCliFileTokenBucket:
+    """Token bucket whose state file is shared by concurrent processes.
+
+    The state (tokens, wall-clock update time) lives in ``<name>.bucket`` and
+    is read-modify-written while holding an exclusive lock on ``<name>.lock``
+    (``flock``, or ``msvcrt.locking`` on Windows). The operating system drops
+    the lock of a process that dies, so no stale-lock recovery is needed and
+    the lock file is never removed.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        name: str,
+        rate: float,
+        burst: int = c.Cli.RateLimitDefaults.BURST,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the shared bucket (full if no state file exists yet).
+
+        Args:
+            directory: Directory shared by all participating processes.
+            name: Bucket name, usually the command name.
+            rate: Tokens added per second.
+            burst: Bucket capacity.
+            clock: Wall-clock time source (must agree across processes).
+
+        """
+        super().__init__()
+        defaults = c.Cli.RateLimitDefaults
+        safe_name = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in name)
+        self._state_path = directory / f"{safe_name}{defaults.STATE_SUFFIX}"
+        self._lock_path = directory / f"{safe_name}{defaults.LOCK_SUFFIX}"
+        self._rate = rate
+        self._burst = float(burst)
+        self._clock = clock
+        self._thread_lock = threading.Lock()
+
+    @property
+    def state_path(self) -> Path:
+        """File holding the shared bucket state."""
+        return self._state_path
+
+    def try_acquire(self, amount: float = 1.0) -> float:
+        """Take ``amount`` tokens; returns 0.0 or the seconds to wait."""
+        defaults = c.Cli.RateLimitDefaults
+        with self._thread_lock, self._locked():
+            now = self._clock()
+            tokens, updated = self._read_state(now)
+            tokens, wait = FlextCliTokenBucket.take(
+                tokens, updated, now, self._rate, self._burst, amount
+            )
+            payload = {defaults.KEY_TOKENS: tokens, defaults.KEY_UPDATED: now}
+            tmp_path = self._state_path.with_name(self._state_path.name + ".tmp")
+            _ = tmp_path.write_text(json.dumps(payload))
+            _ = tmp_path.replace(self._state_path)
+            return wait
+
+    @contextlib.contextmanager
+    def _locked(self) -> Generator[None]:
+        """Hold the exclusive lock on the lock file."""
+        self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._lock_path, os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            if sys.platform == "win32":
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    except OSError:
+                        # LK_LOCK gives up after about ten seconds; keep waiting.
+                        continue
+                    break
+                try:
+                    yield
+                finally:
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _read_state(self, now: float) -> tuple[float, float]:
+        defaults = c.Cli.RateLimitDefaults
+        try:
+            state = json.loads(self._state_path.read_text())
+            return (
+                float(state[defaults.KEY_TOKENS]),
+                float(state[defaults.KEY_UPDATED]),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or corrupt state: start with a full bucket.
+            return self._burst, now
+
+
+__all__ = ["FlextCliFileTokenBucket", "FlextCliTokenBucket"]
@@ -15,11 +15,11 @@ from pathlib import Path
 from typing import override
 
 from flext_core import r
-from rich.errors import ConsoleError, LiveError, StyleError
 
 from flext_cli import (
     FlextCliConstants,
     FlextCliFileTools,
+    FlextCliFormatters,
     FlextCliOutput,
     FlextCliServiceBase,
     FlextCliUtilities,
@@ -137,9 +137,7 @@ class FlextCliCmd(FlextCliServiceBase):
                 ValueError,
                 TypeError,
                 KeyError,
-                ConsoleError,
-                StyleError,
-                LiveError,
+                *FlextCliFormatters.rich_errors(),
             ) as e:
                 self.logger.debug(
                     "edit_config model_validate fallback",
@@ -163,9 +161,7 @@ class FlextCliCmd(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[str].fail(
                 FlextCliConstants.Cli.ErrorMessages.EDIT_CONFIG_FAILED.format(error=e)
@@ -241,9 +237,7 @@ class FlextCliCmd(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 FlextCliConstants.Cli.CmdErrorMessages.GET_CONFIG_FAILED.format(error=e)
@@ -276,9 +270,7 @@ class FlextCliCmd(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[bool].fail(
                 FlextCliConstants.Cli.ErrorMessages.SET_CONFIG_FAILED.format(error=e)
@@ -308,9 +300,7 @@ class FlextCliCmd(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[bool].fail(
                 FlextCliConstants.Cli.CmdErrorMessages.SHOW_CONFIG_FAILED.format(
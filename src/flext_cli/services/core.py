@@ -9,14 +9,27 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import copy
+import time
+import uuid
 from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
 from typing import override
 
 from flext_core import FlextDecorators, FlextLogger, FlextRegistry, r, u
-from rich.errors import ConsoleError, LiveError, StyleError
 
-from flext_cli import FlextCliOutput, FlextCliServiceBase, FlextCliUtilities, c, m, t
+from flext_cli import (
+    FlextCliFormatters,
+    FlextCliOutput,
+    FlextCliServiceBase,
+    FlextCliUtilities,
+    c,
+    m,
+    t,
+)
+from flext_cli.config_engine import FlextCliConfigEngine
+from flext_cli.metrics import FlextCliExecutionMetrics
+from flext_cli.sessions import FlextCliSessionStore
 from flext_cli.typings import FlextCliTypes
 
 
@@ -93,15 +106,24 @@ class FlextCliCore(FlextCliServiceBase):
     _registry: FlextRegistry
     _session_config: dict[str, FlextCliTypes.Cli.JsonValue]
     _session_start_time: str
+    _execution_metrics: FlextCliExecutionMetrics
+    _session_baseline: tuple[int, int]
+    _session_store: FlextCliSessionStore | None
+    _current_session_id: str
+    _config_engine: FlextCliConfigEngine
 
     def __init__(
-        self, config: Mapping[str, FlextCliTypes.Cli.JsonValue] | None = None
+        self,
+        config: Mapping[str, FlextCliTypes.Cli.JsonValue] | None = None,
+        session_store: FlextCliSessionStore | None = None,
     ) -> None:
         """Initialize CLI core with optional configuration seed values.
 
         Args:
             config: Optional configuration dictionary for CLI-specific settings
                 (stored separately, not passed to parent FlextService.__init__)
+            session_store: Optional journal-backed store; when set, sessions
+                and executed commands are persisted and can be resumed
 
         """
         super().__init__(
@@ -118,6 +140,13 @@ class FlextCliCore(FlextCliServiceBase):
         object.__setattr__(self, "_session_active", False)
         object.__setattr__(self, "_caches", {})
         object.__setattr__(self, "_cache_stats", self._CacheStats())
+        object.__setattr__(self, "_execution_metrics", FlextCliExecutionMetrics())
+        object.__setattr__(self, "_session_baseline", (0, 0))
+        object.__setattr__(self, "_session_store", session_store)
+        object.__setattr__(self, "_current_session_id", "")
+        object.__setattr__(
+            self, "_config_engine", FlextCliConfigEngine(self._cli_config)
+        )
         config_dict: Mapping[str, FlextCliTypes.Cli.JsonValue] | None = (
             config if config is not None else None
         )
@@ -156,9 +185,7 @@ class FlextCliCore(FlextCliServiceBase):
                 ValueError,
                 TypeError,
                 KeyError,
-                ConsoleError,
-                StyleError,
-                LiveError,
+                *FlextCliFormatters.rich_errors(),
             ),
         ).map_error(lambda e: error_message.format(error=e))
 
@@ -204,8 +231,11 @@ class FlextCliCore(FlextCliServiceBase):
                 profiles_section_raw
             )
             profiles_section_raw_typed[name] = profile_config
-            config[c.Cli.DictKeys.PROFILES] = profiles_section_raw_typed
-            object.__setattr__(self, "_cli_config", config)
+            applied = self._apply_config_patch({
+                c.Cli.DictKeys.PROFILES: profiles_section_raw_typed
+            })
+            if applied.is_failure:
+                return applied
             FlextLogger(__name__).info(
                 c.Cli.LogMessages.PROFILE_CREATED.format(name=name)
             )
@@ -222,23 +252,30 @@ class FlextCliCore(FlextCliServiceBase):
             r[bool]: True if session ended successfully, failure on error
 
         """
-        try:
-            FlextLogger(__name__).info(
-                "Ending CLI session",
+        FlextLogger(__name__).info(
+            "Ending CLI session",
+            operation="end_session",
+            session_active=self._session_active,
+            total_sessions=len(self._sessions),
+        )
+        if not self._session_active:
+            FlextLogger(__name__).warning(
+                "No active session to end",
                 operation="end_session",
-                session_active=self._session_active,
-                total_sessions=len(self._sessions),
+                existing_sessions=str(list(self._sessions.keys())),
+                consequence="Session end will fail",
             )
+            return r[bool].fail(c.Cli.ErrorMessages.NO_ACTIVE_SESSION)
+        if self._session_store is not None:
+            stored = self._session_store.end_session(self._current_session_id)
+            if stored.is_failure:
+                return stored
+        try:
             FlextLogger(__name__).debug("Terminating session", operation="end_session")
-            if not self._session_active:
-                FlextLogger(__name__).warning(
-                    "No active session to end",
-                    operation="end_session",
-                    existing_sessions=str(list(self._sessions.keys())),
-                    consequence="Session end will fail",
-                )
-                return r[bool].fail(c.Cli.ErrorMessages.NO_ACTIVE_SESSION)
+            # Ended sessions live on in the journal only, never in memory.
+            _ = self._sessions.pop(self._current_session_id, None)
             object.__setattr__(self, "_session_active", False)
+            object.__setattr__(self, "_current_session_id", "")
             delattr(self, c.Cli.PrivateAttributes.SESSION_CONFIG)
             delattr(self, c.Cli.PrivateAttributes.SESSION_START_TIME)
             FlextLogger(__name__).debug(
@@ -253,9 +290,7 @@ class FlextCliCore(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             FlextLogger(__name__).exception(
                 "FAILED to end session - operation aborted",
@@ -329,9 +364,7 @@ class FlextCliCore(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             FlextLogger(__name__).exception(
                 "FATAL ERROR during service execution - execution aborted",
@@ -410,7 +443,11 @@ class FlextCliCore(FlextCliServiceBase):
         context: Mapping[str, FlextCliTypes.Cli.JsonValue] | list[str] | None = None,
         timeout: float | None = None,
     ) -> r[Mapping[str, FlextCliTypes.Cli.JsonValue]]:
-        """Execute registered command with context."""
+        """Execute registered command with context.
+
+        Every execution of a registered command is recorded in the execution
+        metrics (count, failure, latency) reported by `get_command_statistics`.
+        """
         FlextLogger(__name__).info("STARTING CLI command execution", command_name=name)
         command_result = self.get_command(name)
         if command_result.is_failure:
@@ -418,33 +455,13 @@ class FlextCliCore(FlextCliServiceBase):
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 command_result.error or "Command not found"
             )
-        try:
-            execution_context = self._build_execution_context(context)
-            result_dict: dict[str, FlextCliTypes.Cli.JsonValue] = {
-                c.Cli.DictKeys.COMMAND: name,
-                c.Cli.DictKeys.STATUS: True,
-                c.Cli.DictKeys.TIMESTAMP: FlextCliUtilities.generate("timestamp"),
-                c.Cli.DictKeys.TIMEOUT: timeout if timeout is not None else 0.0,
-                c.Cli.DictKeys.CONTEXT: dict(execution_context),
-            }
-            FlextLogger(__name__).info(
-                "COMPLETED CLI command execution", command_name=name
-            )
-            return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].ok(result_dict)
-        except (
-            ValueError,
-            TypeError,
-            KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
-        ) as e:
-            FlextLogger(__name__).exception(
-                "FAILED CLI command execution", command_name=name
-            )
-            return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
-                c.Cli.ErrorMessages.COMMAND_EXECUTION_FAILED.format(error=e)
-            )
+        start_ns = time.perf_counter_ns()
+        result = self._run_command(name, context, timeout)
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        self._execution_metrics.record(name, elapsed_ns, success=result.is_success)
+        if self._session_active and self._session_store is not None:
+            self._journal_command(name, result, elapsed_ns)
+        return result
 
     def get_command(self, name: str) -> r[m.Configuration]:
         """Retrieve registered command definition.
@@ -505,9 +522,7 @@ class FlextCliCore(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             FlextLogger(__name__).exception(
                 "FAILED to retrieve command - operation aborted",
@@ -522,7 +537,10 @@ class FlextCliCore(FlextCliServiceBase):
             )
 
     def get_command_statistics(self) -> r[Mapping[str, FlextCliTypes.Cli.JsonValue]]:
-        """Get command usage statistics using CLI-specific data types.
+        """Get command execution statistics using CLI-specific data types.
+
+        Counts come from recorded executions (not registrations) and include
+        per-command latency percentiles from `FlextCliExecutionMetrics`.
 
         Returns:
             r[m.Cli.CommandStatistics]: Statistics model or error
@@ -534,11 +552,7 @@ class FlextCliCore(FlextCliServiceBase):
 
         """
         try:
-            stats_model = m.Cli.CommandStatistics(
-                total_commands=len(self._commands),
-                successful_commands=len(self._commands),
-                failed_commands=0,
-            )
+            stats_model = self._execution_metrics.to_statistics(len(self._commands))
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].ok(
                 stats_model.model_dump(mode="json")
             )
@@ -546,19 +560,31 @@ class FlextCliCore(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 c.Cli.ErrorMessages.CLI_EXECUTION_ERROR.format(error=e)
             )
 
+    def get_config_engine(self) -> FlextCliConfigEngine:
+        """Return the engine holding versioned configuration history.
+
+        Use it to register per-key validators, subscribe to key changes and
+        inspect history.
+        """
+        return self._config_engine
+
+    def get_execution_metrics(self) -> FlextCliExecutionMetrics:
+        """Return the execution metrics collector (exportable via `to_json`)."""
+        return self._execution_metrics
+
     def get_config(self) -> r[Mapping[str, FlextCliTypes.Cli.JsonValue]]:
         """Get current service configuration.
 
         Returns:
-            r[Mapping[str, FlextCliTypes.Cli.JsonValue]]: Configuration data
+            r[Mapping[str, FlextCliTypes.Cli.JsonValue]]: Copy of the
+            configuration data (the original is shared with the config
+            engine's version history)
 
         """
         try:
@@ -566,14 +592,14 @@ class FlextCliCore(FlextCliServiceBase):
                 return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                     c.Cli.ErrorMessages.CONFIG_NOT_INITIALIZED
                 )
-            return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].ok(self._cli_config)
+            return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].ok(
+                copy.deepcopy(self._cli_config)
+            )
         except (
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 c.Cli.ErrorMessages.CONFIG_RETRIEVAL_FAILED.format(error=e)
@@ -616,14 +642,14 @@ class FlextCliCore(FlextCliServiceBase):
                 FlextLogger(__name__).info(
                     "Configuration retrieval completed", operation="get_configuration"
                 )
-                return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].ok(self._cli_config)
+                return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].ok(
+                    copy.deepcopy(self._cli_config)
+                )
             except (
                 ValueError,
                 TypeError,
                 KeyError,
-                ConsoleError,
-                StyleError,
-                LiveError,
+                *FlextCliFormatters.rich_errors(),
             ) as e:
                 FlextLogger(__name__).exception(
                     "FAILED to retrieve configuration - operation aborted",
@@ -690,9 +716,7 @@ class FlextCliCore(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             FlextLogger(__name__).exception(
                 c.Cli.CoreServiceLogMessages.SERVICE_INFO_COLLECTION_FAILED
@@ -727,6 +751,7 @@ class FlextCliCore(FlextCliServiceBase):
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 c.Cli.ErrorMessages.NO_ACTIVE_SESSION
             )
+        baseline_executions, baseline_failures = self._session_baseline
         try:
             session_duration = c.Cli.CoreServiceDefaults.SESSION_DURATION_INIT
             if self._session_start_time:
@@ -739,8 +764,9 @@ class FlextCliCore(FlextCliServiceBase):
                 duration_delta = current_time - start_time
                 session_duration = int(duration_delta.total_seconds())
             stats_model = m.Cli.SessionStatistics(
-                commands_executed=len(self._commands),
-                errors_count=0,
+                commands_executed=self._execution_metrics.total_executions
+                - baseline_executions,
+                errors_count=self._execution_metrics.total_failures - baseline_failures,
                 session_duration_seconds=session_duration,
             )
             FlextLogger(__name__).debug(
@@ -761,9 +787,7 @@ class FlextCliCore(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             FlextLogger(__name__).exception(
                 "FAILED to collect session statistics - operation aborted",
@@ -796,9 +820,7 @@ class FlextCliCore(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
                 c.Cli.ErrorMessages.CLI_EXECUTION_ERROR.format(error=e)
@@ -849,9 +871,7 @@ class FlextCliCore(FlextCliServiceBase):
                 ValueError,
                 TypeError,
                 KeyError,
-                ConsoleError,
-                StyleError,
-                LiveError,
+                *FlextCliFormatters.rich_errors(),
             ) as e:
                 FlextLogger(__name__).exception(
                     "FAILED to list commands - operation aborted",
@@ -934,6 +954,58 @@ class FlextCliCore(FlextCliServiceBase):
                 )
             )
 
+    def resume_session(self, session_id: str) -> r[m.Cli.CliSession]:
+        """Resume an interrupted session recorded in the session store.
+
+        Args:
+            session_id: Identifier of a session still active in the journal
+
+        Returns:
+            r[m.Cli.CliSession]: Journaled session state, failure when no store
+            is configured, a session is already active, or it already ended
+
+        """
+        if self._session_store is None:
+            return r[m.Cli.CliSession].fail(
+                c.Cli.SessionStoreErrorMessages.STORE_NOT_CONFIGURED
+            )
+        if self._session_active:
+            return r[m.Cli.CliSession].fail(c.Cli.ErrorMessages.SESSION_ALREADY_ACTIVE)
+        resumed = self._session_store.resume_session(session_id)
+        if resumed.is_failure:
+            return resumed
+        session_config = self._session_store.get_session_config(session_id)
+        self._activate_session(
+            session_id,
+            dict(session_config.value) if session_config.is_success else {},
+            resumed.value.start_time or datetime.now(UTC).isoformat(),
+        )
+        FlextLogger(__name__).info(
+            "CLI session resumed",
+            operation="resume_session",
+            session_id=session_id,
+            commands=len(resumed.value.commands),
+        )
+        return resumed
+
+    def rollback_configuration(self, version: int) -> r[bool]:
+        """Restore the configuration as it was at ``version``.
+
+        Args:
+            version: Target version from the configuration history
+
+        Returns:
+            r[bool]: True if restored, failure if the version is not retained
+            or fails validation
+
+        """
+        rolled_back = self._config_engine.rollback(version)
+        if rolled_back.is_failure:
+            return r[bool].fail(rolled_back.error or "Configuration rollback failed")
+        object.__setattr__(self, "_cli_config", dict(self._config_engine.config))
+        self._log_config_update()
+        return r[bool].ok(value=True)
+
     def start_session(
         self, session_config: Mapping[str, FlextCliTypes.Cli.JsonValue] | None = None
     ) -> r[bool]:
@@ -949,35 +1021,52 @@ class FlextCliCore(FlextCliServiceBase):
         if self._session_active:
             return r[bool].fail(c.Cli.ErrorMessages.SESSION_ALREADY_ACTIVE)
         try:
-            if session_config is not None:
-                object.__setattr__(
-                    self,
-                    "_session_config",
-                    dict(session_config),
-                )
-            else:
-                object.__setattr__(self, "_session_config", {})
-            object.__setattr__(self, "_session_active", True)
-            self._session_start_time = datetime.now(UTC).isoformat()
-            FlextLogger(__name__).info(c.Cli.LogMessages.SESSION_STARTED)
-            return r[bool].ok(value=True)
-        except (
-            ValueError,
-            TypeError,
-            KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
-        ) as e:
+            config = dict(session_config) if session_config is not None else {}
+        except (ValueError, TypeError, KeyError) as e:
             return r[bool].fail(
                 c.Cli.ErrorMessages.SESSION_START_FAILED.format(error=e)
             )
+        session_id = uuid.uuid4().hex
+        # Session state is only set once the journal accepted the session.
+        if self._session_store is not None:
+            stored = self._session_store.start_session(session_id, config=config)
+            if stored.is_failure:
+                return r[bool].fail(stored.error or "Session start failed")
+        self._activate_session(session_id, config, datetime.now(UTC).isoformat())
+        FlextLogger(__name__).info(c.Cli.LogMessages.SESSION_STARTED)
+        return r[bool].ok(value=True)
+
+    def _activate_session(
+        self,
+        session_id: str,
+        config: dict[str, FlextCliTypes.Cli.JsonValue],
+        start_time: str,
+    ) -> None:
+        """Make ``session_id`` the active session of this core."""
+        object.__setattr__(self, "_session_config", config)
+        object.__setattr__(self, "_session_active", True)
+        object.__setattr__(self, "_current_session_id", session_id)
+        object.__setattr__(
+            self,
+            "_session_baseline",
+            (
+                self._execution_metrics.total_executions,
+                self._execution_metrics.total_failures,
+            ),
+        )
+        self._session_start_time = start_time
+        self._sessions[session_id] = {
+            "start_time": start_time,
+            "status": c.Cli.SessionStatus.ACTIVE.value,
+        }
 
     def update_configuration(self, config: FlextCliTypes.Cli.JsonValue) -> r[bool]:
         """Update CLI configuration using railway pattern and functional composition.
 
-        Performs configuration update with comprehensive validation and error handling.
-        Uses functional pipeline to ensure safe configuration merging.
+        Applies ``config`` as a JSON merge patch (``None`` deletes a key) through
+        the config engine: only changed keys are validated, each update becomes
+        a version that `rollback_configuration` can restore, and only
+        subscribers of affected keys are notified.
 
         Args:
             config: New configuration schema with CLI-specific structure
@@ -1008,10 +1097,35 @@ class FlextCliCore(FlextCliServiceBase):
             return r[bool].fail(
                 config_result.error or "Configuration validation failed"
             )
-        merged_config_val: dict[str, FlextCliTypes.Cli.JsonValue] = dict(
-            config_result.value or {}
+        if not self._cli_config:
+            return r[bool].fail(c.Cli.ErrorMessages.CONFIG_NOT_INITIALIZED)
+        return self._apply_config_patch(config_result.value)
+
+    def _apply_config_patch(
+        self, patch: Mapping[str, FlextCliTypes.Cli.JsonValue]
+    ) -> r[bool]:
+        """Apply a merge patch through the config engine and sync the view."""
+        applied = self._config_engine.apply_patch(patch)
+        if applied.is_failure:
+            FlextLogger(__name__).warning(
+                "Configuration patch rejected",
+                operation="update_configuration",
+                error=applied.error or "",
+            )
+            return r[bool].fail(
+                c.Cli.ErrorMessages.CONFIG_UPDATE_FAILED.format(
+                    error=applied.error or ""
+                )
+            )
+        object.__setattr__(self, "_cli_config", dict(self._config_engine.config))
+        FlextLogger(__name__).debug(
+            "Configuration patch applied",
+            operation="update_configuration",
+            version=applied.value.version,
+            changed_keys=str(list(applied.value.changed_keys)),
         )
-        return self._merge_configurations(merged_config_val)
+        self._log_config_update()
+        return r[bool].ok(value=True)
 
     def _build_execution_context(
         self, context: Mapping[str, FlextCliTypes.Cli.JsonValue] | list[str] | None
@@ -1029,81 +1143,72 @@ class FlextCliCore(FlextCliServiceBase):
 
         return ctx_input.to_mapping(list_processor=list_processor)
 
+    def _journal_command(
+        self,
+        name: str,
+        result: r[Mapping[str, FlextCliTypes.Cli.JsonValue]],
+        elapsed_ns: int,
+    ) -> None:
+        """Append an executed command to the active journaled session."""
+        if self._session_store is None:
+            return
+        status = (
+            c.Cli.CommandStatus.COMPLETED.value
+            if result.is_success
+            else c.Cli.CommandStatus.FAILED.value
+        )
+        command = m.Cli.CliCommand(
+            name=name,
+            command_line=name,
+            status=status,
+            exit_code=0 if result.is_success else 1,
+            error_output=result.error or "",
+            execution_time=elapsed_ns / c.Cli.MetricsDefaults.NANOS_PER_SECOND,
+        )
+        appended = self._session_store.append_command(self._current_session_id, command)
+        if appended.is_failure:
+            FlextLogger(__name__).warning(
+                "Command not journaled",
+                operation="execute_command",
+                command_name=name,
+                error=appended.error or "",
+            )
+
     def _log_config_update(self) -> None:
         """Log configuration update - direct logger usage."""
         FlextLogger(__name__).info(c.Cli.LogMessages.CLI_CONFIG_UPDATED)
 
-    def _merge_configurations(
-        self, valid_config: Mapping[str, FlextCliTypes.Cli.JsonValue]
-    ) -> r[bool]:
-        """Merge new configuration with existing one."""
+    def _run_command(
+        self,
+        name: str,
+        context: Mapping[str, FlextCliTypes.Cli.JsonValue] | list[str] | None,
+        timeout: float | None,
+    ) -> r[Mapping[str, FlextCliTypes.Cli.JsonValue]]:
+        """Build the execution result for a registered command."""
         try:
-            FlextLogger(__name__).debug(
-                "Merging configurations",
-                operation="update_configuration",
-                new_config_keys=str(list(valid_config.keys())),
-            )
-            existing_config_result = self._validate_existing_config()
-            if existing_config_result.is_failure:
-                error_msg = existing_config_result.error or ""
-                FlextLogger(__name__).warning(
-                    "Existing configuration validation failed",
-                    operation="update_configuration",
-                    error=error_msg,
-                    consequence="Configuration merge will fail",
-                )
-                return r[bool].fail(
-                    existing_config_result.error or "Config validation failed"
-                )
-            existing_config_raw: dict[str, FlextCliTypes.Cli.JsonValue] = dict(
-                existing_config_result.value or {}
-            )
-            existing_config: dict[str, FlextCliTypes.Cli.JsonValue] = dict(
-                existing_config_raw
-            )
-            transformed_config = FlextCliOutput.to_dict_json(valid_config)
-            existing_config_guard: dict[str, FlextCliTypes.Cli.JsonValue] = {
-                str(k): v for k, v in existing_config.items()
-            }
-            transformed_config_guard: dict[str, FlextCliTypes.Cli.JsonValue] = {
-                str(k): v for k, v in transformed_config.items()
+            execution_context = self._build_execution_context(context)
+            result_dict: dict[str, FlextCliTypes.Cli.JsonValue] = {
+                c.Cli.DictKeys.COMMAND: name,
+                c.Cli.DictKeys.STATUS: True,
+                c.Cli.DictKeys.TIMESTAMP: FlextCliUtilities.generate("timestamp"),
+                c.Cli.DictKeys.TIMEOUT: timeout if timeout is not None else 0.0,
+                c.Cli.DictKeys.CONTEXT: dict(execution_context),
             }
-            merge_result = FlextCliUtilities.merge(
-                existing_config_guard, transformed_config_guard, strategy="deep"
-            )
-            if merge_result.is_failure:
-                return r[bool].fail(merge_result.error or "Failed to merge config")
-            merged_candidate = merge_result.value
-            merged_config = FlextCliOutput.to_dict_json(merged_candidate)
-            object.__setattr__(self, "_cli_config", merged_config)
-            FlextLogger(__name__).debug(
-                "Configuration merged successfully",
-                operation="update_configuration",
-                merged_keys=str(list(self._cli_config.keys())),
-            )
-            self._log_config_update()
             FlextLogger(__name__).info(
-                "Configuration update completed successfully",
-                operation="update_configuration",
+                "COMPLETED CLI command execution", command_name=name
             )
-            return r[bool].ok(value=True)
+            return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].ok(result_dict)
         except (
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             FlextLogger(__name__).exception(
-                "FAILED to merge configurations - operation aborted",
-                operation="update_configuration",
-                error=str(e),
-                error_type=type(e).__name__,
-                consequence="Configuration update failed completely",
+                "FAILED CLI command execution", command_name=name
             )
-            return r[bool].fail(
-                c.Cli.ErrorMessages.CONFIG_UPDATE_FAILED.format(error=e)
+            return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
+                c.Cli.ErrorMessages.COMMAND_EXECUTION_FAILED.format(error=e)
             )
 
     def _validate_config_input(
@@ -1134,11 +1239,3 @@ class FlextCliCore(FlextCliServiceBase):
             for key, value in json_config.items()
         }
         return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].ok(normalized_json_config)
-
-    def _validate_existing_config(self) -> r[Mapping[str, FlextCliTypes.Cli.JsonValue]]:
-        """Validate existing configuration state."""
-        if self._cli_config:
-            return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].ok(self._cli_config)
-        return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
-            c.Cli.ErrorMessages.CONFIG_NOT_INITIALIZED
-        )
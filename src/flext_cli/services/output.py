@@ -1,5 +1,8 @@
 """CLI output and formatting tools.
 
+Rich, PyYAML and tabulate are imported by the first call that renders with
+them; JSON, YAML and CSV data is written to stdout without loading Rich.
+
 Copyright (c) 2025 FLEXT Team. All rights reserved.
 SPDX-License-Identifier: MIT
 
@@ -8,21 +11,24 @@ SPDX-License-Identifier: MIT
 from __future__ import annotations
 
 import csv
+import sys
 from collections.abc import Callable, Iterable, Sequence
 from io import StringIO
-from typing import ClassVar, TypeGuard
+from typing import TYPE_CHECKING, ClassVar, TypeGuard
 
-import yaml
 from flext_core import FlextRuntime, r, t
 from pydantic import BaseModel, TypeAdapter
-from rich.console import Console
-from rich.progress import Progress
-from rich.table import Table as RichTable
-from rich.tree import Tree as RichTree
 
 from flext_cli import FlextCliFormatters, FlextCliTables, c, m, p, u
+from flext_cli.metrics import FlextCliMetricsRegistry
 from flext_cli.typings import FlextCliTypes
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.table import Table as RichTable
+    from rich.tree import Tree as RichTree
+
 _JSON_VALUE_ADAPTER: TypeAdapter[object] = TypeAdapter(object)
 
 
@@ -729,6 +735,9 @@ class FlextCliOutput:
             self.print_message(f"Failed to format data: {format_result.error}")
             return
         formatted_data = format_result.value
+        if final_format_type in c.Cli.OutputDefaults.PLAIN_STREAM_FORMATS:
+            _ = sys.stdout.write(formatted_data + c.Cli.OutputDefaults.NEWLINE)
+            return
         self.print_message(formatted_data)
 
     def display_message(self, message: str, message_type: str | None = None) -> None:
@@ -998,6 +1007,9 @@ class FlextCliOutput:
         if table_result.is_failure:
             return table_result
         table = table_result.value
+        FlextCliMetricsRegistry.get_global().record_rendered_rows(
+            c.Cli.OutputFormats.TABLE.value, len(table_data_list)
+        )
         return r[str].ok(self._add_title(table, title))
 
     def format_yaml(self, data: FlextCliTypes.Cli.JsonValue) -> r[str]:
@@ -1014,6 +1026,8 @@ class FlextCliOutput:
             >>> result = output.format_yaml({"key": "value"})
 
         """
+        import yaml
+
         try:
             return r[str].ok(
                 yaml.dump(
@@ -1370,6 +1384,9 @@ class FlextCliOutput:
             dict(data) if isinstance(data, dict) else {}
         )
         writer.writerow(data_dict)
+        FlextCliMetricsRegistry.get_global().record_rendered_rows(
+            c.Cli.OutputFormats.CSV.value, 1
+        )
         return r[str].ok(output_buffer.getvalue())
 
     def _format_csv_list(self, data: FlextCliTypes.Cli.JsonValue) -> r[str]:
@@ -1391,6 +1408,9 @@ class FlextCliOutput:
             processed_row = self._process_csv_row(row)
             csv_rows.append(processed_row)
         writer.writerows(csv_rows)
+        FlextCliMetricsRegistry.get_global().record_rendered_rows(
+            c.Cli.OutputFormats.CSV.value, len(csv_rows)
+        )
         return r[str].ok(output_buffer.getvalue())
 
     def _format_dict_object(
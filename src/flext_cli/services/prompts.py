@@ -10,9 +10,15 @@ from typing import Annotated, override
 
 from flext_core import r
 from pydantic import Field, PrivateAttr
-from rich.errors import ConsoleError, LiveError, StyleError
 
-from flext_cli import FlextCliConstants, FlextCliServiceBase, FlextCliUtilities, m, t
+from flext_cli import (
+    FlextCliConstants,
+    FlextCliFormatters,
+    FlextCliServiceBase,
+    FlextCliUtilities,
+    m,
+    t,
+)
 from flext_cli.typings import FlextCliTypes
 
 CLI = FlextCliConstants.Cli
@@ -86,9 +92,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self.logger.exception(
                 "FAILED to clear prompt history - operation aborted",
@@ -117,9 +121,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self._fatal("confirm", message, exc, "Confirmation failed completely")
             return r[bool].fail(PEM.CONFIRMATION_FAILED.format(error=exc))
@@ -137,9 +139,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self.logger.exception(
                 "FAILED to create progress indicator - operation aborted",
@@ -161,9 +161,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self._fatal(
                 "execute", "execute", exc, "Prompt service execution failed completely"
@@ -192,9 +190,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self.logger.exception(
                 "FAILED to collect prompt statistics - operation aborted",
@@ -229,9 +225,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self.logger.exception(
                 "FAILED to print status message - operation aborted",
@@ -275,9 +269,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self._fatal("prompt", message, exc, "Prompt failed completely")
             return r[str].fail(PEM.PROMPT_FAILED.format(error=exc))
@@ -316,9 +308,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self._fatal(
                 "prompt_choice", message, exc, "Choice prompt failed completely"
@@ -335,9 +325,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self._fatal(
                 "prompt_confirmation",
@@ -366,9 +354,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self._fatal(
                 "prompt_password", message, exc, "Password prompt failed completely"
@@ -401,9 +387,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self._fatal("prompt_text", message, exc, "Text prompt failed completely")
             return r[str].fail(EM.TEXT_PROMPT_FAILED.format(error=exc))
@@ -435,9 +419,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self._fatal(
                 "select_from_options", message, exc, "Selection failed completely"
@@ -477,9 +459,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self._fatal(
                 "with_progress",
@@ -534,9 +514,7 @@ class FlextCliPrompts(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as exc:
             self.logger.exception(
                 "FAILED to print message - operation aborted",
@@ -2,6 +2,7 @@
 
 This module provides lightweight ASCII table formatting as an alternative
 to Rich tables. Optimized for performance, plain text output, and large datasets.
+tabulate is imported on the first table rendered, not at import time.
 
 Copyright (c) 2025 FLEXT Team. All rights reserved.
 SPDX-License-Identifier: MIT
@@ -15,10 +16,15 @@ from itertools import starmap
 from typing import TypeGuard, override
 
 from flext_core import r
-from rich.errors import ConsoleError, LiveError, StyleError
-from tabulate import tabulate
 
-from flext_cli import FlextCliConstants, FlextCliServiceBase, m, t, u
+from flext_cli import (
+    FlextCliConstants,
+    FlextCliFormatters,
+    FlextCliServiceBase,
+    m,
+    t,
+    u,
+)
 from flext_cli.typings import FlextCliTypes
 
 
@@ -187,6 +193,8 @@ class FlextCliTables(FlextCliServiceBase):
         headers_result = FlextCliTables._prepare_headers(data, config_final.headers)
         if headers_result.is_failure:
             return r[str].fail(headers_result.error or "Header preparation failed")
+        from tabulate import tabulate
+
         try:
             if u.is_dict_like(data):
                 mapping_rows: list[Mapping[str, t.ContainerValue]] = []
@@ -251,9 +259,7 @@ class FlextCliTables(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[str].fail(f"Table formatting failed: {e}")
 
@@ -279,9 +285,7 @@ class FlextCliTables(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[bool].fail(str(e))
 
@@ -336,6 +340,8 @@ class FlextCliTables(FlextCliServiceBase):
         headers: str | Sequence[str],
     ) -> r[str]:
         """Create table string using tabulate with exception handling."""
+        from tabulate import tabulate
+
         try:
             colalign = cfg.get_effective_colalign()
             num_cols = len(headers) if headers else 0
@@ -358,9 +364,7 @@ class FlextCliTables(FlextCliServiceBase):
             ValueError,
             TypeError,
             KeyError,
-            ConsoleError,
-            StyleError,
-            LiveError,
+            *FlextCliFormatters.rich_errors(),
         ) as e:
             return r[str].fail(
                 FlextCliConstants.Cli.TablesErrorMessages.TABLE_CREATION_FAILED.format(
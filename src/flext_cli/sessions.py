@@ -0,0 +1,578 @@
+"""Persistent CLI session store backed by an append-only JSON-lines journal.
+
+FlextCliSessionStore records session lifecycle and command events as one JSON
+object per line. Appends are O(1) (one line written, in-memory indexes
+updated), status queries use maintained indexes, superseded records are
+folded by periodic compaction (ended sessions are dropped only on request),
+and sessions left active by an interrupted process can be resumed after
+replaying the journal.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import uuid
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import BinaryIO
+
+from flext_core import FlextLogger, r
+from pydantic import TypeAdapter, ValidationError
+
+from flext_cli import c, m
+from flext_cli.typings import FlextCliTypes
+
+_JSON_OBJECT_ADAPTER: TypeAdapter[object] = TypeAdapter(object)
+
+
+class FlextCliSessionStore:
+    """Journal-backed session store with status indexes and compaction.
+
+    Journal records (``op`` field):
+        - ``start``: session metadata (id, user, start time, config)
+        - ``command``: one command payload appended to a session
+        - ``status``: status change of a previously appended command
+        - ``end``: final session status and end time
+
+    Example:
+        >>> store = FlextCliSessionStore.open(Path("~/.flext/sessions.jsonl")).value
+        >>> session_id = store.start_session(user_id="ops").value
+        >>> store.append_command(session_id, command)
+        >>> store.commands_by_status(session_id, "failed")
+
+    """
+
+    class _SessionState:
+        """Mutable in-memory state of one journaled session."""
+
+        __slots__ = (
+            "command_times",
+            "commands",
+            "config",
+            "end_time",
+            "last_activity",
+            "session_id",
+            "start_time",
+            "status",
+            "status_index",
+            "user_id",
+        )
+
+        def __init__(
+            self,
+            session_id: str,
+            user_id: str,
+            start_time: str,
+            config: Mapping[str, FlextCliTypes.Cli.JsonValue],
+        ) -> None:
+            super().__init__()
+            self.session_id = session_id
+            self.user_id = user_id
+            self.start_time = start_time
+            self.last_activity = start_time
+            self.end_time: str | None = None
+            self.status = c.Cli.SessionStatus.ACTIVE.value
+            self.config = dict(config)
+            self.commands: list[dict[str, FlextCliTypes.Cli.JsonValue]] = []
+            # Journal timestamp of each command, by position
+            self.command_times: list[str] = []
+            # status -> ordered set of command positions
+            self.status_index: dict[str, dict[int, None]] = {}
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        compact_threshold: int = c.Cli.SessionStoreDefaults.COMPACT_THRESHOLD,
+        fsync: bool = False,
+    ) -> None:
+        """Initialize store without touching the journal (see `open`/`load`).
+
+        Args:
+            path: Journal file path.
+            compact_threshold: Superseded records (folded status changes and
+                corrupt lines) tolerated before an automatic compaction; ended
+                sessions are only dropped by ``compact(drop_ended=True)``.
+            fsync: Fsync after every append (durable, slower).
+
+        """
+        super().__init__()
+        self._path = Path(path)
+        self._compact_threshold = compact_threshold
+        self._fsync = fsync
+        self._lock = threading.RLock()
+        self._sessions: dict[str, FlextCliSessionStore._SessionState] = {}
+        self._sessions_by_status: dict[str, dict[str, None]] = {}
+        self._record_count = 0
+        # Records a compaction would drop (folded status changes, corrupt lines)
+        self._superseded_count = 0
+        self._handle: BinaryIO | None = None
+        self._logger = FlextLogger(__name__)
+
+    @classmethod
+    def open(
+        cls,
+        path: str | Path,
+        *,
+        compact_threshold: int = c.Cli.SessionStoreDefaults.COMPACT_THRESHOLD,
+        fsync: bool = False,
+    ) -> r[FlextCliSessionStore]:
+        """Create a store and replay its journal."""
+        store = cls(path, compact_threshold=compact_threshold, fsync=fsync)
+        loaded = store.load()
+        if loaded.is_failure:
+            return r[FlextCliSessionStore].fail(loaded.error or "Journal load failed")
+        return r[FlextCliSessionStore].ok(store)
+
+    @property
+    def path(self) -> Path:
+        """Journal file path."""
+        return self._path
+
+    @property
+    def record_count(self) -> int:
+        """Records currently in the journal file."""
+        return self._record_count
+
+    def load(self) -> r[int]:
+        """Replay the journal into memory, returning the records applied.
+
+        A truncated trailing line (crash during append) is discarded and the
+        file is trimmed so later appends start on a clean line.
+        """
+        with self._lock:
+            self._sessions.clear()
+            self._sessions_by_status.clear()
+            self._record_count = 0
+            self._superseded_count = 0
+            if not self._path.exists():
+                return r[int].ok(0)
+            try:
+                raw = self._path.read_bytes()
+            except OSError as exc:
+                return r[int].fail(
+                    c.Cli.SessionStoreErrorMessages.JOURNAL_LOAD_FAILED.format(
+                        error=exc
+                    )
+                )
+            valid_end = 0
+            offset = 0
+            for line in raw.splitlines(keepends=True):
+                offset += len(line)
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = _JSON_OBJECT_ADAPTER.validate_json(line)
+                except ValidationError:
+                    self._logger.warning(
+                        "Skipping corrupt session journal record",
+                        operation="load",
+                        offset=offset,
+                    )
+                    self._superseded_count += 1
+                    self._record_count += 1
+                    valid_end = offset
+                    continue
+                if isinstance(record, Mapping):
+                    self._apply(record)
+                    self._record_count += 1
+                valid_end = offset
+            if valid_end < len(raw):
+                try:
+                    with self._path.open("r+b") as f:
+                        _ = f.truncate(valid_end)
+                except OSError as exc:
+                    return r[int].fail(
+                        c.Cli.SessionStoreErrorMessages.JOURNAL_LOAD_FAILED.format(
+                            error=exc
+                        )
+                    )
+            return r[int].ok(self._record_count)
+
+    def start_session(
+        self,
+        session_id: str | None = None,
+        user_id: str = c.Cli.CliSessionDefaults.DEFAULT_USER_ID,
+        config: Mapping[str, FlextCliTypes.Cli.JsonValue] | None = None,
+    ) -> r[str]:
+        """Journal a new active session and return its identifier."""
+        resolved_id = session_id or uuid.uuid4().hex
+        with self._lock:
+            if resolved_id in self._sessions:
+                return r[str].fail(
+                    c.Cli.SessionStoreErrorMessages.SESSION_EXISTS.format(
+                        session_id=resolved_id
+                    )
+                )
+            written = self._write_record({
+                "op": c.Cli.SessionStoreDefaults.OP_START,
+                "session_id": resolved_id,
+                "user_id": user_id,
+                "timestamp": self._now(),
+                "config": dict(config or {}),
+            })
+        if written.is_failure:
+            return r[str].fail(written.error or "Session start failed")
+        return r[str].ok(resolved_id)
+
+    def append_command(self, session_id: str, command: m.Cli.CliCommand) -> r[int]:
+        """Append a command to an active session; returns its position."""
+        with self._lock:
+            state_result = self._active_state(session_id)
+            if state_result.is_failure:
+                return r[int].fail(state_result.error or "Session not active")
+            position = len(state_result.value.commands)
+            written = self._write_record({
+                "op": c.Cli.SessionStoreDefaults.OP_COMMAND,
+                "session_id": session_id,
+                "timestamp": self._now(),
+                "command": command.model_dump(mode="json"),
+            })
+        if written.is_failure:
+            return r[int].fail(written.error or "Command append failed")
+        return r[int].ok(position)
+
+    def update_command_status(
+        self, session_id: str, position: int, status: str
+    ) -> r[bool]:
+        """Journal a status change for the command at ``position``."""
+        if status not in c.Cli.ValidationLists.COMMAND_STATUSES:
+            return r[bool].fail(
+                c.Cli.SessionStoreErrorMessages.INVALID_STATUS.format(
+                    status=status, valid=c.Cli.ValidationLists.COMMAND_STATUSES
+                )
+            )
+        with self._lock:
+            state_result = self._active_state(session_id)
+            if state_result.is_failure:
+                return r[bool].fail(state_result.error or "Session not active")
+            if not 0 <= position < len(state_result.value.commands):
+                return r[bool].fail(
+                    c.Cli.SessionStoreErrorMessages.COMMAND_NOT_FOUND.format(
+                        position=position, session_id=session_id
+                    )
+                )
+            return self._write_record({
+                "op": c.Cli.SessionStoreDefaults.OP_STATUS,
+                "session_id": session_id,
+                "timestamp": self._now(),
+                "position": position,
+                "status": status,
+            })
+
+    def end_session(
+        self, session_id: str, status: str = c.Cli.SessionStatus.COMPLETED.value
+    ) -> r[bool]:
+        """Journal the end of an active session."""
+        if status not in c.Cli.ValidationLists.SESSION_STATUSES:
+            return r[bool].fail(
+                c.Cli.SessionStoreErrorMessages.INVALID_STATUS.format(
+                    status=status, valid=c.Cli.ValidationLists.SESSION_STATUSES
+                )
+            )
+        with self._lock:
+            state_result = self._active_state(session_id)
+            if state_result.is_failure:
+                return r[bool].fail(state_result.error or "Session not active")
+            return self._write_record({
+                "op": c.Cli.SessionStoreDefaults.OP_END,
+                "session_id": session_id,
+                "timestamp": self._now(),
+                "status": status,
+            })
+
+    def get_session(self, session_id: str) -> r[m.Cli.CliSession]:
+        """Materialize a journaled session as a `m.Cli.CliSession` model."""
+        with self._lock:
+            state = self._sessions.get(session_id)
+            if state is None:
+                return r[m.Cli.CliSession].fail(
+                    c.Cli.SessionStoreErrorMessages.SESSION_NOT_FOUND.format(
+                        session_id=session_id
+                    )
+                )
+            payloads = list(state.commands)
+            try:
+                return r[m.Cli.CliSession].ok(
+                    m.Cli.CliSession(
+                        session_id=state.session_id,
+                        user_id=state.user_id,
+                        status=state.status,
+                        commands=tuple(
+                            m.Cli.CliCommand.model_validate(payload)
+                            for payload in payloads
+                        ),
+                        start_time=state.start_time,
+                        end_time=state.end_time,
+                        last_activity=state.last_activity,
+                        commands_executed=len(payloads),
+                    )
+                )
+            except ValidationError as exc:
+                return r[m.Cli.CliSession].fail(
+                    c.Cli.SessionStoreErrorMessages.JOURNAL_LOAD_FAILED.format(
+                        error=exc
+                    )
+                )
+
+    def resume_session(self, session_id: str) -> r[m.Cli.CliSession]:
+        """Return an interrupted (still active) session so work can continue."""
+        with self._lock:
+            state_result = self._active_state(session_id)
+            if state_result.is_failure:
+                return r[m.Cli.CliSession].fail(
+                    state_result.error or "Session not resumable"
+                )
+            return self.get_session(session_id)
+
+    def get_session_config(
+        self, session_id: str
+    ) -> r[Mapping[str, FlextCliTypes.Cli.JsonValue]]:
+        """Return the configuration journaled with ``start``."""
+        state = self._sessions.get(session_id)
+        if state is None:
+            return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].fail(
+                c.Cli.SessionStoreErrorMessages.SESSION_NOT_FOUND.format(
+                    session_id=session_id
+                )
+            )
+        return r[Mapping[str, FlextCliTypes.Cli.JsonValue]].ok(dict(state.config))
+
+    def commands_by_status(
+        self, session_id: str, status: str
+    ) -> r[list[m.Cli.CliCommand]]:
+        """Return commands of a session with ``status`` using the status index."""
+        with self._lock:
+            state = self._sessions.get(session_id)
+            if state is None:
+                return r[list[m.Cli.CliCommand]].fail(
+                    c.Cli.SessionStoreErrorMessages.SESSION_NOT_FOUND.format(
+                        session_id=session_id
+                    )
+                )
+            positions = sorted(state.status_index.get(status, {}))
+            payloads = [state.commands[position] for position in positions]
+        try:
+            return r[list[m.Cli.CliCommand]].ok([
+                m.Cli.CliCommand.model_validate(payload) for payload in payloads
+            ])
+        except ValidationError as exc:
+            return r[list[m.Cli.CliCommand]].fail(
+                c.Cli.SessionStoreErrorMessages.JOURNAL_LOAD_FAILED.format(error=exc)
+            )
+
+    def count_by_status(self, session_id: str, status: str) -> int:
+        """Return how many commands of a session currently have ``status``."""
+        state = self._sessions.get(session_id)
+        if state is None:
+            return 0
+        return len(state.status_index.get(status, {}))
+
+    def sessions_by_status(self, status: str) -> list[str]:
+        """Return session identifiers with ``status`` in start order."""
+        with self._lock:
+            return list(self._sessions_by_status.get(status, {}))
+
+    def interrupted_sessions(self) -> list[str]:
+        """Return sessions still active in the journal (resume candidates)."""
+        return self.sessions_by_status(c.Cli.SessionStatus.ACTIVE.value)
+
+    def compact(self, *, drop_ended: bool = False) -> r[int]:
+        """Rewrite the journal with only live records; returns records kept.
+
+        Args:
+            drop_ended: Also discard sessions that have already ended.
+
+        """
+        with self._lock:
+            records = self._snapshot_records(drop_ended=drop_ended)
+            try:
+                self._replace_journal(records)
+            except OSError as exc:
+                return r[int].fail(
+                    c.Cli.SessionStoreErrorMessages.COMPACTION_FAILED.format(error=exc)
+                )
+            if drop_ended:
+                for session_id in [
+                    sid for sid, s in self._sessions.items() if s.end_time is not None
+                ]:
+                    state = self._sessions.pop(session_id)
+                    _ = self._sessions_by_status.get(state.status, {}).pop(
+                        session_id, None
+                    )
+            self._record_count = len(records)
+            self._superseded_count = 0
+            return r[int].ok(len(records))
+
+    def close(self) -> None:
+        """Close the journal file handle (the store can be reused afterwards)."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def _active_state(self, session_id: str) -> r[FlextCliSessionStore._SessionState]:
+        state = self._sessions.get(session_id)
+        if state is None:
+            return r[FlextCliSessionStore._SessionState].fail(
+                c.Cli.SessionStoreErrorMessages.SESSION_NOT_FOUND.format(
+                    session_id=session_id
+                )
+            )
+        if state.end_time is not None:
+            return r[FlextCliSessionStore._SessionState].fail(
+                c.Cli.SessionStoreErrorMessages.SESSION_ENDED.format(
+                    session_id=session_id
+                )
+            )
+        return r[FlextCliSessionStore._SessionState].ok(state)
+
+    def _apply(self, record: Mapping[str, FlextCliTypes.Cli.JsonValue]) -> None:
+        """Apply one journal record to the in-memory state and indexes."""
+        defaults = c.Cli.SessionStoreDefaults
+        op = record.get("op")
+        session_id = str(record.get("session_id", ""))
+        timestamp = str(record.get("timestamp", ""))
+        if op == defaults.OP_START:
+            config = record.get("config")
+            state = FlextCliSessionStore._SessionState(
+                session_id,
+                str(record.get("user_id", "")),
+                timestamp,
+                config if isinstance(config, Mapping) else {},
+            )
+            self._sessions[session_id] = state
+            self._index_session(session_id, None, state.status)
+            return
+        state = self._sessions.get(session_id)
+        if state is None:
+            return
+        state.last_activity = timestamp or state.last_activity
+        if op == defaults.OP_COMMAND:
+            command = record.get("command")
+            if isinstance(command, Mapping):
+                position = len(state.commands)
+                state.commands.append(dict(command))
+                state.command_times.append(timestamp)
+                status = str(command.get("status", ""))
+                state.status_index.setdefault(status, {})[position] = None
+        elif op == defaults.OP_STATUS:
+            position = record.get("position")
+            if isinstance(position, int) and 0 <= position < len(state.commands):
+                command = state.commands[position]
+                old_status = str(command.get("status", ""))
+                new_status = str(record.get("status", ""))
+                _ = state.status_index.get(old_status, {}).pop(position, None)
+                state.status_index.setdefault(new_status, {})[position] = None
+                command["status"] = new_status
+            self._superseded_count += 1
+        elif op == defaults.OP_END:
+            old = state.status
+            state.status = str(record.get("status", c.Cli.SessionStatus.COMPLETED))
+            state.end_time = timestamp
+            self._index_session(session_id, old, state.status)
+
+    def _index_session(self, session_id: str, old: str | None, new: str) -> None:
+        if old is not None:
+            _ = self._sessions_by_status.get(old, {}).pop(session_id, None)
+        self._sessions_by_status.setdefault(new, {})[session_id] = None
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(UTC).isoformat()
+
+    def _replace_journal(
+        self, records: list[dict[str, FlextCliTypes.Cli.JsonValue]]
+    ) -> None:
+        """Atomically replace the journal file with ``records``."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self._path.parent, prefix=f".{self._path.name}.", suffix=".tmp"
+        )
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for record in records:
+                    _ = f.write(_JSON_OBJECT_ADAPTER.dump_json(record) + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self.close()
+            _ = tmp_path.replace(self._path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _snapshot_records(
+        self, *, drop_ended: bool
+    ) -> list[dict[str, FlextCliTypes.Cli.JsonValue]]:
+        defaults = c.Cli.SessionStoreDefaults
+        records: list[dict[str, FlextCliTypes.Cli.JsonValue]] = []
+        for state in self._sessions.values():
+            if drop_ended and state.end_time is not None:
+                continue
+            records.append({
+                "op": defaults.OP_START,
+                "session_id": state.session_id,
+                "user_id": state.user_id,
+                "timestamp": state.start_time,
+                "config": dict(state.config),
+            })
+            records.extend(
+                {
+                    "op": defaults.OP_COMMAND,
+                    "session_id": state.session_id,
+                    "timestamp": timestamp,
+                    "command": dict(command),
+                }
+                for command, timestamp in zip(
+                    state.commands, state.command_times, strict=True
+                )
+            )
+            if state.end_time is not None:
+                records.append({
+                    "op": defaults.OP_END,
+                    "session_id": state.session_id,
+                    "timestamp": state.end_time,
+                    "status": state.status,
+                })
+        return records
+
+    def _write_line(self, line: bytes) -> None:
+        """Write one encoded record, opening the journal lazily."""
+        if self._handle is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self._path.open("ab")
+        _ = self._handle.write(line)
+        self._handle.flush()
+        if self._fsync:
+            os.fsync(self._handle.fileno())
+
+    def _write_record(
+        self, record: Mapping[str, FlextCliTypes.Cli.JsonValue]
+    ) -> r[bool]:
+        """Append one record to the journal and apply it."""
+        try:
+            self._write_line(_JSON_OBJECT_ADAPTER.dump_json(record) + b"\n")
+        except OSError as exc:
+            return r[bool].fail(
+                c.Cli.SessionStoreErrorMessages.JOURNAL_WRITE_FAILED.format(error=exc)
+            )
+        self._record_count += 1
+        self._apply(record)
+        if self._superseded_count >= self._compact_threshold:
+            compacted = self.compact()
+            if compacted.is_failure:
+                self._logger.warning(
+                    "Session journal compaction skipped",
+                    operation="compact",
+                    error=compacted.error or "",
+                )
+        return r[bool].ok(value=True)
+
+
+__all__ = ["FlextCliSessionStore"]
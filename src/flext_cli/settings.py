@@ -12,7 +12,6 @@ from collections.abc import Mapping
 from pathlib import Path
 from typing import Annotated
 
-import yaml
 from flext_core import FlextLogger, FlextSettings, FlextUtilities, r
 from pydantic import Field, TypeAdapter, ValidationError, computed_field
 
@@ -89,6 +88,50 @@ class FlextCliSettings(FlextSettings):
     max_width: Annotated[
         int, Field(default=120, ge=40, le=200, description="Max output width")
     ]
+    metrics_textfile: Annotated[
+        str | None,
+        Field(
+            default=None,
+            description="OpenMetrics textfile path (e.g. node-exporter collector dir)",
+        ),
+    ]
+    metrics_export_interval: Annotated[
+        float,
+        Field(
+            default=0.0,
+            ge=0.0,
+            description="Metrics export interval seconds (0 exports only at exit)",
+        ),
+    ]
+    metrics_exposition: Annotated[
+        c.Cli.MetricsExpositionLiteral,
+        Field(
+            default=c.Cli.MetricsDefaults.EXPOSITION_OPENMETRICS,
+            description="Metrics text format (openmetrics, prometheus)",
+        ),
+    ]
+    rate_limits: Annotated[
+        dict[str, m.Cli.RateLimit],
+        Field(
+            default_factory=dict,
+            description="Per-command token-bucket limits (command -> rate, burst)",
+        ),
+    ]
+    rate_limit_dir: Annotated[
+        Path | None,
+        Field(
+            default=None,
+            description="Directory of bucket files shared by concurrent processes",
+        ),
+    ]
+    rate_limit_max_wait: Annotated[
+        float,
+        Field(
+            default=c.Cli.RateLimitDefaults.MAX_WAIT,
+            ge=0.0,
+            description="Seconds a call may wait for a token before failing",
+        ),
+    ]
 
     @classmethod
     def get_instance(cls) -> FlextCliSettings:
@@ -172,6 +215,17 @@ class FlextCliSettings(FlextSettings):
             f"{c.Cli.ErrorMessages.INVALID_OUTPUT_FORMAT.format(format=output_format)}. Valid: {valid_str}"
         )
 
+    @staticmethod
+    def _parse_yaml(raw: str) -> FlextCliTypes.Cli.JsonValue:
+        """Parse YAML, importing PyYAML only when a YAML file is loaded."""
+        import yaml
+
+        try:
+            parsed: FlextCliTypes.Cli.JsonValue = yaml.safe_load(raw)
+        except yaml.YAMLError as e:
+            raise ValueError(str(e)) from e
+        return parsed
+
     @classmethod
     def load_from_config_file(cls, path: Path) -> r[FlextCliSettings]:
         """Load settings from a JSON or YAML config file."""
@@ -191,14 +245,13 @@ class FlextCliSettings(FlextSettings):
                     _JSON_OBJECT_ADAPTER.validate_json(raw)
                 )
             else:
-                parsed = yaml.safe_load(raw)
+                parsed = cls._parse_yaml(raw)
             if not isinstance(parsed, dict):
                 return r[FlextCliSettings].fail(c.Cli.CmdErrorMessages.CONFIG_NOT_DICT)
             data = _JSON_OBJECT_ADAPTER.validate_python(parsed)
             instance = cls.model_validate(data)
             return r[FlextCliSettings].ok(instance)
         except (
-            yaml.YAMLError,
             ValidationError,
             ValueError,
             TypeError,
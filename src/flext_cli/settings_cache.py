@@ -0,0 +1,309 @@
+"""Validated-settings snapshot cache for fast application startup.
+
+Building settings reads the environment and ``.env`` files and validates
+every field with Pydantic on each start. FlextCliSettingsCache stores the
+resolved values of a settings class together with a fingerprint of what they
+were built from (settings environment variables, input file contents, the
+working directory and the source of the settings classes); on the next start
+with the same fingerprint the global instance is rebuilt from the snapshot
+with ``model_construct``, skipping the sources and model validation.
+
+Snapshots are JSON (``model_dump(mode="json")``), converted back to the field
+types on restore. Secret fields (``SecretStr``/``SecretBytes`` or names such
+as ``api_key``) are never stored: they are left out while at their default,
+and settings holding a secret value are not snapshotted at all.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import typing
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+
+import pydantic
+from flext_core import FlextLogger, FlextSettings, r
+
+from flext_cli import c
+from flext_cli.__version__ import __version__
+from flext_cli.settings import FlextCliSettings
+
+logger = FlextLogger(__name__)
+
+
+class FlextCliSettingsCache[SettingsT: FlextCliSettings]:
+    """Snapshot file of the global settings of one application.
+
+    Example:
+        >>> cache = FlextCliSettingsCache("my-cli", MySettings)
+        >>> settings = cache.load_global()  # snapshot when inputs are unchanged
+
+    """
+
+    def __init__(
+        self,
+        app_name: str,
+        config_class: type[SettingsT],
+        cache_dir: Path | None = None,
+        environ: Mapping[str, str] | None = None,
+    ) -> None:
+        """Initialize the cache of ``config_class`` for ``app_name``.
+
+        Args:
+            app_name: Application the snapshot belongs to.
+            config_class: Settings class snapshotted.
+            cache_dir: Directory holding the ``settings`` subdirectory; by
+                default the ``config_dir`` set in the environment, else the
+                field default of ``config_class`` (config files are only read
+                once settings are loaded).
+            environ: Environment the config directory is read from (default:
+                this process's).
+
+        """
+        defaults = c.Cli.SettingsCacheDefaults
+        self._config_class = config_class
+        directory = (
+            cache_dir
+            if cache_dir is not None
+            else self._config_dir(os.environ if environ is None else environ)
+        )
+        self._path = directory / defaults.DIR_NAME / f"{app_name}{defaults.FILE_SUFFIX}"
+
+    @property
+    def path(self) -> Path:
+        """Snapshot file."""
+        return self._path
+
+    def _config_dir(self, environ: Mapping[str, str]) -> Path:
+        """Config directory named by the environment, else the field default."""
+        config_class = self._config_class
+        env_prefix = str(config_class.model_config.get("env_prefix") or "")
+        names = {
+            f"{env_prefix}{c.Cli.SettingsCacheDefaults.CONFIG_DIR_FIELD}".upper(),
+            c.Cli.SettingsCacheDefaults.CONFIG_DIR_ENV,
+        }
+        for name, value in environ.items():
+            if value and name.upper() in names:
+                return Path(value).expanduser()
+        return Path(
+            config_class.model_fields[
+                c.Cli.SettingsCacheDefaults.CONFIG_DIR_FIELD
+            ].get_default(call_default_factory=True)
+        )
+
+    def fingerprint(
+        self, environ: Mapping[str, str] | None = None, cwd: Path | None = None
+    ) -> str:
+        """Digest of every input the settings are built from.
+
+        Args:
+            environ: Environment to fingerprint (default: this process's).
+            cwd: Directory relative input files resolve against (default:
+                the current one).
+
+        """
+        defaults = c.Cli.SettingsCacheDefaults
+        config_class = self._config_class
+        environ = os.environ if environ is None else environ
+        cwd = Path.cwd() if cwd is None else cwd
+        env_prefix = str(config_class.model_config.get("env_prefix") or "").upper()
+        prefixes = tuple({defaults.ENV_PREFIX, env_prefix} - {""})
+        environment = sorted(
+            (name, value)
+            for name, value in environ.items()
+            if name.upper().startswith(prefixes) or name in defaults.ENV_NAMES
+        )
+        inputs: list[object] = [
+            defaults.FORMAT,
+            __version__,
+            sys.version,
+            pydantic.VERSION,
+            f"{config_class.__module__}.{config_class.__qualname__}",
+            str(cwd),
+            environment,
+        ]
+        for path in self._input_files(cwd):
+            try:
+                inputs.append((str(path), hashlib.blake2b(path.read_bytes()).digest()))
+            except OSError:
+                inputs.append((str(path), None))
+        for source in self._source_files():
+            try:
+                stat = source.stat()
+            except OSError:
+                inputs.append((str(source), None))
+            else:
+                inputs.append((str(source), stat.st_mtime_ns, stat.st_size))
+        return hashlib.blake2b(repr(inputs).encode(), digest_size=16).hexdigest()
+
+    def load_global(self) -> SettingsT:
+        """Return the global settings, from the snapshot when it is current.
+
+        On a miss the settings are built as usual and the snapshot rewritten.
+        Settings already loaded in this process are returned as they are
+        (runtime changes included) and never snapshotted.
+        """
+        config_class = self._config_class
+        if config_class in FlextSettings._instances:
+            return config_class.get_global()
+        fingerprint = self.fingerprint()
+        restored = self.restore(fingerprint)
+        if restored.is_success:
+            return restored.value
+        settings = config_class.get_global()
+        written = self.write(settings, fingerprint)
+        if written.is_failure:
+            logger.debug("Settings snapshot not written", error=str(written.error))
+        return settings
+
+    def restore(self, fingerprint: str) -> r[SettingsT]:
+        """Rebuild the global settings from the snapshot, without validation.
+
+        Field values are converted back to their annotated types; the model
+        and its validators do not run. Fails when the snapshot is missing,
+        unreadable or was written for another ``fingerprint``.
+        """
+        defaults = c.Cli.SettingsCacheDefaults
+        try:
+            snapshot = json.loads(self._path.read_bytes())
+        except FileNotFoundError:
+            return r[SettingsT].fail(defaults.STALE_MESSAGE.format(path=self._path))
+        except Exception as exc:
+            return r[SettingsT].fail(
+                defaults.READ_FAILED_MESSAGE.format(path=self._path, error=exc)
+            )
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get(defaults.KEY_FORMAT) != defaults.FORMAT
+            or snapshot.get(defaults.KEY_FINGERPRINT) != fingerprint
+        ):
+            return r[SettingsT].fail(defaults.STALE_MESSAGE.format(path=self._path))
+        try:
+            settings = self._construct(
+                snapshot[defaults.KEY_FIELDS_SET], snapshot[defaults.KEY_VALUES]
+            )
+        except Exception as exc:
+            return r[SettingsT].fail(
+                defaults.READ_FAILED_MESSAGE.format(path=self._path, error=exc)
+            )
+        # FlextSettings.__init__ skips re-reading the sources of an initialized
+        # singleton; mark the constructed one so get_global() returns it as is.
+        setattr(settings, "_di_provider", None)
+        return r[SettingsT].ok(settings)
+
+    def write(self, settings: SettingsT, fingerprint: str) -> r[Path]:
+        """Snapshot the non-secret field values of ``settings``.
+
+        Fails without writing when a secret field holds a non-default value.
+        """
+        defaults = c.Cli.SettingsCacheDefaults
+        fields = type(settings).model_fields
+        secrets = self._secret_fields()
+        held = sorted(
+            name
+            for name in secrets
+            if getattr(settings, name)
+            != fields[name].get_default(call_default_factory=True)
+        )
+        if held:
+            return r[Path].fail(
+                defaults.SECRETS_MESSAGE.format(path=self._path, fields=", ".join(held))
+            )
+        stored = set(fields) - secrets
+        try:
+            snapshot = {
+                defaults.KEY_FORMAT: defaults.FORMAT,
+                defaults.KEY_FINGERPRINT: fingerprint,
+                defaults.KEY_FIELDS_SET: sorted(settings.model_fields_set & stored),
+                defaults.KEY_VALUES: settings.model_dump(mode="json", include=stored),
+            }
+            self._write_atomic(json.dumps(snapshot).encode())
+        except Exception as exc:
+            return r[Path].fail(
+                defaults.WRITE_FAILED_MESSAGE.format(path=self._path, error=exc)
+            )
+        return r[Path].ok(self._path)
+
+    def _construct(self, fields_set: object, values: object) -> SettingsT:
+        """Build settings from snapshot data, converting values by annotation.
+
+        Raises:
+            TypeError: If the snapshot data has the wrong shape.
+
+        """
+        if not isinstance(fields_set, list) or not isinstance(values, dict):
+            msg = "malformed snapshot"
+            raise TypeError(msg)
+        fields = self._config_class.model_fields
+        converted = {
+            name: pydantic.TypeAdapter(fields[name].annotation).validate_python(value)
+            for name, value in values.items()
+        }
+        return self._config_class.model_construct(
+            _fields_set={str(name) for name in fields_set}, **converted
+        )
+
+    def _secret_fields(self) -> set[str]:
+        """Fields typed as secrets or named like credentials."""
+        markers = c.Cli.SENSITIVE_KEYS
+        return {
+            name
+            for name, field in self._config_class.model_fields.items()
+            if any(marker in name.lower() for marker in markers)
+            or self._is_secret_type(field.annotation)
+        }
+
+    @classmethod
+    def _is_secret_type(cls, annotation: object) -> bool:
+        if isinstance(annotation, type) and issubclass(
+            annotation, (pydantic.SecretStr, pydantic.SecretBytes)
+        ):
+            return True
+        return any(cls._is_secret_type(arg) for arg in typing.get_args(annotation))
+
+    def _input_files(self, cwd: Path) -> Iterator[Path]:
+        """Files pydantic-settings reads for the settings class, from ``cwd``."""
+        config = self._config_class.model_config
+        for key in c.Cli.SettingsCacheDefaults.INPUT_FILE_KEYS:
+            value = config.get(key)
+            names = value if isinstance(value, (list, tuple)) else [value]
+            for name in names:
+                if name:
+                    yield cwd / name
+
+    def _source_files(self) -> Iterator[Path]:
+        """Modules defining the settings classes and their defaults."""
+        modules = {
+            klass.__module__
+            for klass in self._config_class.__mro__
+            if issubclass(klass, pydantic.BaseModel)
+        }
+        modules.add(c.__module__)
+        for module_name in sorted(modules):
+            module_file = getattr(sys.modules.get(module_name), "__file__", None)
+            if module_file:
+                yield Path(module_file)
+
+    def _write_atomic(self, data: bytes) -> None:
+        directory = self._path.parent
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=directory, prefix=f".{self._path.name}.", suffix=".tmp"
+        )
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as snapshot_file:
+                _ = snapshot_file.write(data)
+            _ = tmp_path.replace(self._path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+__all__ = ["FlextCliSettingsCache"]
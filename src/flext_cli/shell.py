@@ -0,0 +1,280 @@
+"""Interactive shell (REPL) over an app's commands, in one warm process.
+
+FlextCliShell reads command lines with prompt-toolkit and dispatches them to
+a FlextCliAppBase (``app.shell()``) or to commands registered on
+FlextCliCommands (``FlextCliShell.for_commands``) without restarting the
+interpreter, so imports, caches and open connections stay warm between
+commands. TAB completes from the same command index as the shell-completion
+cache, and history is kept in a bounded ring buffer (optionally persisted).
+Settings changed by one command (``--verbose``) are restored before the next.
+
+This module imports prompt-toolkit at import time; it is only loaded when a
+shell is created.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import contextlib
+import shlex
+import sys
+from collections import deque
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+from flext_core import r
+from prompt_toolkit import PromptSession
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+from prompt_toolkit.history import History
+from pydantic import BaseModel
+
+from flext_cli import c
+from flext_cli.batch import FlextCliBatchRunner
+from flext_cli.completion_entry import KEY_COMMANDS, complete
+
+if TYPE_CHECKING:
+    from prompt_toolkit.input import Input
+    from prompt_toolkit.output import Output
+
+    from flext_cli.commands import FlextCliCommands
+
+
+class FlextCliShell:
+    """Interactive shell dispatching command lines to a warm executor.
+
+    Example:
+        >>> app.shell().run()  # FlextCliAppBase subclass
+        >>> FlextCliShell.for_commands(commands).run()
+
+    """
+
+    class RingHistory(History):
+        """prompt-toolkit history keeping only the newest ``size`` entries."""
+
+        def __init__(self, size: int, path: Path | None = None) -> None:
+            """Initialize the history, loading the tail of ``path`` if given."""
+            super().__init__()
+            self._size = size
+            self._path = path
+            self._entries: deque[str] = deque(maxlen=size)
+            if path is not None and path.is_file():
+                encoding = c.Cli.Utilities.DEFAULT_ENCODING
+                self._entries.extend(path.read_text(encoding=encoding).splitlines())
+
+        @property
+        def entries(self) -> list[str]:
+            """Entries from oldest to newest."""
+            return list(self._entries)
+
+        @override
+        def load_history_strings(self) -> Iterable[str]:
+            return reversed(self._entries)
+
+        @override
+        def store_string(self, string: str) -> None:
+            self._entries.append(string)
+
+        @override
+        def append_string(self, string: str) -> None:
+            super().append_string(string)
+            # prompt-toolkit keeps its own newest-first copy; bound it too.
+            del self._loaded_strings[self._size :]
+
+        def save(self) -> r[bool]:
+            """Write the entries to the history file (no-op without one)."""
+            if self._path is None:
+                return r[bool].ok(value=False)
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                _ = self._path.write_text(
+                    "".join(f"{entry}\n" for entry in self._entries),
+                    encoding=c.Cli.Utilities.DEFAULT_ENCODING,
+                )
+            except OSError as exc:
+                return r[bool].fail(
+                    c.Cli.ShellDefaults.HISTORY_SAVE_FAILED_MESSAGE.format(
+                        path=self._path, error=exc
+                    )
+                )
+            return r[bool].ok(value=True)
+
+    class IndexCompleter(Completer):
+        """Completes words from a command-index tree (see completion_entry).
+
+        The line is split like the shell does (quotes, escapes), and the word
+        being typed is replaced by the shell-quoted candidate.
+        """
+
+        def __init__(self, tree: dict[str, object]) -> None:
+            """Initialize the completer over ``tree``."""
+            super().__init__()
+            self._tree = tree
+
+        @staticmethod
+        def _split(text: str) -> tuple[list[str], str]:
+            """Return the finished words of ``text`` and the raw last word.
+
+            The last word starts after the last whitespace outside quotes, so
+            an unclosed quote keeps its text in the word being typed.
+            """
+            for start in range(len(text), 0, -1):
+                if text[start - 1].isspace() and text[start - 2 : start - 1] != "\\":
+                    with contextlib.suppress(ValueError):
+                        return shlex.split(text[:start]), text[start:]
+            return [], text
+
+        @staticmethod
+        def _unquote(word: str) -> str:
+            """Value of a raw word, closing a quote left open."""
+            for closing in ("", '"', "'"):
+                with contextlib.suppress(ValueError):
+                    return "".join(shlex.split(word + closing))
+            return word
+
+        @override
+        def get_completions(
+            self, document: Document, complete_event: CompleteEvent
+        ) -> Iterable[Completion]:
+            words, raw = self._split(document.text_before_cursor)
+            for candidate in complete(self._tree, [*words, self._unquote(raw)]):
+                yield Completion(shlex.quote(candidate), start_position=-len(raw))
+
+    def __init__(
+        self,
+        execute: Callable[[list[str]], r[bool]],
+        tree: dict[str, object],
+        *,
+        prompt: str = c.Cli.ShellDefaults.PROMPT_SUFFIX,
+        settings: BaseModel | None = None,
+        history_size: int = c.Cli.ShellDefaults.HISTORY_SIZE,
+        history_path: Path | None = None,
+    ) -> None:
+        """Initialize the shell.
+
+        Args:
+            execute: Runs one argv (an app's ``execute_cli``, for example).
+            tree: Command index used for completion.
+            prompt: Prompt text.
+            settings: Settings restored after each command.
+            history_size: Entries kept in the history ring buffer.
+            history_path: File the history is loaded from and saved to.
+
+        """
+        super().__init__()
+        self._execute = execute
+        self._tree = tree
+        self._prompt = prompt
+        self._settings = settings
+        self._history = FlextCliShell.RingHistory(history_size, history_path)
+
+    @classmethod
+    def for_commands(
+        cls,
+        commands: FlextCliCommands,
+        *,
+        prompt: str = c.Cli.ShellDefaults.PROMPT_SUFFIX,
+        history_size: int = c.Cli.ShellDefaults.HISTORY_SIZE,
+        history_path: Path | None = None,
+    ) -> FlextCliShell:
+        """Shell over the commands registered on ``commands``.
+
+        ``name args...`` calls ``commands.execute_command(name, args)``; its
+        value, if any, is printed.
+        """
+
+        def execute(argv: list[str]) -> r[bool]:
+            result = commands.execute_command(argv[0], argv[1:])
+            if result.is_failure:
+                return r[bool].fail(result.error)
+            if result.value is not None:
+                _ = sys.stdout.write(f"{result.value}\n")
+            return r[bool].ok(value=True)
+
+        tree: dict[str, object] = {
+            KEY_COMMANDS: {name: {} for name in commands.get_commands()}
+        }
+        return cls(
+            execute,
+            tree,
+            prompt=prompt,
+            history_size=history_size,
+            history_path=history_path,
+        )
+
+    @property
+    def history(self) -> FlextCliShell.RingHistory:
+        """History ring buffer of the shell."""
+        return self._history
+
+    def run(
+        self,
+        *,
+        session_input: Input | None = None,
+        session_output: Output | None = None,
+    ) -> r[int]:
+        """Read and run command lines until ``exit``, ``quit`` or end of input.
+
+        Args:
+            session_input: prompt-toolkit input (the terminal by default).
+            session_output: prompt-toolkit output (the terminal by default).
+
+        Returns:
+            r[int]: Number of command lines that failed.
+
+        """
+        session: PromptSession[str] = PromptSession(
+            history=self._history,
+            completer=FlextCliShell.IndexCompleter(self._tree),
+            input=session_input,
+            output=session_output,
+        )
+        failed = 0
+        try:
+            while True:
+                try:
+                    line = session.prompt(self._prompt)
+                except KeyboardInterrupt:
+                    continue
+                except EOFError:
+                    break
+                words = line.split()
+                if words[:1] and words[0] in c.Cli.ShellDefaults.EXIT_COMMANDS:
+                    break
+                result = self.run_line(line)
+                failed += 0 if result.is_success else 1
+        finally:
+            saved = self._history.save()
+        return saved.map(lambda _: failed)
+
+    def run_line(self, line: str) -> r[bool]:
+        """Run one command line (or the ``history`` built-in)."""
+        try:
+            argv = shlex.split(line, comments=True)
+        except ValueError as exc:
+            return self._report(
+                r[bool].fail(c.Cli.ShellDefaults.PARSE_FAILED_MESSAGE.format(error=exc))
+            )
+        if not argv:
+            return r[bool].ok(value=True)
+        if argv == [c.Cli.ShellDefaults.HISTORY_COMMAND]:
+            entries = self._history.entries
+            listing = "".join(
+                f"{number:5d}  {entry}\n" for number, entry in enumerate(entries, 1)
+            )
+            _ = sys.stdout.write(listing)
+            return r[bool].ok(value=True)
+        with FlextCliBatchRunner.restored_settings(self._settings):
+            return self._report(self._execute(argv))
+
+    @staticmethod
+    def _report(result: r[bool]) -> r[bool]:
+        if result.is_failure:
+            _ = sys.stderr.write(f"{result.error}\n")
+        return result
+
+
+__all__ = ["FlextCliShell"]
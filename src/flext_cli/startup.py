@@ -0,0 +1,213 @@
+"""Startup import-time profiler for flext-cli applications.
+
+FlextCliStartupProfiler imports a target in a fresh interpreter started with
+``python -X importtime``, parses the per-module timings into an import tree,
+reports the slowest modules and the critical path (the chain of slowest
+nested imports) and checks the total against a budget, so CI can keep CLI
+cold starts fast. Exposed as ``flext-cli profile-startup``.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+
+from flext_core import r
+
+from flext_cli import c, m
+
+# An import and the nested imports it triggered.
+type _ImportNode = tuple[m.Cli.ImportTiming, list[_ImportNode]]
+
+
+class FlextCliStartupProfiler:
+    """Profile, report and budget the import time of a cold start.
+
+    Example:
+        >>> profile = FlextCliStartupProfiler.profile("my_cli.app:main").value
+        >>> print(FlextCliStartupProfiler.format_report(profile))
+        >>> FlextCliStartupProfiler.check_budget(profile, budget_ms=150.0)
+
+    """
+
+    @staticmethod
+    def check_budget(
+        profile: m.Cli.StartupProfile,
+        budget_ms: float = c.Cli.StartupProfileDefaults.BUDGET_MS,
+    ) -> r[m.Cli.StartupProfile]:
+        """Fail with ``STARTUP_BUDGET_EXCEEDED`` if imports exceed the budget."""
+        defaults = c.Cli.StartupProfileDefaults
+        if profile.total_ms <= budget_ms:
+            return r[m.Cli.StartupProfile].ok(profile)
+        return r[m.Cli.StartupProfile].fail(
+            defaults.BUDGET_EXCEEDED_MESSAGE.format(
+                target=profile.target,
+                total_ms=profile.total_ms,
+                budget_ms=budget_ms,
+            ),
+            error_code=defaults.ERROR_CODE,
+        )
+
+    @staticmethod
+    def critical_path(
+        imports: Sequence[m.Cli.ImportTiming],
+    ) -> tuple[m.Cli.ImportTiming, ...]:
+        """Follow the slowest top-level import down its slowest children.
+
+        ``-X importtime`` prints a module after its nested imports, so the
+        children of an entry at depth ``d`` are the entries at depth ``d + 1``
+        printed since the previous entry at depth ``d``.
+        """
+        # depth -> nodes printed so far whose parent has not been seen yet
+        pending: dict[int, list[_ImportNode]] = {}
+        for timing in imports:
+            children = pending.pop(timing.depth + 1, [])
+            pending.setdefault(timing.depth, []).append((timing, children))
+        path: list[m.Cli.ImportTiming] = []
+        level = pending.get(0, [])
+        while level:
+            timing, level = max(level, key=lambda node: node[0].cumulative_us)
+            path.append(timing)
+        return tuple(path)
+
+    @staticmethod
+    def format_report(
+        profile: m.Cli.StartupProfile,
+        top: int = c.Cli.StartupProfileDefaults.TOP,
+    ) -> str:
+        """Render the critical path and the ``top`` slowest modules."""
+        defaults = c.Cli.StartupProfileDefaults
+        lines = [
+            defaults.REPORT_HEADER.format(
+                target=profile.target,
+                total_ms=profile.total_ms,
+                wall_ms=profile.wall_ms,
+                modules=len(profile.imports),
+            ),
+            defaults.CRITICAL_PATH_HEADER,
+        ]
+        lines.extend(
+            defaults.REPORT_ROW.format(
+                ms=timing.cumulative_us / defaults.US_PER_MS,
+                indent=" " * (defaults.INDENT * index),
+                module=timing.module,
+            )
+            for index, timing in enumerate(profile.critical_path)
+        )
+        lines.append(defaults.SLOWEST_HEADER)
+        slowest = sorted(profile.imports, key=lambda t: t.self_us, reverse=True)
+        lines.extend(
+            defaults.REPORT_ROW.format(
+                ms=timing.self_us / defaults.US_PER_MS, indent="", module=timing.module
+            )
+            for timing in slowest[:top]
+        )
+        return "\n".join(lines)
+
+    @staticmethod
+    def parse_importtime(output: str) -> list[m.Cli.ImportTiming]:
+        """Parse ``-X importtime`` stderr; unrelated lines are ignored."""
+        defaults = c.Cli.StartupProfileDefaults
+        timings: list[m.Cli.ImportTiming] = []
+        for line in output.splitlines():
+            if not line.startswith(defaults.IMPORTTIME_PREFIX):
+                continue
+            columns = line[len(defaults.IMPORTTIME_PREFIX) :].split(
+                defaults.COLUMN_SEPARATOR
+            )
+            if len(columns) != defaults.COLUMNS or not columns[0].strip().isdigit():
+                continue  # header line
+            name = columns[2].rstrip()
+            # One separator space, then INDENT spaces per nesting level.
+            indent = len(name) - len(name.lstrip()) - 1
+            timings.append(
+                m.Cli.ImportTiming(
+                    module=name.strip(),
+                    self_us=int(columns[0]),
+                    cumulative_us=int(columns[1]),
+                    depth=max(0, indent // defaults.INDENT),
+                )
+            )
+        return timings
+
+    @classmethod
+    def profile(
+        cls,
+        target: str = c.Cli.StartupProfileDefaults.TARGET,
+        *,
+        runs: int = c.Cli.StartupProfileDefaults.RUNS,
+        python: str = sys.executable,
+    ) -> r[m.Cli.StartupProfile]:
+        """Import ``target`` in fresh interpreters and keep the fastest run.
+
+        Args:
+            target: Module to import, optionally ``"module:attribute"`` to also
+                resolve a (lazily exported) attribute.
+            runs: Cold starts to measure; the fastest filters out noise.
+            python: Interpreter to run.
+
+        Returns:
+            r[m.Cli.StartupProfile]: Profile of the fastest run, or failure if
+                the import fails.
+
+        """
+        defaults = c.Cli.StartupProfileDefaults
+        module, _, attribute = target.partition(":")
+        code = f"import importlib; _m = importlib.import_module({module!r})"
+        if attribute:
+            code += f"; getattr(_m, {attribute!r})"
+        best: m.Cli.StartupProfile | None = None
+        for _ in range(max(1, runs)):
+            started = time.perf_counter()
+            try:
+                completed = subprocess.run(
+                    [python, "-X", "importtime", "-c", code],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    timeout=defaults.TIMEOUT_SECONDS,
+                )
+            except (OSError, subprocess.TimeoutExpired) as exc:
+                return r[m.Cli.StartupProfile].fail(
+                    defaults.IMPORT_FAILED_MESSAGE.format(target=target, error=exc),
+                    error_code=defaults.FAILED_CODE,
+                )
+            wall_ms = (time.perf_counter() - started) * defaults.MS_PER_SECOND
+            imports = cls.parse_importtime(completed.stderr)
+            if completed.returncode != 0:
+                error = completed.stderr.strip().rsplit("\n", 1)[-1]
+                return r[m.Cli.StartupProfile].fail(
+                    defaults.IMPORT_FAILED_MESSAGE.format(target=target, error=error),
+                    error_code=defaults.FAILED_CODE,
+                )
+            if not imports:
+                return r[m.Cli.StartupProfile].fail(
+                    defaults.NO_OUTPUT_MESSAGE.format(target=target),
+                    error_code=defaults.FAILED_CODE,
+                )
+            total_ms = (
+                sum(t.cumulative_us for t in imports if t.depth == 0)
+                / defaults.US_PER_MS
+            )
+            if best is None or total_ms < best.total_ms:
+                best = m.Cli.StartupProfile(
+                    target=target,
+                    total_ms=total_ms,
+                    wall_ms=wall_ms,
+                    imports=tuple(imports),
+                    critical_path=cls.critical_path(imports),
+                )
+        if best is None:
+            return r[m.Cli.StartupProfile].fail(
+                defaults.NO_OUTPUT_MESSAGE.format(target=target),
+                error_code=defaults.FAILED_CODE,
+            )
+        return r[m.Cli.StartupProfile].ok(best)
+
+
+__all__ = ["FlextCliStartupProfiler"]
@@ -14,9 +14,8 @@ from typing import get_args, get_origin, override
 
 from flext_core import FlextUtilities, r
 from pydantic import BaseModel, ConfigDict, ValidationError, validate_call
-from rich.errors import ConsoleError, LiveError, StyleError
 
-from flext_cli import c, m, t
+from flext_cli import FlextCliFormatters, c, m, t
 from flext_cli.typings import FlextCliTypes
 
 
@@ -50,9 +49,7 @@ class FlextCliUtilities(FlextUtilities):
                     ValueError,
                     TypeError,
                     KeyError,
-                    ConsoleError,
-                    StyleError,
-                    LiveError,
+                    *FlextCliFormatters.rich_errors(),
                 ) as exc:
                     if on_error == "fail":
                         return r[list[U]].fail(f"Error at index {idx}: {exc}")
@@ -82,9 +79,7 @@ class FlextCliUtilities(FlextUtilities):
                     ValueError,
                     TypeError,
                     KeyError,
-                    ConsoleError,
-                    StyleError,
-                    LiveError,
+                    *FlextCliFormatters.rich_errors(),
                 ) as exc:
                     if on_error == "fail":
                         return r[Mapping[str, U]].fail(f"Error processing {key}: {exc}")
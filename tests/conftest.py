@@ -657,6 +657,20 @@ def reset_singletons() -> None:
     return
 
 
+@pytest.fixture(autouse=True)
+def isolated_home(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Point HOME at a temporary directory for each test.
+
+    Apps write settings snapshots and completion caches under the default
+    config directory (``~/.flext``); tests must never touch the real home.
+    """
+    home = tmp_path_factory.mktemp("home")
+    monkeypatch.setenv("HOME", str(home))
+    return home
+
+
 @pytest.fixture
 def clean_flext_container() -> Generator[None]:
     """Ensure clean FlextContainer state for tests."""
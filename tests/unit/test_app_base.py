@@ -0,0 +1,112 @@
+"""FLEXT CLI App Base Tests - Lazy subcommand loading.
+
+Modules tested: flext_cli.app_base
+Scope: "module:function" lazy commands resolved only on invocation or
+command help, load failures, cold-start benchmark against eager registration
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_cli import FlextCliAppBase, FlextCliLazyCommand, FlextCliSettings
+
+_MODULE = "flext_cli_lazy_fixture_cmd"
+_MODULE_SOURCE = '''
+import time
+
+time.sleep(0.02)  # stands in for heavy third-party imports
+CALLS = []
+
+
+def greet(name: str) -> None:
+    """Greet someone."""
+    CALLS.append(name)
+'''
+
+
+@pytest.fixture
+def command_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Write an importable command module that is slow to import."""
+    _ = (tmp_path / f"{_MODULE}.py").write_text(_MODULE_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _ = sys.modules.pop(_MODULE, None)
+    yield _MODULE
+    _ = sys.modules.pop(_MODULE, None)
+
+
+class _LazyApp(FlextCliAppBase[FlextCliSettings]):
+    app_name = "lazy-app"
+    app_help = "Lazy test app"
+    config_class = FlextCliSettings
+    lazy_commands: ClassVar[dict[str, str | tuple[str, str]]] = {
+        "greet": (f"{_MODULE}:greet", "Greet someone"),
+        "broken": "flext_cli_missing_module:run",
+    }
+
+
+class _EagerApp(FlextCliAppBase[FlextCliSettings]):
+    app_name = "eager-app"
+    app_help = "Eager test app"
+    config_class = FlextCliSettings
+
+    def _register_commands(self) -> None:
+        module = importlib.import_module(_MODULE)
+        _ = self._app.command(name="greet")(module.greet)
+
+
+class TestsCliAppBaseLazyCommands:
+    """Tests for lazily imported subcommands."""
+
+    def test_group_help_does_not_import(self, command_module: str) -> None:
+        """Listing commands uses the declared help without importing."""
+        app = _LazyApp()
+        assert app.execute_cli(["--help"]).is_success
+        assert command_module not in sys.modules
+        placeholder = app.click_command().commands["greet"]
+        assert isinstance(placeholder, FlextCliLazyCommand)
+        assert not placeholder.is_resolved
+
+    def test_invocation_and_command_help_resolve(self, command_module: str) -> None:
+        """Running a command, or asking for its help, imports it once."""
+        app = _LazyApp()
+        assert app.execute_cli(["greet", "--help"]).is_success
+        assert command_module in sys.modules
+        assert app.execute_cli(["greet", "ada"]).is_success
+        assert sys.modules[command_module].CALLS == ["ada"]
+
+    def test_unloadable_target_fails(self) -> None:
+        """A target that cannot be imported fails only when invoked."""
+        app = _LazyApp()
+        result = app.execute_cli(["broken"])
+        assert result.is_failure
+        assert "flext_cli_missing_module" in str(result.error)
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("app_class", [_EagerApp, _LazyApp])
+    def test_benchmark_cold_start(
+        self,
+        benchmark: BenchmarkFixture,
+        command_module: str,
+        app_class: type[FlextCliAppBase[FlextCliSettings]],
+    ) -> None:
+        """Benchmark app construction plus ``--help`` with a cold import cache."""
+
+        def purge() -> None:
+            _ = sys.modules.pop(command_module, None)
+
+        def start() -> bool:
+            return app_class().execute_cli(["--help"]).is_success
+
+        assert benchmark.pedantic(start, setup=purge, rounds=5)
@@ -0,0 +1,156 @@
+"""FLEXT CLI Batch Tests - Many command lines in one process.
+
+Modules tested: flext_cli.batch, flext_cli.app_base (--batch)
+Scope: shell-quoted line parsing, NDJSON records, settings isolation between
+commands (nested values included), forked workers and crashed workers, stdin
+source and usage errors
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+from pathlib import Path
+
+import pytest
+import typer
+from flext_core import r
+from pydantic import BaseModel
+
+from flext_cli import FlextCliAppBase, FlextCliBatchRunner, FlextCliSettings, c
+
+_BATCH = """\
+greet 'Ada Lovelace'   # quoted argument
+# comment lines and blank lines are skipped
+
+--verbose greet bob
+greet carl
+fail
+greet 'unterminated
+"""
+
+
+class _Tagged(BaseModel):
+    tags: list[str] = []
+
+
+class _BatchApp(FlextCliAppBase[FlextCliSettings]):
+    app_name = "batch-app"
+    app_help = "Batch test app"
+    config_class = FlextCliSettings
+    completion_cache = False
+
+    def _register_commands(self) -> None:
+        settings = self._config
+
+        @self._app.command()
+        def greet(name: str) -> None:
+            """Greet someone."""
+            typer.echo(f"hello {name} verbose={settings.verbose}")
+
+        @self._app.command()
+        def fail() -> None:
+            """Exit with an error."""
+            raise typer.Exit(3)
+
+        _ = greet, fail
+
+
+def _records(text: str) -> dict[int, dict[str, object]]:
+    records = [json.loads(line) for line in text.splitlines()]
+    return {record[c.Cli.BatchDefaults.KEY_LINE]: record for record in records}
+
+
+class TestsCliBatch:
+    """Tests for FlextCliBatchRunner and FlextCliAppBase batch mode."""
+
+    def test_parse_lines(self) -> None:
+        """Lines are shell-split; comments, blanks and bad quotes are handled."""
+        parsed = list(FlextCliBatchRunner.parse_lines(_BATCH.splitlines()))
+        assert parsed[:2] == [
+            (1, ["greet", "Ada Lovelace"]),
+            (4, ["--verbose", "greet", "bob"]),
+        ]
+        assert isinstance(parsed[-1][1], str)
+        assert parsed[-1][0] == 7
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_batch_records_and_isolation(self, tmp_path: Path, workers: int) -> None:
+        """Each line gets a record; --verbose does not leak to the next line."""
+        source = tmp_path / "commands.txt"
+        _ = source.write_text(_BATCH)
+        output = io.StringIO()
+        result = _BatchApp().execute_batch(source, workers=workers, output=output)
+        assert result.is_failure
+        assert result.error == "2 of 5 batch commands failed"
+        records = _records(output.getvalue())
+        assert sorted(records) == [1, 4, 5, 6, 7]
+        assert records[1]["stdout"] == "hello Ada Lovelace verbose=False\n"
+        assert records[4]["stdout"] == "hello bob verbose=True\n"
+        assert records[5]["stdout"] == "hello carl verbose=False\n"
+        assert records[6]["exit_code"] == c.Cli.BatchDefaults.FAILURE_EXIT
+        assert records[7]["exit_code"] == c.Cli.BatchDefaults.USAGE_EXIT
+
+    def test_execute_cli_batch_option_reads_stdin(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """``--batch -`` reads stdin and writes NDJSON to stdout."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("greet x\ngreet y\n"))
+        app = _BatchApp()
+        assert app.execute_cli(["--batch", "-", "--batch-workers=1"]).is_success
+        records = _records(capsys.readouterr().out)
+        assert [record["argv"] for record in records.values()] == [
+            ["greet", "x"],
+            ["greet", "y"],
+        ]
+
+    @pytest.mark.parametrize(
+        "args",
+        [["--batch"], ["--batch", "-", "--batch-workers", "0"], ["--batch=-", "-x"]],
+    )
+    def test_batch_usage_errors(self, args: list[str]) -> None:
+        """Malformed batch options fail with the usage message."""
+        result = _BatchApp().execute_cli(args)
+        assert result.is_failure
+        assert result.error == c.Cli.BatchDefaults.USAGE_MESSAGE
+
+    def test_missing_batch_file(self, tmp_path: Path) -> None:
+        """An unreadable batch file fails without running anything."""
+        result = _BatchApp().execute_batch(tmp_path / "missing.txt")
+        assert result.is_failure
+        assert "Cannot read batch file" in str(result.error)
+
+    def test_nested_settings_changes_are_undone(self) -> None:
+        """In-place changes to nested values do not leak to the next line."""
+        settings = _Tagged()
+
+        def tag(argv: list[str]) -> r[bool]:
+            settings.tags.extend(argv)
+            return r[bool].ok(value=True)
+
+        runner = FlextCliBatchRunner(tag, settings)
+        assert runner.run(["a\n", "b\n"], io.StringIO()).is_success
+        assert settings.tags == []
+
+    def test_crashed_worker_gets_a_record(self) -> None:
+        """A worker dying without a record reports its exit status."""
+
+        def execute(argv: list[str]) -> r[bool]:
+            if argv == ["crash"]:
+                os._exit(9)
+            typer.echo("x" * 200_000)
+            return r[bool].ok(value=True)
+
+        output = io.StringIO()
+        runner = FlextCliBatchRunner(execute, workers=2)
+        assert runner.run(["crash\n", "big\n"], output).is_failure
+        records = _records(output.getvalue())
+        assert records[1]["error"] == c.Cli.BatchDefaults.CRASHED_MESSAGE.format(
+            status=9
+        )
+        assert len(str(records[2]["stdout"])) == 200_001
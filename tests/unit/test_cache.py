@@ -0,0 +1,149 @@
+"""FLEXT CLI Result Cache Tests - Memoized command results.
+
+Modules tested: flext_cli.cache, flext_cli.middleware (FlextCliCacheMiddleware)
+Scope: LRU eviction and TTL expiry, file store persistence, stable parameter
+hashing, per-command opt-in, single-flight stampede protection
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from flext_cli import (
+    CacheMiddleware,
+    FlextCliFileCacheStore,
+    FlextCliMemoryCacheStore,
+    FlextCliMetricsRegistry,
+    c,
+    p,
+    r,
+)
+
+
+def _context(command: str = "query", **params: object) -> p.Cli.CliContext:
+    return SimpleNamespace(command=command, params=params)
+
+
+class TestsCliResultCacheStores:
+    """Tests for the in-memory and file cache stores."""
+
+    def test_memory_store_evicts_lru_and_expires(self) -> None:
+        """Least recently used entries are evicted; expired ones are misses."""
+        now = [0.0]
+        store = FlextCliMemoryCacheStore(2, clock=lambda: now[0])
+        _ = store.set("a", 1, 10.0)
+        _ = store.set("b", 2, 10.0)
+        assert store.get("a") == 1
+        _ = store.set("c", 3, 10.0)
+        assert store.get("b") is None
+        now[0] = 11.0
+        assert store.get("a") is None
+        assert len(store) == 1
+
+    def test_file_store_round_trip(self, tmp_path: Path) -> None:
+        """JSON values persist; non-JSON values are skipped."""
+        store = FlextCliFileCacheStore(tmp_path)
+        assert store.set("k", {"rows": [1, 2]}, 60.0)
+        assert FlextCliFileCacheStore(tmp_path).get("k") == {"rows": [1, 2]}
+        assert not store.set("obj", object(), 60.0)
+        assert store.delete("k")
+        assert store.get("k") is None
+
+    def test_file_store_evicts_oldest_files(self, tmp_path: Path) -> None:
+        """Beyond ``max_entries`` the least recently written files go first."""
+        store = FlextCliFileCacheStore(tmp_path, max_entries=3)
+        for index, key in enumerate("abcd"):
+            assert store.set(key, index, 60.0)
+            os.utime(tmp_path / f"{key}.json", ns=(index, index))
+        assert store.set("a", 0, 60.0)
+        assert sorted(path.stem for path in tmp_path.iterdir()) == ["a", "c", "d"]
+
+
+class TestsCliCacheMiddleware:
+    """Tests for FlextCliCacheMiddleware."""
+
+    def test_key_ignores_param_order(self) -> None:
+        """The cache key is stable across dict orderings."""
+        first = CacheMiddleware.cache_key("q", {"a": 1, "b": [1, 2]})
+        assert first == CacheMiddleware.cache_key("q", {"b": [1, 2], "a": 1})
+        assert first != CacheMiddleware.cache_key("other", {"a": 1, "b": [1, 2]})
+        with pytest.raises(TypeError):
+            _ = CacheMiddleware.cache_key("q", {"when": object()})
+
+    def test_non_json_params_bypass_cache(self) -> None:
+        """Calls whose parameters have no stable key always run."""
+        calls: list[int] = []
+
+        def handler(_ctx: p.Cli.CliContext) -> r[object]:
+            calls.append(1)
+            return r[object].ok(len(calls))
+
+        cache = CacheMiddleware(["query"], registry=FlextCliMetricsRegistry())
+        marker = object()
+        assert cache(_context(at=marker), handler).value == 1
+        assert cache(_context(at=marker), handler).value == 2
+        assert cache(_context(ratio=float("nan")), handler).value == 3
+
+    def test_caches_only_opted_in_successes(self, tmp_path: Path) -> None:
+        """Only opted-in commands are cached, and only on success."""
+        calls: list[str] = []
+
+        def handler(ctx: p.Cli.CliContext) -> r[object]:
+            calls.append(str(ctx.params.get("id")))
+            if ctx.params.get("id") == "bad":
+                return r[object].fail("not found")
+            return r[object].ok({"id": ctx.params.get("id")})
+
+        cache = CacheMiddleware(
+            ["query"],
+            store=FlextCliFileCacheStore(tmp_path),
+            registry=FlextCliMetricsRegistry(),
+        )
+        assert cache(_context(id="1"), handler).value == {"id": "1"}
+        assert cache(_context(id="1"), handler).value == {"id": "1"}
+        _ = cache(_context(id="bad"), handler)
+        _ = cache(_context(id="bad"), handler)
+        _ = cache(_context("write", id="1"), handler)
+        assert calls == ["1", "bad", "bad", "1"]
+
+        fresh = CacheMiddleware(["query"], store=FlextCliFileCacheStore(tmp_path))
+        assert fresh(_context(id="1"), handler).value == {"id": "1"}
+        assert len(calls) == 4
+        assert fresh.invalidate("query", {"id": "1"})
+
+    def test_single_flight_collapses_concurrent_misses(self) -> None:
+        """Concurrent identical calls run the command once."""
+        registry = FlextCliMetricsRegistry()
+        cache = CacheMiddleware(["query"], registry=registry)
+        calls: list[int] = []
+
+        def slow(_ctx: p.Cli.CliContext) -> r[object]:
+            calls.append(1)
+            time.sleep(0.1)
+            return r[object].ok(len(calls))
+
+        results: list[r[object]] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache(_context(), slow)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert calls == [1]
+        assert [result.value for result in results] == [1] * 5
+        requests = registry.counter(
+            c.Cli.ResultCacheDefaults.REQUESTS, "", ("command", "outcome")
+        )
+        assert requests.value("query", c.Cli.ResultCacheDefaults.OUTCOME_SHARED) == 4
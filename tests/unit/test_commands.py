@@ -13,6 +13,7 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import threading
 import time
 
 from flext_cli import FlextCliCommands, c, m, r, t
@@ -365,3 +366,109 @@ class TestsCliCommands:
         commands_list = result.value
         assert isinstance(commands_list, list)
         assert len(commands_list) == 2
+
+    def test_binding_plan_filters_unaccepted_arguments(self) -> None:
+        """Handlers receive only the arguments their signature accepts."""
+        commands = CommandsFactory.create_commands()
+        seen: list[tuple[str, str]] = []
+
+        def handler(target: str, *, mode: str = "fast") -> r[object]:
+            seen.append((target, mode))
+            return r[object].ok(target)
+
+        _ = commands.register_command("bound", handler)
+        assert commands.execute_command(
+            "bound", ["db"], mode="safe", timeout=10
+        ).is_success
+        assert commands.execute_command("bound", ["a", "b"], target="x").is_success
+        assert seen == [("db", "safe"), ("x", "fast")]
+
+    def test_handler_type_error_is_not_retried(self) -> None:
+        """A TypeError raised inside a handler fails once, without a retry."""
+        commands = CommandsFactory.create_commands()
+        calls: list[int] = []
+
+        def handler(*args: str) -> r[object]:
+            calls.append(len(args))
+            msg = "bad operand"
+            raise TypeError(msg)
+
+        _ = commands.register_command("broken", handler)
+        result = commands.execute_command("broken", ["x"])
+        assert result.is_failure
+        assert "bad operand" in str(result.error)
+        assert calls == [1]
+
+    def test_fan_out_runs_inputs_concurrently(self) -> None:
+        """fan_out runs one invocation per input on a worker pool."""
+        commands = CommandsFactory.create_commands()
+        active: list[int] = [0, 0]
+        lock = threading.Lock()
+
+        def handler(item: int) -> r[object]:
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return r[object].ok(item * 2)
+
+        _ = commands.register_command("double", handler)
+        results = list(commands.fan_out("double", range(12), workers=4))
+        assert sorted(result.value for result in results) == [i * 2 for i in range(12)]
+        assert active[1] > 1
+
+    def test_pipeline_chains_stages_and_streams_failures(self) -> None:
+        """Values flow between stages; failures skip later stages."""
+        commands = CommandsFactory.create_commands()
+
+        def check(item: int) -> r[object]:
+            return r[object].fail(f"odd {item}") if item % 2 else r[object].ok(item)
+
+        def label(*, value: int) -> r[object]:
+            return r[object].ok(f"even {value}")
+
+        _ = commands.register_command("check", check)
+        _ = commands.register_command("label", label)
+        pipeline = (
+            commands
+            .pipeline()
+            .stage("check", workers=3, queue_size=2)
+            .stage("label", argument="value")
+        )
+        outcomes = sorted(
+            str(result.value) if result.is_success else str(result.error)
+            for result in pipeline.run(range(6))
+        )
+        assert outcomes == ["even 0", "even 2", "even 4", "odd 1", "odd 3", "odd 5"]
+        check_metrics, label_metrics = pipeline.stage_metrics()
+        assert (check_metrics.processed, check_metrics.failed) == (6, 3)
+        assert (label_metrics.processed, label_metrics.failed) == (3, 0)
+        assert check_metrics.throughput > 0
+
+    def test_pipeline_keeps_items_of_raising_handlers(self) -> None:
+        """Raised exceptions become failures; any keyword name reaches handlers."""
+        commands = CommandsFactory.create_commands()
+
+        def greet(*, name: object) -> r[object]:
+            if name == "boom":
+                raise RuntimeError(name)
+            return r[object].ok(f"hi {name}")
+
+        _ = commands.register_command("greet", greet)
+        pipeline = commands.pipeline().stage("greet", workers=2, argument="name")
+        results = list(pipeline.run(["a", "boom", ("b",)]))
+        assert sorted(str(result.value) for result in results if result.is_success) == [
+            "hi ('b',)",
+            "hi a",
+        ]
+        assert ["boom" in str(result.error) for result in results].count(True) == 1
+        assert pipeline.stage_metrics()[0].processed == 3
+
+    def test_pipeline_rejects_unknown_stage_command(self) -> None:
+        """A pipeline with an unregistered command yields a single failure."""
+        commands = CommandsFactory.create_commands()
+        results = list(commands.pipeline().stage("missing").run([1, 2]))
+        assert len(results) == 1
+        assert "missing" in str(results[0].error)
@@ -0,0 +1,196 @@
+"""FLEXT CLI Completion Cache Tests - Shell completion without app startup.
+
+Modules tested: flext_cli.completion, flext_cli.completion_entry,
+flext_cli.app_base (completion cache refresh)
+Scope: command tree dump, candidates for commands/options/choices, refresh
+on version or command tree changes, standalone entry script, shell scripts
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import io
+import shutil
+import subprocess
+import sys
+from collections.abc import Callable
+from enum import StrEnum
+from pathlib import Path
+from typing import Annotated
+
+import click
+import pytest
+import typer
+from flext_core import FlextSettings, r
+
+from flext_cli import (
+    FlextCliAppBase,
+    FlextCliCompletionCache,
+    FlextCliSettings,
+    completion_entry,
+)
+
+
+class _Env(StrEnum):
+    DEV = "dev"
+    PROD = "prod"
+
+
+def _app(*, extra: bool = False) -> typer.Typer:
+    app = typer.Typer()
+    users = typer.Typer()
+
+    @app.command()
+    def deploy(
+        env: _Env,
+        replicas: int = 1,
+        region: Annotated[str, typer.Option("--region", "-r")] = "eu",
+        target: Annotated[_Env, typer.Option("--target")] = _Env.DEV,
+    ) -> None:
+        """Deploy."""
+
+    @users.command("list")
+    def list_users() -> None:
+        """List users."""
+
+    @users.command("drop", hidden=True)
+    def drop_users() -> None:
+        """Drop users."""
+
+    if extra:
+        _ = app.command(name="status")(lambda: None)
+    _ = deploy, list_users, drop_users
+    app.add_typer(users, name="users")
+    return app
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> FlextCliCompletionCache:
+    """A completion cache written for the test app."""
+    completion = FlextCliCompletionCache("test-app", tmp_path)
+    assert completion.write(typer.main.get_command(_app()), "1.0").is_success
+    return completion
+
+
+class TestsCliCompletionCache:
+    """Tests for FlextCliCompletionCache and the completion entry script."""
+
+    @pytest.mark.parametrize(
+        ("words", "expected"),
+        [
+            ([""], ["deploy", "users"]),
+            (["users", ""], ["list"]),
+            (["deploy", "--re"], ["--region", "--replicas"]),
+            (["deploy", ""], ["dev", "prod"]),
+            (["deploy", "--replicas", "3", "p"], ["prod"]),
+            (["deploy", "-r", ""], []),
+        ],
+    )
+    def test_candidates(
+        self, cache: FlextCliCompletionCache, words: list[str], expected: list[str]
+    ) -> None:
+        """Subcommands, options and choices complete; hidden ones do not."""
+        assert cache.complete(words) == expected
+
+    def test_ensure_rewrites_on_version_or_tree_change(
+        self, cache: FlextCliCompletionCache
+    ) -> None:
+        """The file is written again only when the version or tree differs."""
+
+        def factory() -> typer.core.TyperGroup:
+            return typer.main.get_command(_app())
+
+        def extended() -> typer.core.TyperGroup:
+            return typer.main.get_command(_app(extra=True))
+
+        written = cache.path.stat().st_mtime_ns
+        assert cache.ensure(factory, "1.0").value is False
+        assert cache.path.stat().st_mtime_ns == written
+        assert cache.ensure(extended, "1.0").value is True
+        assert "status" in cache.complete([""])
+        assert cache.ensure(extended, "2.0").value is True
+        assert cache.is_current(cache.fingerprint(cache.dump_tree(extended()), "2.0"))
+
+    def test_entry_script_runs_standalone(self, cache: FlextCliCompletionCache) -> None:
+        """The entry script answers from the file without importing flext_cli."""
+        script = cache.script("bash")
+        assert script.is_success
+        entry = Path(completion_entry.__file__)
+        assert str(entry) in script.value
+        completed = subprocess.run(
+            [sys.executable, "-S", "-I", str(entry), str(cache.path), "us"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert completed.stdout.split() == ["users"]
+        assert cache.script("tcsh").is_failure
+
+    @pytest.mark.skipif(shutil.which("bash") is None, reason="bash not found")
+    @pytest.mark.parametrize(
+        ("words", "expected"),
+        [
+            (["deploy", "--re"], ["--region", "--replicas"]),
+            (["deploy", "--target", "=", "p"], ["prod"]),
+            (["deploy", "--target", "=", ""], ["dev", "prod"]),
+            (["deploy", "d"], ["dev"]),
+        ],
+    )
+    def test_bash_script_rejoins_option_values(
+        self, cache: FlextCliCompletionCache, words: list[str], expected: list[str]
+    ) -> None:
+        """Words bash splits at "=" are rejoined before completing."""
+        run = (
+            f"{cache.script('bash').value}"
+            'COMP_WORDS=(test-app "$@"); COMP_CWORD=$#; _test_app_completion; '
+            'printf "%s\\n" "${COMPREPLY[@]}"'
+        )
+        completed = subprocess.run(
+            ["bash", "-c", run, "bash", *words],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert completed.stdout.split() == expected
+
+    def test_app_refreshes_cache_under_config_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Running an app writes its cache below the configured config dir."""
+        FlextSettings.reset_for_testing()
+        FlextCliSettings._reset_instance()
+        monkeypatch.setenv("FLEXT_CLI_CONFIG_DIR", str(tmp_path))
+
+        class _App(FlextCliAppBase[FlextCliSettings]):
+            app_name = "completion-app"
+            app_help = "Completion test app"
+            app_version = "3.1"
+            config_class = FlextCliSettings
+
+            def _register_commands(self) -> None:
+                _ = self._app.command(name="hello")(lambda: None)
+
+        checks: list[str] = []
+        ensure = FlextCliCompletionCache.ensure
+
+        def counted_ensure(
+            cache: FlextCliCompletionCache,
+            command_factory: Callable[[], click.Command],
+            version: str,
+        ) -> r[bool]:
+            checks.append(version)
+            return ensure(cache, command_factory, version)
+
+        monkeypatch.setattr(FlextCliCompletionCache, "ensure", counted_ensure)
+        app = _App()
+        assert app.execute_cli(["--help"]).is_success
+        completion = app.completion()
+        assert completion.path.is_relative_to(tmp_path)
+        assert "hello" in completion.complete([""])
+        assert app.execute_cli(["hello"]).is_success
+        batch = app.execute_batch(io.StringIO("hello\n"), output=io.StringIO())
+        assert batch.is_success
+        assert len(checks) == 1
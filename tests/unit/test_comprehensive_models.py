@@ -1,5 +1,7 @@
 """Comprehensive parametrized unit tests for 100% coverage."""
 
+import copy
+import pickle
 from datetime import datetime
 
 import pytest
@@ -93,6 +95,53 @@ class TestsCliComprehensiveModels:
         )
         assert len(session.commands) == commands_count
 
+    def test_session_add_command_shares_log(self) -> None:
+        """add_command returns a new session; earlier sessions are unchanged."""
+        session = m.Cli.CliSession(session_id="log", status="active")
+        first = session.add_command(create_test_cli_command(name="a")).value
+        second = first.add_command(
+            create_test_cli_command(name="b", status="completed")
+        ).value
+        branch = first.add_command(create_test_cli_command(name="c")).value
+        assert len(session.commands) == 0
+        assert [cmd.name for cmd in first.commands] == ["a"]
+        assert [cmd.name for cmd in second.commands] == ["a", "b"]
+        assert [cmd.name for cmd in branch.commands] == ["a", "c"]
+        assert [cmd.name for cmd in branch.commands_by_status("pending")] == [
+            "a",
+            "c",
+        ]
+        assert second.count_by_status("completed") == 1
+        assert branch.count_by_status("completed") == 0
+
+    def test_session_command_log_round_trip(self) -> None:
+        """The command log serializes as a list and validates back."""
+        session = m.Cli.CliSession(session_id="rt", status="active")
+        for i in range(3):
+            session = session.add_command(create_test_cli_command(name=f"c{i}")).value
+        dumped = session.model_dump(mode="json")
+        assert [cmd["name"] for cmd in dumped["commands"]] == ["c0", "c1", "c2"]
+        restored = m.Cli.CliSession.model_validate(dumped)
+        assert restored.commands == session.commands
+        assert restored.count_by_status("pending") == 3
+
+    def test_session_deep_copies_and_pickles(self) -> None:
+        """Copied and unpickled sessions get a command log of their own."""
+        session = m.Cli.CliSession(session_id="copy", status="active")
+        session = session.add_command(create_test_cli_command(name="a")).value
+        copies = [
+            copy.deepcopy(session),
+            session.model_copy(deep=True),
+            pickle.loads(pickle.dumps(session)),
+        ]
+        for duplicate in copies:
+            assert duplicate.commands == session.commands
+            grown = duplicate.add_command(create_test_cli_command(name="b")).value
+            assert grown.count_by_status("pending") == 2
+        assert [cmd.name for cmd in session.commands] == ["a"]
+        grown = session.add_command(create_test_cli_command(name="c")).value
+        assert [cmd.name for cmd in grown.commands] == ["a", "c"]
+
 
 class TestsCliModelValidation:
     """Tests focusing on model validation edge cases."""
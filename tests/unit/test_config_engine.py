@@ -0,0 +1,106 @@
+"""FLEXT CLI Config Engine Tests - Incremental merge-patch configuration.
+
+Modules tested: flext_cli.config_engine, FlextCliCore configuration updates
+Scope: RFC 7396 merge semantics, per-key validation, versioned rollback,
+affected-key subscriptions
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+
+from flext_cli import FlextCliConfigEngine, FlextCliCore, m, r
+
+
+class TestsCliConfigEngine:
+    """Tests for FlextCliConfigEngine."""
+
+    def test_merge_patch_semantics(self) -> None:
+        """Null deletes, objects merge recursively, other values replace."""
+        target = {"a": {"b": 1, "c": 2}, "d": [1], "e": "x"}
+        merged = FlextCliConfigEngine.merge_patch(
+            target, {"a": {"b": None, "f": 3}, "d": [2], "g": {"h": None}}
+        )
+        assert merged == {"a": {"c": 2, "f": 3}, "d": [2], "e": "x", "g": {}}
+        assert target == {"a": {"b": 1, "c": 2}, "d": [1], "e": "x"}
+
+    def test_diff_round_trips(self) -> None:
+        """A diff patch turns source into target."""
+        source = {"a": 1, "b": {"c": 1, "d": 2}}
+        target = {"b": {"c": 1, "d": 3}, "e": 4}
+        patch = FlextCliConfigEngine.diff(source, target)
+        assert patch == {"a": None, "b": {"d": 3}, "e": 4}
+        assert FlextCliConfigEngine.merge_patch(source, patch) == target
+
+    def test_validates_only_changed_keys(self) -> None:
+        """Validators run only when their key is affected."""
+        engine = FlextCliConfigEngine({"port": 1, "host": "a"})
+        calls: list[str] = []
+
+        def check_port(value: object) -> r[bool]:
+            calls.append("port")
+            if isinstance(value, int):
+                return r[bool].ok(value=True)
+            return r[bool].fail("must be int")
+
+        engine.register_validator("port", check_port)
+        assert engine.apply_patch({"host": "b"}).is_success
+        assert calls == []
+        rejected = engine.apply_patch({"port": "x"})
+        assert rejected.is_failure
+        assert "port" in (rejected.error or "")
+        assert engine.config["port"] == 1
+        assert engine.version == 1
+
+    def test_subscribers_and_rollback(self) -> None:
+        """Subscribers see affected changes; rollback restores an old version."""
+        engine = FlextCliConfigEngine({"db": {"host": "a", "port": 1}, "debug": False})
+        seen: list[tuple[str, int]] = []
+        _ = engine.subscribe("db.host", lambda v: seen.append(("host", v.version)))
+        token = engine.subscribe("debug", lambda v: seen.append(("debug", v.version)))
+        _ = engine.apply_patch({"db": {"host": "b"}})
+        _ = engine.apply_patch({"db": {"port": None}})
+        assert engine.apply_patch({"db": {"host": "b"}}).value.version == 2
+        assert engine.unsubscribe(token)
+
+        restored = engine.rollback(0)
+        assert restored.is_success
+        assert restored.value.source == "rollback"
+        assert engine.config == {"db": {"host": "a", "port": 1}, "debug": False}
+        assert seen == [("host", 1), ("host", 3)]
+        assert engine.rollback(99).is_failure
+        assert [v.version for v in engine.history()] == [1, 2, 3]
+
+    def test_rollback_restores_none_values(self) -> None:
+        """Rolling back restores keys whose old value was ``None``."""
+        original = {"db": {"host": "a", "password": None}, "proxy": None}
+        engine = FlextCliConfigEngine(original)
+        _ = engine.apply_patch({"db": {"password": "s3cret"}, "proxy": "p"})
+        _ = engine.apply_patch({"db": {"password": None}})
+        assert engine.rollback(0).value.changed_keys == ("db.password", "proxy")
+        assert engine.config == original
+        assert not isinstance(engine.config, MutableMapping)
+
+    def test_core_update_configuration_uses_patches(self) -> None:
+        """FlextCliCore applies updates as patches and can roll them back."""
+        core = FlextCliCore({"profile": "default", "debug": False})
+        versions: list[m.Cli.ConfigVersion] = []
+        _ = core.get_config_engine().subscribe("debug", versions.append)
+        assert core.update_configuration({"debug": True}).is_success
+        assert core.update_configuration({"profile": None}).is_success
+        assert core.get_config().value == {"debug": True}
+        assert [v.version for v in versions] == [1]
+        assert core.rollback_configuration(0).is_success
+        assert core.get_config().value == {"profile": "default", "debug": False}
+
+    def test_core_get_config_returns_a_copy(self) -> None:
+        """Changing the returned configuration leaves the service untouched."""
+        core = FlextCliCore({"db": {"host": "a"}})
+        config = core.get_config().value
+        assert isinstance(config, dict)
+        config["db"] = {"host": "b"}
+        assert core.get_config().value == {"db": {"host": "a"}}
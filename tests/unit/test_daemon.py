@@ -0,0 +1,155 @@
+"""FLEXT CLI Daemon Tests - Warm fork server for FlextCliAppBase apps.
+
+Modules tested: flext_cli.daemon, flext_cli.daemon_client, flext_cli.__main__
+Scope: target loading, forwarding argv/env/cwd/stdio to a forked child, exit
+status, settings-input and stale-source fallbacks, SIGINT restore, stop
+request
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from flext_cli import FlextCliDaemon, c, daemon_client
+from flext_cli.__main__ import main
+
+_MODULE = "flext_cli_daemon_fixture_app"
+_MODULE_SOURCE = '''
+import os
+
+import typer
+
+from flext_cli import FlextCliAppBase, FlextCliSettings
+
+
+class DaemonApp(FlextCliAppBase[FlextCliSettings]):
+    app_name = "daemon-app"
+    app_help = "Daemon test app"
+    config_class = FlextCliSettings
+    completion_cache = False
+
+    def _register_commands(self) -> None:
+        @self._app.command()
+        def greet(name: str) -> None:
+            """Greet someone."""
+            typer.echo(f"hello {name} in {os.getcwd()} as {os.environ['WHO']}")
+
+        @self._app.command()
+        def fail() -> None:
+            """Exit with an error."""
+            raise typer.Exit(3)
+
+        _ = greet, fail
+'''
+_TARGET = f"{_MODULE}:DaemonApp"
+
+
+@pytest.fixture
+def app_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Directory holding an importable test app module."""
+    _ = (tmp_path / f"{_MODULE}.py").write_text(_MODULE_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def running(app_dir: Path) -> Iterator[FlextCliDaemon]:
+    """A daemon serving the test app in a background process."""
+    daemon = FlextCliDaemon(_TARGET, app_dir / "app.sock", idle_timeout=30.0)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(app_dir), *sys.path]))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "flext_cli", "daemon", "serve", _TARGET]
+        + ["--socket", str(daemon.socket_path), "--idle-timeout", "30"],
+        env=env,
+        cwd=app_dir,
+    )
+    deadline = time.monotonic() + 30
+    while not daemon.socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    yield daemon
+    _ = daemon.stop()
+    _ = process.wait(timeout=10)
+
+
+class TestsCliDaemon:
+    """Tests for FlextCliDaemon and its client script."""
+
+    def test_load_app_rejects_other_targets(self, app_dir: Path) -> None:
+        """Only importable FlextCliAppBase subclasses are served; exits pass through."""
+        assert FlextCliDaemon.load_app(_TARGET).is_success
+        assert FlextCliDaemon.load_app("os:path").is_failure
+        assert FlextCliDaemon.load_app(f"{_MODULE}:Missing").is_failure
+        socket_path = FlextCliDaemon.default_socket(_TARGET, app_dir)
+        assert socket_path.parent.name == c.Cli.DaemonDefaults.DIR_NAME
+        cold = FlextCliDaemon(_TARGET, socket_path)
+        assert cold.run_cold(["fail"], spawn=False) == 3
+
+    def test_client_runs_commands_in_warm_children(
+        self, running: FlextCliDaemon, tmp_path: Path
+    ) -> None:
+        """Argv, cwd, environment, stdio and exit status reach the child."""
+        env = dict(os.environ, WHO="client")
+
+        def call(*args: str) -> subprocess.CompletedProcess[str]:
+            return subprocess.run(
+                [*running.client_command(), *args],
+                capture_output=True,
+                text=True,
+                env=env,
+                cwd=tmp_path,
+                check=False,
+            )
+
+        greeted = call("greet", "ada")
+        assert greeted.returncode == 0
+        assert greeted.stdout.strip() == f"hello ada in {tmp_path} as client"
+        assert call("fail").returncode == 3
+        assert call("greet").returncode == 2
+
+    def test_fallback_replies(self, running: FlextCliDaemon, app_dir: Path) -> None:
+        """Other settings inputs run cold; changed sources retire the daemon."""
+        socket_path = str(running.socket_path)
+        cold = {
+            daemon_client.KEY_FALLBACK: c.Cli.DaemonDefaults.MISMATCH_ENV,
+            daemon_client.KEY_SPAWN: False,
+        }
+        handler = signal.getsignal(signal.SIGINT)
+        request = daemon_client.request(["greet", "ada"])
+        request[daemon_client.KEY_ENV] = {"FLEXT_CLI_PROFILE": "other"}
+        assert daemon_client.forward(socket_path, request) == cold
+        assert signal.getsignal(signal.SIGINT) is handler
+        request = daemon_client.request(["greet", "ada"])
+        request[daemon_client.KEY_CWD] = str(app_dir / "elsewhere")
+        assert daemon_client.forward(socket_path, request) == cold
+        _ = (app_dir / ".env").write_text("FLEXT_CLI_PROFILE=other\n")
+        request = daemon_client.request(["greet", "ada"])
+        request[daemon_client.KEY_CWD] = str(app_dir)
+        assert daemon_client.forward(socket_path, request) == cold
+        os.utime(app_dir / f"{_MODULE}.py")
+        request = daemon_client.request(["greet", "ada"])
+        reply = daemon_client.forward(socket_path, request) or {}
+        assert reply[daemon_client.KEY_FALLBACK] == c.Cli.DaemonDefaults.MISMATCH_STALE
+        assert reply[daemon_client.KEY_SPAWN] is True
+
+    def test_client_command_and_stop_without_daemon(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """The client command line is printed; stopping nothing fails."""
+        socket_path = tmp_path / "none.sock"
+        argv = ["daemon", "client", _TARGET, "--socket", str(socket_path)]
+        assert main(argv) == 0
+        assert capsys.readouterr().out.split()[-2:] == [str(socket_path), _TARGET]
+        assert main(["daemon", "stop", _TARGET, "--socket", str(socket_path)]) == 1
+        assert "No daemon" in capsys.readouterr().err
@@ -0,0 +1,147 @@
+"""FLEXT CLI Metrics Tests - Execution statistics and latency histograms.
+
+Modules tested: flext_cli.metrics, FlextCliCore/FlextCliCommands statistics
+Scope: Histogram bucketing and percentiles, per-command counters, JSON export,
+OpenMetrics registry rendering and textfile export
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from flext_cli import (
+    FlextCliCommands,
+    FlextCliCore,
+    FlextCliExecutionMetrics,
+    FlextCliLatencyHistogram,
+    FlextCliMetricsRegistry,
+    FlextCliOpenMetricsExporter,
+    FlextCliSettings,
+    r,
+)
+from tests._helpers import create_test_cli_command
+
+
+class TestsCliMetrics:
+    """Tests for FlextCliLatencyHistogram and FlextCliExecutionMetrics."""
+
+    def test_histogram_percentiles_within_relative_error(self) -> None:
+        """Percentiles stay within the sub-bucket precision."""
+        histogram = FlextCliLatencyHistogram()
+        for value in range(1, 10_001):
+            histogram.record(value * 1_000)
+        assert histogram.count == 10_000
+        for percent, expected in ((50.0, 5_000_000), (99.0, 9_900_000)):
+            reported = histogram.percentile(percent)
+            assert abs(reported - expected) / expected < 0.07
+
+    def test_histogram_single_sample_is_exact(self) -> None:
+        """A single sample reports itself for every percentile."""
+        histogram = FlextCliLatencyHistogram()
+        histogram.record(123_456_789)
+        snapshot = histogram.snapshot()
+        assert snapshot.count == 1
+        assert snapshot.p50_seconds == pytest.approx(0.123456789)
+        assert snapshot.p99_seconds == pytest.approx(0.123456789)
+        assert sum(snapshot.bucket_counts) == 1
+
+    def test_execution_metrics_counts_failures(self) -> None:
+        """Failures are counted separately from successes."""
+        metrics = FlextCliExecutionMetrics()
+        metrics.record("deploy", 1_000, success=True)
+        metrics.record("deploy", 2_000, success=False)
+        stats = metrics.command_stats("deploy")
+        assert stats is not None
+        assert (stats.executions, stats.failures, stats.successes) == (2, 1, 1)
+        assert metrics.command_stats("missing") is None
+
+    def test_execution_metrics_json_export(self) -> None:
+        """Statistics export as a JSON document."""
+        metrics = FlextCliExecutionMetrics()
+        metrics.record("sync", 5_000, success=True)
+        exported = json.loads(metrics.to_json())
+        assert exported["total_executions"] == 1
+        assert exported["per_command"]["sync"]["latency"]["count"] == 1
+
+    def test_commands_record_executions(self) -> None:
+        """FlextCliCommands statistics reflect executions, not registrations."""
+        commands = FlextCliCommands()
+        _ = commands.register_command("ok", lambda: r[object].ok("done"))
+        _ = commands.register_command("bad", lambda: r[object].fail("boom"))
+        _ = commands.execute_command("ok")
+        _ = commands.execute_command("ok")
+        _ = commands.execute_command("bad")
+        stats = commands.get_command_statistics().value
+        assert stats.total_commands == 2
+        assert stats.total_executions == 3
+        assert stats.successful_commands == 2
+        assert stats.failed_commands == 1
+
+    def test_core_statistics_track_session_executions(self) -> None:
+        """FlextCliCore session statistics count executions since session start."""
+        core = FlextCliCore()
+        _ = core.register_command(create_test_cli_command(name="status"))
+        _ = core.execute_command("status")
+        _ = core.start_session()
+        _ = core.execute_command("status")
+        session_stats = core.get_session_statistics().value
+        assert session_stats["commands_executed"] == 1
+        command_stats = core.get_command_statistics().value
+        assert command_stats["total_executions"] == 2
+        assert command_stats["failed_commands"] == 0
+
+    def test_registry_renders_openmetrics(self) -> None:
+        """Command executions appear as counters and cumulative histograms."""
+        registry = FlextCliMetricsRegistry()
+        metrics = FlextCliExecutionMetrics(registry)
+        metrics.record("deploy", 3_000_000, success=True)
+        metrics.record("deploy", 700_000_000, success=False)
+        registry.record_file_io("read", 128)
+        text = registry.render()
+        assert 'flext_cli_command_executions_total{command="deploy"} 2' in text
+        assert 'flext_cli_command_failures_total{command="deploy"} 1' in text
+        assert (
+            'flext_cli_command_duration_seconds_bucket{command="deploy",le="+Inf"} 2'
+            in text
+        )
+        assert 'flext_cli_file_io_bytes_total{direction="read"} 128' in text
+        assert text.endswith("# EOF\n")
+        assert "# EOF" not in registry.render("prometheus")
+
+    def test_registry_rejects_kind_conflict(self) -> None:
+        """A metric name cannot be reused with another metric kind."""
+        registry = FlextCliMetricsRegistry()
+        _ = registry.counter("jobs", "Jobs.")
+        with pytest.raises(TypeError):
+            _ = registry.gauge("jobs", "Jobs.")
+
+    def test_exporter_writes_textfile(self, tmp_path: Path) -> None:
+        """Exporter atomically writes the rendered registry."""
+        registry = FlextCliMetricsRegistry()
+        registry.record_rendered_rows("table", 3)
+        target = tmp_path / "collector" / "cli.prom"
+        exporter = FlextCliOpenMetricsExporter(target, registry)
+        assert exporter.write().is_success
+        assert 'flext_cli_output_rows_total{format="table"} 3' in target.read_text()
+        assert [p.name for p in target.parent.iterdir()] == ["cli.prom"]
+
+    def test_family_base_is_abstract(self) -> None:
+        """Only concrete metric kinds can be instantiated."""
+        assert inspect.isabstract(FlextCliMetricsRegistry._Family)
+        assert not inspect.isabstract(FlextCliMetricsRegistry.Counter)
+
+    def test_settings_reject_unknown_exposition(self) -> None:
+        """An unsupported exposition format fails settings validation."""
+        settings = FlextCliSettings.get_global()
+        with pytest.raises(ValidationError):
+            setattr(settings, "metrics_exposition", "xml")
+        assert settings.metrics_exposition == "openmetrics"
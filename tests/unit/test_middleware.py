@@ -0,0 +1,495 @@
+"""FLEXT CLI Middleware Tests - Compiled middleware chains.
+
+Modules tested: flext_cli.middleware
+Scope: Chain ordering, in-place insert/remove, compose benchmark for
+1-20 middlewares, asyncio chains mixing sync and async middleware, retry
+backoff/classification/deadline, circuit breaker and bulkhead, timing and
+slow-call profiling, cached validation fast paths
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import cProfile
+import random
+import threading
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_cli import (
+    AsyncMiddlewareChain,
+    AsyncRetryMiddleware,
+    AsyncRunner,
+    BulkheadMiddleware,
+    CircuitBreakerMiddleware,
+    FlextCliCommands,
+    FlextCliMetricsRegistry,
+    FlextMiddleware,
+    MiddlewareChain,
+    RetryMiddleware,
+    TimingMiddleware,
+    ValidationMiddleware,
+    c,
+    p,
+    r,
+)
+
+
+def _tagging(tag: str) -> p.Cli.Middleware:
+    def middleware(
+        ctx: p.Cli.CliContext,
+        next_: Callable[[p.Cli.CliContext], r[object]],
+    ) -> r[object]:
+        ctx.params = {**ctx.params, "trail": [*ctx.params.get("trail", []), tag]}
+        return next_(ctx)
+
+    return middleware
+
+
+def _async_tagging(tag: str) -> p.Cli.AsyncMiddleware:
+    async def middleware(
+        ctx: p.Cli.CliContext,
+        next_: Callable[[p.Cli.CliContext], Awaitable[r[object]]],
+    ) -> r[object]:
+        ctx.params = {**ctx.params, "trail": [*ctx.params.get("trail", []), tag]}
+        await asyncio.sleep(0)
+        return await next_(ctx)
+
+    return middleware
+
+
+def _handler(ctx: p.Cli.CliContext) -> r[object]:
+    return r[object].ok(ctx.params.get("trail", []))
+
+
+def _context() -> p.Cli.CliContext:
+    return SimpleNamespace(args=[], cwd=".", env={}, params={})
+
+
+def _flaky(
+    failures: int, error_code: str = "TRANSIENT"
+) -> tuple[Callable[[p.Cli.CliContext], r[object]], list[int]]:
+    calls: list[int] = []
+
+    def handler(_ctx: p.Cli.CliContext) -> r[object]:
+        calls.append(len(calls) + 1)
+        if len(calls) > failures:
+            return r[object].ok(len(calls))
+        return r[object].fail("boom", error_code=error_code)
+
+    return handler, calls
+
+
+class TestsCliMiddlewareChain:
+    """Tests for FlextCliMiddlewareChain."""
+
+    def test_compose_runs_in_order(self) -> None:
+        """Middlewares run outermost first before the handler."""
+        chain = FlextMiddleware.compose([_tagging("a"), _tagging("b")], _handler)
+        assert isinstance(chain, MiddlewareChain)
+        assert chain(_context()).value == ["a", "b"]
+        assert chain(_context()).value == ["a", "b"]
+
+    def test_insert_and_remove_in_place(self) -> None:
+        """Insert/remove re-point neighbours without rebuilding the chain."""
+        first, last = _tagging("a"), _tagging("z")
+        chain = FlextMiddleware.compose([first], _handler)
+        chain.insert(0, _tagging("start"))
+        chain.append(last)
+        chain.insert(2, _tagging("mid"))
+        assert chain(_context()).value == ["start", "a", "mid", "z"]
+        assert chain.remove(first)
+        assert chain.remove(last)
+        assert not chain.remove(last)
+        assert chain(_context()).value == ["start", "mid"]
+        assert len(chain) == 2
+
+    def test_empty_chain_calls_handler(self) -> None:
+        """A chain without middleware calls the handler directly."""
+        chain = FlextMiddleware.compose([], _handler)
+        assert chain(_context()).value == []
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("depth", [1, 5, 10, 20])
+    def test_benchmark_compiled_chain(
+        self, benchmark: BenchmarkFixture, depth: int
+    ) -> None:
+        """Benchmark calling a compiled chain of ``depth`` middlewares."""
+
+        def passthrough(
+            ctx: p.Cli.CliContext,
+            next_: Callable[[p.Cli.CliContext], r[object]],
+        ) -> r[object]:
+            return next_(ctx)
+
+        chain = FlextMiddleware.compose([passthrough] * depth, _handler)
+        ctx = _context()
+        result = benchmark(chain, ctx)
+        assert result.is_success
+
+
+class TestsCliAsyncMiddleware:
+    """Tests for asyncio middleware composition and adapters."""
+
+    def test_async_chain_mixes_sync_and_async(self) -> None:
+        """Sync middleware and handlers are adapted inside an async chain."""
+        chain = FlextMiddleware.compose_async(
+            [_async_tagging("a"), _tagging("s"), _async_tagging("b")], _handler
+        )
+        assert isinstance(chain, AsyncMiddlewareChain)
+        assert asyncio.run(chain(_context())).value == ["a", "s", "b"]
+
+    def test_sync_chain_runs_async_middleware(self) -> None:
+        """Async middleware runs inside a sync chain via the runner."""
+
+        async def async_handler(ctx: p.Cli.CliContext) -> r[object]:
+            return r[object].ok(ctx.params.get("trail", []))
+
+        chain = FlextMiddleware.compose(
+            [_tagging("s"), _async_tagging("a")], async_handler
+        )
+        assert chain(_context()).value == ["s", "a"]
+
+    def test_async_chains_overlap(self) -> None:
+        """Concurrent async chains overlap their I/O waits."""
+
+        async def slow_handler(ctx: p.Cli.CliContext) -> r[object]:
+            await asyncio.sleep(0.05)
+            return r[object].ok(ctx.params)
+
+        chain = FlextMiddleware.compose_async([_async_tagging("a")], slow_handler)
+
+        async def run_many() -> list[r[object]]:
+            return await asyncio.gather(*(chain(_context()) for _ in range(10)))
+
+        start = time.perf_counter()
+        results = asyncio.run(run_many())
+        assert all(result.is_success for result in results)
+        assert time.perf_counter() - start < 0.4
+
+    def test_runner_command_keeps_signature(self) -> None:
+        """Wrapped async commands are plain callables for Typer."""
+
+        @AsyncRunner.command
+        async def fetch(url: str, times: int = 1) -> str:
+            await asyncio.sleep(0)
+            return url * times
+
+        assert fetch("ab", times=2) == "abab"
+        assert list(fetch.__annotations__) == ["url", "times", "return"]
+
+    def test_runner_reuses_one_helper_loop(self) -> None:
+        """Inside a running loop, calls share one long-lived helper thread."""
+
+        async def current_thread() -> str:
+            await asyncio.sleep(0)
+            return threading.current_thread().name
+
+        async def nested() -> str:
+            return AsyncRunner.run(current_thread())
+
+        async def from_loop() -> list[str]:
+            return [AsyncRunner.run(current_thread()) for _ in range(3)]
+
+        async def from_loop_nested() -> str:
+            return AsyncRunner.run(nested())
+
+        names = asyncio.run(from_loop())
+        assert names == [c.Cli.AsyncRunnerDefaults.THREAD_NAME] * 3
+        assert AsyncRunner.run(current_thread()) == threading.current_thread().name
+        assert asyncio.run(from_loop()) == names
+        assert asyncio.run(from_loop_nested()) != names[0]
+
+    def test_commands_execute_async_handlers(self) -> None:
+        """FlextCliCommands awaits async handlers in both execution paths."""
+        commands = FlextCliCommands()
+
+        async def ping(name: str = "x") -> r[object]:
+            await asyncio.sleep(0)
+            return r[object].ok(f"pong {name}")
+
+        _ = commands.register_command("ping", ping)
+        assert commands.execute_command("ping", name="a").value == "pong a"
+        result = asyncio.run(commands.execute_command_async("ping", name="b"))
+        assert result.value == "pong b"
+
+
+class TestsCliRetryMiddleware:
+    """Tests for the retry engine."""
+
+    def test_recovers_and_records_metrics(self) -> None:
+        """Transient failures are retried and counted per command."""
+        registry = FlextCliMetricsRegistry()
+        handler, calls = _flaky(2)
+        ctx = SimpleNamespace(command="sync", params={})
+        retry = RetryMiddleware(5, 0.001, registry=registry, rng=random.Random(7))
+        assert retry(ctx, handler).value == 3
+        assert calls == [1, 2, 3]
+        defaults = c.Cli.RetryDefaults
+        outcomes = registry.counter(defaults.OUTCOMES, "", ("command", "outcome"))
+        assert outcomes.value("sync", defaults.OUTCOME_RECOVERED) == 1
+        assert registry.counter(defaults.RETRIES, "", ("command",)).value("sync") == 2
+
+    def test_backoff_window_is_exponential_and_capped(self) -> None:
+        """Jitter is drawn from an exponentially growing, capped window."""
+        retry = RetryMiddleware(backoff=0.5, max_backoff=3.0)
+        assert [retry.backoff_window(n) for n in range(1, 6)] == [
+            0.5,
+            1.0,
+            2.0,
+            3.0,
+            3.0,
+        ]
+
+    def test_only_classified_failures_are_retried(self) -> None:
+        """Failures outside retry_codes return immediately."""
+        handler, calls = _flaky(5, error_code="INVALID")
+        retry = RetryMiddleware(
+            5, 0.001, retry_codes={"TRANSIENT"}, registry=FlextCliMetricsRegistry()
+        )
+        assert retry(_context(), handler).is_failure
+        assert calls == [1]
+
+    def test_deadline_bounds_total_time(self) -> None:
+        """No retry is started that would overrun the deadline."""
+        handler, calls = _flaky(100)
+        retry = RetryMiddleware(
+            100, 0.01, deadline=0.1, registry=FlextCliMetricsRegistry()
+        )
+        start = time.monotonic()
+        assert retry(_context(), handler).is_failure
+        assert time.monotonic() - start < 0.2
+        assert 1 <= len(calls) < 100
+
+    def test_async_retry_sleeps_on_event_loop(self) -> None:
+        """The async variant composes natively into async chains."""
+        handler, calls = _flaky(2)
+        retry = AsyncRetryMiddleware(4, 0.001, registry=FlextCliMetricsRegistry())
+        assert FlextMiddleware.is_async(retry)
+        chain = FlextMiddleware.compose_async([retry], handler)
+        assert asyncio.run(chain(_context())).is_success
+        assert calls == [1, 2, 3]
+
+
+class TestsCliResilienceMiddleware:
+    """Tests for the circuit breaker and bulkhead middleware."""
+
+    def test_circuit_opens_probes_and_closes(self) -> None:
+        """A high failure rate opens the circuit; a good probe closes it."""
+        now = [0.0]
+        breaker = CircuitBreakerMiddleware(
+            0.5,
+            min_calls=4,
+            window=10.0,
+            window_buckets=5,
+            reset_timeout=5.0,
+            clock=lambda: now[0],
+            registry=FlextCliMetricsRegistry(),
+        )
+        ctx = SimpleNamespace(command="db", params={})
+        good, bad = _flaky(0)[0], _flaky(100)[0]
+        for handler in (good, bad, good, bad):
+            _ = breaker(ctx, handler)
+        assert breaker.state("db") == c.Cli.CircuitBreakerDefaults.STATE_OPEN
+        rejected = breaker(ctx, good)
+        assert rejected.error_code == c.Cli.CircuitBreakerDefaults.ERROR_CODE
+
+        now[0] = 6.0
+        assert breaker.state("db") == c.Cli.CircuitBreakerDefaults.STATE_HALF_OPEN
+        _ = breaker(ctx, bad)
+        assert breaker.state("db") == c.Cli.CircuitBreakerDefaults.STATE_OPEN
+        now[0] = 12.0
+        assert breaker(ctx, good).is_success
+        assert breaker.state("db") == c.Cli.CircuitBreakerDefaults.STATE_CLOSED
+
+    def test_old_failures_leave_the_window(self) -> None:
+        """Failures older than the rolling window do not count."""
+        now = [0.0]
+        breaker = CircuitBreakerMiddleware(
+            0.5, min_calls=4, window=10.0, clock=lambda: now[0]
+        )
+        bad = _flaky(100)[0]
+        for _ in range(3):
+            _ = breaker(_context(), bad)
+        now[0] = 15.0
+        _ = breaker(_context(), bad)
+        assert breaker.state("unknown") == c.Cli.CircuitBreakerDefaults.STATE_CLOSED
+
+    def test_bulkhead_bounds_concurrency(self) -> None:
+        """Calls beyond the limit wait for the queue timeout, then fail."""
+        bulkhead = BulkheadMiddleware(2, 0.05, registry=FlextCliMetricsRegistry())
+        results: list[r[object]] = []
+
+        def slow(_ctx: p.Cli.CliContext) -> r[object]:
+            time.sleep(0.2)
+            return r[object].ok(True)
+
+        threads = [
+            threading.Thread(target=lambda: results.append(bulkhead(_context(), slow)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        codes = sorted(result.error_code or "ok" for result in results)
+        assert codes == [c.Cli.BulkheadDefaults.ERROR_CODE] * 2 + ["ok", "ok"]
+        assert bulkhead.in_flight("unknown") == 0
+
+
+class TestsCliTimingMiddleware:
+    """Tests for FlextCliTimingMiddleware."""
+
+    def test_records_wall_and_cpu_per_command(self) -> None:
+        """Wall and CPU histograms are kept per command and reported."""
+        registry = FlextCliMetricsRegistry()
+        timing = TimingMiddleware(registry=registry)
+        handler, _calls = _flaky(1)
+        for command in ("build", "build", "deploy"):
+            _ = timing(SimpleNamespace(command=command, params={}), handler)
+        summary = timing.summary()
+        assert summary["build"].wall.count == 2
+        assert summary["build"].failures == 1
+        assert summary["deploy"].cpu.count == 1
+        wall = registry.histogram(c.Cli.TimingDefaults.WALL, "", ("command",))
+        assert wall.count("build") == 2
+        report = timing.report().splitlines()
+        assert report[0] == c.Cli.TimingDefaults.REPORT_HEADER
+        assert [line.split()[0] for line in report[1:]] == ["build", "deploy"]
+
+    def test_profiles_only_the_slowest_calls(self) -> None:
+        """Only calls in the slowest percentile keep a cProfile capture."""
+        timing = TimingMiddleware(
+            profile_slowest=10.0,
+            min_samples=5,
+            max_profiles=2,
+            registry=FlextCliMetricsRegistry(),
+        )
+
+        def handler(ctx: p.Cli.CliContext) -> r[object]:
+            time.sleep(float(str(ctx.params["delay"])))
+            return r[object].ok(True)
+
+        for index in range(20):
+            delay = 0.05 if index in {10, 15} else 0.0
+            _ = timing(SimpleNamespace(command="job", params={"delay": delay}), handler)
+        profiles = timing.profiles("job")
+        assert len(profiles) == 2
+        assert all(profile.wall_seconds >= 0.05 for profile in profiles)
+        assert "function calls" in profiles[0].profile
+
+    def test_profiling_cleans_up_after_errors(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Profilers stop on exceptions; foreign tracing is not snapshotted."""
+        timing = TimingMiddleware(
+            profile_slowest=100.0, min_samples=0, registry=FlextCliMetricsRegistry()
+        )
+
+        def boom(_ctx: p.Cli.CliContext) -> r[object]:
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            _ = timing(_context(), boom)
+        probe = cProfile.Profile()
+        probe.enable()
+        probe.disable()
+
+        tracemalloc.start()
+        try:
+            _ = timing(_context(), lambda _ctx: r[object].ok(True))
+        finally:
+            tracemalloc.stop()
+        assert timing.profiles()[0].allocations == ()
+
+        registered: list[object] = []
+        monkeypatch.setattr(atexit, "register", registered.append)
+        timing.register_exit_report()
+        timing.register_exit_report()
+        assert len(registered) == 1
+
+
+class _DeployParams(BaseModel):
+    target: str
+    replicas: int = 1
+
+
+class TestsCliValidationMiddleware:
+    """Tests for FlextCliValidationMiddleware."""
+
+    def test_dumps_validated_params_by_default(self) -> None:
+        """Validated params are coerced and dumped back into the context."""
+        ctx = SimpleNamespace(params={"target": "prod", "replicas": "3"})
+        result = ValidationMiddleware(_DeployParams)(
+            ctx, lambda c_: r[object].ok(c_.params)
+        )
+        assert result.value == {"target": "prod", "replicas": 3}
+        assert ValidationMiddleware.validated(ctx, _DeployParams) == _DeployParams(
+            target="prod", replicas=3
+        )
+
+    def test_passes_model_instance_without_dump(self) -> None:
+        """With dump=False handlers read the model; instances skip validation."""
+        middleware = ValidationMiddleware(_DeployParams, dump=False)
+
+        def handler(ctx: p.Cli.CliContext) -> r[object]:
+            model = ValidationMiddleware.validated(ctx, _DeployParams)
+            return r[object].ok(model.replicas if model else None)
+
+        raw = {"target": "prod"}
+        ctx = SimpleNamespace(params=raw)
+        assert middleware(ctx, handler).value == 1
+        assert ctx.params is raw
+        instance = _DeployParams(target="dev", replicas=2)
+        ctx = SimpleNamespace(params=instance)
+        assert middleware(ctx, handler).value == 2
+        assert ValidationMiddleware.validated(ctx, _DeployParams) is instance
+
+    def test_slotted_context_and_failures_reported(self) -> None:
+        """Slotted contexts validate in both modes; invalid params fail."""
+
+        class _Slotted:
+            __slots__ = ("params",)
+
+            def __init__(self, params: object) -> None:
+                self.params = params
+
+        def handler(ctx: p.Cli.CliContext) -> r[object]:
+            model = ValidationMiddleware.validated(ctx, _DeployParams)
+            return r[object].ok(model.replicas if model else ctx.params)
+
+        dumped = ValidationMiddleware(_DeployParams)(_Slotted({"target": "a"}), handler)
+        assert dumped.value == {"target": "a", "replicas": 1}
+        passed = ValidationMiddleware(_DeployParams, dump=False)(
+            _Slotted({"target": "a", "replicas": 3}), handler
+        )
+        assert passed.value == 3
+        result = ValidationMiddleware(_DeployParams)(_context(), _handler)
+        assert result.is_failure
+        assert "Validation failed" in (result.error or "")
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("dump", [True, False])
+    def test_benchmark_validation(
+        self, benchmark: BenchmarkFixture, dump: bool
+    ) -> None:
+        """Benchmark validation with and without dumping params."""
+        middleware = ValidationMiddleware(_DeployParams, dump=dump)
+        ctx = SimpleNamespace(params={"target": "prod", "replicas": 2})
+
+        def run() -> r[object]:
+            ctx.params = {"target": "prod", "replicas": 2}
+            return middleware(ctx, _handler)
+
+        assert benchmark(run).is_success
@@ -11,6 +11,8 @@ Tests cover:
 - Boolean flags with various defaults
 - Field aliases and populate_by_name
 - Complex validation rules
+- Per-model-class caching of derived signatures and CLI params
+- Compiled invocation path and its per-call overhead benchmark
 
 Copyright (c) 2025 FLEXT Team. All rights reserved.
 SPDX-License-Identifier: MIT
@@ -19,10 +21,13 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import inspect
 from collections.abc import Callable
+from pathlib import Path
 
 import pytest
 from pydantic import BaseModel, ValidationError
+from pytest_benchmark.fixture import BenchmarkFixture
 
 from flext_cli import FlextCliCli, m
 from tests.models import tm
@@ -233,3 +238,117 @@ class TestsCliModelCommandComprehensive:
 
         command = cli.model_command(tm.AliasedConfig, handler)
         assert command is not None
+
+
+class _DeployParams(BaseModel):
+    env: str
+    replicas: int = 2
+    dry_run: bool = False
+
+
+class TestsCliModelCommandCache:
+    """Tests for the per-model-class command metadata cache."""
+
+    @pytest.fixture
+    def cache(self, monkeypatch: pytest.MonkeyPatch) -> m.Cli.ModelCommandCache:
+        """Install a fresh shared cache."""
+        fresh = m.Cli.ModelCommandCache()
+        monkeypatch.setattr(m.Cli.ModelCommandCache, "_shared", fresh)
+        return fresh
+
+    def test_builder_reuses_cached_signature(
+        self, cache: m.Cli.ModelCommandCache
+    ) -> None:
+        """A second build reuses the signature; config defaults still apply."""
+        first = m.Cli.ModelCommandBuilder(_DeployParams, str).build()
+        signature = cache.entry(_DeployParams).signature
+        second = m.Cli.ModelCommandBuilder(_DeployParams, str).build()
+        assert cache.entry(_DeployParams).signature is signature
+        assert inspect.signature(second) == inspect.signature(first)
+        assert len(cache) == 1
+
+        class _Config:
+            replicas = 5
+
+        configured = m.Cli.ModelCommandBuilder(_DeployParams, str, _Config()).build()
+        assert inspect.signature(configured).parameters["replicas"].default == 5
+        assert cache.entry(_DeployParams).signature is signature
+
+    def test_cli_params_cached_per_class(self, cache: m.Cli.ModelCommandCache) -> None:
+        """Specs are derived once; each call returns a new list."""
+        first = m.Cli.CliModelConverter.model_to_cli_params(_DeployParams).value
+        second = m.Cli.CliModelConverter.model_to_cli_params(_DeployParams).value
+        assert first is not second
+        assert [spec.field_name for spec in first] == ["env", "replicas", "dry_run"]
+        assert all(a is b for a, b in zip(first, second, strict=True))
+        assert cache.entry(_DeployParams).cli_params is not None
+
+    def test_entries_persist_between_runs(
+        self, cache: m.Cli.ModelCommandCache, tmp_path: Path
+    ) -> None:
+        """A persisted entry is loaded by a new cache if the model is unchanged."""
+        cache.persist_to(tmp_path)
+        built = m.Cli.ModelCommandBuilder(_DeployParams, str).build()
+        _ = m.Cli.CliModelConverter.model_to_cli_params(_DeployParams)
+        assert list(tmp_path.glob("*.json"))
+
+        next_run = m.Cli.ModelCommandCache()
+        next_run.persist_to(tmp_path)
+        entry = next_run.entry(_DeployParams)
+        assert entry.annotations == {"env": str, "replicas": int, "dry_run": bool}
+        assert entry.cli_params is not None
+        assert [spec.default for spec in entry.cli_params][1:] == [2, False]
+        assert m.Cli.ModelCommandCache.fingerprint(_DeployParams) == entry.fingerprint
+        assert inspect.signature(built).parameters.keys() == entry.annotations.keys()
+
+
+class TestsCliModelCommandInvocation:
+    """Tests for the compiled model command wrapper."""
+
+    def test_binding_and_argument_errors(self) -> None:
+        """Keyword and positional calls bind; bad calls fail like bind()."""
+        command = m.Cli.ModelCommandBuilder(
+            _DeployParams, lambda params: params.model_dump()
+        ).build()
+        assert command(env="prod", replicas=3) == {
+            "env": "prod",
+            "replicas": 3,
+            "dry_run": False,
+        }
+        assert command("dev", 4, True) == {"env": "dev", "replicas": 4, "dry_run": True}
+        with pytest.raises(RuntimeError, match="unexpected keyword argument"):
+            command(env="prod", unknown=1)
+        with pytest.raises(RuntimeError, match="multiple values"):
+            command("dev", env="prod")
+
+    def test_config_updated_with_bound_arguments(self) -> None:
+        """Fields the config defines receive the invocation's values."""
+
+        class _Config:
+            replicas = 1
+
+        config = _Config()
+        command = m.Cli.ModelCommandBuilder(_DeployParams, str, config).build()
+        _ = command(env="prod", replicas=6)
+        assert config.replicas == 6
+        assert not hasattr(config, "env")
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("path", ["direct", "command"])
+    def test_benchmark_invocation_overhead(
+        self, benchmark: BenchmarkFixture, path: str
+    ) -> None:
+        """Benchmark a model command call against validating and calling directly."""
+
+        def handler(params: BaseModel) -> str:
+            return params.__class__.__name__
+
+        command = m.Cli.ModelCommandBuilder(_DeployParams, handler).build()
+
+        def direct() -> object:
+            return handler(_DeployParams.model_validate({"env": "prod", "replicas": 3}))
+
+        def invoke() -> object:
+            return command(env="prod", replicas=3)
+
+        assert benchmark(direct if path == "direct" else invoke) == "_DeployParams"
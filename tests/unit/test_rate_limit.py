@@ -0,0 +1,101 @@
+"""FLEXT CLI Rate Limit Tests - Token-bucket throttling.
+
+Modules tested: flext_cli.rate_limit, flext_cli.middleware
+(FlextCliRateLimitMiddleware)
+Scope: Bucket refill and burst, shared file buckets, waiting vs rejecting,
+configuration from FlextCliSettings
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from flext_cli import (
+    FlextCliFileTokenBucket,
+    FlextCliMetricsRegistry,
+    FlextCliSettings,
+    FlextCliTokenBucket,
+    RateLimitMiddleware,
+    c,
+    m,
+    p,
+    r,
+)
+
+
+def _ok(_ctx: p.Cli.CliContext) -> r[object]:
+    return r[object].ok(True)
+
+
+class TestsCliTokenBuckets:
+    """Tests for the in-process and file-backed token buckets."""
+
+    def test_bucket_allows_burst_then_refills(self) -> None:
+        """A full bucket allows ``burst`` calls, then refills at ``rate``."""
+        now = [0.0]
+        bucket = FlextCliTokenBucket(2.0, 3, clock=lambda: now[0])
+        assert [bucket.try_acquire() for _ in range(4)] == [0.0, 0.0, 0.0, 0.5]
+        now[0] = 1.0
+        assert [bucket.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+    def test_file_buckets_share_state(self, tmp_path: Path) -> None:
+        """Two bucket objects on one directory draw from the same tokens."""
+        now = [100.0]
+        first = FlextCliFileTokenBucket(tmp_path, "api", 1.0, 2, clock=lambda: now[0])
+        second = FlextCliFileTokenBucket(tmp_path, "api", 1.0, 2, clock=lambda: now[0])
+        assert [first.try_acquire(), second.try_acquire()] == [0.0, 0.0]
+        assert first.try_acquire() == pytest.approx(1.0)
+        now[0] = 101.0
+        assert not second.try_acquire()
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "api.bucket",
+            "api.lock",
+        ]
+
+
+class TestsCliRateLimitMiddleware:
+    """Tests for FlextCliRateLimitMiddleware."""
+
+    def test_waits_for_tokens_within_max_wait(self) -> None:
+        """Calls sleep for the next token while it arrives within max_wait."""
+        limiter = RateLimitMiddleware(
+            {"api": m.Cli.RateLimit(rate=50.0, burst=1)},
+            max_wait=1.0,
+            registry=FlextCliMetricsRegistry(),
+        )
+        ctx = SimpleNamespace(command="api", params={})
+        assert all(limiter(ctx, _ok).is_success for _ in range(3))
+
+    def test_rejects_and_passes_unlimited_commands(self) -> None:
+        """Calls beyond max_wait fail; unlisted commands are not limited."""
+        limiter = RateLimitMiddleware(
+            {"api": m.Cli.RateLimit(rate=0.5)},
+            max_wait=0.0,
+            registry=FlextCliMetricsRegistry(),
+        )
+        ctx = SimpleNamespace(command="api", params={})
+        assert limiter(ctx, _ok).is_success
+        assert limiter(ctx, _ok).error_code == c.Cli.RateLimitDefaults.ERROR_CODE
+        other = SimpleNamespace(command="local", params={})
+        assert all(limiter(other, _ok).is_success for _ in range(5))
+
+    def test_from_settings(self, tmp_path: Path) -> None:
+        """Limits and the shared directory come from FlextCliSettings."""
+        assert RateLimitMiddleware.from_settings(FlextCliSettings()) is None
+        settings = FlextCliSettings(
+            rate_limits={"api": {"rate": 5.0, "burst": 2}},
+            rate_limit_dir=tmp_path,
+            rate_limit_max_wait=0.0,
+        )
+        limiter = RateLimitMiddleware.from_settings(settings)
+        assert limiter is not None
+        ctx = SimpleNamespace(command="api", params={})
+        assert [limiter(ctx, _ok).is_success for _ in range(3)] == [True, True, False]
+        assert (tmp_path / "api.bucket").exists()
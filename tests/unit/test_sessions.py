@@ -0,0 +1,163 @@
+"""FLEXT CLI Session Store Tests - Append-only journal persistence.
+
+Modules tested: flext_cli.sessions, FlextCliCore session integration
+Scope: Journal append/replay, status indexes, crash tolerance, compaction,
+resuming interrupted sessions
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from itertools import count
+from pathlib import Path
+
+import pytest
+
+from flext_cli import FlextCliCore, FlextCliSessionStore, m
+from tests._helpers import create_test_cli_command
+
+
+class TestsCliSessionStore:
+    """Tests for FlextCliSessionStore."""
+
+    def test_append_and_replay(self, tmp_path: Path) -> None:
+        """Commands and status changes survive reopening the journal."""
+        journal = tmp_path / "sessions.jsonl"
+        store = FlextCliSessionStore.open(journal).value
+        session_id = store.start_session(user_id="ops").value
+        for name in ("build", "test", "deploy"):
+            _ = store.append_command(session_id, m.Cli.CliCommand(name=name))
+        assert store.update_command_status(session_id, 1, "failed").is_success
+        store.close()
+
+        reopened = FlextCliSessionStore.open(journal).value
+        session = reopened.get_session(session_id).value
+        assert [cmd.name for cmd in session.commands] == ["build", "test", "deploy"]
+        failed = reopened.commands_by_status(session_id, "failed").value
+        assert [cmd.name for cmd in failed] == ["test"]
+        assert reopened.count_by_status(session_id, "pending") == 2
+
+    def test_truncated_tail_is_discarded(self, tmp_path: Path) -> None:
+        """A partially written last record is dropped on load."""
+        journal = tmp_path / "sessions.jsonl"
+        store = FlextCliSessionStore.open(journal).value
+        session_id = store.start_session().value
+        _ = store.append_command(session_id, m.Cli.CliCommand(name="sync"))
+        store.close()
+        with journal.open("ab") as handle:
+            _ = handle.write(b'{"op": "command", "session_')
+
+        reopened = FlextCliSessionStore.open(journal).value
+        assert reopened.record_count == 2
+        assert journal.read_bytes().endswith(b"\n")
+        assert len(reopened.get_session(session_id).value.commands) == 1
+
+    def test_interrupted_sessions_and_end(self, tmp_path: Path) -> None:
+        """Sessions without an end record are reported as interrupted."""
+        store = FlextCliSessionStore.open(tmp_path / "sessions.jsonl").value
+        done = store.start_session().value
+        open_id = store.start_session().value
+        assert store.end_session(done).is_success
+        assert store.interrupted_sessions() == [open_id]
+        assert store.sessions_by_status("completed") == [done]
+        assert store.append_command(done, m.Cli.CliCommand(name="x")).is_failure
+        assert store.end_session(done, "unknown").is_failure
+
+    def test_compaction_drops_superseded_records(self, tmp_path: Path) -> None:
+        """Compaction folds status records into command payloads."""
+        journal = tmp_path / "sessions.jsonl"
+        store = FlextCliSessionStore.open(journal, compact_threshold=4).value
+        session_id = store.start_session().value
+        _ = store.append_command(session_id, m.Cli.CliCommand(name="job"))
+        for status in ("running", "failed", "running", "completed"):
+            _ = store.update_command_status(session_id, 0, status)
+        assert store.record_count < 6
+        store.close()
+
+        reopened = FlextCliSessionStore.open(journal).value
+        assert reopened.count_by_status(session_id, "completed") == 1
+        assert [p.name for p in tmp_path.iterdir()] == ["sessions.jsonl"]
+
+    def test_ended_sessions_dropped_only_on_request(self, tmp_path: Path) -> None:
+        """Automatic compaction keeps ended sessions; drop_ended removes them."""
+        journal = tmp_path / "sessions.jsonl"
+        store = FlextCliSessionStore.open(journal, compact_threshold=2).value
+        ended: list[str] = []
+        for _ in range(3):
+            session_id = store.start_session().value
+            _ = store.append_command(session_id, m.Cli.CliCommand(name="job"))
+            _ = store.update_command_status(session_id, 0, "completed")
+            _ = store.end_session(session_id)
+            ended.append(session_id)
+        open_id = store.start_session().value
+        assert store.record_count < 13
+        assert store.sessions_by_status("completed") == ended
+        assert store.compact(drop_ended=True).value == 1
+        store.close()
+
+        reopened = FlextCliSessionStore.open(journal).value
+        assert reopened.interrupted_sessions() == [open_id]
+        assert reopened.sessions_by_status("completed") == []
+
+    def test_compaction_keeps_command_timestamps(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Compacted command records keep the time they were appended at."""
+        ticks = count()
+        monkeypatch.setattr(
+            FlextCliSessionStore,
+            "_now",
+            staticmethod(lambda: f"2025-01-01T00:00:{next(ticks):02d}+00:00"),
+        )
+        journal = tmp_path / "sessions.jsonl"
+        store = FlextCliSessionStore.open(journal).value
+        session_id = store.start_session().value
+        for name in ("first", "second"):
+            _ = store.append_command(session_id, m.Cli.CliCommand(name=name))
+        before = journal.read_text().splitlines()
+        assert store.compact().is_success
+        assert journal.read_text().splitlines() == before
+
+    def test_core_start_failure_leaves_no_session(self, tmp_path: Path) -> None:
+        """A session the store cannot journal is never activated."""
+        journal = tmp_path / "sessions.jsonl"
+        core = FlextCliCore(session_store=FlextCliSessionStore.open(journal).value)
+        journal.mkdir()
+        assert core.start_session({"profile": "dev"}).is_failure
+        assert core.get_session_statistics().is_failure
+        assert core.end_session().is_failure
+        journal.rmdir()
+        assert core.start_session().is_success
+
+    def test_core_forgets_ended_sessions(self, tmp_path: Path) -> None:
+        """Ended sessions are kept by the journal, not in core memory."""
+        journal = tmp_path / "sessions.jsonl"
+        core = FlextCliCore(session_store=FlextCliSessionStore.open(journal).value)
+        for _ in range(3):
+            assert core.start_session().is_success
+            assert core.end_session().is_success
+        assert core._sessions == {}
+        ended = FlextCliSessionStore.open(journal).value
+        assert len(ended.sessions_by_status("completed")) == 3
+
+    def test_core_journals_and_resumes(self, tmp_path: Path) -> None:
+        """FlextCliCore journals executions and resumes interrupted sessions."""
+        journal = tmp_path / "sessions.jsonl"
+        core = FlextCliCore(session_store=FlextCliSessionStore.open(journal).value)
+        _ = core.register_command(create_test_cli_command(name="status"))
+        assert core.start_session().is_success
+        _ = core.execute_command("status")
+
+        store = FlextCliSessionStore.open(journal).value
+        interrupted = store.interrupted_sessions()
+        assert len(interrupted) == 1
+        resumed_core = FlextCliCore(session_store=store)
+        resumed = resumed_core.resume_session(interrupted[0])
+        assert resumed.is_success
+        assert [cmd.status for cmd in resumed.value.commands] == ["completed"]
+        assert resumed_core.end_session().is_success
+        assert store.interrupted_sessions() == []
+        assert FlextCliCore().resume_session(interrupted[0]).is_failure
@@ -0,0 +1,148 @@
+"""FLEXT CLI Settings Cache Tests - Validated settings snapshots.
+
+Modules tested: flext_cli.settings_cache, flext_cli.app_base (settings_cache)
+Scope: fingerprint inputs, JSON snapshot restore without validation, secret
+fields, stale and unreadable snapshots, live singletons and app startup
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from flext_core import FlextSettings
+from pydantic import SecretStr
+
+from flext_cli import FlextCliAppBase, FlextCliSettings, FlextCliSettingsCache
+
+
+class _CachedApp(FlextCliAppBase[FlextCliSettings]):
+    app_name = "cached-app"
+    app_help = "Settings cache test app"
+    config_class = FlextCliSettings
+    completion_cache = False
+
+    def _register_commands(self) -> None:
+        """No commands needed."""
+
+
+class _SecretSettings(FlextCliSettings):
+    password: SecretStr | None = None
+
+
+def _reset() -> None:
+    FlextSettings.reset_for_testing()
+    FlextCliSettings._reset_instance()
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Generator[FlextCliSettingsCache[FlextCliSettings]]:
+    _reset()
+    yield FlextCliSettingsCache("cached-app", FlextCliSettings, tmp_path)
+    _reset()
+
+
+class TestsCliSettingsCache:
+    """Tests for FlextCliSettingsCache and FlextCliAppBase startup."""
+
+    def test_snapshot_round_trip_skips_validation(
+        self,
+        cache: FlextCliSettingsCache[FlextCliSettings],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A current snapshot becomes the global instance without validating."""
+        built = cache.load_global()
+        assert cache.path.is_file()
+        expected = built.model_dump()
+        _reset()
+
+        def fail_validation(*_args: object, **_kwargs: object) -> None:
+            pytest.fail("settings were validated")
+
+        monkeypatch.setattr(FlextCliSettings, "__init__", fail_validation)
+        restored = cache.load_global()
+        assert restored is not built
+        assert restored.model_dump() == expected
+        monkeypatch.undo()
+        assert FlextCliSettings.get_global() is restored
+
+    def test_live_settings_are_not_snapshotted(
+        self, cache: FlextCliSettingsCache[FlextCliSettings]
+    ) -> None:
+        """Settings already loaded (and changed) are returned as they are."""
+        live = FlextCliSettings.get_global()
+        live.verbose = not live.verbose
+        assert cache.load_global() is live
+        assert not cache.path.exists()
+
+    @pytest.mark.parametrize(
+        ("name", "changes"),
+        [("FLEXT_CLI_PROFILE", True), ("FLEXT_DEBUG", True), ("UNRELATED_X", False)],
+    )
+    def test_fingerprint_covers_settings_environment(
+        self,
+        cache: FlextCliSettingsCache[FlextCliSettings],
+        monkeypatch: pytest.MonkeyPatch,
+        name: str,
+        changes: bool,
+    ) -> None:
+        """Only variables that can configure settings change the fingerprint."""
+        before = cache.fingerprint()
+        monkeypatch.setenv(name, "changed")
+        assert (cache.fingerprint() != before) is changes
+
+    def test_stale_and_unreadable_snapshots_fail(
+        self, cache: FlextCliSettingsCache[FlextCliSettings]
+    ) -> None:
+        """Restoring needs a readable snapshot written for the same inputs."""
+        assert cache.restore(cache.fingerprint()).is_failure
+        assert cache.write(FlextCliSettings.get_global(), "other").is_success
+        _reset()
+        stale = cache.restore(cache.fingerprint())
+        assert stale.is_failure
+        assert "missing or stale" in str(stale.error)
+        _ = cache.path.write_bytes(b"not a snapshot")
+        unreadable = cache.restore(cache.fingerprint())
+        assert "Cannot read settings snapshot" in str(unreadable.error)
+
+    def test_secret_fields_are_never_written(self, tmp_path: Path) -> None:
+        """Secrets are left out at their default and block the snapshot when set."""
+        cache = FlextCliSettingsCache("secret-app", _SecretSettings, tmp_path)
+        assert cache.write(_SecretSettings.model_construct(), "plain").is_success
+        snapshot = json.loads(cache.path.read_text())
+        assert "password" not in snapshot["values"]
+        held = _SecretSettings.model_construct(password=SecretStr("hunter2"))
+        written = cache.write(held, "secret")
+        assert written.is_failure
+        assert "secret fields are set (password)" in str(written.error)
+        assert "hunter2" not in cache.path.read_text()
+
+    def test_app_startup_writes_and_reuses_snapshot(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Apps snapshot their settings under the default config directory."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        _reset()
+        first = _CachedApp()._config
+        snapshot = FlextCliSettingsCache("cached-app", FlextCliSettings).path
+        assert snapshot.is_relative_to(tmp_path)
+        assert snapshot.is_file()
+        _reset()
+        assert _CachedApp()._config.model_dump() == first.model_dump()
+        _reset()
+
+    def test_snapshot_directory_follows_environment(self, tmp_path: Path) -> None:
+        """The config directory set in the environment holds the snapshot."""
+        for name in ("FLEXT_CLI_CONFIG_DIR", "flext_config_dir"):
+            cache = FlextCliSettingsCache(
+                "cached-app", FlextCliSettings, environ={name: str(tmp_path)}
+            )
+            assert cache.path == tmp_path / "settings" / "cached-app.snapshot"
+        default = FlextCliSettingsCache("cached-app", FlextCliSettings, environ={})
+        assert default.path.is_relative_to(Path.home() / ".flext")
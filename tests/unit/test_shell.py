@@ -0,0 +1,161 @@
+"""FLEXT CLI Shell Tests - Interactive prompt over warm commands.
+
+Modules tested: flext_cli.shell, flext_cli.app_base (shell)
+Scope: ring-buffer history (saved on errors too), quote-aware command-index
+completion, line dispatch with settings restore, the prompt loop and
+FlextCliCommands dispatch
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import typer
+from flext_core import FlextSettings, r
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from flext_cli import FlextCliAppBase, FlextCliCommands, FlextCliSettings, FlextCliShell
+from flext_cli.completion_entry import KEY_COMMANDS, KEY_OPTIONS
+
+
+class _ShellApp(FlextCliAppBase[FlextCliSettings]):
+    app_name = "shell-app"
+    app_help = "Shell test app"
+    config_class = FlextCliSettings
+    completion_cache = False
+
+    def _register_commands(self) -> None:
+        settings = self._config
+
+        @self._app.command()
+        def greet(name: str) -> None:
+            """Greet someone."""
+            typer.echo(f"hello {name} verbose={settings.verbose}")
+
+        @self._app.command()
+        def fail() -> None:
+            """Exit with an error."""
+            raise typer.Exit(3)
+
+        _ = greet, fail
+
+
+@pytest.fixture
+def app(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> _ShellApp:
+    FlextSettings.reset_for_testing()
+    FlextCliSettings._reset_instance()
+    monkeypatch.setenv("FLEXT_CLI_CONFIG_DIR", str(tmp_path))
+    return _ShellApp()
+
+
+def _run(shell: FlextCliShell, text: str) -> r[int]:
+    with create_pipe_input() as pipe:
+        pipe.send_text(text)
+        return shell.run(session_input=pipe, session_output=DummyOutput())
+
+
+class TestsCliShell:
+    """Tests for FlextCliShell and FlextCliAppBase.shell."""
+
+    def test_history_is_bounded_and_saved(self, tmp_path: Path) -> None:
+        """Only the newest entries are kept, loaded and written back."""
+        path = tmp_path / "shell.history"
+        _ = path.write_text("one\ntwo\nthree\n")
+        history = FlextCliShell.RingHistory(3, path)
+        history.append_string("four")
+        assert history.entries == ["two", "three", "four"]
+        assert list(history.load_history_strings()) == ["four", "three", "two"]
+        assert history.save().value is True
+        assert path.read_text() == "two\nthree\nfour\n"
+        assert FlextCliShell.RingHistory(3).save().value is False
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("gr", [("greet", -2)]),
+            ("", [("fail", 0), ("greet", 0)]),
+            ("greet --l", [("--loud", -3)]),
+            ("greet ", []),
+            ('greet "--l', [("--loud", -4)]),
+            ("greet 'a b' --l", [("--loud", -3)]),
+        ],
+    )
+    def test_completer_uses_command_index(
+        self, text: str, expected: list[tuple[str, int]]
+    ) -> None:
+        """TAB candidates come from the command-index tree."""
+        tree: dict[str, object] = {
+            KEY_COMMANDS: {
+                "greet": {KEY_OPTIONS: [[["--loud"], False, []]]},
+                "fail": {},
+            }
+        }
+        completer = FlextCliShell.IndexCompleter(tree)
+        completions = completer.get_completions(Document(text), CompleteEvent())
+        assert sorted((item.text, item.start_position) for item in completions) == (
+            expected
+        )
+
+    def test_history_is_saved_when_a_command_raises(self, tmp_path: Path) -> None:
+        """An exception leaving the loop still writes the history file."""
+
+        def explode(_argv: list[str]) -> r[bool]:
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        path = tmp_path / "shell.history"
+        shell = FlextCliShell(explode, {}, history_path=path)
+        with pytest.raises(RuntimeError, match="boom"):
+            _ = _run(shell, "explode\n")
+        assert path.read_text() == "explode\n"
+
+    def test_run_line_restores_settings(
+        self, app: _ShellApp, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """``--verbose`` applies to its own line only; errors reach stderr."""
+        shell = app.shell()
+        assert shell.run_line("--verbose greet ada").is_success
+        assert shell.run_line("greet bob").is_success
+        assert shell.run_line("greet 'open").is_failure
+        assert shell.run_line("fail").is_failure
+        captured = capsys.readouterr()
+        assert "hello ada verbose=True" in captured.out
+        assert "hello bob verbose=False" in captured.out
+        assert "Cannot parse command line" in captured.err
+
+    def test_prompt_loop_and_history(
+        self, app: _ShellApp, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """The loop runs lines until ``exit`` and persists the history."""
+        result = _run(app.shell(), "greet ada\nfail\nhistory\nexit\ngreet never\n")
+        assert result.value == 1
+        out = capsys.readouterr().out
+        assert "hello ada" in out
+        assert "never" not in out
+        saved = tmp_path / "history" / "shell-app.history"
+        assert saved.read_text().splitlines() == [
+            "greet ada",
+            "fail",
+            "history",
+            "exit",
+        ]
+
+    def test_for_commands_dispatch(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Registered FlextCliCommands handlers run with positional arguments."""
+        commands = FlextCliCommands()
+
+        def echo(*words: str) -> r[object]:
+            return r[object].ok(" ".join(words))
+
+        _ = commands.register_command("echo", echo)
+        shell = FlextCliShell.for_commands(commands)
+        assert _run(shell, "echo a 'b c'\nmissing\n").value == 1
+        assert "a b c" in capsys.readouterr().out
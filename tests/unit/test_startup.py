@@ -0,0 +1,98 @@
+"""FLEXT CLI Startup Profiler Tests - Import-time budgets.
+
+Modules tested: flext_cli.startup, flext_cli.__main__
+Scope: -X importtime parsing, critical path, budget check, profile-startup
+entry point exit status, Rich/PyYAML/tabulate kept out of cold imports
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from flext_cli import FlextCliFormatters, FlextCliStartupProfiler, c
+from flext_cli.__main__ import main
+
+_IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     leaf_a
+import time:       300 |        300 |     leaf_b
+import time:       200 |        600 |   mid
+import time:        50 |         50 |   side
+import time:       400 |       1050 | app
+import time:        70 |         70 | other
+unrelated stderr line
+"""
+
+
+class TestsCliStartupProfiler:
+    """Tests for FlextCliStartupProfiler and the profile-startup command."""
+
+    def test_parse_importtime_depths(self) -> None:
+        """Timings and nesting depth are parsed; other lines are skipped."""
+        timings = FlextCliStartupProfiler.parse_importtime(_IMPORTTIME)
+        assert [(t.module, t.depth) for t in timings] == [
+            ("leaf_a", 2),
+            ("leaf_b", 2),
+            ("mid", 1),
+            ("side", 1),
+            ("app", 0),
+            ("other", 0),
+        ]
+        assert timings[4].self_us == 400
+        assert timings[4].cumulative_us == 1050
+
+    def test_critical_path_follows_slowest_children(self) -> None:
+        """The path descends through the slowest import at each level."""
+        timings = FlextCliStartupProfiler.parse_importtime(_IMPORTTIME)
+        path = FlextCliStartupProfiler.critical_path(timings)
+        assert [t.module for t in path] == ["app", "mid", "leaf_b"]
+
+    def test_profile_and_budget(self) -> None:
+        """A real cold import is profiled and checked against a budget."""
+        profiled = FlextCliStartupProfiler.profile("json", runs=1)
+        assert profiled.is_success
+        profile = profiled.value
+        assert any(t.module == "json" for t in profile.imports)
+        assert profile.total_ms > 0
+        assert "Critical path" in FlextCliStartupProfiler.format_report(profile)
+        exceeded = FlextCliStartupProfiler.check_budget(profile, budget_ms=0.0)
+        assert exceeded.is_failure
+        assert exceeded.error_code == c.Cli.StartupProfileDefaults.ERROR_CODE
+
+    def test_profile_reports_import_errors(self) -> None:
+        """A target that fails to import yields a failure."""
+        result = FlextCliStartupProfiler.profile("json:missing_attr", runs=1)
+        assert result.is_failure
+        assert "missing_attr" in str(result.error)
+
+    def test_profile_startup_exit_status(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """The CLI exits 1 when the budget is exceeded, 0 otherwise."""
+        assert main(["profile-startup", "json", "--runs", "1", "--top", "3"]) == 0
+        assert "Startup profile for json" in capsys.readouterr().out
+        assert main(["profile-startup", "json", "--budget-ms", "0"]) == 1
+        assert "budget" in capsys.readouterr().err
+
+    def test_rendering_libraries_import_lazily(self) -> None:
+        """Importing the output services does not import Rich, YAML or tabulate."""
+        code = (
+            "import sys; import flext_cli.services.output, flext_cli.settings; "
+            "print(sorted({'rich.console', 'yaml', 'tabulate'} & set(sys.modules)))"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert completed.stdout.strip() == "[]"
+        errors = FlextCliFormatters.rich_errors()
+        assert {error.__name__ for error in errors} >= {"ConsoleError", "StyleError"}